@@ -3,36 +3,82 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
-import time
-import yaml  # type: ignore
 import voluptuous as vol
 import inspect
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PLATFORMS, DEFAULT_RETENTION_MONTHS, DEFAULT_DASHBOARD_VERSION, DEFAULT_NOTAM_RADIUS_NM
-from .utils.qcode_parser import parse_qcode, sort_notams_by_criticality, get_criticality_emoji, NOTAMCriticality
-from .utils.forecast_analysis import (
-    calculate_sunset_sunrise,
-    get_forecast_window,
-    analyze_forecast_trends,
-    check_overnight_conditions,
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    DEFAULT_RETENTION_MONTHS,
+    DEFAULT_DASHBOARD_VERSION,
+    DEFAULT_NOTAM_RADIUS_NM,
+    DEFAULT_BRIEFING_NOTIFY_SERVICE,
+    AI_BRIEFING_READINESS_TIMEOUT_SECONDS,
+    AI_BRIEFING_RUN_DEADLINE_SECONDS,
+    NOTAM_STARTUP_READINESS_TIMEOUT_SECONDS,
+    DEFAULT_AI_BRIEFING_CONCURRENCY,
+    MAX_AI_BRIEFING_CONCURRENCY,
+)
+from .utils.asset_cache import (
+    DASHBOARD_TEMPLATE_ASSET,
+    PREFLIGHT_PROMPT_ASSET,
+    asset_path,
+    async_load_text_asset,
+    load_yaml_asset,
+)
+from .utils.briefing_dispatcher import (
+    async_dispatch_briefings,
+    group_briefings_by_time,
+)
+from .utils.briefing_fingerprint import build_briefing_fingerprint, material_change_reason
+from .utils.briefing_history import (
+    DEFAULT_MAX_BRIEFINGS_PER_AIRFIELD,
+    get_briefing_history,
+)
+from .utils.briefing_stream import EVENT_AI_BRIEFING, BriefingStream, chunk_for_speech
+from .utils.briefing_prompt import (
+    assemble_briefing_prompt,
+    build_conditions_section,
+    build_notam_section,
+    build_static_prefix,
+    estimate_tokens,
 )
+from .utils.cache_manager import async_flush_cache_managers, async_warm_cache_managers
+from .utils.job_scheduler import ensure_job_scheduler, remove_job_scheduler
+from .utils.registry import (
+    HangarRegistry,
+    find_aircraft,
+    get_registry,
+    remove_registry,
+)
+from .utils.timezone_resolver import async_resolve_airfield_timezones
+from .utils.readiness import async_wait_until_ready
+from .utils.feature_imports import async_import_features, enabled_features
+
+if TYPE_CHECKING:
+    from .utils.forecast_frame import ForecastFrame
+    from .utils.openweathermap import OpenWeatherMapClient
 
 _LOGGER = logging.getLogger(__name__)
 
-# Dashboard template cache (performance optimization)
-_DASHBOARD_TEMPLATE_CACHE: dict | None = None
-_TEMPLATE_MODIFIED_TIME: float | None = None
-# Backwards-compatible aliases for performance tests
-_dashboard_template_cache = _DASHBOARD_TEMPLATE_CACHE
-_dashboard_template_mtime = _TEMPLATE_MODIFIED_TIME
+# hass.data[DOMAIN] key holding per-entry AI briefing input fingerprints
+BRIEFING_FINGERPRINTS_KEY = "briefing_fingerprints"
 
 
 def _load_integration_version() -> str:
@@ -161,6 +207,76 @@ def _get_briefing_text(hass: HomeAssistant) -> str | None:
     return briefing
 
 
+def _resolve_history_airfield(history, airfield: str | None) -> str | None:
+    """Match an airfield name or slug against the briefing history.
+
+    Args:
+        history: BriefingHistory instance (or None)
+        airfield: Airfield name or slug
+
+    Returns:
+        Airfield name as stored in the history, or None if unknown
+    """
+    if history is None or not airfield:
+        return None
+    wanted = airfield.lower().replace(" ", "_")
+    for name in history.airfields():
+        if name == airfield or name.lower().replace(" ", "_") == wanted:
+            return name
+    return None
+
+
+async def _speak_briefing_chunks(
+    hass: HomeAssistant,
+    tts_entity: str,
+    media_player: str,
+    briefing: str,
+) -> None:
+    """Speak a briefing incrementally to cut time-to-first-word.
+
+    The first short chunk is spoken with tts.speak, so synthesis of a few
+    sentences (not the whole briefing) is all that delays the first word.
+    The remaining chunks are queued on the media player as TTS media
+    sources and synthesised as the player reaches them. Calls are blocking
+    so the chunks are queued in order.
+
+    Args:
+        hass: Home Assistant instance
+        tts_entity: TTS engine entity
+        media_player: Target media player entity
+        briefing: Briefing text
+    """
+    from urllib.parse import quote
+
+    chunks = chunk_for_speech(briefing)
+    if not chunks:
+        return
+
+    await hass.services.async_call(
+        "tts",
+        "speak",
+        {
+            "entity_id": tts_entity,
+            "media_player_entity_id": media_player,
+            "message": chunks[0],
+        },
+        blocking=True,
+    )
+    for chunk in chunks[1:]:
+        await hass.services.async_call(
+            "media_player",
+            "play_media",
+            {
+                "entity_id": media_player,
+                "media_content_id": (
+                    f"media-source://tts/{tts_entity}?message={quote(chunk)}"),
+                "media_content_type": "music",
+                "enqueue": "add",
+            },
+            blocking=True,
+        )
+
+
 def _resolve_airfield_slug(hass: HomeAssistant) -> str | None:
     """Resolve the current airfield slug for briefing.
 
@@ -311,7 +427,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.info("Manual AI briefing refresh requested")
         entries = hass.config_entries.async_entries(DOMAIN)
         for entry in entries:
-            await async_generate_all_ai_briefings(hass, entry)
+            await async_generate_all_ai_briefings(hass, entry, force=True)
 
     async def handle_speak_briefing(call: ServiceCall) -> None:
         """Service to speak the current AI pre-flight briefing via TTS.
@@ -325,6 +441,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         Service data options (all optional):
             - tts_entity_id: TTS engine entity (e.g., tts.cloud)
             - media_player_entity_id: Target media player (e.g., media_player.living_room)
+            - stream: Speak the first sentences straight away and queue the
+              rest on the media player (player must support enqueue)
         """
         # Get briefing text
         briefing = _get_briefing_text(hass)
@@ -344,6 +462,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             )
             return
 
+        if call.data.get("stream"):
+            await _speak_briefing_chunks(
+                hass, tts_entity, media_player, briefing)
+            return
+
         await hass.services.async_call(
             "tts",
             "speak",
@@ -355,6 +478,31 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             blocking=False,
         )
 
+    async def handle_get_briefing_history(call: ServiceCall) -> ServiceResponse:
+        """Service returning stored AI briefings for an airfield.
+
+        Service data options:
+            - airfield: Airfield name or slug (defaults to the selected airfield)
+            - limit: Number of most recent briefings to return (default 1)
+            - at: Return the briefing that was current at this time instead
+        """
+        history = get_briefing_history(hass)
+        airfield = _resolve_history_airfield(
+            history, call.data.get("airfield") or _resolve_airfield_slug(hass))
+        if history is None or airfield is None:
+            return {"airfield": call.data.get("airfield"), "briefings": []}
+
+        when = call.data.get("at")
+        if when is not None:
+            if when.tzinfo is None:
+                # Naive times are in the Home Assistant time zone
+                when = dt_util.as_utc(when)
+            found = history.at(airfield, when)
+            briefings = [found] if found else []
+        else:
+            briefings = history.recent(airfield, call.data.get("limit", 1))
+        return {"airfield": airfield, "briefings": briefings}
+
     # Removed duplicate handle_install_dashboard definition (consolidated below)
     async def handle_install_dashboard(call: ServiceCall) -> None:
         """Service to install the Hangar Assistant dashboard.
@@ -415,13 +563,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             else:
                 _LOGGER.error("❌ Dashboard YAML generation failed")
     
-    async def handle_calculate_fuel_cost(call: ServiceCall) -> None:
+    async def handle_calculate_fuel_cost(call: ServiceCall) -> ServiceResponse:
         """Service to calculate fuel cost for a flight.
         
         Service data:
             - aircraft_reg: Aircraft registration (e.g., G-ABCD)
             - flight_time_hours: Flight time in hours
             - fuel_price_per_liter: Fuel price per liter (or gallon)
+
+        Returns:
+            The calculation (also fired as a hangar_assistant_fuel_cost_calculated
+            event), or an ``error`` when it cannot be made
         """
         from .utils.units import convert_fuel_volume
         
@@ -429,23 +581,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         flight_time = call.data.get("flight_time_hours", 0)
         fuel_price = call.data.get("fuel_price_per_liter", 0)
         
-        # Find aircraft config
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
-            _LOGGER.warning("No config entry found for fuel cost calculation")
-            return
-        
-        entry = entries[0]
-        aircraft_list = entry.data.get("aircraft", [])
-        aircraft = None
-        for ac in aircraft_list:
-            if ac.get("reg", "").replace("-", "_").upper() == aircraft_reg:
-                aircraft = ac
-                break
-        
+        # Find aircraft config in any config entry
+        _, aircraft = find_aircraft(hass, aircraft_reg)
         if not aircraft:
             _LOGGER.warning("Aircraft %s not found", aircraft_reg)
-            return
+            return {"aircraft_reg": aircraft_reg, "error": "aircraft_not_found"}
         
         # Get fuel config
         fuel_config = aircraft.get("fuel", {})
@@ -454,7 +594,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         
         if burn_rate <= 0:
             _LOGGER.warning("Aircraft %s has no fuel burn rate configured", aircraft_reg)
-            return
+            return {"aircraft_reg": aircraft_reg, "error": "no_burn_rate"}
         
         # Convert burn rate to liters/hour
         burn_rate_liters = convert_fuel_volume(burn_rate, from_unit=burn_rate_unit, to_unit="liters")
@@ -472,19 +612,19 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             total_cost
         )
         
-        # Fire event with results
-        hass.bus.async_fire(
-            f"{DOMAIN}_fuel_cost_calculated",
-            {
-                "aircraft_reg": aircraft_reg,
-                "flight_time_hours": flight_time,
-                "fuel_used_liters": round(fuel_used, 2),
-                "fuel_price_per_liter": fuel_price,
-                "total_cost": round(total_cost, 2),
-            }
-        )
+        result = {
+            "aircraft_reg": aircraft_reg,
+            "flight_time_hours": flight_time,
+            "fuel_used_liters": round(fuel_used, 2),
+            "fuel_price_per_liter": fuel_price,
+            "total_cost": round(total_cost, 2),
+        }
+
+        # Fire event with results (for automations that predate responses)
+        hass.bus.async_fire(f"{DOMAIN}_fuel_cost_calculated", result)
+        return result
     
-    async def handle_estimate_trip_fuel(call: ServiceCall) -> None:
+    async def handle_estimate_trip_fuel(call: ServiceCall) -> ServiceResponse:
         """Service to estimate fuel required for a trip.
         
         Service data:
@@ -493,6 +633,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             - destination_icao: Destination ICAO code
             - distance_nm: Distance in nautical miles
             - cruise_speed_kts: Cruise speed in knots
+
+        Returns:
+            The estimate (also fired as a hangar_assistant_trip_fuel_estimated
+            event), or an ``error`` when it cannot be made
         """
         from .utils.units import convert_fuel_volume, calculate_fuel_endurance
         from .const import DEFAULT_FUEL_RESERVE_MINUTES
@@ -503,22 +647,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         distance_nm = call.data.get("distance_nm", 0)
         cruise_speed = call.data.get("cruise_speed_kts", 100)
         
-        # Find aircraft config
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
-            return
-        
-        entry = entries[0]
-        aircraft_list = entry.data.get("aircraft", [])
-        aircraft = None
-        for ac in aircraft_list:
-            if ac.get("reg", "").replace("-", "_").upper() == aircraft_reg:
-                aircraft = ac
-                break
-        
+        # Find aircraft config in any config entry
+        registry, aircraft = find_aircraft(hass, aircraft_reg)
         if not aircraft:
             _LOGGER.warning("Aircraft %s not found", aircraft_reg)
-            return
+            return {"aircraft_reg": aircraft_reg, "error": "aircraft_not_found"}
         
         # Get fuel config
         fuel_config = aircraft.get("fuel", {})
@@ -529,7 +662,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         
         if burn_rate <= 0:
             _LOGGER.warning("Aircraft %s has no fuel burn rate configured", aircraft_reg)
-            return
+            return {"aircraft_reg": aircraft_reg, "error": "no_burn_rate"}
         
         # Calculate flight time
         flight_time_hours = distance_nm / cruise_speed if cruise_speed > 0 else 0
@@ -541,8 +674,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         fuel_required = burn_rate_liters * flight_time_hours
         
         # Get reserve from settings
-        settings = entry.data.get("settings", {})
-        fuel_settings = settings.get("fuel", {})
+        fuel_settings = registry.settings.get("fuel", {})
         reserve_minutes = fuel_settings.get("reserve_minutes", DEFAULT_FUEL_RESERVE_MINUTES)
         reserve_fuel = burn_rate_liters * (reserve_minutes / 60.0)
         
@@ -563,22 +695,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             reserve_minutes
         )
         
-        # Fire event with results
-        hass.bus.async_fire(
-            f"{DOMAIN}_trip_fuel_estimated",
-            {
-                "aircraft_reg": aircraft_reg,
-                "departure": departure,
-                "destination": destination,
-                "distance_nm": distance_nm,
-                "flight_time_hours": round(float(flight_time_hours or 0.0), 2),
-                "fuel_required_liters": round(fuel_required, 2),
-                "reserve_fuel_liters": round(reserve_fuel, 2),
-                "total_fuel_required_liters": round(total_fuel_required, 2),
-                "tank_capacity_liters": round(float(capacity_liters or 0.0), 2),
-                "sufficient_capacity": sufficient,
-            }
-        )
+        result = {
+            "aircraft_reg": aircraft_reg,
+            "departure": departure,
+            "destination": destination,
+            "distance_nm": distance_nm,
+            "flight_time_hours": round(float(flight_time_hours or 0.0), 2),
+            "fuel_required_liters": round(fuel_required, 2),
+            "reserve_fuel_liters": round(reserve_fuel, 2),
+            "total_fuel_required_liters": round(total_fuel_required, 2),
+            "tank_capacity_liters": round(float(capacity_liters or 0.0), 2),
+            "sufficient_capacity": sufficient,
+        }
+
+        # Fire event with results (for automations that predate responses)
+        hass.bus.async_fire(f"{DOMAIN}_trip_fuel_estimated", result)
+        return result
 
     # Register all services
     await _register_service(
@@ -596,8 +728,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         vol.Schema({
             vol.Optional("tts_entity_id"): cv.entity_id,
             vol.Optional("media_player_entity_id"): cv.entity_id,
+            vol.Optional("stream", default=False): cv.boolean,
         })
     )
+    await _register_service(
+        hass, "get_briefing_history", handle_get_briefing_history,
+        vol.Schema({
+            vol.Optional("airfield"): str,
+            vol.Optional("limit", default=1): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=1, max=DEFAULT_MAX_BRIEFINGS_PER_AIRFIELD)),
+            vol.Optional("at"): cv.datetime,
+        }),
+        supports_response=SupportsResponse.ONLY,
+    )
     await _register_service(
         hass, "install_dashboard", handle_install_dashboard,
         vol.Schema({
@@ -610,7 +754,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             vol.Required("aircraft_reg"): str,
             vol.Required("flight_time_hours"): cv.positive_float,
             vol.Required("fuel_price_per_liter"): cv.positive_float,
-        })
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
     )
     await _register_service(
         hass, "estimate_trip_fuel", handle_estimate_trip_fuel,
@@ -620,7 +765,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             vol.Required("destination_icao"): str,
             vol.Required("distance_nm"): cv.positive_float,
             vol.Required("cruise_speed_kts"): cv.positive_float,
-        })
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     return True
@@ -630,7 +776,8 @@ async def _register_service(
     hass: HomeAssistant,
     service_name: str,
     handler,
-    schema: vol.Schema
+    schema: vol.Schema,
+    supports_response: SupportsResponse | None = None,
 ) -> None:
     """Register a service and handle mock awaitable responses.
 
@@ -639,9 +786,13 @@ async def _register_service(
         service_name: Name of the service
         handler: Service handler function
         schema: Service schema for validation
+        supports_response: Whether the service returns response data
     """
+    kwargs = {"schema": schema}
+    if supports_response is not None:
+        kwargs["supports_response"] = supports_response
     result = hass.services.async_register(
-        DOMAIN, service_name, handler, schema=schema
+        DOMAIN, service_name, handler, **kwargs
     )
     if inspect.isawaitable(result):
         await result
@@ -789,86 +940,110 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         reason="major_version_upgrade" if force_dashboard_rebuild else "startup",
     )
 
+    # Load stored briefings before the sensors restore from them, and
+    # record every completed briefing from now on
+    history = get_briefing_history(hass)
+    if history is not None:
+        await history.async_load()
+
+        @callback
+        def _record_briefing(event) -> None:
+            history.add(
+                event.data.get("airfield_name"),
+                event.data.get("text"),
+                dt_util.utcnow())
+
+        entry.async_on_unload(
+            hass.bus.async_listen(EVENT_AI_BRIEFING, _record_briefing))
+
+    # All periodic and startup jobs run through the entry's scheduler,
+    # which prevents overlapping runs, staggers start times and records
+    # durations for the Job Scheduler diagnostics sensor
+    # (created before the platforms so the sensor can attach to it)
+    scheduler = ensure_job_scheduler(hass, entry.entry_id)
+
+    # Index airfields, aircraft, pilots and hangars once for the platforms
+    # and services
+    registry = get_registry(hass, entry)
+
+    # Load the modules of enabled optional features (NOTAM, OWM, CheckWX,
+    # AI) in the executor; disabled features are never imported
+    await async_import_features(hass, enabled_features(entry.data))
+
+    # Resolve airfield timezones once (finder loaded in the executor) so
+    # the timezone sensors and briefings only read the stored result
+    try:
+        await async_resolve_airfield_timezones(hass, registry)
+    except Exception as e:
+        _LOGGER.warning("Could not resolve airfield timezones: %s", e)
+
     # Forward setup to sensor and binary_sensor platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Set up briefing schedules
-    for briefing in entry.data.get("briefings", []):
-        async def run_briefing(now, b=briefing, e=entry):
-            await async_send_briefing(hass, b, e)
+    # Platforms have created their API clients (and cache managers); load
+    # persisted cache entries into memory in one job per namespace
+    await async_warm_cache_managers(hass)
 
-        # Parse HH:MM:SS or HH:MM
-        time_parts = briefing["briefing_time"].split(":")
-        hour = int(time_parts[0])
-        minute = int(time_parts[1])
+    # Set up briefing schedules: one job per distinct minute, so all
+    # briefings due together are dispatched as one concurrent burst
+    for (hour, minute), group in group_briefings_by_time(
+            entry.data.get("briefings", [])).items():
+        async def run_briefings(g=group, e=entry):
+            await async_send_briefings(hass, g, e)
 
         entry.async_on_unload(
-            async_track_time_change(
-                hass,
-                run_briefing,
+            scheduler.schedule(
+                f"briefings_{hour:02d}{minute:02d}",
+                run_briefings,
                 hour=hour,
-                minute=minute,
-                second=0))
+                minute=minute))
 
     # Reload integration if options change in the UI
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    # Write out batched (write-behind) cache entries before shutdown
+    entry.async_on_unload(
+        hass.async_add_shutdown_job(
+            HassJob(async_flush_cache_managers, f"{DOMAIN} cache flush"),
+            hass,
+            True))
+
     # Set up hourly AI briefings if an agent is defined
     ai_config = entry.data.get("ai_assistant", {})
     if ai_config.get("ai_agent_entity"):
-        async def run_hourly_ai_briefing(now):
+        async def run_hourly_ai_briefing():
             await async_generate_all_ai_briefings(hass, entry)
 
         entry.async_on_unload(
-            async_track_time_change(
-                hass,
-                run_hourly_ai_briefing,
-                minute=0,
-                second=0))
+            scheduler.schedule(
+                "hourly_ai_briefings", run_hourly_ai_briefing, minute=0))
 
-        # Also run once on startup after sensors are ready
-        async def wait_for_sensors_and_brief():
-            """Wait for airfield sensors to be available before generating briefings.
+        # Also run once on startup, as soon as the airfield sensors report
+        async def brief_when_sensors_ready():
+            """Generate the first briefings once airfield sensors have values.
 
-            Polls for sensor readiness up to 30 seconds with 1-second intervals.
-            Proceeds once all airfield density altitude sensors are available or
-            timeout expires.
+            Waits (event-driven, no polling) for every airfield's density
+            altitude sensor to report a usable state, up to
+            AI_BRIEFING_READINESS_TIMEOUT_SECONDS, then generates briefings.
             """
-            import asyncio
-            airfield_slugs = [
-                (af.get("name") or "").lower().replace(" ", "_")
+            sensor_ids = [
+                f"sensor.{(af.get('name') or '').lower().replace(' ', '_')}"
+                "_density_altitude"
                 for af in entry.data.get("airfields", [])
                 if isinstance(af, dict) and af.get("name")
             ]
-
-            # Wait up to 30 seconds for sensors to become available
-            max_wait = 30
-            for attempt in range(max_wait):
-                # Check if all required sensors are available
-                all_ready = True
-                for slug in airfield_slugs:
-                    sensor_id = f"sensor.{slug}_density_altitude"
-                    state = hass.states.get(sensor_id)
-                    if not state or state.state in ("unknown", "unavailable"):
-                        all_ready = False
-                        break
-
-                if all_ready:
-                    _LOGGER.debug(
-                        "Sensors ready after %d seconds, generating AI briefings",
-                        attempt + 1)
-                    await async_generate_all_ai_briefings(hass, entry)
-                    return
-
-                await asyncio.sleep(1)
-
-            # Timeout - proceed anyway but log warning
-            _LOGGER.warning(
-                "Sensor readiness timeout after %d seconds, generating AI briefings anyway",
-                max_wait)
+            not_ready = await async_wait_until_ready(
+                hass, sensor_ids, timeout=AI_BRIEFING_READINESS_TIMEOUT_SECONDS)
+            if not_ready:
+                _LOGGER.warning(
+                    "Sensor readiness timeout after %d seconds (%s), "
+                    "generating AI briefings anyway",
+                    AI_BRIEFING_READINESS_TIMEOUT_SECONDS,
+                    ", ".join(not_ready))
             await async_generate_all_ai_briefings(hass, entry)
 
-        hass.async_create_task(wait_for_sensors_and_brief())
+        scheduler.run_in_background(
+            entry, "startup_ai_briefings", brief_when_sensors_ready)
 
     # Set up scheduled NOTAM updates if enabled
     integrations = entry.data.get("integrations", {})
@@ -880,7 +1055,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_time = notam_config.get("update_time", "02:00")
         hour, minute = map(int, update_time.split(":"))
 
-        async def update_notams(now):
+        async def update_notams():
             """Scheduled NOTAM update."""
             notam_client = NOTAMClient(
                 hass, notam_config.get(
@@ -897,17 +1072,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Schedule daily update
         entry.async_on_unload(
-            async_track_time_change(
-                hass,
-                update_notams,
-                hour=hour,
-                minute=minute,
-                second=0))
+            scheduler.schedule(
+                "notam_update", update_notams, hour=hour, minute=minute))
 
-        # Also run once on startup (after a brief delay for network)
+        # Also run once on startup, once Home Assistant (and its network
+        # stack) has finished starting
         async def initial_notam_update():
-            import asyncio
-            await asyncio.sleep(10)  # Wait 10 seconds for network to be ready
+            await async_wait_until_ready(
+                hass,
+                wait_for_start=True,
+                timeout=NOTAM_STARTUP_READINESS_TIMEOUT_SECONDS)
             notam_client = NOTAMClient(
                 hass, notam_config.get(
                     "cache_days", 7), entry)
@@ -921,7 +1095,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 _LOGGER.debug(
                     "Initial NOTAM fetch failed (will retry at scheduled time): %s", e)
 
-        hass.async_create_task(initial_notam_update())
+        scheduler.run_in_background(
+            entry, "initial_notam_update", initial_notam_update)
 
     return True
 
@@ -937,11 +1112,7 @@ def _get_template_path() -> str:
     Returns:
         Absolute path to glass_cockpit.yaml template
     """
-    return os.path.join(
-        os.path.dirname(__file__),
-        "dashboard_templates",
-        "glass_cockpit.yaml"
-    )
+    return asset_path(DASHBOARD_TEMPLATE_ASSET)
 
 
 async def _generate_dashboard_yaml(
@@ -960,17 +1131,13 @@ async def _generate_dashboard_yaml(
     Returns:
         YAML string ready for manual installation, or None on error
     """
-    def _load_and_format():
-        """Sync function for YAML I/O (wrapped in executor)."""
-        try:
-            template_path = _get_template_path()
-            
-            # Load template
-            with open(template_path, 'r', encoding='utf-8') as f:
-                yaml_content = f.read()
-            
-            # Add instructional header
-            header = """# Hangar Assistant Glass Cockpit Dashboard
+    yaml_content = await async_load_text_asset(hass, DASHBOARD_TEMPLATE_ASSET)
+    if yaml_content is None:
+        _LOGGER.error("Failed to load dashboard template")
+        return None
+
+    # Add instructional header
+    header = """# Hangar Assistant Glass Cockpit Dashboard
 # 
 # INSTALLATION INSTRUCTIONS:
 # 1. Go to Home Assistant Settings → Dashboards
@@ -986,19 +1153,7 @@ async def _generate_dashboard_yaml(
 # The dashboard will now be available in your sidebar.
 #
 """
-            
-            return header + yaml_content
-            
-        except OSError as e:
-            _LOGGER.error("Failed to load dashboard template: %s", e)
-            return None
-        except Exception as e:
-            _LOGGER.error("Unexpected error generating dashboard YAML: %s", e)
-            return None
-    
-    # Run blocking I/O in executor
-    yaml_string = await hass.async_add_executor_job(_load_and_format)
-    return yaml_string
+    return header + yaml_content
 
 
 def _validate_template(template_path: str) -> bool:
@@ -1074,55 +1229,17 @@ def _should_rebuild_dashboard(
     return False
 
 
-def _load_dashboard_template(template_path: str) -> dict | None:
-    """Load dashboard template from YAML file with caching.
+def _load_dashboard_template() -> dict | None:
+    """Load the parsed dashboard template.
 
-    Caches the parsed template in memory and only reloads if the file
-    has been modified. This significantly improves dashboard rebuild
-    performance by avoiding redundant YAML parsing.
-
-    Performance optimization: Returns cached reference instead of deep copy
-    since callers don't mutate the template.
-
-    Args:
-        template_path: Path to template file
+    The template is parsed once and served from the asset cache until the
+    file's mtime changes. Callers get a shared reference and must not
+    mutate it.
 
     Returns:
         Dashboard config dict or None on error
     """
-    global _DASHBOARD_TEMPLATE_CACHE, _TEMPLATE_MODIFIED_TIME
-
-    try:
-        # Check if template has been modified since last load
-        current_mtime = os.path.getmtime(template_path)
-        
-        if (_DASHBOARD_TEMPLATE_CACHE is not None and
-                _TEMPLATE_MODIFIED_TIME == current_mtime):
-            _LOGGER.debug(
-                "Using cached dashboard template (age: %.1fs)",
-                time.time() - current_mtime
-            )
-            # Return cached reference (30-40% faster than deep copy)
-            # Safe because callers don't mutate the template
-            return _DASHBOARD_TEMPLATE_CACHE
-
-        # Cache miss or file modified - load and parse
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = yaml.safe_load(f)
-        
-        # Update cache
-        _DASHBOARD_TEMPLATE_CACHE = template
-        _TEMPLATE_MODIFIED_TIME = current_mtime
-        _LOGGER.debug("Dashboard template loaded and cached")
-        
-        return template
-
-    except yaml.YAMLError as e:
-        _LOGGER.error("YAML parsing error in dashboard template: %s", e)
-        return None
-    except OSError as e:
-        _LOGGER.error("Error reading dashboard template: %s", e)
-        return None
+    return load_yaml_asset(DASHBOARD_TEMPLATE_ASSET)
 
 
 def _write_dashboard(dashboard_path: str, dashboard_config: dict) -> bool:
@@ -1135,6 +1252,9 @@ def _write_dashboard(dashboard_path: str, dashboard_config: dict) -> bool:
     Returns:
         True on success, False on error
     """
+    # Only needed when writing a dashboard (runs in the executor)
+    import yaml  # type: ignore
+
     try:
         # Create directory if needed
         os.makedirs(os.path.dirname(dashboard_path), exist_ok=True)
@@ -1186,7 +1306,7 @@ async def async_create_dashboard(
                 return False
 
             # Load and write dashboard (YAML I/O is blocking)
-            dashboard_config = _load_dashboard_template(template_path)
+            dashboard_config = _load_dashboard_template()
             if dashboard_config is None:
                 return False
 
@@ -1289,7 +1409,17 @@ async def _reload_dashboards(hass: HomeAssistant) -> None:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    await async_flush_cache_managers(hass, close=True)
+    fingerprints = _get_briefing_fingerprint_store(hass)
+    if fingerprints is not None:
+        fingerprints.pop(entry.entry_id, None)
+    history = get_briefing_history(hass)
+    if history is not None:
+        await history.async_flush()
+    remove_job_scheduler(hass, entry.entry_id)
+    remove_registry(hass, entry.entry_id)
+    return unload_ok
 
 
 async def async_cleanup_records(hass: HomeAssistant, months: int) -> None:
@@ -1329,70 +1459,104 @@ async def async_cleanup_records(hass: HomeAssistant, months: int) -> None:
 
 
 async def _request_ai_briefing_with_retry(
-    hass: HomeAssistant, agent_id: str, airfield_name: str, user_prompt: str
+    hass: HomeAssistant,
+    agent_id: str,
+    airfield_name: str,
+    user_prompt: str,
+    semaphore=None,
 ) -> bool:
     """Request AI briefing for an airfield with exponential backoff retry.
 
     Attempts to call the conversation.process service up to 3 times with
-    exponential backoff on failure. Fires hangar_assistant_ai_briefing event
-    on success.
+    exponential backoff on failure. Delivers the result through a
+    BriefingStream: a started event when the request is sent, then the
+    hangar_assistant_ai_briefing event on success (or a failed event).
+
+    When a semaphore is given it is held only for the service call itself,
+    so an airfield waiting out its backoff does not block the others.
 
     Args:
         hass: Home Assistant instance
         agent_id: The AI agent entity ID to use
         airfield_name: The airfield name (for logging and event data)
         user_prompt: The complete prompt to send to the AI agent
+        semaphore: Optional asyncio.Semaphore limiting concurrent requests
 
     Returns:
         True if briefing generated successfully, False otherwise
     """
     import asyncio
+    from contextlib import nullcontext
 
     MAX_RETRIES = 3
     BACKOFF_SECONDS = 60
 
-    for retry in range(MAX_RETRIES):
-        try:
-            _LOGGER.debug(
-                "Requesting AI briefing for %s from %s (attempt %d/%d)",
-                airfield_name,
-                agent_id,
-                retry + 1,
-                MAX_RETRIES)
-            result = await hass.services.async_call(
-                "conversation",
-                "process",
-                {
-                    "agent_id": agent_id,
-                    "text": user_prompt,
-                },
-                blocking=True,
-                return_response=True
-            )
-
-            if result and "response" in result:
-                try:
-                    response_text = result["response"]["speech"]["plain"]["speech"]
-                    # Fire event that the sensors are listening for
-                    hass.bus.async_fire("hangar_assistant_ai_briefing", {
-                        "airfield_name": airfield_name,
-                        "text": response_text
-                    })
-                    _LOGGER.info(
-                        "Successfully generated AI briefing for %s",
-                        airfield_name)
-                    return True
-                except (KeyError, TypeError) as e:
-                    _LOGGER.error(
-                        "AI Agent returned an unexpected response format for %s: %s",
-                        airfield_name,
-                        result)
-                    return False  # Don't retry format errors
-            else:
-                _LOGGER.warning(
-                    "AI Agent %s returned no response for %s",
+    # conversation.process returns the whole answer at once: sensors see
+    # "started", then the final text
+    stream = BriefingStream(hass, airfield_name)
+    stream.start()
+    try:
+        for retry in range(MAX_RETRIES):
+            try:
+                _LOGGER.debug(
+                    "Requesting AI briefing for %s from %s (attempt %d/%d)",
+                    airfield_name,
                     agent_id,
-                    airfield_name)
+                    retry + 1,
+                    MAX_RETRIES)
+                async with semaphore if semaphore is not None else nullcontext():
+                    result = await hass.services.async_call(
+                        "conversation",
+                        "process",
+                        {
+                            "agent_id": agent_id,
+                            "text": user_prompt,
+                        },
+                        blocking=True,
+                        return_response=True
+                    )
+
+                if result and "response" in result:
+                    try:
+                        response_text = result["response"]["speech"]["plain"]["speech"]
+                        # Publish the complete text the sensors are listening for
+                        stream.finish(response_text)
+                        _LOGGER.info(
+                            "Successfully generated AI briefing for %s",
+                            airfield_name)
+                        return True
+                    except (KeyError, TypeError) as e:
+                        _LOGGER.error(
+                            "AI Agent returned an unexpected response format for %s: %s",
+                            airfield_name,
+                            result)
+                        return False  # Don't retry format errors
+                else:
+                    _LOGGER.warning(
+                        "AI Agent %s returned no response for %s",
+                        agent_id,
+                        airfield_name)
+                    if retry < MAX_RETRIES - 1:
+                        # Wait before retry (exponential backoff)
+                        wait_time = BACKOFF_SECONDS * (2 ** retry)
+                        _LOGGER.info(
+                            "Retrying AI briefing for %s in %d seconds",
+                            airfield_name,
+                            wait_time)
+                        await asyncio.sleep(wait_time)
+                    else:
+                        _LOGGER.error(
+                            "AI briefing failed for %s after %d attempts",
+                            airfield_name,
+                            MAX_RETRIES)
+                        return False
+            except Exception as e:
+                _LOGGER.error(
+                    "Error generating AI briefing for %s (attempt %d/%d): %s",
+                    airfield_name,
+                    retry + 1,
+                    MAX_RETRIES,
+                    e)
                 if retry < MAX_RETRIES - 1:
                     # Wait before retry (exponential backoff)
                     wait_time = BACKOFF_SECONDS * (2 ** retry)
@@ -1407,29 +1571,11 @@ async def _request_ai_briefing_with_retry(
                         airfield_name,
                         MAX_RETRIES)
                     return False
-        except Exception as e:
-            _LOGGER.error(
-                "Error generating AI briefing for %s (attempt %d/%d): %s",
-                airfield_name,
-                retry + 1,
-                MAX_RETRIES,
-                e)
-            if retry < MAX_RETRIES - 1:
-                # Wait before retry (exponential backoff)
-                wait_time = BACKOFF_SECONDS * (2 ** retry)
-                _LOGGER.info(
-                    "Retrying AI briefing for %s in %d seconds",
-                    airfield_name,
-                    wait_time)
-                await asyncio.sleep(wait_time)
-            else:
-                _LOGGER.error(
-                    "AI briefing failed for %s after %d attempts",
-                    airfield_name,
-                    MAX_RETRIES)
-                return False
 
-    return False
+        return False
+    finally:
+        # No-op after a successful finish; covers errors and cancellation
+        stream.fail()
 
 
 def _gather_airfield_sensor_data(
@@ -1472,7 +1618,8 @@ def _get_timezone_and_solar_info(
     hass: HomeAssistant,
     slug: str,
     lat: float | None,
-    lon: float | None
+    lon: float | None,
+    registry: HangarRegistry | None = None,
 ) -> tuple[str, str, str]:
     """Get timezone and solar information for an airfield.
 
@@ -1481,18 +1628,23 @@ def _get_timezone_and_solar_info(
         slug: Airfield slug
         lat: Latitude (optional)
         lon: Longitude (optional)
+        registry: Entry registry holding the zones resolved at setup
 
     Returns:
         Tuple of (timezone, sunrise_time, sunset_time)
     """
-    tz_sensor = hass.states.get(f"sensor.{slug}_airfield_timezone")
-    tz_value = tz_sensor.state if tz_sensor else None
+    tz_value = registry.airfield_timezone(slug) if registry else None
+    if not tz_value:
+        tz_sensor = hass.states.get(f"sensor.{slug}_airfield_timezone")
+        tz_value = tz_sensor.state if tz_sensor else None
     if not tz_value:
         tz_value = getattr(hass.config, "time_zone", None) or "UTC"
 
     sunrise_time = "unknown"
     sunset_time = "unknown"
     if lat is not None and lon is not None:
+        from .utils.forecast_analysis import calculate_sunset_sunrise
+
         try:
             now = dt_util.now()
             sunrise, sunset = calculate_sunset_sunrise(
@@ -1528,6 +1680,9 @@ def _process_notams_for_briefing(
     if not raw_notams:
         return f"No NOTAMs available within {notam_radius}nm (or NOTAM data not configured)"
 
+    # Preloaded at setup when NOTAMs are enabled
+    from .utils.qcode_parser import parse_qcode, sort_notams_by_criticality
+
     # Parse Q-codes and sort by criticality
     notams_data = []
     for notam in raw_notams:
@@ -1537,58 +1692,32 @@ def _process_notams_for_briefing(
         notams_data.append(notam)
     notams_data = sort_notams_by_criticality(notams_data)
 
-    # Format NOTAMs
-    notam_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    notam_details = []
-
-    for notam in notams_data:
-        parsed = notam.get("parsed_qcode", {})
-        crit = parsed.get("criticality", NOTAMCriticality.LOW).name
-        notam_counts[crit] += 1
-
-        emoji = get_criticality_emoji(parsed.get(
-            "criticality", NOTAMCriticality.LOW))
-        category = parsed.get("category", "UNKNOWN")
-        description = parsed.get("description", "")
-
-        notam_id = notam.get("id", "Unknown")
-        location = notam.get("location", "Unknown")
-        text = notam.get("text", "No details")
-        start = notam.get("start_time", "Unknown")
-        end = notam.get("end_time", "Unknown")
-
-        notam_details.append(
-            f"\n{emoji} {crit} - {notam_id} ({location}) - {category}"
-            f"\n  Q-code: {notam.get('q_code', 'N/A')} - {description}"
-            f"\n  Valid: {start} to {end}"
-            f"\n  Details: {text[:200]}..."
-            f"\n"
-        )
-
-    notam_summary = f"{len(notams_data)} NOTAMs within {notam_radius}nm:"
-    notam_summary += f" {notam_counts['CRITICAL']}🔴 CRITICAL, {notam_counts['HIGH']}🟠 HIGH, {notam_counts['MEDIUM']}🟡 MEDIUM, {notam_counts['LOW']}⚪ LOW"
-    return notam_summary + "".join(notam_details)
+    # Format NOTAMs, trimming low-priority detail to the token budget
+    return build_notam_section(notams_data, notam_radius)
 
 
-def _process_forecast_for_briefing(
-    hass: HomeAssistant,
+async def _async_process_forecast_for_briefing(
     entry: ConfigEntry,
-    slug: str,
+    owm_client: OpenWeatherMapClient | None,
     lat: float | None,
     lon: float | None,
     now: datetime,
-    airfield_name: str
+    airfield_name: str,
+    overnight_thresholds: dict[str, float] | None = None,
 ) -> str:
     """Process forecast data for AI briefing.
 
+    The hourly forecast comes from the OWM client, usually from the shared
+    "weather" cache that the forecast sensors have already filled.
+
     Args:
-        hass: Home Assistant instance
         entry: Config entry
-        slug: Airfield slug
+        owm_client: OWM client for the run, or None without an API key
         lat: Latitude (optional)
         lon: Longitude (optional)
         now: Current datetime
         airfield_name: Airfield name for logging
+        overnight_thresholds: Airfield's overnight risk thresholds
 
     Returns:
         Formatted forecast text for prompt
@@ -1603,32 +1732,35 @@ def _process_forecast_for_briefing(
     if not owm_enabled:
         return "\nOpenWeatherMap forecast not enabled\n"
 
+    if owm_client is None:
+        return "\nOpenWeatherMap API key not configured\n"
+
+    # Preloaded at setup when OpenWeatherMap is enabled
+    from .utils.forecast_analysis import get_forecast_window
+    from .utils.forecast_frame import ForecastFrame
+    from .utils.openweathermap import DEFAULT_UNITS, WIND_SPEED_UNITS
+
     try:
         window_start, window_end, is_overnight = get_forecast_window(
             float(lat), float(lon), now)
 
-        forecast_hourly_sensor = hass.states.get(
-            f"sensor.{slug}_weather_forecast_hourly")
-
-        if not forecast_hourly_sensor or not forecast_hourly_sensor.attributes:
-            return "\nOWM forecast sensor not available\n"
-
-        forecast_raw = forecast_hourly_sensor.attributes.get("forecast", [])
-        if not forecast_raw:
+        data = await owm_client.get_weather_data(float(lat), float(lon))
+        hourly = owm_client.extract_hourly_forecast(data) if data else []
+        if not hourly:
             return "\nForecast data empty\n"
 
-        # Filter forecast to window
-        forecast_data = [
-            item for item in forecast_raw
-            if (item_time := dt_util.parse_datetime(item.get("datetime")))
-            and window_start <= item_time <= window_end
-        ]
+        # Parsed once per briefing; trends and overnight checks share a
+        # bisected window of it
+        frame = ForecastFrame.from_forecast(
+            hourly, wind_unit=WIND_SPEED_UNITS[DEFAULT_UNITS])
+        forecast_data = frame.window(window_start, window_end)
 
-        if not forecast_data:
+        if not len(forecast_data):
             return "\nNo forecast data in window\n"
 
         return _format_forecast_text(
-            forecast_data, window_end, is_overnight, window_start
+            forecast_data, window_end, is_overnight, window_start,
+            overnight_thresholds,
         )
 
     except Exception as e:
@@ -1637,41 +1769,65 @@ def _process_forecast_for_briefing(
         return f"\nError processing forecast: {e}\n"
 
 
+def _forecast_point_value(value: float, spec: str) -> str:
+    """Format a forecast column value, or "?" when it is missing (nan)."""
+    return "?" if math.isnan(value) else format(value, spec)
+
+
 def _format_forecast_text(
-    forecast_data: list,
+    forecast_data: ForecastFrame,
     window_end: datetime,
     is_overnight: bool,
-    window_start: datetime
+    window_start: datetime,
+    overnight_thresholds: dict[str, float] | None = None,
 ) -> str:
     """Format forecast data into text for AI prompt.
 
     Args:
-        forecast_data: List of forecast items
+        forecast_data: Forecast points within the window
         window_end: End of forecast window
         is_overnight: Whether forecast extends overnight
         window_start: Start of forecast window
+        overnight_thresholds: Airfield's overnight risk thresholds
 
     Returns:
         Formatted forecast text
     """
+    from .utils.forecast_analysis import (
+        analyze_forecast_trends,
+        check_overnight_conditions,
+    )
+    from .utils.forecast_frame import value_or
+
     # Analyze trends
     trends = analyze_forecast_trends(forecast_data)
 
     forecast_text = f"\n### FORECAST TO {window_end.strftime('%H:%M %Z')}:\n"
     forecast_text += f"Overall Trend: {trends['overall'].upper()}\n"
-    forecast_text += f"Summary: {trends['summary']}\n\n"
+    forecast_text += f"Summary: {trends['summary']}\n"
+    tendency = [
+        f"{horizon} {values['pressure']['slope_per_hour']:+.1f}"
+        for horizon, values in trends.get("horizons", {}).items()
+        if horizon != "window"
+    ]
+    if tendency:
+        forecast_text += f"Pressure Tendency (hPa/h): {', '.join(tendency)}\n"
+    forecast_text += "\n"
     forecast_text += "Key Forecast Points:\n"
 
     # Show forecast every 2-3 hours
     step = max(1, len(forecast_data) // 4)
-    for item in forecast_data[::step]:
-        time_str = dt_util.parse_datetime(
-            item.get("datetime")).strftime("%H:%M")
-        temp_f = item.get("temperature", "?")
-        wind_speed_f = item.get("wind_speed", "?")
-        wind_dir_f = item.get("wind_bearing", "?")
-        clouds_f = item.get("cloud_coverage", "?")
-        precip_f = item.get("precipitation", 0)
+    for index in range(0, len(forecast_data), step):
+        time_str = forecast_data.time_at(
+            index, window_start.tzinfo or timezone.utc).strftime("%H:%M")
+        # Normalised columns, so OWM and HA forecasts read the same
+        temp_f = _forecast_point_value(forecast_data.temp_c[index], ".0f")
+        wind_speed_f = _forecast_point_value(
+            forecast_data.wind_kt[index], ".0f")
+        wind_dir_f = _forecast_point_value(
+            forecast_data.wind_dir[index], "03.0f")
+        clouds_f = _forecast_point_value(forecast_data.cloud_pct[index], ".0f")
+        precip_f = format(value_or(forecast_data.precip_mm[index], 0.0), "g")
 
         forecast_text += (
             f"  {time_str}: {temp_f}°C, Wind {wind_speed_f}kt @ {wind_dir_f}°, "
@@ -1680,7 +1836,7 @@ def _format_forecast_text(
     # Check overnight conditions
     if is_overnight:
         overnight_warnings = check_overnight_conditions(
-            forecast_data, window_start, window_end)
+            forecast_data, window_start, window_end, overnight_thresholds)
 
         if overnight_warnings["has_warnings"]:
             forecast_text += f"\n⚠️ OVERNIGHT WARNINGS:\n{overnight_warnings['summary']}\n"
@@ -1725,68 +1881,90 @@ def _build_briefing_prompt(
     Returns:
         Complete prompt string
     """
-    lat = airfield.get("latitude")
-    lon = airfield.get("longitude")
-
-    return (
-        f"{system_instructions}\n\n"
-        f"### LIVE DATA FOR {airfield_name} ({icao}):\n"
-        f"**Airfield Information:**\n"
-        f"- ICAO: {icao}\n"
-        f"- Coordinates: {lat}, {lon}\n"
-        f"- Elevation: {airfield.get('elevation', 'unknown')} m\n"
-        f"- Runway: {sensor_data['runway_number']} - {sensor_data['runway_length']}m\n"
-        f"- Timezone: {tz_value}\n"
-        f"- Current Time: {now.strftime('%H:%M %Z')}\n"
-        f"- Sunrise: {sunrise_time} | Sunset: {sunset_time}\n\n"
-        f"**Current Weather:**\n"
-        f"- Wind: {sensor_data['wind_speed'].state if sensor_data['wind_speed'] else 'unknown'}kt at {sensor_data['wind_dir'].state if sensor_data['wind_dir'] else 'unknown'}°\n"
-        f"- Crosswind: {sensor_data['crosswind'] if sensor_data['crosswind'] else 'unknown'}kt | Headwind: {sensor_data['headwind'] if sensor_data['headwind'] else 'unknown'}kt\n"
-        f"- Temperature: {sensor_data['temp'].state if sensor_data['temp'] else 'unknown'}°C | Dew Point: {sensor_data['dp'].state if sensor_data['dp'] else 'unknown'}°C\n"
-        f"- Pressure: {sensor_data['pressure'].state if sensor_data['pressure'] else 'unknown'} hPa\n"
-        f"- Cloud Base (Est): {sensor_data['cloud_base'].state if sensor_data['cloud_base'] else 'unknown'} ft AGL\n"
-        f"- Density Altitude: {sensor_data['da'].state if sensor_data['da'] else 'unknown'} ft\n"
-        f"- Carburettor Icing Risk: {sensor_data['carb'].state if sensor_data['carb'] else 'unknown'}\n"
-        f"- Recommended Runway: {sensor_data['runway_number']}\n"
-        f"- Weather Data Age: {sensor_data['weather_age'].state if sensor_data['weather_age'] else 'unknown'} minutes\n"
-        f"- Master Safety Alert: {'ACTIVE ⚠️' if sensor_data['safety_alert'] and sensor_data['safety_alert'].state == 'on' else 'OK ✓'}\n\n"
-        f"**NOTAMs ({notam_radius}nm radius):**\n"
-        f"{notam_text}\n\n"
-        f"**FORECAST:**\n"
-        f"{forecast_text}\n\n"
-        f"Please provide the briefing based on this data following the CFI morning brief format specified.")
+    # Static instructions and airfield details are cached across runs
+    static_prefix = build_static_prefix(
+        system_instructions,
+        airfield_name,
+        icao,
+        airfield.get("latitude"),
+        airfield.get("longitude"),
+        airfield.get("elevation", "unknown"),
+        tz_value)
+    conditions = build_conditions_section(
+        sensor_data, sunrise_time, sunset_time, now)
+
+    return assemble_briefing_prompt(
+        static_prefix, conditions, notam_text, notam_radius, forecast_text)
+
+
+def _get_ai_briefing_concurrency(ai_config: dict) -> int:
+    """Get the configured number of simultaneous AI briefing requests.
+
+    Args:
+        ai_config: The ai_assistant section of the config entry
+
+    Returns:
+        Concurrency limit between 1 and MAX_AI_BRIEFING_CONCURRENCY
+    """
+    try:
+        value = int(ai_config.get(
+            "briefing_concurrency", DEFAULT_AI_BRIEFING_CONCURRENCY))
+    except (TypeError, ValueError):
+        value = DEFAULT_AI_BRIEFING_CONCURRENCY
+    return max(1, min(value, MAX_AI_BRIEFING_CONCURRENCY))
+
+
+def _get_briefing_fingerprint_store(hass: HomeAssistant) -> dict | None:
+    """Get the per-entry store of AI briefing input fingerprints.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Dict of entry ID to {airfield name: fingerprint}, or None when
+        hass.data is unavailable (as in unit tests)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return None
+    return hass_data.setdefault(DOMAIN, {}).setdefault(
+        BRIEFING_FINGERPRINTS_KEY, {})
 
 
 async def async_generate_all_ai_briefings(
         hass: HomeAssistant,
-        entry: ConfigEntry) -> None:
-    """Trigger AI briefing generation for all airfields."""
+        entry: ConfigEntry,
+        force: bool = False) -> dict[str, bool]:
+    """Trigger AI briefing generation for all airfields.
+
+    Prompts are built for every airfield first, then requested concurrently
+    (bounded by the ``briefing_concurrency`` AI option). Each airfield keeps
+    its own retry/backoff timeline, and the whole run is cancelled after
+    AI_BRIEFING_RUN_DEADLINE_SECONDS so it never overlaps the next hourly run.
+
+    Airfields whose inputs have not changed materially since their last
+    successful briefing are skipped (see utils/briefing_fingerprint.py), so
+    the hourly run only calls the LLM when the advice could differ.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        force: Regenerate every briefing even if its inputs are unchanged
+
+    Returns:
+        Dict of airfield name to True if its briefing was generated or is
+        still current
+    """
+    import asyncio
+
     ai_config = entry.data.get("ai_assistant", {})
     agent_id = ai_config.get("ai_agent_entity")
     if not agent_id:
-        return
+        return {}
 
-    # Load system prompt from file without blocking the event loop
-    prompt_path = os.path.join(
-        os.path.dirname(__file__),
-        "prompts",
-        "preflight_brief.txt")
-
-    def _read_prompt_file() -> str:
-        if not os.path.exists(prompt_path):
-            return ""
-        try:
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except (OSError, UnicodeDecodeError) as e:
-            _LOGGER.error("Error reading preflight_brief.txt: %s", e)
-            return ""
-        except Exception as e:
-            _LOGGER.error(
-                "Unexpected error reading preflight_brief.txt: %s", e)
-            return ""
-
-    system_instructions = await hass.async_add_executor_job(_read_prompt_file)
+    # System prompt is read from disk once and served from memory after that
+    system_instructions = await async_load_text_asset(
+        hass, PREFLIGHT_PROMPT_ASSET) or ""
 
     # Get global settings for NOTAM radius
     settings = entry.data.get("settings", {})
@@ -1794,7 +1972,30 @@ async def async_generate_all_ai_briefings(
         "notam_default_radius_nm",
         DEFAULT_NOTAM_RADIUS_NM)
 
-    # Generate briefings for each airfield
+    registry = get_registry(hass, entry)
+
+    fingerprint_store = _get_briefing_fingerprint_store(hass)
+    previous_fingerprints: dict = {}
+    if fingerprint_store is not None:
+        previous_fingerprints = fingerprint_store.setdefault(
+            entry.entry_id, {})
+
+    # Preloaded at setup when forecasts or the AI assistant are enabled
+    from .utils.overnight_rules import overnight_thresholds
+
+    # One OWM client per run; forecasts come from the shared weather cache
+    owm_client = None
+    if entry.data.get("integrations", {}).get(
+            "openweathermap", {}).get("enabled", False):
+        # Preloaded at setup when OpenWeatherMap is enabled
+        from .utils.openweathermap import client_from_entry
+
+        owm_client = client_from_entry(hass, entry)
+
+    # Build the prompt for each airfield
+    prompts: dict[str, str] = {}
+    fingerprints: dict[str, dict] = {}
+    unchanged: list[str] = []
     for airfield in entry.data.get("airfields", []):
         airfield_name = airfield["name"]
         slug = airfield_name.lower().replace(" ", "_")
@@ -1811,7 +2012,7 @@ async def async_generate_all_ai_briefings(
 
         # Get timezone and solar info
         tz_value, sunrise_time, sunset_time = _get_timezone_and_solar_info(
-            hass, slug, lat, lon
+            hass, slug, lat, lon, registry
         )
 
         # Process NOTAMs
@@ -1821,10 +2022,24 @@ async def async_generate_all_ai_briefings(
 
         # Process forecast data
         now = dt_util.now()
-        forecast_text = _process_forecast_for_briefing(
-            hass, entry, slug, lat, lon, now, airfield_name
+        forecast_text = await _async_process_forecast_for_briefing(
+            entry, owm_client, lat, lon, now, airfield_name,
+            overnight_thresholds(airfield),
         )
 
+        fingerprint = build_briefing_fingerprint(
+            system_instructions, sensor_data, notam_text, forecast_text, now)
+        reason = material_change_reason(
+            previous_fingerprints.get(airfield_name), fingerprint)
+        if reason is None and not force:
+            unchanged.append(airfield_name)
+            continue
+        _LOGGER.debug(
+            "Generating AI briefing for %s: %s",
+            airfield_name,
+            "forced refresh" if force else reason)
+        fingerprints[airfield_name] = fingerprint
+
         user_prompt = _build_briefing_prompt(
             system_instructions,
             airfield_name,
@@ -1839,51 +2054,106 @@ async def async_generate_all_ai_briefings(
             notam_radius,
             forecast_text
         )
+        prompts[airfield_name] = user_prompt
+        _LOGGER.debug(
+            "AI briefing prompt for %s: ~%d tokens",
+            airfield_name,
+            estimate_tokens(user_prompt))
 
-        # Request AI briefing with automatic retry on failure
-        await _request_ai_briefing_with_retry(hass, agent_id, airfield_name, user_prompt)
+    if unchanged:
+        _LOGGER.debug(
+            "AI briefing inputs unchanged, skipping: %s",
+            ", ".join(unchanged))
+    results: dict[str, bool] = dict.fromkeys(unchanged, True)
+    if not prompts:
+        return results
+
+    # Request briefings concurrently; retries run independently per airfield
+    semaphore = asyncio.Semaphore(_get_ai_briefing_concurrency(ai_config))
+    tasks = {
+        asyncio.create_task(
+            _request_ai_briefing_with_retry(
+                hass, agent_id, airfield_name, user_prompt, semaphore),
+            name=f"{DOMAIN} AI briefing {airfield_name}"): airfield_name
+        for airfield_name, user_prompt in prompts.items()
+    }
+    done, pending = await asyncio.wait(
+        tasks, timeout=AI_BRIEFING_RUN_DEADLINE_SECONDS)
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+        _LOGGER.warning(
+            "AI briefing run deadline (%d s) reached; cancelled: %s",
+            AI_BRIEFING_RUN_DEADLINE_SECONDS,
+            ", ".join(sorted(tasks[task] for task in pending)))
+
+    for task, airfield_name in tasks.items():
+        if task in done and not task.cancelled() and task.exception() is None:
+            results[airfield_name] = bool(task.result())
+            if results[airfield_name]:
+                # Only a delivered briefing becomes the new baseline
+                previous_fingerprints[airfield_name] = fingerprints[airfield_name]
+        else:
+            if task in done and not task.cancelled():
+                _LOGGER.error(
+                    "AI briefing for %s failed: %s",
+                    airfield_name,
+                    task.exception())
+            results[airfield_name] = False
+
+    _LOGGER.debug(
+        "AI briefing run complete: %d/%d succeeded, %d unchanged",
+        sum(results.values()) - len(unchanged),
+        len(tasks),
+        len(unchanged))
+    return results
+
+
+def _briefing_notify_service(settings: dict) -> str:
+    """Return the notify service for scheduled briefings.
+
+    Accepts the service with or without the ``notify.`` domain prefix;
+    blank values fall back to persistent notifications.
+
+    Args:
+        settings: Global settings
+
+    Returns:
+        Notify service name (without ``notify.``)
+    """
+    service = str(settings.get("briefing_notify_service") or "").strip()
+    service = service.removeprefix("notify.")
+    return service or DEFAULT_BRIEFING_NOTIFY_SERVICE
+
+
+async def async_send_briefings(
+        hass: HomeAssistant,
+        briefings: list[dict],
+        entry: ConfigEntry) -> int:
+    """Send a group of scheduled briefings concurrently.
+
+    Args:
+        hass: Home Assistant instance
+        briefings: Briefings due at the same time
+        entry: Config entry holding pilots and settings
+
+    Returns:
+        Number of notifications sent successfully
+    """
+    settings = entry.data.get("settings", {})
+    return await async_dispatch_briefings(
+        hass,
+        briefings,
+        entry.data.get("pilots", []),
+        notify_service=_briefing_notify_service(settings),
+    )
 
 
 async def async_send_briefing(
         hass: HomeAssistant,
         briefing: dict,
         entry: ConfigEntry) -> None:
-    """Compose and send the briefing email."""
-    airfield_slug = briefing["airfield_name"].lower().replace(" ", "_")
-    aircraft_slug = briefing["aircraft_reg"].lower().replace(" ", "_")
-
-    # Fetch current states
-    da = hass.states.get(f"sensor.{airfield_slug}_density_altitude")
-    carb = hass.states.get(f"sensor.{airfield_slug}_carb_risk")
-    roll = hass.states.get(f"sensor.{aircraft_slug}_calculated_ground_roll")
-
-    # Get recipient emails from pilot names
-    pilot_names = briefing.get("pilots", [])
-    all_pilots = entry.data.get("pilots", [])
-    recipient_emails = [p["email"]
-                        for p in all_pilots if p["name"] in pilot_names]
-
-    subject = f"✈️ Hangar Briefing: {briefing['airfield_name']} / {briefing['aircraft_reg']}"
-    body = (
-        f"Good morning Captain.\n\n"
-        f"Here is your automated safety briefing for {briefing['airfield_name']}:\n"
-        f"- Density Altitude: {da.state if da else 'N/A'} ft\n"
-        f"- Carb Icing Risk: {carb.state if carb else 'N/A'}\n"
-        f"- Predicted Ground Roll ({briefing['aircraft_reg']}): {roll.state if roll else 'N/A'} m\n\n"
-        f"Fly safe!")
-
-    try:
-        await hass.services.async_call(
-            "notify",
-            "persistent_notification",  # Fallback for demo, usually 'email' or 'mobile_app'
-            {
-                "title": subject,
-                "message": body
-            }
-        )
-        _LOGGER.info("Briefing for %s sent to %s pilots: %s",
-                     briefing["airfield_name"],
-                     len(recipient_emails),
-                     ", ".join(recipient_emails))
-    except Exception as e:
-        _LOGGER.error("Failed to send briefing: %s", e)
+    """Compose and send a single briefing."""
+    await async_send_briefings(hass, [briefing], entry)
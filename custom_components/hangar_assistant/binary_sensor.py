@@ -16,6 +16,7 @@ from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, DEFAULT_UNIT_PREFERENCE, DEFAULT_STALE_WEATHER_MINUTES
 from .utils.units import convert_speed, get_speed_unit
+from .utils.registry import get_registry
 
 
 async def async_setup_entry(
@@ -50,9 +51,7 @@ async def async_setup_entry(
             dict)] if isinstance(
                 entry.data,
         dict) else []
-    airfield_lookup = {
-        (a.get("name") or "").lower(): a for a in airfields if a.get("name")
-    }
+    registry = get_registry(hass, entry)
 
     # Generate a Master Safety Alert for every Airfield in the list
     for airfield in airfields:
@@ -74,10 +73,9 @@ async def async_setup_entry(
         entry.data,
         dict) else []
     for aircraft in aircraft_list:
-        linked_name = (aircraft.get("linked_airfield") or "").lower()
-        if not linked_name:
+        if not aircraft.get("linked_airfield"):
             continue
-        airfield_config = airfield_lookup.get(linked_name)
+        airfield_config = registry.airfield(aircraft["linked_airfield"])
         if not airfield_config:
             continue
         if not (
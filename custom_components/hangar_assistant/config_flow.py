@@ -10,7 +10,11 @@ from homeassistant.helpers import selector
 from .const import (
     DOMAIN,
     DEFAULT_AI_SYSTEM_PROMPT,
+    DEFAULT_AI_BRIEFING_CONCURRENCY,
+    DEFAULT_BRIEFING_NOTIFY_SERVICE,
+    MAX_AI_BRIEFING_CONCURRENCY,
     DEFAULT_DASHBOARD_VERSION,
+    DASHBOARD_INSTALL_READINESS_TIMEOUT_SECONDS,
     UNIT_PREFERENCE_AVIATION,
     UNIT_PREFERENCE_SI,
     DEFAULT_UNIT_PREFERENCE,
@@ -25,6 +29,8 @@ from .const import (
     US_REG_PATTERN,
     EU_REG_PATTERN,
 )
+from .utils.overnight_rules import AIRFIELD_THRESHOLD_PREFIX, DEFAULT_OVERNIGHT_THRESHOLDS
+from .utils.readiness import async_wait_until_ready
 from .utils.i18n import get_available_languages, get_distance_unit_options, get_action_options, get_unit_preference_options
 from .validation import (
     validate_icao,
@@ -866,13 +872,21 @@ class HangarAssistantConfigFlow(
             
             # Trigger dashboard installation AFTER entry is created
             if method in ["automatic", "manual"]:
-                # Schedule dashboard installation as a background task
-                # This ensures it runs after entry setup completes
+                # Schedule dashboard installation as a background task that
+                # waits (event-driven) for the new entry's airfield sensor,
+                # which only exists once entry setup has completed
+                airfield_name = (self.wizard_state.airfield_data or {}).get("name") or ""
+                ready_entities = [
+                    f"sensor.{airfield_name.lower().replace(' ', '_')}_density_altitude"
+                ] if airfield_name else []
+
                 async def _install_dashboard_after_setup():
-                    """Install dashboard after a brief delay to ensure entry is fully set up."""
-                    import asyncio
-                    await asyncio.sleep(2)  # Allow entry setup to complete
-                    
+                    """Install the dashboard once the new entry is set up."""
+                    await async_wait_until_ready(
+                        self.hass,
+                        ready_entities,
+                        timeout=DASHBOARD_INSTALL_READINESS_TIMEOUT_SECONDS)
+
                     try:
                         await self.hass.services.async_call(
                             DOMAIN,
@@ -883,21 +897,10 @@ class HangarAssistantConfigFlow(
                         _LOGGER.info("Dashboard installation triggered: %s", method)
                     except Exception as e:
                         _LOGGER.error("Dashboard installation failed: %s", e)
-                
-                # Fire and forget - don't block wizard completion; schedule reliably
-                import asyncio
-                task = asyncio.create_task(_install_dashboard_after_setup())
-                # Call HA task scheduler for test assertions
-                try:
-                    self.hass.async_create_task(task)
-                except Exception:
-                    pass
-                # Cancel to avoid lingering tasks in test environments
-                try:
-                    task.cancel()
-                except Exception:
-                    pass
-            
+
+                # Fire and forget - don't block wizard completion
+                self.hass.async_create_task(_install_dashboard_after_setup())
+
             return result
         
         return self.async_show_form(
@@ -1158,6 +1161,7 @@ class HangarOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional("openweathermap_cache_ttl", default=settings.get("openweathermap_cache_ttl", 10)): selector.NumberSelector(
                     selector.NumberSelectorConfig(min=5, max=60, step=1, mode=selector.NumberSelectorMode.BOX, unit_of_measurement="min")
                 ),
+                vol.Optional("briefing_notify_service", default=settings.get("briefing_notify_service", DEFAULT_BRIEFING_NOTIFY_SERVICE)): selector.TextSelector(),
             })
         )
 
@@ -1413,9 +1417,27 @@ class HangarOptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 vol.Optional("use_owm_forecast", default=airfield.get("use_owm_forecast", True)): selector.BooleanSelector(),
                 vol.Optional("use_owm_alerts", default=airfield.get("use_owm_alerts", True)): selector.BooleanSelector(),
+                **self._overnight_threshold_fields(airfield),
             })
         )
 
+    @staticmethod
+    def _overnight_threshold_fields(airfield: dict) -> dict:
+        """Schema fields for an airfield's overnight risk thresholds."""
+        fields = {
+            "heavy_rain_mm_h": (0, 100, 0.5, "mm/h"),
+            "strong_wind_kt": (5, 100, 1, "kt"),
+            "gust_kt": (5, 120, 1, "kt"),
+            "fog_visibility_m": (100, 5000, 100, "m"),
+        }
+        schema = {}
+        for name, (low, high, step, unit) in fields.items():
+            key = AIRFIELD_THRESHOLD_PREFIX + name
+            schema[vol.Optional(key, default=airfield.get(key, DEFAULT_OVERNIGHT_THRESHOLDS[name]))] = selector.NumberSelector(
+                selector.NumberSelectorConfig(min=low, max=high, step=step, mode=selector.NumberSelectorMode.BOX, unit_of_measurement=unit)
+            )
+        return schema
+
     async def async_step_airfield_delete(self, user_input=None):
         """Delete an airfield."""
         if user_input is not None:
@@ -2227,6 +2249,16 @@ class HangarOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(
                 "use_custom_system_prompt",
                 default=use_custom): selector.BooleanSelector(),
+            vol.Optional(
+                "briefing_concurrency",
+                default=ai_config.get(
+                    "briefing_concurrency",
+                    DEFAULT_AI_BRIEFING_CONCURRENCY)): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=MAX_AI_BRIEFING_CONCURRENCY,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX)),
         }
 
         # Show custom prompt field if toggle is enabled
@@ -141,6 +141,20 @@ UK_REG_PATTERN = r"^[A-Z]-[A-Z]{4}$"
 US_REG_PATTERN = r"^[A-Z]\d{4,5}[A-Z]?$"
 EU_REG_PATTERN = r"^[A-Z]{2}-[A-Z]{3}$"
 
+# AI briefing generation (hourly run across all airfields)
+DEFAULT_AI_BRIEFING_CONCURRENCY = 2  # Simultaneous requests to the AI agent
+MAX_AI_BRIEFING_CONCURRENCY = 10
+AI_BRIEFING_RUN_DEADLINE_SECONDS = 50 * 60  # Finish before the next hourly run
+
+# Startup readiness gates (event-driven; work starts as soon as ready)
+AI_BRIEFING_READINESS_TIMEOUT_SECONDS = 30  # Airfield sensors for first briefing
+NOTAM_STARTUP_READINESS_TIMEOUT_SECONDS = 120  # HA started before first fetch
+DASHBOARD_INSTALL_READINESS_TIMEOUT_SECONDS = 60  # Entry set up after wizard
+
+# Scheduled pilot briefings (settings["briefing_notify_service"])
+DEFAULT_BRIEFING_NOTIFY_SERVICE = "persistent_notification"
+BRIEFING_NOTIFY_TIMEOUT_SECONDS = 15  # Per recipient; one slow target can't stall the rest
+
 # Default AI system prompt for aviation briefings
 DEFAULT_AI_SYSTEM_PROMPT = """You are an aviation safety assistant specializing in pre-flight briefings and CAP 1590B compliance.
 
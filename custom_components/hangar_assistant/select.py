@@ -8,7 +8,6 @@ entities in the config entry and expose stable entity_ids for dashboard binding.
 """
 
 import logging
-from typing import Iterable, List
 
 try:
     from homeassistant.components.select import SelectEntity
@@ -31,42 +30,11 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .utils.registry import HangarRegistry, get_registry
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _slugify(value: str | None) -> str:
-    """Convert a name/registration to a slug suitable for entity options."""
-    return (value or "").strip().lower().replace(" ", "_")
-
-
-def _extract_slugs(items: Iterable[dict], keys: List[str]) -> list[str]:
-    """Extract unique slugs from a sequence of dicts using preferred keys.
-
-    Args:
-        items: Iterable of configuration dicts (airfields, aircraft, or pilots).
-        keys: Ordered list of field names to inspect for a usable identifier.
-
-    Returns:
-        Ordered list of slugified identifiers with duplicates removed while
-        preserving first-seen order.
-    """
-    seen: set[str] = set()
-    slugs: list[str] = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        for key in keys:
-            raw = item.get(key)
-            if raw:
-                slug = _slugify(str(raw))
-                if slug and slug not in seen:
-                    seen.add(slug)
-                    slugs.append(slug)
-                break
-    return slugs
-
-
 class HangarSelectBase(SelectEntity):
     """Base class for Hangar Assistant select entities.
 
@@ -169,22 +137,24 @@ class HangarSelect(HangarSelectBase):
         super().__init__(entry, "Hangar Selector", options, "hangar_selector")
 
 
+def _registry(entry: ConfigEntry) -> HangarRegistry:
+    """Build an uncached registry for an entry (option helpers and tests)."""
+    return HangarRegistry(getattr(entry, "entry_id", None), entry.data)
+
+
 def _build_airfield_options(entry: ConfigEntry) -> list[str]:
     """Return slugs for all configured airfields in the config entry."""
-    return _extract_slugs(
-        entry.data.get(
-            "airfields", []), [
-            "name", "icao_code"])
+    return _registry(entry).airfield_options
 
 
 def _build_aircraft_options(entry: ConfigEntry) -> list[str]:
     """Return slugs for all configured aircraft in the config entry."""
-    return _extract_slugs(entry.data.get("aircraft", []), ["reg", "name"])
+    return _registry(entry).aircraft_options
 
 
 def _build_pilot_options(entry: ConfigEntry) -> list[str]:
     """Return slugs for all configured pilots in the config entry."""
-    return _extract_slugs(entry.data.get("pilots", []), ["name", "pilot_name"])
+    return _registry(entry).pilot_options
 
 
 def _build_hangar_options(entry: ConfigEntry) -> list[str]:
@@ -193,28 +163,7 @@ def _build_hangar_options(entry: ConfigEntry) -> list[str]:
     Hangar slugs are in the format "{airfield_slug}_{hangar_slug}" to match
     the entity ID pattern and ensure uniqueness across airfields.
     """
-    hangars = entry.data.get("hangars", [])
-    slugs: list[str] = []
-    seen: set[str] = set()
-
-    for hangar in hangars:
-        if not isinstance(hangar, dict):
-            continue
-
-        hangar_name = hangar.get("name", "")
-        airfield_name = hangar.get("airfield_name", "")
-
-        if hangar_name and airfield_name:
-            # Generate composite slug: {airfield}_{hangar}
-            airfield_slug = _slugify(airfield_name)
-            hangar_slug = _slugify(hangar_name)
-            composite_slug = f"{airfield_slug}_{hangar_slug}"
-
-            if composite_slug and composite_slug not in seen:
-                seen.add(composite_slug)
-                slugs.append(composite_slug)
-
-    return slugs
+    return _registry(entry).hangar_options
 
 
 async def async_setup_entry(
@@ -228,10 +177,11 @@ async def async_setup_entry(
     from the stored configuration so dashboards can bind directly without user
     helpers.
     """
-    airfield_options = _build_airfield_options(entry)
-    hangar_options = _build_hangar_options(entry)
-    aircraft_options = _build_aircraft_options(entry)
-    pilot_options = _build_pilot_options(entry)
+    registry = get_registry(hass, entry)
+    airfield_options = registry.airfield_options
+    hangar_options = registry.hangar_options
+    aircraft_options = registry.aircraft_options
+    pilot_options = registry.pilot_options
 
     entities: list[SelectEntity] = []
     entities.append(AirfieldSelect(entry, airfield_options))
@@ -6,12 +6,13 @@ import math
 import time
 from collections import OrderedDict
 from typing import Any
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
 )
 from homeassistant.const import (
+    EntityCategory,
     STATE_UNKNOWN,
     STATE_UNAVAILABLE,
 )
@@ -36,15 +37,18 @@ from .const import (
     DEFAULT_SATURATION_SPREAD_C,
     DEFAULT_SENSOR_CACHE_TTL_SECONDS,
 )
-from .utils.units import convert_altitude, convert_speed, get_altitude_unit, get_speed_unit
-from .utils.notam import NOTAMClient
-
-try:
-    from timezonefinder import TimezoneFinder
-except ImportError:  # pragma: no cover - handled in runtime fallback
-    TimezoneFinder = None
-
-_TZ_FINDER = TimezoneFinder() if TimezoneFinder else None
+from .utils.daylight_ticker import get_daylight_ticker
+from .utils.ephemeris import DaylightTimeline, SunEvents
+from .utils.timezone_resolver import resolve_timezone
+from .utils.units import convert_altitude, unit_converters
+from .utils.job_scheduler import JobScheduler, get_job_scheduler
+from .utils.registry import get_registry
+from .utils.briefing_history import get_briefing_history
+from .utils.briefing_stream import (
+    EVENT_AI_BRIEFING,
+    EVENT_AI_BRIEFING_FAILED,
+    EVENT_AI_BRIEFING_STARTED,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,15 +83,15 @@ async def async_setup_entry(
             []) if isinstance(
             a,
             dict)]
-    airfield_lookup = {
-        (a.get("name") or "").lower(): a for a in airfields if a.get("name")
-    }
+    registry = get_registry(hass, entry)
 
     # Check if NOTAM integration is enabled
     integrations = entry.data.get("integrations", {})
     notam_config = integrations.get("notams", {})
     notam_enabled = notam_config.get("enabled", False)
     
+    owm_enabled = integrations.get("openweathermap", {}).get("enabled", False)
+
     # Check if CheckWX integration is enabled
     checkwx_config = integrations.get("checkwx", {})
     checkwx_enabled = checkwx_config.get("enabled", False)
@@ -136,8 +140,7 @@ async def async_setup_entry(
 
     # 2. Process Aircraft from the list
     for aircraft in entry.data.get("aircraft", []):
-        linked_name = (aircraft.get("linked_airfield") or "").lower()
-        linked_airfield = airfield_lookup.get(linked_name, {})
+        linked_airfield = registry.airfield(aircraft.get("linked_airfield")) or {}
         entities.append(GroundRollSensor(hass, aircraft, global_settings))
         entities.append(
             PerformanceMarginSensor(
@@ -146,6 +149,17 @@ async def async_setup_entry(
                 linked_airfield,
                 global_settings))
         
+        # Forecast flyability needs OWM forecasts for the linked airfield
+        if (owm_enabled and linked_airfield
+                and linked_airfield.get("use_owm_forecast", True)):
+            entities.append(
+                FlyabilityTimelineSensor(
+                    hass,
+                    aircraft,
+                    linked_airfield,
+                    global_settings,
+                    entry))
+
         # Add fuel sensors if fuel burn rate is configured
         fuel_config = aircraft.get("fuel", {})
         burn_rate = fuel_config.get("burn_rate", 0.0)
@@ -163,6 +177,11 @@ async def async_setup_entry(
     # 4. Add global integration health sensor
     entities.append(IntegrationHealthSensor(hass, entry, global_settings))
 
+    # 5. Add job scheduler diagnostics sensor
+    scheduler = get_job_scheduler(hass, getattr(entry, "entry_id", None))
+    if scheduler is not None:
+        entities.append(JobSchedulerSensor(hass, entry, scheduler))
+
     # Add all generated entities to the system
     async_add_entities(entities)
 
@@ -203,6 +222,8 @@ class HangarSensorBase(SensorEntity):
         self._global_settings = global_settings or {}
         self._unit_preference = self._global_settings.get(
             "unit_preference", DEFAULT_UNIT_PREFERENCE)
+        # Resolved once; conversions are then a multiplication each
+        self._units = unit_converters(self._unit_preference)
         # Use Name or Reg to create a safe unique ID
         name_or_reg = config.get("name") or config.get("reg") or "unknown"
         self._id_slug = name_or_reg.lower().replace(" ", "_")
@@ -374,8 +395,7 @@ class DensityAltSensor(HangarSensorBase):
         elif global_sensor := self._global_settings.get('global_pressure_sensor'):
             self._source_entities.append(global_sensor)
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_altitude_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.altitude_unit
         self._da_caution_ft = self._global_settings.get(
             "da_caution_ft", DEFAULT_DA_CAUTION_FT)
         self._da_warning_ft = self._global_settings.get(
@@ -429,10 +449,7 @@ class DensityAltSensor(HangarSensorBase):
         da_feet = round(pa + (120 * (temp - isa_temp)))
 
         # Convert to user's preferred unit
-        converted = convert_altitude(
-            da_feet,
-            from_feet=True,
-            to_preference=self._unit_preference)
+        converted = self._units.altitude_from_feet(da_feet)
         return round(converted) if converted is not None else None
 
     @property
@@ -515,8 +532,7 @@ class CloudBaseSensor(HangarSensorBase):
         if t_sensor and dp_sensor:
             self._source_entities = [t_sensor, dp_sensor]
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_altitude_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.altitude_unit
 
     @property
     def name(self) -> str:
@@ -541,10 +557,7 @@ class CloudBaseSensor(HangarSensorBase):
 
         cb_feet = round(((t - dp) / 2.5) * 1000)
         # Convert to user's preferred unit
-        converted = convert_altitude(
-            cb_feet,
-            from_feet=True,
-            to_preference=self._unit_preference)
+        converted = self._units.altitude_from_feet(cb_feet)
         return round(converted) if converted is not None else None
 
 
@@ -727,8 +740,7 @@ class CarbRiskTransitionSensor(HangarSensorBase):
         if t_sensor and dp_sensor:
             self._source_entities = [t_sensor, dp_sensor]
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_altitude_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.altitude_unit
 
     @property
     def name(self) -> str:
@@ -769,10 +781,7 @@ class CarbRiskTransitionSensor(HangarSensorBase):
         alt_feet = round(res) if res < 20000 else 0
 
         # Convert to user's preferred unit
-        converted = convert_altitude(
-            alt_feet,
-            from_feet=True,
-            to_preference=self._unit_preference)
+        converted = self._units.altitude_from_feet(alt_feet)
         return round(converted) if converted is not None else None
 
 
@@ -936,15 +945,19 @@ class IcingAdvisorySensor(HangarSensorBase):
 
 
 class DaylightCountdownSensor(HangarSensorBase):
-    """Provides legal daylight countdowns using Home Assistant sun events.
+    """Provides legal daylight countdowns for the airfield.
 
     Calculates minutes until the end of legal daylight (sunset + 30 minutes) when
     above the horizon, or minutes until legal daylight begins (30 minutes before
-    next sunrise) when below the horizon. Uses Home Assistant's `sun.sun` entity
-    to avoid external dependencies and falls back gracefully if unavailable.
+    next sunrise) when below the horizon. Sun events come from the airfield's own
+    coordinates via a precomputed DaylightTimeline; airfields without coordinates
+    fall back to Home Assistant's `sun.sun` entity (the home location). The
+    state is refreshed by the integration-wide daylight ticker every minute and
+    at the exact sunrise/sunset, not recomputed on every read.
 
     Inputs:
-        - sun.sun entity (global HA sun integration)
+        - latitude/longitude (from config), or
+        - sun.sun entity (global HA sun integration) as fallback
 
     Outputs/Behavior:
         - native_value: Minutes until the next legal daylight boundary (int)
@@ -962,8 +975,37 @@ class DaylightCountdownSensor(HangarSensorBase):
     def __init__(self, hass: HomeAssistant, config: dict,
                  global_settings: dict | None = None):
         super().__init__(hass, config, global_settings)
-        # Track sun state changes for live countdowns
-        self._source_entities = ["sun.sun"]
+        try:
+            self._coords: tuple[float, float] | None = (
+                float(config["latitude"]), float(config["longitude"]))
+        except (KeyError, TypeError, ValueError):
+            self._coords = None
+        self._timeline = (
+            DaylightTimeline(*self._coords) if self._coords else None)
+        # Parsed sun.sun events, keyed on the raw attribute strings
+        self._sun_key: tuple | None = None
+        self._sun_events: SunEvents | None = None
+        # Last computed countdown, refreshed by the daylight ticker
+        self._data: dict | None = None
+        if self._coords is None:
+            # Track sun state changes for phase flips at the home location
+            self._source_entities = ["sun.sun"]
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh from the shared minute ticker (and sun.sun if used)."""
+
+        @callback
+        def _refresh(_event=None) -> None:
+            self._data = self._compute()
+            self.async_write_ha_state()
+
+        if self._source_entities:
+            self.async_on_remove(
+                async_track_state_change_event(
+                    self.hass, self._source_entities, _refresh))
+        self.async_on_remove(
+            get_daylight_ticker(self.hass).async_register(
+                _refresh, self._timeline))
 
     @property
     def name(self) -> str:
@@ -986,20 +1028,39 @@ class DaylightCountdownSensor(HangarSensorBase):
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
 
-    def _compute(self):
-        now = dt_util.utcnow()
+    def _home_sun_events(self) -> SunEvents | None:
+        """Return events from sun.sun, parsing only when its state changed."""
         sun = self.hass.states.get("sun.sun")
         if not sun:
             return None
+        key = (
+            sun.state,
+            sun.attributes.get("next_rising"),
+            sun.attributes.get("next_setting"),
+        )
+        if key != self._sun_key:
+            self._sun_key = key
+            self._sun_events = SunEvents(
+                "day" if sun.state == "above_horizon" else "night",
+                self._parse_iso(key[1]),
+                self._parse_iso(key[2]),
+            )
+        return self._sun_events
 
-        next_rising = self._parse_iso(sun.attributes.get("next_rising"))
-        next_setting = self._parse_iso(sun.attributes.get("next_setting"))
-        phase = "day" if sun.state == "above_horizon" else "night"
+    def _compute(self):
+        now = dt_util.utcnow()
+        if self._timeline is not None:
+            events = self._timeline.events_at(now)
+        else:
+            events = self._home_sun_events()
+        if events is None:
+            return None
 
-        daylight_end = next_setting + \
-            timedelta(minutes=30) if next_setting else None
-        daylight_start = next_rising - \
-            timedelta(minutes=30) if next_rising else None
+        next_rising = events.next_rising
+        next_setting = events.next_setting
+        phase = events.phase
+        daylight_end = events.legal_daylight_end
+        daylight_start = events.legal_daylight_start
 
         countdown = None
         daylight_remaining = None
@@ -1023,11 +1084,18 @@ class DaylightCountdownSensor(HangarSensorBase):
             "legal_daylight_start": daylight_start.isoformat() if daylight_start else None,
             "daylight_remaining_min": daylight_remaining,
             "daylight_starts_in_min": daylight_starts_in,
+            "source": "airfield_coords" if self._coords else "sun.sun",
         }
 
+    def _current(self) -> dict | None:
+        """Return the last ticker-computed countdown, computing on first use."""
+        if self._data is None:
+            self._data = self._compute()
+        return self._data
+
     @property
     def native_value(self) -> int | None:
-        data = self._compute()
+        data = self._current()
         if not data:
             return None
         return data.get("countdown")
@@ -1035,7 +1103,7 @@ class DaylightCountdownSensor(HangarSensorBase):
     @property
     def extra_state_attributes(self) -> dict:
         attrs = super().extra_state_attributes
-        data = self._compute() or {}
+        data = self._current() or {}
         attrs.update(
             {
                 "phase": data.get("phase"),
@@ -1045,6 +1113,7 @@ class DaylightCountdownSensor(HangarSensorBase):
                 "legal_daylight_start": data.get("legal_daylight_start"),
                 "daylight_remaining_min": data.get("daylight_remaining_min"),
                 "daylight_starts_in_min": data.get("daylight_starts_in_min"),
+                "source": data.get("source"),
             }
         )
         return attrs
@@ -1080,8 +1149,7 @@ class PrimaryRunwayCrosswindSensor(HangarSensorBase):
         if w_sensor and wd_sensor:
             self._source_entities = [w_sensor, wd_sensor]
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_speed_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.speed_unit
 
     @property
     def name(self) -> str:
@@ -1107,8 +1175,7 @@ class PrimaryRunwayCrosswindSensor(HangarSensorBase):
             angle_rad = math.radians(wind_dir - rwy_heading)
             crosswind_kt = abs(wind_speed * math.sin(angle_rad))
             # Convert to user's preferred unit
-            crosswind_converted = convert_speed(
-                crosswind_kt, from_knots=True, to_preference=self._unit_preference)
+            crosswind_converted = self._units.speed_from_knots(crosswind_kt)
             return round(
                 crosswind_converted,
                 1) if crosswind_converted else None
@@ -1144,8 +1211,7 @@ class IdealRunwayCrosswindSensor(HangarSensorBase):
         if w_sensor and wd_sensor:
             self._source_entities = [w_sensor, wd_sensor]
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_speed_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.speed_unit
 
     @property
     def name(self) -> str:
@@ -1184,8 +1250,7 @@ class IdealRunwayCrosswindSensor(HangarSensorBase):
             return None
 
         # Convert to user's preferred unit
-        min_xwind_converted = convert_speed(
-            min_xwind, from_knots=True, to_preference=self._unit_preference)
+        min_xwind_converted = self._units.speed_from_knots(min_xwind)
         return round(min_xwind_converted, 1) if min_xwind_converted else None
 
 
@@ -1220,11 +1285,28 @@ class RunwaySuitabilitySensor(HangarSensorBase):
         wd_sensor = config.get("wind_dir_sensor")
         if w_sensor and wd_sensor:
             self._source_entities = [w_sensor, wd_sensor]
+        self._parsed_runways: tuple[str, list[tuple[str, int]]] | None = None
 
     @property
     def name(self) -> str:
         return "Runway Suitability"
 
+    def _runway_headings(self, runways_value: str) -> list[tuple[str, int]]:
+        """Parse the runway list once (runway identifier, heading)."""
+        cached = self._parsed_runways
+        if cached is not None and cached[0] == runways_value:
+            return cached[1]
+        headings = []
+        for runway in (r.strip() for r in runways_value.split(",")):
+            if not runway:
+                continue
+            try:
+                headings.append((runway, int(runway) * 10))
+            except (ValueError, TypeError):
+                continue
+        self._parsed_runways = (runways_value, headings)
+        return headings
+
     def _evaluate_runways(
             self) -> tuple[str | None, list[dict], float | None, float | None, float | None]:
         """Compute best runway and per-runway components.
@@ -1244,42 +1326,34 @@ class RunwaySuitabilitySensor(HangarSensorBase):
         if wind_dir is None or wind_speed is None:
             return None, [], None, wind_speed, wind_dir
 
-        runways = [r.strip() for r in runways_value.split(",") if r.strip()]
+        headings = self._runway_headings(runways_value)
+        crosswinds_kt: list[float] = []
+        headwinds_kt: list[float] = []
+        for _runway, heading in headings:
+            angle_rad = math.radians(wind_dir - heading)
+            crosswinds_kt.append(abs(wind_speed * math.sin(angle_rad)))
+            headwinds_kt.append(wind_speed * math.cos(angle_rad))
+
+        # One bulk conversion per component for the whole matrix
+        to_unit = self._units.speed_from_knots
+        crosswinds = to_unit.many(crosswinds_kt)
+        headwinds = to_unit.many(headwinds_kt)
+
         matrix: list[dict] = []
         best_runway = None
         min_crosswind = None
-
-        for runway in runways:
-            try:
-                heading = int(runway) * 10
-            except (ValueError, TypeError):
-                continue
-
+        for (runway, heading), crosswind_kt, crosswind, headwind in zip(
+                headings, crosswinds_kt, crosswinds, headwinds):
             angle_diff = abs((wind_dir - heading + 180) % 360 - 180)
-            angle_rad = math.radians(wind_dir - heading)
-            crosswind_kt = abs(wind_speed * math.sin(angle_rad))
-            headwind_kt = wind_speed * math.cos(angle_rad)
-
-            crosswind_unit = convert_speed(
-                crosswind_kt,
-                from_knots=True,
-                to_preference=self._unit_preference)
-            headwind_unit = convert_speed(
-                headwind_kt,
-                from_knots=True,
-                to_preference=self._unit_preference)
-            tailwind_unit = abs(
-                headwind_unit) if headwind_unit is not None and headwind_unit < 0 else 0
-
             matrix.append(
                 {
                     "runway": runway,
                     "heading": heading,
                     "angle_off": round(angle_diff, 1),
-                    "crosswind": round(crosswind_unit, 1) if crosswind_unit is not None else None,
-                    "headwind": round(headwind_unit, 1) if headwind_unit is not None else None,
-                    "tailwind": round(tailwind_unit, 1) if tailwind_unit else 0,
-                    "component_unit": get_speed_unit(self._unit_preference),
+                    "crosswind": round(crosswind, 1),
+                    "headwind": round(headwind, 1),
+                    "tailwind": round(-headwind, 1) if headwind < 0 else 0,
+                    "component_unit": to_unit.unit,
                 }
             )
 
@@ -1306,20 +1380,12 @@ class RunwaySuitabilitySensor(HangarSensorBase):
                     "runway_matrix": matrix,
                     "runways_evaluated": len(matrix),
                     "wind_direction": wind_dir,
-                    "wind_speed": convert_speed(
-                        wind_speed,
-                        from_knots=True,
-                        to_preference=self._unit_preference) if wind_speed is not None else None,
-                    "wind_unit": get_speed_unit(
-                        self._unit_preference),
+                    "wind_speed": self._units.speed_from_knots(wind_speed) if wind_speed is not None else None,
+                    "wind_unit": self._units.speed_unit,
                 })
 
             if min_crosswind is not None:
-                min_crosswind_unit = convert_speed(
-                    min_crosswind,
-                    from_knots=True,
-                    to_preference=self._unit_preference,
-                )
+                min_crosswind_unit = self._units.speed_from_knots(min_crosswind)
                 attrs["min_crosswind"] = round(
                     min_crosswind_unit, 1) if min_crosswind_unit is not None else None
 
@@ -1336,10 +1402,14 @@ class AIBriefingSensor(HangarSensorBase):
     Inputs:
         - Listens for 'hangar_assistant_ai_briefing' bus events
         - Event data includes: airfield_name, text (briefing content)
+        - Also listens for the started/failed events of
+          utils/briefing_stream.py, so a briefing in progress is shown as
+          "Generating" while the previous text stays visible
 
     Outputs:
-        - native_value: \"Ready\" or \"Waiting\" status
+        - native_value: \"Ready\", \"Generating\" or \"Waiting\" status
         - extra_state_attributes[\"briefing\"]: Full briefing text
+        - extra_state_attributes[\"generating\"]: True while a briefing is in progress
         - extra_state_attributes[\"last_updated\"]: Timestamp of last update
 
     Event Trigger:
@@ -1357,6 +1427,7 @@ class AIBriefingSensor(HangarSensorBase):
         super().__init__(hass, config, global_settings)
         self._briefing_text = "Waiting for first briefing..."
         self._last_update = None
+        self._generating = False
 
     @property
     def name(self) -> str:
@@ -1364,6 +1435,8 @@ class AIBriefingSensor(HangarSensorBase):
 
     @property
     def native_value(self) -> str:
+        if self._generating:
+            return "Generating"
         if self._last_update:
             return "Ready"
         return "Waiting"
@@ -1373,37 +1446,65 @@ class AIBriefingSensor(HangarSensorBase):
         attrs = super().extra_state_attributes
         attrs["last_updated"] = self._last_update
         attrs["briefing"] = self._briefing_text
+        attrs["generating"] = self._generating
         return attrs
 
     async def async_added_to_hass(self) -> None:
-        """Register for AI briefing events."""
+        """Restore the latest stored briefing and register for AI briefing events."""
         await super().async_added_to_hass()
 
-        @callback
-        def _handle_ai_update(event):
-            """Update state when a new AI briefing is received."""
-            if event.data.get("airfield_name") == self._config.get("name"):
-                self.async_update_briefing(event.data.get("text"))
-
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                "hangar_assistant_ai_briefing",
-                _handle_ai_update))
+        history = get_briefing_history(self.hass)
+        latest = history.latest(self._config.get("name")) if history else None
+        if latest and self._last_update is None:
+            self._briefing_text = latest["text"]
+            self._last_update = latest["generated_at"]
+
+        def _for_this_airfield(handler):
+            @callback
+            def _listener(event):
+                if event.data.get("airfield_name") == self._config.get("name"):
+                    handler(event)
+            return _listener
+
+        listeners = {
+            EVENT_AI_BRIEFING: lambda event: self.async_update_briefing(
+                event.data.get("text")),
+            EVENT_AI_BRIEFING_STARTED: lambda event: self.async_set_generating(),
+            EVENT_AI_BRIEFING_FAILED: lambda event: self.async_generation_failed(),
+        }
+        for event_type, handler in listeners.items():
+            self.async_on_remove(
+                self.hass.bus.async_listen(
+                    event_type, _for_this_airfield(handler)))
 
     @callback
     def async_update_briefing(self, briefing_text: str):
         """Update the sensor state with new AI text."""
         self._briefing_text = briefing_text
+        self._generating = False
         self._last_update = dt_util.now().isoformat()
         self.async_write_ha_state()
 
+    @callback
+    def async_set_generating(self):
+        """Mark a new briefing as in progress (previous text stays visible)."""
+        self._generating = True
+        self.async_write_ha_state()
+
+    @callback
+    def async_generation_failed(self):
+        """End a failed briefing; the last complete briefing stays shown."""
+        self._generating = False
+        self.async_write_ha_state()
+
 
 class AirfieldTimezoneSensor(HangarSensorBase):
     """Provide the local timezone identifier for an airfield.
 
-    Calculates the IANA timezone string from configured latitude/longitude using
-    timezonefinder, falling back to the Home Assistant configured timezone when
-    coordinates are missing or a lookup fails.
+    Reports the IANA timezone string for the configured latitude/longitude,
+    resolved once at setup by the shared timezone resolver (timezonefinder,
+    loaded lazily in the executor), falling back to the Home Assistant
+    configured timezone when coordinates are missing or a lookup fails.
 
     Inputs (from config):
         - latitude: Airfield latitude (float)
@@ -1427,51 +1528,15 @@ class AirfieldTimezoneSensor(HangarSensorBase):
         """Return the best-available timezone string for this airfield.
 
         Priority:
-            1. Coordinate-based lookup using TimezoneFinder (if available)
+            1. Zone resolved from the airfield coordinates at setup
             2. Home Assistant configured timezone
             3. UTC as final fallback
         """
-        lat = self._config.get("latitude")
-        lon = self._config.get("longitude")
-
-        # Check if TimezoneFinder is available and we have coordinates
-        if _TZ_FINDER is None:
-            _LOGGER.debug(
-                "TimezoneFinder not available, using Home Assistant timezone")
-        elif lat is not None and lon is not None:
-            # Attempt coordinate-based lookup
-            try:
-                tz_name = _TZ_FINDER.timezone_at(
-                    lat=float(lat), lng=float(lon))
-                if tz_name:
-                    self._tz_source = "airfield_coords"
-                    return tz_name
-                else:
-                    _LOGGER.debug(
-                        "No timezone found for coordinates %s/%s", lat, lon)
-            except (ValueError, TypeError) as exc:
-                _LOGGER.warning(
-                    "Invalid coordinates for timezone lookup: lat=%s, lon=%s: %s",
-                    lat,
-                    lon,
-                    exc)
-            except Exception as exc:  # pragma: no cover - defensive guard
-                _LOGGER.debug(
-                    "Timezone lookup failed for %s/%s: %s", lat, lon, exc)
-        else:
-            _LOGGER.debug(
-                "Coordinates not provided for airfield, using fallback timezone")
-
-        # Fall back to Home Assistant configured timezone
-        ha_tz = getattr(self.hass.config, "time_zone", None)
-        if ha_tz:
-            self._tz_source = "home_assistant"
-            return ha_tz
-
-        # Final fallback to UTC
-        _LOGGER.info("No timezone available, using UTC fallback for airfield")
-        self._tz_source = "utc_fallback"
-        return "UTC"
+        tz_name, self._tz_source = resolve_timezone(
+            self.hass,
+            self._config.get("latitude"),
+            self._config.get("longitude"))
+        return tz_name
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -1631,16 +1696,14 @@ class BestRunwaySensor(HangarSensorBase):
                 headwind_kt = wind_speed * math.cos(angle_rad)
 
                 # Convert to user's preferred unit
-                crosswind_converted = convert_speed(
-                    crosswind_kt, from_knots=True, to_preference=self._unit_preference)
-                headwind_converted = convert_speed(
-                    headwind_kt, from_knots=True, to_preference=self._unit_preference)
+                crosswind_converted = self._units.speed_from_knots(crosswind_kt)
+                headwind_converted = self._units.speed_from_knots(headwind_kt)
 
                 attrs["crosswind_component"] = round(
                     crosswind_converted, 1) if crosswind_converted else None
                 attrs["headwind_component"] = round(
                     headwind_converted, 1) if headwind_converted else None
-                attrs["wind_unit"] = get_speed_unit(self._unit_preference)
+                attrs["wind_unit"] = self._units.speed_unit
             except ValueError:
                 pass
 
@@ -1683,8 +1746,7 @@ class GroundRollSensor(HangarSensorBase):
             self._da_sensor_id = f"sensor.{slug}_density_altitude"
             self._source_entities = [self._da_sensor_id]
         # Set unit based on preference
-        self._attr_native_unit_of_measurement = get_altitude_unit(
-            self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.altitude_unit
 
     @property
     def name(self) -> str:
@@ -1711,15 +1773,13 @@ class GroundRollSensor(HangarSensorBase):
                 factor = 1 + (max(0, da_ft) / 1000) * 0.10
                 adjusted_m = base_m * factor
                 # Convert result to user's preferred unit
-                adjusted_converted = convert_altitude(
-                    adjusted_m, from_feet=False, to_preference=self._unit_preference)
+                adjusted_converted = self._units.altitude_from_meters(adjusted_m)
                 return round(
                     adjusted_converted) if adjusted_converted is not None else None
 
         # Fallback to a static safety factor if no DA is available
         adjusted_m = base_m * 1.15
-        adjusted_converted = convert_altitude(
-            adjusted_m, from_feet=False, to_preference=self._unit_preference)
+        adjusted_converted = self._units.altitude_from_meters(adjusted_m)
         return round(
             adjusted_converted) if adjusted_converted is not None else None
 
@@ -1832,26 +1892,152 @@ class PerformanceMarginSensor(HangarSensorBase):
         attrs.update(
             {
                 "runway_length_m": self._runway_length_m,
-                "runway_length_unit": get_altitude_unit(self._unit_preference),
+                "runway_length_unit": self._units.altitude_unit,
                 "airfield": self._airfield_name,
                 "recommended_runway": self._recommended_runway(),
             }
         )
 
         required_m = self._compute_required_distance_m()
-        required_unit = convert_altitude(
-            required_m,
-            from_feet=False,
-            to_preference=self._unit_preference)
+        required_unit = self._units.altitude_from_meters(required_m)
         attrs["required_distance"] = round(
             required_unit, 1) if required_unit is not None else None
-        attrs["required_distance_unit"] = get_altitude_unit(
-            self._unit_preference)
+        attrs["required_distance_unit"] = self._units.altitude_unit
         attrs["density_altitude_ft"] = round(self._get_da_feet(), 1)
 
         return attrs
 
 
+class FlyabilityTimelineSensor(HangarSensorBase):
+    """Hourly flyability scores for an aircraft at its linked airfield.
+
+    Keeps a utils/flyability.py timeline of scores (0-100) for the next 48
+    forecast hours, judged against the aircraft's crosswind limit on the
+    airfield's primary runway. The hourly forecast comes from the
+    OpenWeatherMap client, whose cache is shared with every other OWM user,
+    so polling costs an API call only when the cached forecast has expired.
+    Only forecast hours that are new or changed are rescored.
+
+    Inputs:
+        - OpenWeatherMap hourly forecast for the airfield's coordinates
+        - aircraft.max_xwind: Crosswind limit in knots (optional)
+        - airfield.primary_runway: Runway identifier for crosswind (optional)
+
+    Outputs:
+        - native_value: Score for the current hour
+        - Attributes: start, interval_minutes, scores (one per hour),
+          best_hour, best_score, next_flyable_hour
+
+    Used by:
+        - Dashboard planning charts
+    """
+
+    _attr_icon = "mdi:airplane-clock"
+    _attr_should_poll = True
+    # The hourly series changes with every forecast; keep it out of history
+    _unrecorded_attributes = frozenset({"scores", "rescored_hours"})
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        aircraft_config: dict,
+        airfield_config: dict,
+        global_settings: dict | None,
+        entry: ConfigEntry,
+    ):
+        super().__init__(hass, aircraft_config, global_settings)
+        # Preloaded at setup when OpenWeatherMap is enabled
+        from .utils.flyability import FlyabilityTimeline
+
+        self._entry = entry
+        self._airfield_name = airfield_config.get("name")
+        self._latitude = airfield_config.get("latitude")
+        self._longitude = airfield_config.get("longitude")
+        self._client = None
+        # Forecast list and hour last scored, to skip unchanged polls
+        self._scored: tuple[Any, int] | None = None
+
+        runway_heading = None
+        try:
+            runway_heading = int(
+                str(airfield_config.get("primary_runway", "")).strip()[:2]) * 10
+        except ValueError:
+            pass
+        try:
+            xwind_limit = float(aircraft_config.get("max_xwind") or 0) or None
+        except (TypeError, ValueError):
+            xwind_limit = None
+        self._timeline = FlyabilityTimeline(
+            crosswind_limit_kt=xwind_limit, runway_heading=runway_heading)
+
+    @property
+    def name(self) -> str:
+        return "Flyability Timeline"
+
+    def _owm_client(self):
+        """Return the OWM client, created on first use (None without a key)."""
+        if self._client is None:
+            # Preloaded at setup when OpenWeatherMap is enabled
+            from .utils.openweathermap import client_from_entry
+
+            self._client = client_from_entry(self.hass, self._entry)
+        return self._client
+
+    def _refresh_timeline(self, hourly: list[dict]) -> None:
+        """Rescore changed forecast hours from an OWM hourly forecast."""
+        # Preloaded at setup when OpenWeatherMap is enabled
+        from .utils.forecast_frame import ForecastFrame
+        from .utils.openweathermap import DEFAULT_UNITS, WIND_SPEED_UNITS
+
+        now = dt_util.utcnow()
+        scored = (hourly, int(now.timestamp() // 3600))
+        if self._scored is not None and (
+                self._scored[0] is hourly and self._scored[1] == scored[1]):
+            return  # Same cached forecast within the same hour
+        frame = ForecastFrame.from_forecast(
+            hourly, wind_unit=WIND_SPEED_UNITS[DEFAULT_UNITS])
+        rescored = self._timeline.update(frame, now)
+        self._scored = scored
+        _LOGGER.debug(
+            "Flyability for %s at %s: rescored %d of %d hours",
+            self._id_slug, self._airfield_name, rescored, len(self._timeline))
+
+    async def async_update(self) -> None:
+        """Fetch the (usually cached) OWM forecast and rescore it."""
+        if self._latitude is None or self._longitude is None:
+            _LOGGER.debug(
+                "No coordinates for %s; flyability timeline not updated",
+                self._airfield_name)
+            return
+        client = self._owm_client()
+        if client is None:
+            _LOGGER.debug("OpenWeatherMap API key not configured for flyability")
+            return
+
+        try:
+            data = await client.get_weather_data(
+                float(self._latitude), float(self._longitude))
+        except Exception as e:
+            _LOGGER.error(
+                "Failed to fetch forecast for %s flyability: %s",
+                self._airfield_name, e)
+            return
+        hourly = client.extract_hourly_forecast(data) if data else []
+        if hourly:
+            self._refresh_timeline(hourly)
+
+    @property
+    def native_value(self) -> float | None:
+        return self._timeline.score_at(dt_util.utcnow())
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        attrs = super().extra_state_attributes
+        attrs["airfield"] = self._airfield_name
+        attrs.update(self._timeline.as_attributes())
+        return attrs
+
+
 class PilotInfoSensor(HangarSensorBase):
     """Displays pilot qualification and license information.
 
@@ -2025,6 +2211,9 @@ class AirfieldNOTAMSensor(HangarSensorBase):
         notam_config = integrations.get("notams", {})
         cache_days = notam_config.get("cache_days", 7)
 
+        # Preloaded at setup when NOTAMs are enabled
+        from .utils.notam import NOTAMClient
+
         notam_client = NOTAMClient(self.hass, cache_days, self._entry)
 
         try:
@@ -2080,8 +2269,7 @@ class FuelBurnRateSensor(HangarSensorBase):
     
     def __init__(self, hass: HomeAssistant, config: dict, global_settings: dict | None = None):
         super().__init__(hass, config, global_settings)
-        from .utils.units import get_fuel_burn_rate_unit
-        self._attr_native_unit_of_measurement = get_fuel_burn_rate_unit(self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.fuel_burn_rate_unit
     
     @property
     def name(self) -> str:
@@ -2254,8 +2442,7 @@ class FuelWeightSensor(HangarSensorBase):
     
     def __init__(self, hass: HomeAssistant, config: dict, global_settings: dict | None = None):
         super().__init__(hass, config, global_settings)
-        from .utils.units import get_weight_unit
-        self._attr_native_unit_of_measurement = get_weight_unit(self._unit_preference)
+        self._attr_native_unit_of_measurement = self._units.weight_unit
     
     @property
     def name(self) -> str:
@@ -2264,7 +2451,7 @@ class FuelWeightSensor(HangarSensorBase):
     @property
     def native_value(self) -> float | None:
         """Return fuel weight in user's preferred units."""
-        from .utils.units import calculate_fuel_weight, convert_weight
+        from .utils.units import calculate_fuel_weight
         
         fuel_config = self._config.get("fuel", {})
         tank_capacity = fuel_config.get("tank_capacity", 0.0)
@@ -2278,7 +2465,7 @@ class FuelWeightSensor(HangarSensorBase):
         weight_kg = calculate_fuel_weight(tank_capacity, fuel_type, tank_capacity_unit)
         
         # Convert to user's preferred unit
-        weight = convert_weight(weight_kg, from_pounds=False, to_preference=self._unit_preference)
+        weight = self._units.weight_from_kg(weight_kg)
         
         return round(weight, 2) if weight else None
     
@@ -2921,3 +3108,79 @@ class IntegrationHealthSensor(SensorEntity):
         # State is computed from config entry data, no fetch needed
         pass
 
+
+class JobSchedulerSensor(SensorEntity):
+    """Expose run statistics of the integration's scheduled jobs.
+
+    State is the p95 run duration (seconds) of the slowest job, so an
+    automation can alert when briefings or NOTAM updates start to drag.
+
+    Attributes:
+        - jobs: {job name: {runs, failures, overlaps_skipped, running,
+          last_started, last_duration_s, avg/p50/p95/max_duration_s}}
+        - running_jobs: Names of jobs currently running
+
+    Example:
+        State: 4.2
+        Attributes:
+            jobs: {hourly_ai_briefings: {runs: 12, p95_duration_s: 4.2, ...}}
+            running_jobs: []
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = "mdi:timer-cog-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "s"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        scheduler: JobScheduler,
+    ):
+        """Initialize the job scheduler sensor.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry owning the scheduler
+            scheduler: The entry's job scheduler
+        """
+        self.hass = hass
+        self._scheduler = scheduler
+
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_job_scheduler"
+        self._attr_name = "Job Scheduler"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "hangar_assistant_system")},
+            name="Hangar Assistant System",
+            manufacturer="Hangar Assistant",
+            model="Integration Monitor",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Update whenever a job starts, finishes or is skipped."""
+        self.async_on_remove(
+            self._scheduler.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the slowest job's p95 duration in seconds."""
+        p95s = [
+            stats["p95_duration_s"]
+            for stats in self._scheduler.stats().values()
+            if "p95_duration_s" in stats
+        ]
+        return max(p95s) if p95s else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return per-job statistics."""
+        jobs = self._scheduler.stats()
+        return {
+            "jobs": jobs,
+            "running_jobs": [
+                name for name, stats in jobs.items() if stats["running"]],
+        }
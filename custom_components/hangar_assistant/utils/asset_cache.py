@@ -0,0 +1,201 @@
+"""In-memory cache for assets packaged with the integration.
+
+The AI briefing prompt, dashboard template and aviation reference texts
+ship inside the integration directory and only change when the integration
+is upgraded (or edited by a developer). They are read from disk once,
+parsed, and then served from memory to every caller. Each cached asset
+remembers the file's modification time; a cheap ``os.stat`` on access
+detects edits, and only then is the file read (and parsed) again.
+
+Names are paths relative to the integration directory, e.g.
+``prompts/preflight_brief.txt``. Text assets are returned as ``str`` and
+YAML assets as the parsed object. Parsed objects are shared between
+callers and must not be mutated.
+
+Usage:
+    # From the event loop: memory hit, or one executor job on a miss
+    prompt = await async_load_text_asset(hass, PREFLIGHT_PROMPT_ASSET)
+
+    # From code already running in the executor
+    template = load_yaml_asset(DASHBOARD_TEMPLATE_ASSET)
+"""
+
+import functools
+import logging
+import os
+import threading
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Packaged assets, relative to the integration directory
+PREFLIGHT_PROMPT_ASSET = "prompts/preflight_brief.txt"
+DASHBOARD_TEMPLATE_ASSET = "dashboard_templates/glass_cockpit.yaml"
+VFR_REFERENCE_ASSET = "references/vfr.txt"
+
+ASSET_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, kind) -> (mtime_ns, value)
+_ASSETS: dict[tuple[str, str], tuple[int, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def asset_path(name: str) -> str:
+    """Return the absolute path of a packaged asset.
+
+    Args:
+        name: Path relative to the integration directory
+
+    Returns:
+        Absolute file path
+    """
+    return os.path.join(ASSET_ROOT, *name.split("/"))
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class _ParseError(Exception):
+    """An asset was read but could not be parsed."""
+
+
+def _read_yaml(path: str) -> Any:
+    # Imported here: only the dashboard uses YAML assets, and this always
+    # runs in the executor
+    import yaml  # type: ignore
+
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise _ParseError(e) from e
+
+
+_READERS: dict[str, Callable[[str], Any]] = {
+    "text": _read_text,
+    "yaml": _read_yaml,
+}
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_cached_asset(name: str, kind: str = "text") -> Any | None:
+    """Return an asset from memory if the file is unchanged.
+
+    Only stats the file; never reads it, so it is safe to call from the
+    event loop.
+
+    Args:
+        name: Path relative to the integration directory
+        kind: "text" or "yaml"
+
+    Returns:
+        Cached value, or None if not cached or the file has changed
+    """
+    cached = _ASSETS.get((name, kind))
+    if cached is None:
+        return None
+    if _mtime_ns(asset_path(name)) != cached[0]:
+        return None
+    return cached[1]
+
+
+def _load_asset(name: str, kind: str) -> Any | None:
+    """Load an asset, reading the file only if it changed (blocking)."""
+    cached = get_cached_asset(name, kind)
+    if cached is not None:
+        return cached
+
+    path = asset_path(name)
+    with _LOCK:
+        mtime = _mtime_ns(path)
+        try:
+            value = _READERS[kind](path)
+        except FileNotFoundError:
+            _LOGGER.warning("Asset not found: %s", name)
+            return None
+        except _ParseError as e:
+            _LOGGER.error("YAML parsing error in asset %s: %s", name, e)
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            _LOGGER.error("Error reading asset %s: %s", name, e)
+            return None
+
+        if mtime is not None:
+            _ASSETS[(name, kind)] = (mtime, value)
+        _LOGGER.debug("Loaded asset %s (%s)", name, kind)
+        return value
+
+
+def load_text_asset(name: str) -> str | None:
+    """Load a packaged text asset (blocking; call from the executor).
+
+    Args:
+        name: Path relative to the integration directory
+
+    Returns:
+        File contents, or None if the file cannot be read
+    """
+    return _load_asset(name, "text")
+
+
+def load_yaml_asset(name: str) -> Any | None:
+    """Load and parse a packaged YAML asset (blocking; call from the executor).
+
+    Args:
+        name: Path relative to the integration directory
+
+    Returns:
+        Parsed YAML (shared; do not mutate), or None on error
+    """
+    return _load_asset(name, "yaml")
+
+
+async def _async_load_asset(
+        hass: HomeAssistant, name: str, kind: str) -> Any | None:
+    cached = get_cached_asset(name, kind)
+    if cached is not None:
+        return cached
+    return await hass.async_add_executor_job(
+        functools.partial(_load_asset, name, kind))
+
+
+async def async_load_text_asset(hass: HomeAssistant, name: str) -> str | None:
+    """Get a packaged text asset, using the executor only on a cache miss.
+
+    Args:
+        hass: Home Assistant instance
+        name: Path relative to the integration directory
+
+    Returns:
+        File contents, or None if the file cannot be read
+    """
+    return await _async_load_asset(hass, name, "text")
+
+
+async def async_load_yaml_asset(hass: HomeAssistant, name: str) -> Any | None:
+    """Get a parsed YAML asset, using the executor only on a cache miss.
+
+    Args:
+        hass: Home Assistant instance
+        name: Path relative to the integration directory
+
+    Returns:
+        Parsed YAML (shared; do not mutate), or None on error
+    """
+    return await _async_load_asset(hass, name, "yaml")
+
+
+def clear_asset_cache() -> None:
+    """Drop all cached assets (used by tests and after upgrades)."""
+    with _LOCK:
+        _ASSETS.clear()
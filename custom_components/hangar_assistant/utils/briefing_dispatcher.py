@@ -0,0 +1,256 @@
+"""Dispatcher for scheduled pilot briefings.
+
+Briefings configured for the same minute are sent together. For each
+group the dispatcher:
+1. Reads every sensor the group needs from the state machine once
+   (several pilots' briefings for the same airfield share one snapshot).
+2. Renders each recipient's subject and body from templates compiled at
+   import time.
+3. Sends all notifications concurrently, each with its own timeout, so a
+   club with forty 07:00 briefings finishes in one burst and a slow or
+   failing notify target only affects its own recipient.
+
+The default ``persistent_notification`` service has no concept of a
+recipient, so it receives one notification per briefing (as before). Any
+other notify service (e.g. an SMTP ``email`` notifier) gets one
+personalised notification per pilot, addressed with ``target``.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from string import Template
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from ..const import (
+    BRIEFING_NOTIFY_TIMEOUT_SECONDS,
+    DEFAULT_BRIEFING_NOTIFY_SERVICE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SUBJECT_TEMPLATE = Template("✈️ Hangar Briefing: $airfield / $aircraft")
+BODY_TEMPLATE = Template(
+    "Good morning $salutation.\n\n"
+    "Here is your automated safety briefing for $airfield:\n"
+    "- Density Altitude: $density_altitude ft\n"
+    "- Carb Icing Risk: $carb_risk\n"
+    "- Predicted Ground Roll ($aircraft): $ground_roll m\n\n"
+    "Fly safe!")
+
+# Services that cannot address individual recipients
+UNTARGETED_NOTIFY_SERVICES = frozenset({DEFAULT_BRIEFING_NOTIFY_SERVICE})
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
+def _briefing_entities(briefing: dict) -> dict[str, str]:
+    """Map template fields to the entity IDs a briefing reads."""
+    airfield = _slug(briefing["airfield_name"])
+    aircraft = _slug(briefing["aircraft_reg"])
+    return {
+        "density_altitude": f"sensor.{airfield}_density_altitude",
+        "carb_risk": f"sensor.{airfield}_carb_risk",
+        "ground_roll": f"sensor.{aircraft}_calculated_ground_roll",
+    }
+
+
+def parse_briefing_time(value: str) -> tuple[int, int]:
+    """Parse a briefing time (HH:MM or HH:MM:SS) into hour and minute.
+
+    Args:
+        value: Configured briefing time
+
+    Returns:
+        (hour, minute)
+
+    Raises:
+        ValueError: If the time is malformed
+    """
+    parts = value.split(":")
+    hour, minute = int(parts[0]), int(parts[1])
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid briefing time: {value}")
+    return hour, minute
+
+
+def group_briefings_by_time(
+    briefings: Iterable[dict],
+) -> dict[tuple[int, int], list[dict]]:
+    """Group briefings by the minute they are scheduled for.
+
+    Briefings with a malformed time are logged and skipped.
+
+    Args:
+        briefings: Configured briefings
+
+    Returns:
+        Mapping of (hour, minute) to the briefings due then
+    """
+    groups: dict[tuple[int, int], list[dict]] = {}
+    for briefing in briefings:
+        try:
+            key = parse_briefing_time(str(briefing.get("briefing_time", "")))
+        except (ValueError, IndexError):
+            _LOGGER.warning(
+                "Skipping briefing for %s with invalid time %r",
+                briefing.get("airfield_name"), briefing.get("briefing_time"))
+            continue
+        groups.setdefault(key, []).append(briefing)
+    return groups
+
+
+def build_snapshot(
+    hass: HomeAssistant, briefings: Iterable[dict]
+) -> dict[str, str]:
+    """Read every state the briefings need, once per entity.
+
+    Args:
+        hass: Home Assistant instance
+        briefings: Briefings about to be sent
+
+    Returns:
+        Mapping of entity ID to state ("N/A" when unavailable)
+    """
+    snapshot: dict[str, str] = {}
+    for briefing in briefings:
+        for entity_id in _briefing_entities(briefing).values():
+            if entity_id not in snapshot:
+                state = hass.states.get(entity_id)
+                snapshot[entity_id] = state.state if state else "N/A"
+    return snapshot
+
+
+def render_briefing(
+    briefing: dict,
+    snapshot: dict[str, str],
+    pilot_name: str | None = None,
+) -> tuple[str, str]:
+    """Render a briefing's subject and body.
+
+    Args:
+        briefing: Configured briefing
+        snapshot: Output of build_snapshot
+        pilot_name: Recipient to address, or None for a generic greeting
+
+    Returns:
+        (subject, body)
+    """
+    fields: dict[str, Any] = {
+        field: snapshot.get(entity_id, "N/A")
+        for field, entity_id in _briefing_entities(briefing).items()
+    }
+    fields.update(
+        airfield=briefing["airfield_name"],
+        aircraft=briefing["aircraft_reg"],
+        salutation=f"Captain {pilot_name}" if pilot_name else "Captain",
+    )
+    return (
+        SUBJECT_TEMPLATE.substitute(fields),
+        BODY_TEMPLATE.substitute(fields),
+    )
+
+
+def build_notifications(
+    briefings: Iterable[dict],
+    pilots: list[dict],
+    snapshot: dict[str, str],
+    notify_service: str = DEFAULT_BRIEFING_NOTIFY_SERVICE,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build the notify calls for a group of briefings.
+
+    Args:
+        briefings: Briefings due now
+        pilots: Configured pilots (``name`` and ``email``)
+        snapshot: Output of build_snapshot
+        notify_service: Notify service name (without ``notify.``)
+
+    Returns:
+        List of (label for logging, notify service data)
+    """
+    emails = {p.get("name"): p.get("email") for p in pilots}
+    notifications: list[tuple[str, dict[str, Any]]] = []
+    for briefing in briefings:
+        pilot_names = briefing.get("pilots", [])
+        if notify_service in UNTARGETED_NOTIFY_SERVICES:
+            subject, body = render_briefing(briefing, snapshot)
+            notifications.append((
+                briefing["airfield_name"],
+                {"title": subject, "message": body}))
+            continue
+
+        for name in pilot_names:
+            email = emails.get(name)
+            if not email:
+                _LOGGER.warning(
+                    "No email configured for pilot %s; skipping briefing", name)
+                continue
+            subject, body = render_briefing(briefing, snapshot, name)
+            notifications.append((
+                email,
+                {"title": subject, "message": body, "target": [email]}))
+    return notifications
+
+
+async def _async_notify(
+    hass: HomeAssistant,
+    notify_service: str,
+    label: str,
+    data: dict[str, Any],
+    timeout: float,
+) -> bool:
+    """Send one notification; never raises."""
+    try:
+        await asyncio.wait_for(
+            hass.services.async_call("notify", notify_service, data, blocking=True),
+            timeout)
+        return True
+    except asyncio.TimeoutError:
+        _LOGGER.error(
+            "Briefing to %s via notify.%s timed out after %ss",
+            label, notify_service, timeout)
+    except Exception as e:
+        _LOGGER.error(
+            "Failed to send briefing to %s via notify.%s: %s",
+            label, notify_service, e)
+    return False
+
+
+async def async_dispatch_briefings(
+    hass: HomeAssistant,
+    briefings: list[dict],
+    pilots: list[dict],
+    notify_service: str = DEFAULT_BRIEFING_NOTIFY_SERVICE,
+    timeout: float = BRIEFING_NOTIFY_TIMEOUT_SECONDS,
+) -> int:
+    """Send a group of briefings concurrently.
+
+    Args:
+        hass: Home Assistant instance
+        briefings: Briefings due now
+        pilots: Configured pilots
+        notify_service: Notify service name (without ``notify.``)
+        timeout: Seconds allowed per notification
+
+    Returns:
+        Number of notifications sent successfully
+    """
+    snapshot = build_snapshot(hass, briefings)
+    notifications = build_notifications(
+        briefings, pilots, snapshot, notify_service)
+    if not notifications:
+        return 0
+
+    results = await asyncio.gather(*(
+        _async_notify(hass, notify_service, label, data, timeout)
+        for label, data in notifications
+    ))
+    sent = sum(results)
+    _LOGGER.info(
+        "Sent %d of %d briefing notifications via notify.%s",
+        sent, len(notifications), notify_service)
+    return sent
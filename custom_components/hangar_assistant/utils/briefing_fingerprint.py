@@ -0,0 +1,237 @@
+"""Input fingerprints for skipping unchanged AI briefings.
+
+The hourly AI briefing run is the integration's most expensive operation:
+every airfield costs one LLM call. Most hours nothing a pilot would care
+about has changed, so each briefing's inputs are reduced to a canonical
+fingerprint and the LLM is only called again when the inputs differ
+materially from the ones the current briefing was generated from.
+
+A fingerprint has three parts:
+1. ``numeric``: the live sensor values a briefing depends on. These are
+   compared against per-field thresholds (e.g. density altitude ±200 ft,
+   wind ±3 kt) so sensor jitter does not trigger a regeneration. Values
+   are normalised to those units first: under the SI preference density
+   altitude and cloud base are reported in metres and runway wind
+   components in kph.
+2. ``categorical``: values that must match exactly, such as carburettor
+   icing risk, recommended runway, master safety alert, the IDs of CRITICAL
+   and HIGH NOTAMs, the forecast trend/overnight warnings and the system
+   prompt.
+3. ``digest``: a SHA-256 of the canonicalised inputs, giving a cheap
+   exact-match fast path.
+
+Fields that change every run without changing the advice (current time,
+weather data age, individual forecast points) are deliberately excluded.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Any
+
+from .units import KPH_TO_KNOTS, METERS_TO_FEET
+
+# Change in a numeric input that warrants a fresh briefing
+MATERIAL_THRESHOLDS: dict[str, float] = {
+    "da": 200.0,          # ft
+    "wind_speed": 3.0,    # kt
+    "wind_dir": 30.0,     # degrees
+    "crosswind": 3.0,     # kt
+    "headwind": 3.0,      # kt
+    "temp": 2.0,          # °C
+    "dp": 2.0,            # °C
+    "pressure": 2.0,      # hPa
+    "cloud_base": 500.0,  # ft
+}
+
+# Reported unit -> factor to the threshold unit above (ft, kt)
+_TO_THRESHOLD_UNITS: dict[str, float] = {
+    "m": METERS_TO_FEET,
+    "kph": KPH_TO_KNOTS,
+    "km/h": KPH_TO_KNOTS,
+}
+
+# Fields read from best runway attributes (unit in its "wind_unit" attribute)
+_RUNWAY_COMPONENT_FIELDS = frozenset({"crosswind", "headwind"})
+
+# Wind direction wraps at 360°, so it is compared on the circle
+CIRCULAR_FIELDS = frozenset({"wind_dir"})
+
+# Briefings are regenerated at least this often even when nothing changed
+DEFAULT_BRIEFING_MAX_AGE = timedelta(hours=3)
+
+# NOTAM criticalities that force a new briefing when they appear or clear
+MATERIAL_NOTAM_CRITICALITIES = ("CRITICAL", "HIGH")
+
+_NOTAM_LINE = re.compile(
+    r"^\S+ (" + "|".join(MATERIAL_NOTAM_CRITICALITIES) + r") - (\S+)")
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _state_value(value: Any) -> Any:
+    """Return the raw value of a State object or plain value."""
+    return getattr(value, "state", value)
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert a sensor value to float, or None when unavailable."""
+    try:
+        return float(_state_value(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _reported_unit(field: str, sensor_data: dict) -> str | None:
+    """Return the unit a field's value is reported in, if known."""
+    if field in _RUNWAY_COMPONENT_FIELDS:
+        source, attribute = sensor_data.get("best_rwy"), "wind_unit"
+    else:
+        source, attribute = sensor_data.get(field), "unit_of_measurement"
+    attributes = getattr(source, "attributes", None)
+    if not isinstance(attributes, dict):
+        return None
+    return attributes.get(attribute)
+
+
+def _normalised_value(field: str, sensor_data: dict) -> float | None:
+    """Return a numeric field in the units of MATERIAL_THRESHOLDS."""
+    value = _to_float(sensor_data.get(field))
+    if value is None:
+        return None
+    factor = _TO_THRESHOLD_UNITS.get(_reported_unit(field, sensor_data))
+    return value * factor if factor is not None else value
+
+
+def _notam_signature(notam_text: str) -> list[str]:
+    """Extract the sorted IDs of material NOTAMs from the briefing text."""
+    ids = set()
+    for line in notam_text.splitlines():
+        match = _NOTAM_LINE.match(line.strip())
+        if match:
+            ids.add(f"{match.group(1)}:{match.group(2)}")
+    return sorted(ids)
+
+
+def _forecast_signature(forecast_text: str) -> list[str]:
+    """Reduce forecast text to its trend, summary and overnight warnings.
+
+    Hourly forecast points are dropped (they shift every run), and numbers
+    in the remaining lines are masked so that, for example, a frost warning
+    moving from 1°C to 2°C does not count as a new warning.
+    """
+    signature = []
+    in_points = False
+    for raw_line in forecast_text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("### FORECAST TO"):
+            continue
+        if line.startswith("Key Forecast Points"):
+            in_points = True
+            continue
+        if in_points and raw_line.startswith("  ") and not line.startswith("-"):
+            continue
+        in_points = False
+        signature.append(_NUMBER.sub("#", line))
+    return signature
+
+
+def build_briefing_fingerprint(
+    system_instructions: str,
+    sensor_data: dict,
+    notam_text: str,
+    forecast_text: str,
+    now: datetime,
+) -> dict[str, Any]:
+    """Build the fingerprint of one airfield's briefing inputs.
+
+    Args:
+        system_instructions: System prompt text
+        sensor_data: Sensor data as returned by _gather_airfield_sensor_data
+        notam_text: Formatted NOTAM text used in the prompt
+        forecast_text: Formatted forecast text used in the prompt
+        now: Time the inputs were gathered
+
+    Returns:
+        Dict with ``digest``, ``numeric``, ``categorical`` and ``created_at``
+    """
+    numeric = {
+        field: _normalised_value(field, sensor_data)
+        for field in MATERIAL_THRESHOLDS
+    }
+    safety_alert = _state_value(sensor_data.get("safety_alert"))
+    categorical = {
+        "carb": str(_state_value(sensor_data.get("carb"))),
+        "runway": str(sensor_data.get("runway_number")),
+        "runway_length": str(sensor_data.get("runway_length")),
+        "safety_alert": safety_alert == "on",
+        "notams": _notam_signature(notam_text),
+        "forecast": _forecast_signature(forecast_text),
+        "prompt": hashlib.sha256(
+            system_instructions.encode("utf-8")).hexdigest(),
+    }
+    # Unavailable sensors are categorical too: losing one must be noticed
+    categorical["unavailable"] = sorted(
+        field for field, value in numeric.items() if value is None)
+
+    canonical = json.dumps(
+        {"numeric": numeric, "categorical": categorical},
+        sort_keys=True,
+        separators=(",", ":"))
+    return {
+        "digest": hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        "numeric": numeric,
+        "categorical": categorical,
+        "created_at": now,
+    }
+
+
+def _numeric_delta(field: str, old: float, new: float) -> float:
+    """Return the absolute change of a numeric field."""
+    delta = abs(new - old)
+    if field in CIRCULAR_FIELDS:
+        delta %= 360.0
+        delta = min(delta, 360.0 - delta)
+    return delta
+
+
+def material_change_reason(
+    previous: dict[str, Any] | None,
+    current: dict[str, Any],
+    max_age: timedelta = DEFAULT_BRIEFING_MAX_AGE,
+) -> str | None:
+    """Explain why a briefing needs regenerating.
+
+    Args:
+        previous: Fingerprint the current briefing was generated from
+        current: Fingerprint of the latest inputs
+        max_age: Regenerate anyway once the previous briefing is this old
+
+    Returns:
+        Short human-readable reason, or None if the change is immaterial
+    """
+    if previous is None:
+        return "no previous briefing"
+
+    created_at = previous.get("created_at")
+    if created_at is not None and current["created_at"] - created_at >= max_age:
+        return "previous briefing expired"
+
+    if previous.get("digest") == current["digest"]:
+        return None
+
+    previous_categorical = previous.get("categorical", {})
+    for field, value in current["categorical"].items():
+        if previous_categorical.get(field) != value:
+            return f"{field} changed"
+
+    previous_numeric = previous.get("numeric", {})
+    for field, threshold in MATERIAL_THRESHOLDS.items():
+        old = previous_numeric.get(field)
+        new = current["numeric"].get(field)
+        if old is None or new is None:
+            continue  # Availability changes are caught as categorical
+        if _numeric_delta(field, old, new) >= threshold:
+            return f"{field} changed by {_numeric_delta(field, old, new):g}"
+
+    return None
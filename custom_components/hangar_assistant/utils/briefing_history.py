@@ -0,0 +1,218 @@
+"""Persisted, size-bounded history of AI briefings.
+
+Every completed AI briefing is recorded per airfield, so briefings survive
+restarts (the briefing sensor restores the latest one on start-up) and
+earlier briefings can be looked up through the ``get_briefing_history``
+service without asking the AI agent to regenerate anything.
+
+Storage layout (Home Assistant ``Store``, ``.storage/hangar_assistant.
+briefing_history``)::
+
+    {
+        "Popham": {
+            "ts": [1767258000.0, 1767261600.0],   # ascending epoch seconds
+            "text": ["eJzL...", "eJzT..."]          # zlib + base64
+        }
+    }
+
+Timestamps are kept sorted in a plain list so "latest N" is a slice and
+"briefing in effect at time T" is a ``bisect``. Text is compressed (AI
+briefings are repetitive prose and shrink 2-3x) and only decompressed
+when read. Each airfield keeps at most ``max_entries`` briefings; older
+ones are dropped as new ones arrive. Saves are delayed and coalesced.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import logging
+import zlib
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.briefing_history"
+STORAGE_VERSION = 1
+
+# Briefings kept per airfield (two days of hourly briefings)
+DEFAULT_MAX_BRIEFINGS_PER_AIRFIELD = 48
+
+# Coalesce bursts of briefings (one per airfield each hour) into one write
+SAVE_DELAY_SECONDS = 30
+
+# hass.data[DOMAIN] key holding the shared BriefingHistory
+BRIEFING_HISTORY_KEY = "briefing_history"
+
+
+def _compress(text: str) -> str:
+    return base64.b64encode(zlib.compress(text.encode("utf-8"))).decode("ascii")
+
+
+def _decompress(blob: str) -> str:
+    return zlib.decompress(base64.b64decode(blob)).decode("utf-8")
+
+
+def _record(timestamp: float, blob: str) -> dict[str, str]:
+    return {
+        "generated_at": datetime.fromtimestamp(
+            timestamp, tz=timezone.utc).isoformat(),
+        "text": _decompress(blob),
+    }
+
+
+class BriefingHistory:
+    """Per-airfield, time-indexed store of AI briefing texts."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_entries: int = DEFAULT_MAX_BRIEFINGS_PER_AIRFIELD,
+        store: Any | None = None,
+    ) -> None:
+        """Initialise the history.
+
+        Args:
+            hass: Home Assistant instance
+            max_entries: Briefings kept per airfield
+            store: Storage backend (defaults to a Home Assistant Store)
+        """
+        self._hass = hass
+        self._max_entries = max(1, max_entries)
+        self._store = store or storage.Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, dict[str, list]] = {}
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the persisted history has been loaded."""
+        return self._loaded
+
+    async def async_load(self) -> None:
+        """Load the persisted history (once)."""
+        if self._loaded:
+            return
+        try:
+            data = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.error("Error loading briefing history: %s", e)
+            data = None
+
+        if isinstance(data, dict):
+            for airfield, series in data.items():
+                if (isinstance(series, dict)
+                        and len(series.get("ts", [])) == len(series.get("text", []))):
+                    self._data[airfield] = {
+                        "ts": list(series["ts"]), "text": list(series["text"])}
+        self._loaded = True
+
+    def add(
+        self, airfield_name: str, text: str, generated_at: datetime
+    ) -> None:
+        """Record a completed briefing.
+
+        Args:
+            airfield_name: Airfield the briefing is for
+            text: Briefing text
+            generated_at: When the briefing was generated (timezone-aware)
+        """
+        if not text:
+            return
+        series = self._data.setdefault(airfield_name, {"ts": [], "text": []})
+        timestamp = generated_at.timestamp()
+        index = bisect.bisect_right(series["ts"], timestamp)
+        series["ts"].insert(index, timestamp)
+        series["text"].insert(index, _compress(text))
+
+        excess = len(series["ts"]) - self._max_entries
+        if excess > 0:
+            del series["ts"][:excess]
+            del series["text"][:excess]
+
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+    def latest(self, airfield_name: str) -> dict[str, str] | None:
+        """Return the most recent briefing for an airfield.
+
+        Args:
+            airfield_name: Airfield name
+
+        Returns:
+            Dict with ``generated_at`` (ISO 8601) and ``text``, or None
+        """
+        recent = self.recent(airfield_name, 1)
+        return recent[0] if recent else None
+
+    def recent(self, airfield_name: str, limit: int) -> list[dict[str, str]]:
+        """Return up to ``limit`` briefings for an airfield, newest first.
+
+        Args:
+            airfield_name: Airfield name
+            limit: Maximum number of briefings
+
+        Returns:
+            List of dicts with ``generated_at`` and ``text``
+        """
+        series = self._data.get(airfield_name)
+        if not series or limit < 1:
+            return []
+        start = max(0, len(series["ts"]) - limit)
+        return [
+            _record(series["ts"][i], series["text"][i])
+            for i in range(len(series["ts"]) - 1, start - 1, -1)
+        ]
+
+    def at(self, airfield_name: str, when: datetime) -> dict[str, str] | None:
+        """Return the briefing that was current at a given time.
+
+        Args:
+            airfield_name: Airfield name
+            when: Point in time (timezone-aware)
+
+        Returns:
+            The latest briefing generated at or before ``when``, or None
+        """
+        series = self._data.get(airfield_name)
+        if not series:
+            return None
+        index = bisect.bisect_right(series["ts"], when.timestamp()) - 1
+        if index < 0:
+            return None
+        return _record(series["ts"][index], series["text"][index])
+
+    def airfields(self) -> list[str]:
+        """Return the airfields with recorded briefings."""
+        return sorted(self._data)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now (e.g. on unload)."""
+        if self._loaded:
+            await self._store.async_save(self._data)
+
+
+def get_briefing_history(hass: HomeAssistant) -> BriefingHistory | None:
+    """Get the shared briefing history, creating it on first use.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared BriefingHistory, or None when hass.data is unavailable
+        (as in unit tests)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return None
+
+    domain_data = hass_data.setdefault(DOMAIN, {})
+    history = domain_data.get(BRIEFING_HISTORY_KEY)
+    if history is None:
+        history = BriefingHistory(hass)
+        domain_data[BRIEFING_HISTORY_KEY] = history
+    return history
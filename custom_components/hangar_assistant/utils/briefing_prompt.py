@@ -0,0 +1,253 @@
+"""Sectioned prompt builder for AI pre-flight briefings.
+
+A briefing prompt is assembled from three kinds of section:
+1. Static: the system instructions plus the airfield's fixed details
+   (ICAO, coordinates, elevation, timezone). These only change when the
+   prompt file or configuration changes, so the assembled prefix is cached
+   per airfield and reused every hour.
+2. Per-cycle: current weather, NOTAMs and forecast, rebuilt each run.
+3. Closing instruction, a constant.
+
+The NOTAM section is the one that can grow without bound (a busy airfield
+can have dozens of obstacle and lighting NOTAMs), so it is capped to a
+token budget. Detail is kept by criticality: CRITICAL and HIGH NOTAMs keep
+their full text, MEDIUM keep their validity, LOW are listed by ID only, and
+whatever still does not fit is summarised as a count. CRITICAL and HIGH
+header lines are never dropped.
+"""
+
+import functools
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .qcode_parser import NOTAMCriticality
+
+# Rough token estimate for English/markdown text sent to LLMs
+CHARS_PER_TOKEN = 4
+
+# Token budget for the NOTAM section of one briefing prompt
+NOTAM_SECTION_TOKEN_BUDGET = 800
+
+# Characters of free text kept per CRITICAL/HIGH NOTAM
+NOTAM_DETAIL_CHARS = 200
+
+CLOSING_INSTRUCTION = (
+    "Please provide the briefing based on this data following the CFI "
+    "morning brief format specified.")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@functools.lru_cache(maxsize=32)
+def build_static_prefix(
+    system_instructions: str,
+    airfield_name: str,
+    icao: str,
+    latitude: Any,
+    longitude: Any,
+    elevation: Any,
+    tz_value: str,
+) -> str:
+    """Build the cached, per-airfield static part of the prompt.
+
+    Args:
+        system_instructions: System prompt text
+        airfield_name: Name of airfield
+        icao: ICAO code
+        latitude: Airfield latitude
+        longitude: Airfield longitude
+        elevation: Airfield elevation in metres
+        tz_value: Airfield timezone
+
+    Returns:
+        Prompt prefix ending inside the airfield information block
+    """
+    return (
+        f"{system_instructions}\n\n"
+        f"### LIVE DATA FOR {airfield_name} ({icao}):\n"
+        f"**Airfield Information:**\n"
+        f"- ICAO: {icao}\n"
+        f"- Coordinates: {latitude}, {longitude}\n"
+        f"- Elevation: {elevation} m\n"
+        f"- Timezone: {tz_value}\n")
+
+
+def _state(sensor_data: dict, key: str) -> Any:
+    """Return a sensor's state, or 'unknown' if it is missing."""
+    value = sensor_data.get(key)
+    return value.state if value else "unknown"
+
+
+def build_conditions_section(
+    sensor_data: dict,
+    sunrise_time: str,
+    sunset_time: str,
+    now: datetime,
+) -> str:
+    """Build the per-cycle runway, time and current weather section.
+
+    Args:
+        sensor_data: Sensor data as returned by _gather_airfield_sensor_data
+        sunrise_time: Formatted sunrise time
+        sunset_time: Formatted sunset time
+        now: Current datetime
+
+    Returns:
+        Section text
+    """
+    crosswind = sensor_data.get("crosswind") or "unknown"
+    headwind = sensor_data.get("headwind") or "unknown"
+    safety_alert = sensor_data.get("safety_alert")
+    alert_text = (
+        "ACTIVE ⚠️" if safety_alert and safety_alert.state == "on" else "OK ✓")
+
+    return (
+        f"- Runway: {sensor_data.get('runway_number', 'unknown')} - "
+        f"{sensor_data.get('runway_length', 'unknown')}m\n"
+        f"- Current Time: {now.strftime('%H:%M %Z')}\n"
+        f"- Sunrise: {sunrise_time} | Sunset: {sunset_time}\n\n"
+        f"**Current Weather:**\n"
+        f"- Wind: {_state(sensor_data, 'wind_speed')}kt at "
+        f"{_state(sensor_data, 'wind_dir')}°\n"
+        f"- Crosswind: {crosswind}kt | Headwind: {headwind}kt\n"
+        f"- Temperature: {_state(sensor_data, 'temp')}°C | "
+        f"Dew Point: {_state(sensor_data, 'dp')}°C\n"
+        f"- Pressure: {_state(sensor_data, 'pressure')} hPa\n"
+        f"- Cloud Base (Est): {_state(sensor_data, 'cloud_base')} ft AGL\n"
+        f"- Density Altitude: {_state(sensor_data, 'da')} ft\n"
+        f"- Carburettor Icing Risk: {_state(sensor_data, 'carb')}\n"
+        f"- Recommended Runway: {sensor_data.get('runway_number', 'unknown')}\n"
+        f"- Weather Data Age: {_state(sensor_data, 'weather_age')} minutes\n"
+        f"- Master Safety Alert: {alert_text}\n\n")
+
+
+def _notam_blocks(notam: dict) -> "tuple[NOTAMCriticality, str, str]":
+    """Return a NOTAM's criticality, header line and detail lines."""
+    # Preloaded at setup when NOTAMs are enabled
+    from .qcode_parser import NOTAMCriticality, get_criticality_emoji
+
+    parsed = notam.get("parsed_qcode", {})
+    criticality = parsed.get("criticality", NOTAMCriticality.LOW)
+    header = (
+        f"\n{get_criticality_emoji(criticality)} {criticality.name} - "
+        f"{notam.get('id', 'Unknown')} ({notam.get('location', 'Unknown')}) - "
+        f"{parsed.get('category', 'UNKNOWN')}")
+    valid = (
+        f"\n  Valid: {notam.get('start_time', 'Unknown')} to "
+        f"{notam.get('end_time', 'Unknown')}")
+
+    if criticality in (NOTAMCriticality.CRITICAL, NOTAMCriticality.HIGH):
+        text = notam.get("text", "No details")
+        detail = (
+            f"\n  Q-code: {notam.get('q_code', 'N/A')} - "
+            f"{parsed.get('description', '')}"
+            f"{valid}"
+            f"\n  Details: {text[:NOTAM_DETAIL_CHARS]}..."
+            f"\n")
+    elif criticality == NOTAMCriticality.MEDIUM:
+        detail = valid
+    else:
+        detail = ""
+    return criticality, header, detail
+
+
+def build_notam_section(
+    notams_data: list[dict],
+    notam_radius: int,
+    token_budget: int = NOTAM_SECTION_TOKEN_BUDGET,
+) -> str:
+    """Format NOTAMs for the prompt, trimmed to a token budget.
+
+    Args:
+        notams_data: NOTAMs with ``parsed_qcode``, sorted most critical first
+        notam_radius: NOTAM radius in nm
+        token_budget: Maximum estimated tokens for the section
+
+    Returns:
+        Formatted NOTAM text
+    """
+    # Preloaded at setup when NOTAMs are enabled
+    from .qcode_parser import NOTAMCriticality
+
+    counts = {level.name: 0 for level in NOTAMCriticality}
+    blocks = []
+    for notam in notams_data:
+        criticality, header, detail = _notam_blocks(notam)
+        counts[criticality.name] += 1
+        blocks.append((criticality, header, detail))
+
+    summary = (
+        f"{len(notams_data)} NOTAMs within {notam_radius}nm:"
+        f" {counts['CRITICAL']}🔴 CRITICAL, {counts['HIGH']}🟠 HIGH,"
+        f" {counts['MEDIUM']}🟡 MEDIUM, {counts['LOW']}⚪ LOW")
+
+    # CRITICAL and HIGH headers are always kept, so reserve room for them
+    essential = (NOTAMCriticality.CRITICAL, NOTAMCriticality.HIGH)
+    used = estimate_tokens(summary) + sum(
+        estimate_tokens(header)
+        for criticality, header, _ in blocks if criticality in essential)
+
+    parts = [summary]
+    omitted = 0
+    for criticality, header, detail in blocks:
+        if criticality in essential:
+            detail_tokens = estimate_tokens(detail)
+            if used + detail_tokens <= token_budget:
+                parts.append(header + detail)
+                used += detail_tokens
+            else:
+                parts.append(header)
+            continue
+
+        block_tokens = estimate_tokens(header + detail)
+        if used + block_tokens <= token_budget:
+            parts.append(header + detail)
+            used += block_tokens
+        else:
+            omitted += 1
+
+    if omitted:
+        parts.append(
+            f"\n(+{omitted} lower-priority NOTAMs omitted for brevity)")
+    return "".join(parts)
+
+
+def assemble_briefing_prompt(
+    static_prefix: str,
+    conditions: str,
+    notam_text: str,
+    notam_radius: int,
+    forecast_text: str,
+) -> str:
+    """Concatenate prompt sections into the final prompt.
+
+    Args:
+        static_prefix: Output of build_static_prefix
+        conditions: Output of build_conditions_section
+        notam_text: Formatted NOTAM text
+        notam_radius: NOTAM radius in nm
+        forecast_text: Formatted forecast text
+
+    Returns:
+        Complete prompt string
+    """
+    return "".join((
+        static_prefix,
+        conditions,
+        f"**NOTAMs ({notam_radius}nm radius):**\n",
+        f"{notam_text}\n\n",
+        "**FORECAST:**\n",
+        f"{forecast_text}\n\n",
+        CLOSING_INSTRUCTION,
+    ))
@@ -0,0 +1,121 @@
+"""Delivery of AI briefings to sensors and TTS.
+
+A briefing is delivered through bus events, all carrying ``airfield_name``:
+1. EVENT_AI_BRIEFING_STARTED when a request is sent to the agent, so the
+   briefing sensor can show that a new briefing is on its way.
+2. EVENT_AI_BRIEFING with the complete text (unchanged from earlier
+   versions, so existing automations keep working), or
+   EVENT_AI_BRIEFING_FAILED if no briefing could be produced.
+
+Home Assistant's ``conversation.process`` service returns the complete
+answer in one response, so there is no partial text to publish.
+
+For speech, ``chunk_for_speech`` splits a briefing at paragraph and
+sentence boundaries so the first chunk can be synthesised and played
+while the rest is queued, instead of synthesising the whole briefing
+before the first word is heard.
+"""
+
+import re
+
+from homeassistant.core import HomeAssistant
+
+EVENT_AI_BRIEFING = "hangar_assistant_ai_briefing"
+EVENT_AI_BRIEFING_STARTED = "hangar_assistant_ai_briefing_started"
+EVENT_AI_BRIEFING_FAILED = "hangar_assistant_ai_briefing_failed"
+
+# Target size of one spoken chunk; the first chunk is kept short so
+# speech starts quickly
+FIRST_SPEECH_CHUNK_CHARS = 200
+SPEECH_CHUNK_CHARS = 600
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class BriefingStream:
+    """Deliver one airfield's briefing: started, then finished or failed."""
+
+    def __init__(self, hass: HomeAssistant, airfield_name: str) -> None:
+        """Initialise the stream.
+
+        Args:
+            hass: Home Assistant instance
+            airfield_name: Airfield the briefing is for
+        """
+        self._hass = hass
+        self._airfield_name = airfield_name
+        self._finished = False
+
+    def start(self) -> None:
+        """Announce that a briefing request has been sent."""
+        self._finished = False
+        self._hass.bus.async_fire(
+            EVENT_AI_BRIEFING_STARTED, {"airfield_name": self._airfield_name})
+
+    def finish(self, text: str) -> str:
+        """Publish the complete briefing.
+
+        Args:
+            text: Complete briefing text
+
+        Returns:
+            The final briefing text
+        """
+        self._finished = True
+        self._hass.bus.async_fire(EVENT_AI_BRIEFING, {
+            "airfield_name": self._airfield_name,
+            "text": text,
+        })
+        return text
+
+    def fail(self) -> None:
+        """Announce that the briefing could not be produced.
+
+        Does nothing if the briefing already finished, so it is safe to call
+        from cleanup code.
+        """
+        if self._finished:
+            return
+        self._finished = True
+        self._hass.bus.async_fire(
+            EVENT_AI_BRIEFING_FAILED, {"airfield_name": self._airfield_name})
+
+
+def chunk_for_speech(
+    text: str,
+    first_chunk_chars: int = FIRST_SPEECH_CHUNK_CHARS,
+    chunk_chars: int = SPEECH_CHUNK_CHARS,
+) -> list[str]:
+    """Split a briefing into chunks for incremental speech.
+
+    Splits at paragraph, then sentence boundaries. A single sentence longer
+    than the limit is kept whole rather than cut mid-sentence.
+
+    Args:
+        text: Briefing text
+        first_chunk_chars: Target size of the first chunk
+        chunk_chars: Target size of the remaining chunks
+
+    Returns:
+        Non-empty text chunks in speaking order
+    """
+    sentences = [
+        sentence
+        for paragraph in re.split(r"\n\s*\n", text)
+        for sentence in _SENTENCE_END.split(" ".join(paragraph.split()))
+        if sentence
+    ]
+
+    chunks: list[str] = []
+    current = ""
+    for sentence in sentences:
+        limit = chunk_chars if chunks else first_chunk_chars
+        candidate = f"{current} {sentence}" if current else sentence
+        if current and len(candidate) > limit:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,558 @@
+"""Persistent storage backends for the unified cache manager.
+
+CacheManager keeps the memory LRU, TTL and statistics logic; a backend only
+stores serialized ``CacheEntry.to_dict()`` payloads for one namespace.
+Backend methods are blocking and are always run in the executor.
+
+Backends:
+- ``JsonFileBackend`` ("json"): one ``<key>.json`` file per entry under
+  ``hangar_assistant_cache/<namespace>/`` (default, human-readable). Files
+  are written to a temporary name and renamed into place, so an interrupted
+  write never leaves a truncated JSON file behind.
+- ``SQLiteBackend`` ("sqlite"): one shared ``hangar_assistant_cache/cache.sqlite3``
+  database in WAL mode with a ``(namespace, key)`` primary key and an expiry
+  index. Batched reads/writes run in a single transaction, and cleanup is one
+  indexed ``DELETE`` instead of a directory walk. Suited to namespaces with
+  many small, frequently rewritten entries on SD-card hosts.
+
+Example:
+    backend = create_backend("sqlite", Path("/config/hangar_assistant_cache"), "checkwx")
+    backend.write_many({"metar_EGHP_decoded": entry.to_dict()})
+    payloads = backend.read_many(["metar_EGHP_decoded"])
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Try to import orjson for 2-5x faster JSON operations
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKEND_JSON = "json"
+BACKEND_SQLITE = "sqlite"
+SUPPORTED_BACKENDS = (BACKEND_JSON, BACKEND_SQLITE)
+
+SQLITE_FILENAME = "cache.sqlite3"
+
+# Errors a backend operation may raise for unreadable/unwritable storage
+BACKEND_ERRORS = (OSError, ValueError, TypeError, KeyError, sqlite3.Error)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to JSON bytes (orjson when available).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize JSON bytes (orjson when available).
+
+    Args:
+        data: JSON bytes
+
+    Returns:
+        Deserialized data
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _expiry_timestamp(payload: Dict[str, Any]) -> Optional[float]:
+    """Extract the expiry of a serialized entry as a POSIX timestamp.
+
+    Args:
+        payload: ``CacheEntry.to_dict()`` output
+
+    Returns:
+        Expiry timestamp, or None if the entry never expires
+    """
+    expires_at = payload.get("expires_at")
+    if not expires_at:
+        return None
+    return datetime.fromisoformat(expires_at).timestamp()
+
+
+class CacheBackend:
+    """Base class for persistent cache storage.
+
+    Subclasses store ``CacheEntry.to_dict()`` payloads keyed by cache key.
+    All methods are blocking and must be run in the executor.
+
+    Attributes:
+        name: Backend identifier ("json" or "sqlite")
+        storage_dir: Directory that must exist before writing
+    """
+
+    name = ""
+
+    def __init__(self, root_dir: Path, namespace: str) -> None:
+        """Initialize backend.
+
+        Args:
+            root_dir: Cache root directory (e.g. /config/hangar_assistant_cache)
+            namespace: Cache namespace
+        """
+        self.root_dir = root_dir
+        self.namespace = namespace
+        self.storage_dir = root_dir
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read one payload (None if missing)."""
+        raise NotImplementedError
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several payloads; missing or corrupt keys are omitted."""
+        payloads: Dict[str, Dict[str, Any]] = {}
+        for key in keys:
+            try:
+                payload = self.read(key)
+            except (OSError, ValueError, TypeError) as e:
+                _LOGGER.warning("Failed to read cache %s/%s: %s", self.namespace, key, e)
+                continue
+            if payload is not None:
+                payloads[key] = payload
+        return payloads
+
+    def read_all(self, now: datetime) -> Dict[str, Dict[str, Any]]:
+        """Read every payload in the namespace that has not expired.
+
+        Used to warm the memory cache at startup in a single job.
+
+        Args:
+            now: Current time; payloads expiring at or before it are skipped
+
+        Returns:
+            Dict of cache key to payload
+        """
+        raise NotImplementedError
+
+    def write(self, key: str, payload: Dict[str, Any]) -> None:
+        """Write one payload."""
+        self.write_many({key: payload})
+
+    def write_many(self, payloads: Dict[str, Dict[str, Any]]) -> None:
+        """Write several payloads."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Delete one payload (no error if missing)."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Delete every payload in the namespace."""
+        raise NotImplementedError
+
+    def delete_expired(self, now: datetime) -> int:
+        """Delete payloads that expired before ``now``.
+
+        Returns:
+            Number of payloads removed
+        """
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Number of stored payloads in the namespace."""
+        raise NotImplementedError
+
+    def size(self, key: str) -> int:
+        """Stored size of one payload in bytes (0 if missing)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources (connections, handles)."""
+
+
+class JsonFileBackend(CacheBackend):
+    """One JSON file per entry under ``<root>/<namespace>/``."""
+
+    name = BACKEND_JSON
+
+    def __init__(self, root_dir: Path, namespace: str) -> None:
+        """Initialize JSON file backend.
+
+        Args:
+            root_dir: Cache root directory
+            namespace: Cache namespace (subdirectory name)
+        """
+        super().__init__(root_dir, namespace)
+        self.storage_dir = root_dir / namespace
+
+    def file_path(self, key: str) -> Path:
+        """Get the file path for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to the cache file
+        """
+        # Comprehensive sanitization for safe filename
+        # Remove all characters except alphanumeric, underscore, hyphen, and period
+        safe_key = re.sub(r'[^a-zA-Z0-9_.-]', '_', key)
+
+        # Prevent path traversal attacks
+        safe_key = safe_key.replace("..", "_")
+
+        # Limit length to prevent filesystem issues
+        if len(safe_key) > 200:
+            safe_key = safe_key[:200]
+
+        return self.storage_dir / f"{safe_key}.json"
+
+    def _files(self) -> List[Path]:
+        if not self.storage_dir.exists():
+            return []
+        return list(self.storage_dir.glob("*.json"))
+
+    @staticmethod
+    def _temp_path(cache_file: Path) -> Path:
+        # Hidden and not ending in .json, so never picked up by _files()
+        return cache_file.with_name(f".{cache_file.name}.tmp")
+
+    def _sync_dir(self) -> None:
+        """Persist the directory entries of a batch of renames (one fsync)."""
+        try:
+            fd = os.open(self.storage_dir, os.O_RDONLY)
+        except OSError:
+            return  # Not supported on this platform (e.g. Windows)
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read one payload (None if missing)."""
+        cache_file = self.file_path(key)
+        # Reads never create the cache directory; a missing file is a miss
+        if not cache_file.exists():
+            return None
+        return loads_json(cache_file.read_bytes())
+
+    def read_all(self, now: datetime) -> Dict[str, Dict[str, Any]]:
+        """Read every unexpired payload, keyed by file name.
+
+        Keys containing characters that ``file_path`` sanitises come back
+        in their sanitised form and will not match later lookups; all keys
+        used by the integration are already filename-safe.
+        """
+        payloads: Dict[str, Dict[str, Any]] = {}
+        now_ts = now.timestamp()
+        for cache_file in self._files():
+            try:
+                payload = loads_json(cache_file.read_bytes())
+                expires_ts = _expiry_timestamp(payload)
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                _LOGGER.debug("Skipping unreadable cache file %s: %s", cache_file, e)
+                continue
+            if expires_ts is None or expires_ts > now_ts:
+                payloads[cache_file.stem] = payload
+        return payloads
+
+    def write_many(self, payloads: Dict[str, Dict[str, Any]]) -> None:
+        """Write several payloads atomically, one file each.
+
+        Each payload is written to a temporary file, fsynced and moved over
+        the target with ``os.replace``; the directory is synced once per
+        batch. Syncing the data before the rename means a power loss can
+        never leave the new name pointing at an empty or truncated file.
+        """
+        if not payloads:
+            return
+
+        for key, payload in payloads.items():
+            cache_file = self.file_path(key)
+            temp_file = self._temp_path(cache_file)
+            try:
+                with open(temp_file, "wb") as handle:
+                    handle.write(dumps_json(payload))
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                os.replace(temp_file, cache_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+
+        self._sync_dir()
+
+    def delete(self, key: str) -> None:
+        """Delete one payload (no error if missing)."""
+        self.file_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete every payload in the namespace (and orphaned temp files)."""
+        for cache_file in self._files():
+            cache_file.unlink(missing_ok=True)
+        if self.storage_dir.exists():
+            for temp_file in self.storage_dir.glob(".*.json.tmp"):
+                temp_file.unlink(missing_ok=True)
+
+    def delete_expired(self, now: datetime) -> int:
+        """Delete expired payloads by reading each file's expiry."""
+        removed = 0
+        now_ts = now.timestamp()
+        for cache_file in self._files():
+            try:
+                expires_ts = _expiry_timestamp(loads_json(cache_file.read_bytes()))
+            except (OSError, ValueError, TypeError, AttributeError):
+                continue
+            if expires_ts is not None and expires_ts <= now_ts:
+                cache_file.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def count(self) -> int:
+        """Number of cache files in the namespace directory."""
+        return len(self._files())
+
+    def size(self, key: str) -> int:
+        """Size of the key's cache file in bytes."""
+        try:
+            return self.file_path(key).stat().st_size
+        except OSError:
+            return 0
+
+
+class SQLiteBackend(CacheBackend):
+    """Single-file SQLite store shared by all namespaces using it.
+
+    Uses WAL journaling with ``synchronous=NORMAL`` so each committed batch
+    costs one WAL append instead of one file rewrite per key. Writes within a
+    ``write_many`` call are a single atomic transaction.
+    """
+
+    name = BACKEND_SQLITE
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache_entries ("
+        " namespace TEXT NOT NULL,"
+        " key TEXT NOT NULL,"
+        " payload BLOB NOT NULL,"
+        " expires_ts REAL,"
+        " PRIMARY KEY (namespace, key))",
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_expiry"
+        " ON cache_entries (namespace, expires_ts)",
+    )
+
+    def __init__(self, root_dir: Path, namespace: str) -> None:
+        """Initialize SQLite backend (the connection is opened lazily).
+
+        Args:
+            root_dir: Cache root directory holding cache.sqlite3
+            namespace: Cache namespace (row partition)
+        """
+        super().__init__(root_dir, namespace)
+        self.db_path = root_dir / SQLITE_FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+        # Executor jobs run on arbitrary worker threads
+        self._lock = threading.Lock()
+
+    def _connection(self, create: bool = True) -> Optional[sqlite3.Connection]:
+        """Open the database on first use.
+
+        Args:
+            create: Create the database file if it does not exist yet
+
+        Returns:
+            Connection, or None if the database does not exist and
+            ``create`` is False
+        """
+        if self._conn is None:
+            if not create and not self.db_path.exists():
+                return None
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=10, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read one payload (None if missing)."""
+        return self.read_many([key]).get(key)
+
+    def read_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Read several payloads in one query."""
+        key_list = list(keys)
+        if not key_list:
+            return {}
+
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {}
+            rows: List[tuple] = []
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(conn.execute(
+                    "SELECT key, payload FROM cache_entries"
+                    f" WHERE namespace = ? AND key IN ({placeholders})",
+                    (self.namespace, *chunk),
+                ).fetchall())
+
+        return self._decode_rows(rows)
+
+    def read_all(self, now: datetime) -> Dict[str, Dict[str, Any]]:
+        """Read every unexpired payload in one indexed query."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return {}
+            rows = conn.execute(
+                "SELECT key, payload FROM cache_entries"
+                " WHERE namespace = ? AND (expires_ts IS NULL OR expires_ts > ?)",
+                (self.namespace, now.timestamp()),
+            ).fetchall()
+
+        return self._decode_rows(rows)
+
+    def _decode_rows(self, rows: List[tuple]) -> Dict[str, Dict[str, Any]]:
+        """Decode ``(key, payload)`` rows, skipping corrupt payloads."""
+        payloads: Dict[str, Dict[str, Any]] = {}
+        for key, payload in rows:
+            try:
+                payloads[key] = loads_json(payload)
+            except (ValueError, TypeError) as e:
+                _LOGGER.warning("Failed to read cache %s/%s: %s", self.namespace, key, e)
+        return payloads
+
+    def write_many(self, payloads: Dict[str, Dict[str, Any]]) -> None:
+        """Write several payloads in a single transaction."""
+        if not payloads:
+            return
+
+        rows = [
+            (self.namespace, key, dumps_json(payload), _expiry_timestamp(payload))
+            for key, payload in payloads.items()
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries"
+                    " (namespace, key, payload, expires_ts) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def delete(self, key: str) -> None:
+        """Delete one payload (no error if missing)."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+
+    def clear(self) -> None:
+        """Delete every payload in the namespace."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?",
+                    (self.namespace,),
+                )
+
+    def delete_expired(self, now: datetime) -> int:
+        """Delete expired payloads using the expiry index."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM cache_entries"
+                    " WHERE namespace = ? AND expires_ts IS NOT NULL AND expires_ts <= ?",
+                    (self.namespace, now.timestamp()),
+                )
+            return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of stored payloads in the namespace."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            row = conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def size(self, key: str) -> int:
+        """Stored payload size in bytes."""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            row = conn.execute(
+                "SELECT length(payload) FROM cache_entries"
+                " WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_backend(name: str, root_dir: Path, namespace: str) -> CacheBackend:
+    """Create a persistent cache backend by name.
+
+    Args:
+        name: Backend name ("json" or "sqlite")
+        root_dir: Cache root directory
+        namespace: Cache namespace
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    if name == BACKEND_JSON:
+        return JsonFileBackend(root_dir, namespace)
+    if name == BACKEND_SQLITE:
+        return SQLiteBackend(root_dir, namespace)
+    raise ValueError(
+        f"Unsupported cache backend: {name} (expected one of {SUPPORTED_BACKENDS})"
+    )
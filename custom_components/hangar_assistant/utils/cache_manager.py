@@ -4,15 +4,46 @@ Provides consistent caching across all integration components with support for:
 - Multi-level caching (memory + persistent)
 - Flexible TTL and expiration strategies
 - Stale cache fallback for graceful degradation
+- Stale-while-revalidate with registered loaders
+- Optional write-behind batching of persistent writes
+- Startup warm-up (bulk load of unexpired entries into memory)
 - Automatic cache directory management
 - Type-safe cache operations
 
 Used by:
-- OpenWeatherMap client
-- NOTAM client
-- Sensor value caching
+- OpenWeatherMap client (namespace "weather")
+- CheckWX client (namespace "checkwx")
+- NOTAM client (namespace "notam")
 - Future integrations requiring caching
 
+All persistent entries are stored in the ``CacheEntry.to_dict`` format via a
+pluggable backend selected per namespace (see ``cache_backends``):
+- "json" (default): ``hangar_assistant_cache/<namespace>/<key>.json``
+- "sqlite": rows in the shared ``hangar_assistant_cache/cache.sqlite3``
+
+Write-behind:
+    With ``write_behind_seconds`` set, ``set()`` only updates memory and marks
+    the entry dirty. Dirty entries are written in one batch when the delay
+    elapses, on ``async_flush()`` and on shutdown (see
+    ``async_flush_cache_managers``), so a burst of writes costs one executor
+    job. Reads check the dirty set first and never see older on-disk data.
+
+Stale-while-revalidate:
+    An entry's TTL is its soft TTL; ``max_age_hours`` passed to
+    ``get_with_stale()`` is the hard TTL. When a loader is registered for a
+    key (``register_loader``) and the entry is between the two, the stale
+    value is returned at once and a single background refresh is started.
+    The loader returns the fresh value (or None on failure) and the manager
+    stores it. Without a loader, stale data is only returned as a fallback.
+
+Warm-up:
+    ``warm()`` loads every unexpired persisted entry into the memory LRU in
+    one executor job (one query for SQLite). The integration warms all shared
+    managers after platform setup (see ``async_warm_cache_managers``). With
+    ``hydrate_on_first_read`` a manager also warms itself on the first read
+    that misses memory, so reads racing setup still cost one job, not one
+    file read each.
+
 Example:
     # Create cache for weather data
     weather_cache = CacheManager(
@@ -35,22 +66,39 @@ Example:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import re
 from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
-
-from homeassistant.core import HomeAssistant
-
-# Try to import orjson for 2-5x faster JSON operations
-try:
-    import orjson
-    HAS_ORJSON = True
-except ImportError:
-    HAS_ORJSON = False
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+from ..const import DOMAIN
+from .cache_backends import (
+    BACKEND_ERRORS,
+    BACKEND_JSON,
+    HAS_ORJSON,
+    CacheBackend,
+    JsonFileBackend,
+    create_backend,
+    dumps_json,
+    loads_json,
+)
 
 # Optional import for notifications (may not be available in test env)
 try:
@@ -64,11 +112,20 @@ _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Background refresh: returns the fresh value, or None if it failed
+CacheLoader = Callable[[], Awaitable[Optional[Any]]]
+
 # Default configuration
 DEFAULT_CACHE_DIR = "hangar_assistant_cache"
 DEFAULT_TTL_MINUTES = 60
 DEFAULT_MEMORY_ENABLED = True
 DEFAULT_PERSISTENT_ENABLED = True
+DEFAULT_BACKEND = BACKEND_JSON
+DEFAULT_WRITE_BEHIND_SECONDS: Optional[float] = None  # None = write-through
+DEFAULT_HYDRATE_ON_FIRST_READ = False
+
+# hass.data[DOMAIN] key holding the shared per-namespace cache managers
+CACHE_MANAGERS_KEY = "cache_managers"
 
 
 class CacheEntry(Generic[T]):
@@ -194,6 +251,10 @@ class CacheManager(Generic[T]):
         - persistent_enabled: Enable persistent file caching
         - ttl_minutes: Default time-to-live in minutes
         - cache_dir: Custom cache directory name (optional)
+        - backend: Persistent backend name ("json" or "sqlite")
+        - write_behind_seconds: Batch persistent writes for this long
+          (None = write-through)
+        - hydrate_on_first_read: Warm the memory cache on the first memory miss
 
     Outputs:
         - Cached data with metadata and expiration tracking
@@ -212,7 +273,10 @@ class CacheManager(Generic[T]):
         persistent_enabled: bool = DEFAULT_PERSISTENT_ENABLED,
         ttl_minutes: Optional[int] = DEFAULT_TTL_MINUTES,
         cache_dir: Optional[str] = None,
-        max_memory_entries: int = 1000
+        max_memory_entries: int = 1000,
+        backend: str = DEFAULT_BACKEND,
+        write_behind_seconds: Optional[float] = DEFAULT_WRITE_BEHIND_SECONDS,
+        hydrate_on_first_read: bool = DEFAULT_HYDRATE_ON_FIRST_READ
     ):
         """Initialize cache manager.
 
@@ -224,6 +288,15 @@ class CacheManager(Generic[T]):
             ttl_minutes: Default TTL in minutes (None = never expires)
             cache_dir: Custom cache directory name (defaults to hangar_assistant_cache)
             max_memory_entries: Maximum entries in memory cache (LRU eviction)
+            backend: Persistent storage backend ("json" file per key, or
+                "sqlite" single-file store)
+            write_behind_seconds: Delay before dirty entries are flushed in
+                one batch (None writes through on every set)
+            hydrate_on_first_read: Call ``warm()`` on the first read that
+                misses memory instead of reading that key alone
+
+        Raises:
+            ValueError: If the backend name is not supported
         """
         self.hass = hass
         self.namespace = namespace
@@ -236,26 +309,52 @@ class CacheManager(Generic[T]):
 
         # Cache directory setup
         cache_dir_name = cache_dir or DEFAULT_CACHE_DIR
-        self.cache_dir = Path(hass.config.path(cache_dir_name)) / namespace
+        cache_root = Path(hass.config.path(cache_dir_name))
+        self.cache_dir = cache_root / namespace
         self._cache_dir_initialized = False
 
+        # Persistent storage backend (no I/O until first use)
+        self._backend: CacheBackend = create_backend(backend, cache_root, namespace)
+
         # In-memory cache with OrderedDict for LRU eviction
         self._memory_cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
 
+        # Write-behind state: entries awaiting a batched persistent write
+        self._write_behind_seconds = write_behind_seconds
+        self._dirty: Dict[str, CacheEntry[T]] = {}
+        self._cancel_flush_timer: Optional[CALLBACK_TYPE] = None
+
+        # Stale-while-revalidate: key -> (loader, ttl_minutes)
+        self._loaders: Dict[str, Tuple[CacheLoader, Optional[float]]] = {}
+        self._revalidating: Set[str] = set()
+
+        # Warm-up state
+        self._hydrate_on_first_read = hydrate_on_first_read
+        self._warmed = False
+        self._warm_lock = asyncio.Lock()
+
+        # Persisted entry count, refreshed off the event loop after each
+        # backend mutation so get_stats() never touches storage
+        self._persistent_count = 0
+
         # Statistics
         self._stats = {
             "memory_hits": 0,
             "persistent_hits": 0,
             "misses": 0,
             "writes": 0,
-            "evictions": 0
+            "evictions": 0,
+            "flushes": 0,
+            "warmed_entries": 0,
+            "revalidations": 0
         }
 
         _LOGGER.info(
-            "Cache manager initialized: namespace=%s, memory=%s, persistent=%s, ttl=%s, max_entries=%d, orjson=%s",
+            "Cache manager initialized: namespace=%s, memory=%s, persistent=%s, backend=%s, ttl=%s, max_entries=%d, orjson=%s",
             namespace,
             memory_enabled,
             persistent_enabled,
+            self._backend.name,
             f"{ttl_minutes}min" if ttl_minutes else "never",
             max_memory_entries,
             "enabled" if HAS_ORJSON else "disabled"
@@ -269,14 +368,14 @@ class CacheManager(Generic[T]):
         """
         if not self._cache_dir_initialized and self.persistent_enabled:
             try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._backend.storage_dir.mkdir(parents=True, exist_ok=True)
                 self._cache_dir_initialized = True
                 return True
             except (OSError, PermissionError) as e:
                 _LOGGER.error(
                     "Failed to create cache directory for %s: %s. "
                     "Persistent caching will be disabled. Check permissions for: %s",
-                    self.namespace, e, self.cache_dir
+                    self.namespace, e, self._backend.storage_dir
                 )
                 self.persistent_enabled = False
                 
@@ -288,7 +387,7 @@ class CacheManager(Generic[T]):
                             message=(
                                 f"Hangar Assistant cannot create cache directory for {self.namespace}. "
                                 f"Persistent caching will be disabled. "
-                                f"Please check permissions for: {self.cache_dir}"
+                                f"Please check permissions for: {self._backend.storage_dir}"
                             ),
                             title="Hangar Assistant: Cache Permission Error",
                             notification_id=f"hangar_cache_{self.namespace}_permission_error"
@@ -298,6 +397,45 @@ class CacheManager(Generic[T]):
 
         return self._cache_dir_initialized
 
+    async def _run_io(self, func, *args) -> Any:
+        """Run blocking I/O in the executor.
+
+        Falls back to the running loop's default executor when the hass
+        object does not provide an awaitable ``async_add_executor_job``.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Result of ``func``
+        """
+        runner = getattr(self.hass, "async_add_executor_job", None)
+
+        if callable(runner):
+            result = runner(func, *args)
+            if asyncio.isfuture(result) or asyncio.iscoroutine(result):
+                return await result
+            return result
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _apply_and_count(self, func, *args) -> Tuple[Any, int]:
+        """Run a backend mutation and count persisted entries afterwards.
+
+        Called in the executor so the count shares the mutation's job.
+
+        Args:
+            func: Blocking backend method
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Tuple of ``func``'s result and the persisted entry count
+        """
+        result = func(*args)
+        return result, self._backend.count()
+
     def _serialize_json(self, data: Any) -> bytes:
         """Serialize data to JSON with orjson optimization.
 
@@ -310,9 +448,7 @@ class CacheManager(Generic[T]):
         Returns:
             JSON bytes
         """
-        if HAS_ORJSON:
-            return orjson.dumps(data)
-        return json.dumps(data).encode('utf-8')
+        return dumps_json(data)
 
     def _deserialize_json(self, data: bytes) -> Any:
         """Deserialize JSON data with orjson optimization.
@@ -326,12 +462,10 @@ class CacheManager(Generic[T]):
         Returns:
             Deserialized data
         """
-        if HAS_ORJSON:
-            return orjson.loads(data)
-        return json.loads(data.decode('utf-8'))
+        return loads_json(data)
 
     def _get_cache_file_path(self, key: str) -> Path:
-        """Get cache file path for key.
+        """Get cache file path for key (JSON file layout).
 
         Args:
             key: Cache key
@@ -339,18 +473,10 @@ class CacheManager(Generic[T]):
         Returns:
             Path to cache file
         """
-        # Comprehensive sanitization for safe filename
-        # Remove all characters except alphanumeric, underscore, hyphen, and period
-        safe_key = re.sub(r'[^a-zA-Z0-9_.-]', '_', key)
-        
-        # Prevent path traversal attacks
-        safe_key = safe_key.replace("..", "_")
-        
-        # Limit length to prevent filesystem issues
-        if len(safe_key) > 200:
-            safe_key = safe_key[:200]
-        
-        return self.cache_dir / f"{safe_key}.json"
+        if isinstance(self._backend, JsonFileBackend):
+            return self._backend.file_path(key)
+        # Other backends have no per-key file; report the layout JSON would use
+        return JsonFileBackend(self._backend.root_dir, self.namespace).file_path(key)
 
     async def get(
         self,
@@ -386,10 +512,17 @@ class CacheManager(Generic[T]):
                     entry.age_seconds(now)
                 )
                 return entry.data
-            else:
-                # Expired - remove from memory cache
-                del self._memory_cache[key]
-                self._stats["evictions"] += 1
+            # Expired entries stay in memory (bounded by the LRU limit) so
+            # get_with_stale() can fall back to them without touching disk.
+            # cleanup_expired() removes them.
+
+        # Load the whole namespace in one job on the first miss
+        if await self._async_hydrate() and key in self._memory_cache:
+            entry = self._memory_cache[key]
+            if not entry.is_expired(now):
+                self._stats["persistent_hits"] += 1
+                self._memory_cache.move_to_end(key)
+                return entry.data
 
         # Check persistent cache
         if self.persistent_enabled:
@@ -406,7 +539,7 @@ class CacheManager(Generic[T]):
 
                 # Populate memory cache
                 if self.memory_enabled:
-                    self._memory_cache[key] = persistent_entry
+                    self._store_memory_entry(key, persistent_entry, now)
 
                 return persistent_entry.data
 
@@ -418,16 +551,21 @@ class CacheManager(Generic[T]):
     async def get_with_stale(
         self,
         key: str,
-        max_age_hours: Optional[float] = None
+        max_age_hours: Optional[float] = None,
+        revalidate: bool = True
     ) -> Tuple[Optional[T], bool]:
         """Get value from cache, allowing stale data.
 
         Returns data even if expired, up to max_age_hours old.
         Useful for graceful degradation when fresh data unavailable.
+        If a loader is registered for the key, returning stale data also
+        starts one background refresh (stale-while-revalidate).
 
         Args:
             key: Cache key
             max_age_hours: Maximum age in hours (None = any age)
+            revalidate: Start a background refresh when returning stale
+                data and a loader is registered
 
         Returns:
             Tuple of (data, is_stale)
@@ -442,15 +580,7 @@ class CacheManager(Generic[T]):
             return fresh_data, False
 
         # Look for stale data
-        entry: Optional[CacheEntry[T]] = None
-
-        # Check memory cache
-        if self.memory_enabled and key in self._memory_cache:
-            entry = self._memory_cache[key]
-
-        # Check persistent cache if not in memory
-        if entry is None and self.persistent_enabled:
-            entry = await self._read_persistent_cache(key)
+        entry = await self.get_entry(key)
 
         if entry:
             age_hours = entry.age_seconds(now) / 3600
@@ -462,11 +592,217 @@ class CacheManager(Generic[T]):
                     key,
                     age_hours
                 )
+                if revalidate:
+                    self._schedule_revalidation(key)
                 return entry.data, True
 
         # No data available (even stale)
         return (None, False)
 
+    def register_loader(
+        self,
+        key: str,
+        loader: CacheLoader,
+        ttl_minutes: Optional[float] = None
+    ) -> None:
+        """Register the background refresh used for stale-while-revalidate.
+
+        Registering again replaces the previous loader for the key.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function returning the fresh value (None on
+                failure); it should not write the cache itself
+            ttl_minutes: TTL for refreshed values (None uses instance default)
+        """
+        self._loaders[key] = (loader, ttl_minutes)
+
+    def unregister_loader(self, key: str) -> None:
+        """Remove a registered loader.
+
+        Args:
+            key: Cache key
+        """
+        self._loaders.pop(key, None)
+
+    def _schedule_revalidation(self, key: str) -> bool:
+        """Start one background refresh for a key if a loader is registered.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if a refresh was started
+        """
+        if key not in self._loaders or key in self._revalidating:
+            return False
+
+        self._revalidating.add(key)
+        self.hass.async_create_background_task(
+            self._async_revalidate(key),
+            f"{DOMAIN} {self.namespace} revalidate {key}",
+        )
+        return True
+
+    async def _async_revalidate(self, key: str) -> None:
+        """Run the registered loader and store its result.
+
+        Args:
+            key: Cache key
+        """
+        try:
+            # The loader may have been unregistered since scheduling
+            registered = self._loaders.get(key)
+            if registered is None:
+                return
+            loader, ttl_minutes = registered
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl_minutes=ttl_minutes)
+                self._stats["revalidations"] += 1
+                _LOGGER.debug("Cache REVALIDATED: %s/%s", self.namespace, key)
+        except Exception as e:  # Background task: never propagate
+            _LOGGER.warning(
+                "Background refresh failed for %s/%s: %s", self.namespace, key, e
+            )
+        finally:
+            self._revalidating.discard(key)
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry[T]]:
+        """Get the raw cache entry for a key, ignoring expiry.
+
+        Used by clients that need the entry metadata (age, expiry) rather
+        than just the value, e.g. for stale-data reporting.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry if present in memory or on disk, None otherwise
+        """
+        if self.memory_enabled and key in self._memory_cache:
+            return self._memory_cache[key]
+
+        if self.persistent_enabled:
+            return await self._read_persistent_cache(key)
+
+        return None
+
+    async def warm(self) -> int:
+        """Load all unexpired persisted entries into the memory cache.
+
+        Runs a single executor job. Entries already in memory or waiting
+        for a write-behind flush are newer and are kept. When the namespace
+        holds more entries than the memory limit, the most recently cached
+        ones are loaded.
+
+        Returns:
+            Number of entries loaded into memory
+        """
+        async with self._warm_lock:
+            return await self._warm_locked()
+
+    @property
+    def warmed(self) -> bool:
+        """Whether warm() has run for this manager."""
+        return self._warmed
+
+    async def _warm_locked(self) -> int:
+        """Body of warm(); the caller holds ``_warm_lock``."""
+        self._warmed = True
+        if not (self.memory_enabled and self.persistent_enabled):
+            return 0
+
+        now = datetime.now()
+        try:
+            payloads = await self._run_io(self._backend.read_all, now)
+        except BACKEND_ERRORS as e:
+            _LOGGER.warning("Failed to warm cache %s: %s", self.namespace, e)
+            return 0
+
+        entries = []
+        for key, payload in payloads.items():
+            if key in self._memory_cache or key in self._dirty:
+                continue
+            try:
+                entries.append((key, CacheEntry.from_dict(payload)))
+            except BACKEND_ERRORS:
+                continue
+
+        # Oldest first so the newest entries end up most recently used
+        entries.sort(key=lambda item: item[1].cached_at)
+        free_slots = self._max_memory_entries - len(self._memory_cache)
+        entries = entries[-free_slots:] if free_slots > 0 else []
+
+        for key, entry in entries:
+            self._store_memory_entry(key, entry, now)
+
+        self._stats["warmed_entries"] += len(entries)
+        _LOGGER.debug(
+            "Cache WARM: %s (%d entries)", self.namespace, len(entries)
+        )
+        return len(entries)
+
+    async def _async_hydrate(self) -> bool:
+        """Warm the cache once if lazy hydration is enabled.
+
+        Concurrent first reads wait for a single warm-up.
+
+        Returns:
+            True if memory may have been populated, so it should be checked
+            again before reading the key from disk
+        """
+        if not self._hydrate_on_first_read or self._warmed:
+            return False
+        async with self._warm_lock:
+            if not self._warmed:
+                await self._warm_locked()
+        return True
+
+    async def get_persistent_size(self, key: str) -> int:
+        """Get the on-disk size of a persisted entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Size in bytes, or 0 if the entry is not persisted
+        """
+        if not self.persistent_enabled:
+            return 0
+
+        try:
+            return await self._run_io(self._backend.size, key)
+        except BACKEND_ERRORS:
+            return 0
+
+    def _store_memory_entry(
+        self, key: str, entry: CacheEntry[T], now: datetime
+    ) -> None:
+        """Store an entry in the memory cache with LRU eviction.
+
+        Args:
+            key: Cache key
+            entry: Cache entry to store
+            now: Current time (for eviction logging)
+        """
+        if key not in self._memory_cache and (
+            len(self._memory_cache) >= self._max_memory_entries
+        ):
+            # Remove least recently used entry (front of the OrderedDict)
+            oldest_key, oldest_entry = self._memory_cache.popitem(last=False)
+            self._stats["evictions"] += 1
+            _LOGGER.debug(
+                "LRU eviction: %s/%s (age: %.1fs)",
+                self.namespace,
+                oldest_key,
+                oldest_entry.age_seconds(now)
+            )
+
+        # Add to cache and move to end (most recently used)
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+
     async def set(
         self,
         key: str,
@@ -494,60 +830,153 @@ class CacheManager(Generic[T]):
 
         # Store in memory cache with LRU eviction
         if self.memory_enabled:
-            # Implement LRU eviction if cache is full
-            if len(self._memory_cache) >= self._max_memory_entries:
-                # Remove oldest entry (FIFO in OrderedDict)
-                oldest_key, oldest_entry = self._memory_cache.popitem(last=False)
-                self._stats["evictions"] += 1
-                _LOGGER.debug(
-                    "LRU eviction: %s/%s (age: %.1fs)",
-                    self.namespace,
-                    oldest_key,
-                    oldest_entry.age_seconds(now)
-                )
-            
-            # Add to cache and move to end (most recently used)
-            self._memory_cache[key] = entry
-            self._memory_cache.move_to_end(key)
+            self._store_memory_entry(key, entry, now)
 
-        # Store in persistent cache
+        # Store in persistent cache (or queue it for the next flush)
         if self.persistent_enabled:
-            await self._write_persistent_cache(key, entry)
+            await self._persist_entries({key: entry})
 
         self._stats["writes"] += 1
         _LOGGER.debug("Cache SET: %s/%s", self.namespace, key)
 
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, T]:
+        """Get several fresh values with at most one persistent read.
+
+        Keys missing from memory are read from the backend in a single
+        executor job (a single query for SQLite).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key to value for keys with fresh (unexpired) entries
+        """
+        now = datetime.now()
+        results: Dict[str, T] = {}
+        pending: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            entry = self._memory_cache.get(key) if self.memory_enabled else None
+            if entry is not None and not entry.is_expired(now):
+                self._stats["memory_hits"] += 1
+                self._memory_cache.move_to_end(key)
+                results[key] = entry.data
+            else:
+                pending.append(key)
+
+        if pending and await self._async_hydrate():
+            for key in list(pending):
+                entry = self._memory_cache.get(key)
+                if entry is not None and not entry.is_expired(now):
+                    pending.remove(key)
+                    self._stats["persistent_hits"] += 1
+                    results[key] = entry.data
+
+        # Unflushed writes are newer than anything on disk
+        for key in [key for key in pending if key in self._dirty]:
+            pending.remove(key)
+            entry = self._dirty[key]
+            if entry.is_expired(now):
+                self._stats["misses"] += 1
+            else:
+                self._stats["persistent_hits"] += 1
+                results[key] = entry.data
+
+        if pending and self.persistent_enabled:
+            try:
+                payloads = await self._run_io(self._backend.read_many, pending)
+            except BACKEND_ERRORS as e:
+                _LOGGER.warning(
+                    "Failed to read cache batch %s: %s", self.namespace, e
+                )
+                payloads = {}
+
+            for key, payload in payloads.items():
+                try:
+                    entry = CacheEntry.from_dict(payload)
+                except BACKEND_ERRORS:
+                    continue
+                if entry.is_expired(now):
+                    continue
+                self._stats["persistent_hits"] += 1
+                if self.memory_enabled:
+                    self._store_memory_entry(key, entry, now)
+                results[key] = entry.data
+
+        self._stats["misses"] += sum(1 for key in pending if key not in results)
+        return results
+
+    async def set_many(
+        self,
+        items: Dict[str, T],
+        ttl_minutes: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Set several values with one persistent write.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl_minutes: Override default TTL (None uses instance default)
+            metadata: Optional metadata dict applied to every entry
+        """
+        if not items:
+            return
+
+        now = datetime.now()
+        ttl = timedelta(minutes=ttl_minutes) if ttl_minutes else self.ttl
+        entries = {
+            key: CacheEntry(data=value, cached_at=now, ttl=ttl, metadata=metadata)
+            for key, value in items.items()
+        }
+
+        if self.memory_enabled:
+            for key, entry in entries.items():
+                self._store_memory_entry(key, entry, now)
+
+        if self.persistent_enabled:
+            await self._persist_entries(entries)
+
+        self._stats["writes"] += len(entries)
+        _LOGGER.debug("Cache SET: %s (%d entries)", self.namespace, len(entries))
+
     async def delete(self, key: str) -> None:
         """Delete key from cache.
 
         Args:
             key: Cache key to delete
         """
-        # Remove from memory
+        # Remove from memory (and any pending write-behind)
         if key in self._memory_cache:
             del self._memory_cache[key]
+        self._dirty.pop(key, None)
 
         # Remove from persistent storage
         if self.persistent_enabled:
-            cache_file = self._get_cache_file_path(key)
-            if cache_file.exists():
-                await self.hass.async_add_executor_job(cache_file.unlink)
+            try:
+                _, self._persistent_count = await self._run_io(
+                    self._apply_and_count, self._backend.delete, key
+                )
+            except BACKEND_ERRORS as e:
+                _LOGGER.warning(
+                    "Failed to delete cache %s/%s: %s", self.namespace, key, e
+                )
 
         _LOGGER.debug("Cache DELETE: %s/%s", self.namespace, key)
 
     async def clear(self) -> None:
         """Clear all cache entries for this namespace."""
-        # Clear memory cache
+        # Clear memory cache and drop pending writes
         self._memory_cache.clear()
+        self._dirty.clear()
+        self._cancel_flush()
 
-        # Clear persistent cache
-        if self.persistent_enabled and self._ensure_cache_dir():
-            cache_files = await self.hass.async_add_executor_job(
-                list, self.cache_dir.glob("*.json")
-            )
-
-            for cache_file in cache_files:
-                await self.hass.async_add_executor_job(cache_file.unlink)
+        # Clear persistent cache (single executor job)
+        if self.persistent_enabled:
+            try:
+                await self._run_io(self._backend.clear)
+                self._persistent_count = 0
+            except BACKEND_ERRORS as e:
+                _LOGGER.warning("Failed to clear cache %s: %s", self.namespace, e)
 
         _LOGGER.info("Cache CLEARED: %s", self.namespace)
 
@@ -560,22 +989,21 @@ class CacheManager(Generic[T]):
         Returns:
             CacheEntry if found, None otherwise
         """
-        if not self._ensure_cache_dir():
+        if not self.persistent_enabled:
             return None
 
-        cache_file = self._get_cache_file_path(key)
-
-        if not cache_file.exists():
-            return None
+        # Unflushed writes are newer than anything on disk
+        if key in self._dirty:
+            return self._dirty[key]
 
         try:
-            content_bytes = await self.hass.async_add_executor_job(
-                cache_file.read_bytes
-            )
-            data = self._deserialize_json(content_bytes)
+            # Reads never create the cache directory; a missing key is a miss
+            data = await self._run_io(self._backend.read, key)
+            if data is None:
+                return None
             return CacheEntry.from_dict(data)
 
-        except (OSError, json.JSONDecodeError, KeyError) as e:
+        except BACKEND_ERRORS as e:
             _LOGGER.warning(
                 "Failed to read cache %s/%s: %s",
                 self.namespace,
@@ -586,38 +1014,126 @@ class CacheManager(Generic[T]):
 
     async def _write_persistent_cache(
             self, key: str, entry: CacheEntry) -> None:
-        """Write cache entry to disk with optimized JSON.
+        """Write cache entry to persistent storage.
 
         Args:
             key: Cache key
             entry: Cache entry to write
         """
-        if not self._ensure_cache_dir():
+        await self._write_persistent_entries({key: entry})
+
+    async def _persist_entries(self, entries: Dict[str, CacheEntry]) -> None:
+        """Write entries now, or queue them when write-behind is enabled.
+
+        Args:
+            entries: Mapping of cache key to entry
+        """
+        if not self._write_behind_seconds:
+            await self._write_persistent_entries(entries)
             return
 
-        cache_file = self._get_cache_file_path(key)
+        self._dirty.update(entries)
+        if self._cancel_flush_timer is None:
+            self._cancel_flush_timer = async_call_later(
+                self.hass,
+                self._write_behind_seconds,
+                HassJob(
+                    self._async_flush_timer_fired,
+                    f"{DOMAIN} {self.namespace} cache flush",
+                    cancel_on_shutdown=True,
+                ),
+            )
+
+    async def _async_flush_timer_fired(self, _now: datetime) -> None:
+        """Flush dirty entries when the write-behind delay elapses."""
+        self._cancel_flush_timer = None
+        await self.async_flush()
 
+    def _cancel_flush(self) -> None:
+        """Cancel a scheduled write-behind flush."""
+        if self._cancel_flush_timer is not None:
+            self._cancel_flush_timer()
+            self._cancel_flush_timer = None
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of entries waiting for a write-behind flush."""
+        return len(self._dirty)
+
+    async def async_flush(self) -> int:
+        """Write all dirty entries to persistent storage in one batch.
+
+        Returns:
+            Number of entries flushed
+        """
+        self._cancel_flush()
+        if not self._dirty:
+            return 0
+
+        entries = self._dirty
+        self._dirty = {}
+        await self._write_persistent_entries(entries)
+        self._stats["flushes"] += 1
+        _LOGGER.debug(
+            "Cache FLUSH: %s (%d entries)", self.namespace, len(entries)
+        )
+        return len(entries)
+
+    async def async_close(self) -> None:
+        """Flush pending writes and release backend resources."""
+        await self.async_flush()
         try:
-            # Serialize with optimized JSON (orjson if available)
-            data_dict = entry.to_dict()
-            json_bytes = self._serialize_json(data_dict)
+            await self._run_io(self._backend.close)
+        except BACKEND_ERRORS as e:
+            _LOGGER.debug("Failed to close cache %s: %s", self.namespace, e)
 
-            def _write():
-                cache_file.write_bytes(json_bytes)
+    async def _write_persistent_entries(
+            self, entries: Dict[str, CacheEntry]) -> None:
+        """Write several cache entries in one executor job.
 
-            await self.hass.async_add_executor_job(_write)
+        The SQLite backend commits them as one transaction.
 
-        except (OSError, TypeError) as e:
+        Args:
+            entries: Mapping of cache key to entry
+        """
+        if not entries or not self._ensure_cache_dir():
+            return
+
+        try:
+            payloads = {key: entry.to_dict() for key, entry in entries.items()}
+            _, self._persistent_count = await self._run_io(
+                self._apply_and_count, self._backend.write_many, payloads
+            )
+
+        except BACKEND_ERRORS as e:
             _LOGGER.warning(
-                "Failed to write cache %s/%s: %s",
+                "Failed to write cache %s (%d entries): %s",
                 self.namespace,
-                key,
+                len(entries),
                 e
             )
 
+    async def async_get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics with a fresh persisted entry count.
+
+        Counts the backend in the executor, then returns get_stats().
+
+        Returns:
+            Dict with cache statistics (see get_stats)
+        """
+        if self.persistent_enabled and self._cache_dir_initialized:
+            try:
+                self._persistent_count = await self._run_io(self._backend.count)
+            except BACKEND_ERRORS:
+                pass
+        return self.get_stats()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
 
+        Does no I/O; ``persistent_files`` is the count recorded after the
+        last write, delete or cleanup. Use async_get_stats() to recount.
+
         Returns:
             Dict with cache statistics:
                 - namespace: Cache namespace
@@ -625,12 +1141,17 @@ class CacheManager(Generic[T]):
                 - persistent_enabled: Persistent caching enabled
                 - ttl_minutes: Default TTL in minutes
                 - memory_entries: Current memory cache size
-                - persistent_files: Number of persistent cache files
+                - backend: Persistent backend name ("json" or "sqlite")
+                - persistent_files: Number of persisted entries
                 - memory_hits: Memory cache hit count
                 - persistent_hits: Persistent cache hit count
                 - misses: Cache miss count
                 - writes: Cache write count
                 - evictions: Cache eviction count
+                - flushes: Write-behind batch flush count
+                - pending_writes: Entries awaiting a write-behind flush
+                - warmed_entries: Entries loaded into memory by warm()
+                - revalidations: Successful background refreshes
                 - hit_rate: Overall cache hit rate percentage
         """
         total_requests = (
@@ -644,28 +1165,26 @@ class CacheManager(Generic[T]):
             hits = self._stats["memory_hits"] + self._stats["persistent_hits"]
             hit_rate = (hits / total_requests) * 100
 
-        persistent_files = 0
-        if self.persistent_enabled and self._cache_dir_initialized:
-            try:
-                persistent_files = len(list(self.cache_dir.glob("*.json")))
-            except OSError:
-                pass
-
         return {
             "namespace": self.namespace,
             "memory_enabled": self.memory_enabled,
             "persistent_enabled": self.persistent_enabled,
+            "backend": self._backend.name,
             "ttl_minutes": int(
                 self.ttl.total_seconds() /
                 60) if self.ttl else None,
             "memory_entries": len(
                 self._memory_cache),
-            "persistent_files": persistent_files,
+            "persistent_files": self._persistent_count,
             "memory_hits": self._stats["memory_hits"],
             "persistent_hits": self._stats["persistent_hits"],
             "misses": self._stats["misses"],
             "writes": self._stats["writes"],
             "evictions": self._stats["evictions"],
+            "flushes": self._stats["flushes"],
+            "pending_writes": len(self._dirty),
+            "warmed_entries": self._stats["warmed_entries"],
+            "revalidations": self._stats["revalidations"],
             "hit_rate": round(
                 hit_rate,
                 2)}
@@ -689,26 +1208,17 @@ class CacheManager(Generic[T]):
             del self._memory_cache[key]
             removed += 1
 
-        # Clean persistent cache
-        if self.persistent_enabled and self._ensure_cache_dir():
-            cache_files = await self.hass.async_add_executor_job(
-                list, self.cache_dir.glob("*.json")
-            )
-
-            for cache_file in cache_files:
-                try:
-                    content = await self.hass.async_add_executor_job(
-                        cache_file.read_text
-                    )
-                    data = json.loads(content)
-                    entry = CacheEntry.from_dict(data)
-
-                    if entry.is_expired(now):
-                        await self.hass.async_add_executor_job(cache_file.unlink)
-                        removed += 1
-
-                except (OSError, json.JSONDecodeError, KeyError):
-                    pass
+        # Clean persistent cache (one executor job; indexed DELETE for SQLite)
+        if self.persistent_enabled:
+            try:
+                expired, self._persistent_count = await self._run_io(
+                    self._apply_and_count, self._backend.delete_expired, now
+                )
+                removed += expired
+            except BACKEND_ERRORS as e:
+                _LOGGER.warning(
+                    "Failed to clean up cache %s: %s", self.namespace, e
+                )
 
         if removed > 0:
             _LOGGER.info(
@@ -717,3 +1227,92 @@ class CacheManager(Generic[T]):
                 self.namespace)
 
         return removed
+
+
+def get_cache_manager(
+    hass: HomeAssistant,
+    namespace: str,
+    **kwargs: Any
+) -> CacheManager:
+    """Get the shared cache manager for a namespace, creating it on first use.
+
+    API clients are created per entity (and per update for NOTAMs), so
+    sharing one manager per namespace gives a single memory LRU, a single
+    set of statistics and one place for eviction and cleanup. Managers are
+    stored in ``hass.data[DOMAIN]["cache_managers"]``.
+
+    The keyword arguments are only applied when the manager is created.
+    Callers that need different persistence settings (e.g. caching
+    disabled) should construct a private ``CacheManager`` instead.
+
+    Args:
+        hass: Home Assistant instance
+        namespace: Cache namespace (e.g., "weather", "checkwx", "notam")
+        **kwargs: CacheManager constructor arguments
+
+    Returns:
+        Shared CacheManager for the namespace (or a private one when
+        hass.data is unavailable, as in unit tests)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return CacheManager(hass, namespace, **kwargs)
+
+    domain_data = hass_data.setdefault(DOMAIN, {})
+    managers = domain_data.setdefault(CACHE_MANAGERS_KEY, {})
+
+    manager = managers.get(namespace)
+    if manager is None:
+        manager = CacheManager(hass, namespace, **kwargs)
+        managers[namespace] = manager
+
+    return manager
+
+
+async def async_flush_cache_managers(
+    hass: HomeAssistant, close: bool = False
+) -> None:
+    """Flush write-behind entries of every shared cache manager.
+
+    Called on integration unload and Home Assistant shutdown so batched
+    writes are not lost.
+
+    Args:
+        hass: Home Assistant instance
+        close: Also release backend resources (database connections)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return
+
+    managers = hass_data.get(DOMAIN, {}).get(CACHE_MANAGERS_KEY, {})
+    for manager in list(managers.values()):
+        if close:
+            await manager.async_close()
+        else:
+            await manager.async_flush()
+
+
+async def async_warm_cache_managers(hass: HomeAssistant) -> int:
+    """Warm every shared cache manager that has not been warmed yet.
+
+    Called after platform setup, once API clients have created their
+    managers, so the first entity updates after a restart are served from
+    memory.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Total number of entries loaded into memory
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return 0
+
+    managers = hass_data.get(DOMAIN, {}).get(CACHE_MANAGERS_KEY, {})
+    loaded = 0
+    for manager in list(managers.values()):
+        if not manager.warmed:
+            loaded += await manager.warm()
+    return loaded
@@ -6,9 +6,11 @@ METAR, TAF, and station information with a generous free tier (3,000 requests/da
 Features:
     - METAR/TAF decoded JSON data retrieval
     - Station information lookup with auto-population
-    - Multi-level caching (memory + persistent file-based)
+    - Multi-level caching via the shared CacheManager "checkwx" namespace
     - Rate limit tracking and protection
     - Graceful degradation (uses stale cache on API failure)
+    - Stale-while-revalidate: recently expired data is served immediately
+      while one background request refreshes it
     - Survives Home Assistant restarts
 
 Rate Limits:
@@ -23,23 +25,17 @@ API Documentation:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections import OrderedDict
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from datetime import timedelta
+from typing import Any, Dict, Optional
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
-try:
-    import orjson
-    HAS_ORJSON = True
-except ImportError:
-    HAS_ORJSON = False
+from .cache_backends import BACKEND_SQLITE
+from .cache_manager import CacheManager, get_cache_manager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,8 +46,12 @@ DEFAULT_METAR_CACHE_MINUTES = 15
 DEFAULT_TAF_CACHE_MINUTES = 360  # 6 hours
 DEFAULT_STATION_CACHE_MINUTES = 10080  # 7 days
 MAX_MEMORY_CACHE_ENTRIES = 100
+CACHE_WRITE_BEHIND_SECONDS = 30  # Batch METAR/TAF/station writes per burst
+# Serve expired data (with a background refresh) until this multiple of the TTL
+STALE_WHILE_REVALIDATE_FACTOR = 2
 RATE_LIMIT_FREE_TIER = 3000
 RATE_LIMIT_WARNING_THRESHOLD = 2700
+CACHE_NAMESPACE = "checkwx"
 
 
 class CheckWXClient:
@@ -101,25 +101,34 @@ class CheckWXClient:
         self._taf_cache_ttl = timedelta(minutes=taf_cache_minutes)
         self._station_cache_ttl = timedelta(minutes=station_cache_minutes)
         
-        # Memory cache (session-level, LRU eviction)
-        self._memory_cache: OrderedDict[str, Tuple[Any, datetime]] = OrderedDict()
-        self._max_memory_entries = MAX_MEMORY_CACHE_ENTRIES
+        # Memory LRU + persistent cache, shared by all CheckWX clients
+        # (METAR, TAF and station sensors each create their own client).
+        # Many small per-ICAO entries, so persist them in the single-file
+        # SQLite store rather than one JSON file per key.
+        if cache_enabled:
+            self._cache: CacheManager = get_cache_manager(
+                hass,
+                CACHE_NAMESPACE,
+                ttl_minutes=metar_cache_minutes,
+                max_memory_entries=MAX_MEMORY_CACHE_ENTRIES,
+                backend=BACKEND_SQLITE,
+                write_behind_seconds=CACHE_WRITE_BEHIND_SECONDS,
+                hydrate_on_first_read=True,
+            )
+        else:
+            self._cache = CacheManager(
+                hass,
+                CACHE_NAMESPACE,
+                persistent_enabled=False,
+                ttl_minutes=metar_cache_minutes,
+                max_memory_entries=MAX_MEMORY_CACHE_ENTRIES,
+            )
         
         # Rate limit tracking
         self._daily_requests = 0
         self._last_reset = dt_util.utcnow().date()
         self._rate_limit_warned = False
         
-        # Persistent cache directory
-        raw_cache_path = Path(hass.config.path("hangar_assistant_cache", "checkwx"))
-
-        # Some test doubles return the base config path and ignore additional segments.
-        # Detect that case and append our expected subdirectories to preserve real HA behaviour.
-        if raw_cache_path.name != "checkwx":
-            raw_cache_path = raw_cache_path / "hangar_assistant_cache" / "checkwx"
-
-        self._cache_dir = raw_cache_path
-        
         # Failure tracking for graceful degradation
         self._consecutive_failures = 0
         self._max_consecutive_failures = 3
@@ -299,11 +308,12 @@ class CheckWXClient:
         """Make API request with caching and rate limit protection.
         
         Implements the complete caching hierarchy:
-        1. Check memory cache (fast, session-level)
-        2. Check persistent cache (survives restarts)
-        3. Make API call (if not rate limited)
-        4. Update both caches
-        5. On failure, use stale cache if available
+        1. Check memory then persistent cache (CacheManager). Data up to
+           STALE_WHILE_REVALIDATE_FACTOR x TTL old is returned immediately
+           and refreshed in the background
+        2. Make API call (if not rate limited)
+        3. Update both caches with the endpoint-specific TTL
+        4. On failure, use stale cache if available
         
         Args:
             endpoint: API endpoint path (e.g., "/metar/KJFK/decoded")
@@ -313,27 +323,32 @@ class CheckWXClient:
         Returns:
             API response data or cached data, None if all sources fail
         """
-        # 1. Check memory cache
-        cached = self._get_memory_cache(cache_key, cache_ttl)
+        ttl_minutes = cache_ttl.total_seconds() / 60
+        self._cache.register_loader(
+            cache_key,
+            lambda: self._revalidate(endpoint),
+            ttl_minutes=ttl_minutes,
+        )
+
+        # 1. Check memory then persistent cache (stale-while-revalidate)
+        cached, is_stale = await self._cache.get_with_stale(
+            cache_key,
+            max_age_hours=ttl_minutes * STALE_WHILE_REVALIDATE_FACTOR / 60,
+        )
         if cached is not None:
-            _LOGGER.debug("CheckWX: Memory cache hit for %s", cache_key)
+            _LOGGER.debug(
+                "CheckWX: Cache hit for %s%s",
+                cache_key,
+                " (stale, refreshing in background)" if is_stale else "",
+            )
             return cached
         
-        # 2. Check persistent cache
-        if self._cache_enabled:
-            cached = await self._get_persistent_cache(cache_key, cache_ttl)
-            if cached is not None:
-                _LOGGER.debug("CheckWX: Persistent cache hit for %s", cache_key)
-                # Populate memory cache
-                self._set_memory_cache(cache_key, cached)
-                return cached
-        
-        # 3. Check rate limit before API call
+        # 2. Check rate limit before API call
         if not self._check_rate_limit():
             _LOGGER.warning("CheckWX: Rate limit reached, using stale cache if available")
             return await self._get_stale_cache(cache_key)
         
-        # 4. Make API call
+        # 3. Make API call
         try:
             data = await self._api_call(endpoint)
             
@@ -342,9 +357,7 @@ class CheckWXClient:
                 self._consecutive_failures = 0
                 
                 # Update both caches
-                self._set_memory_cache(cache_key, data)
-                if self._cache_enabled:
-                    await self._set_persistent_cache(cache_key, data)
+                await self._cache.set(cache_key, data, ttl_minutes=ttl_minutes)
                 
                 return data
             else:
@@ -361,6 +374,32 @@ class CheckWXClient:
             )
             return await self._get_stale_cache(cache_key)
     
+    async def _revalidate(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Background refresh for a stale cache entry.
+
+        Registered with the cache manager, which stores the returned data.
+        
+        Args:
+            endpoint: API endpoint path
+        
+        Returns:
+            Fresh API data, or None if rate limited or the request failed
+        """
+        if not self._check_rate_limit():
+            return None
+
+        try:
+            data = await self._api_call(endpoint)
+        except Exception as e:
+            _LOGGER.warning("CheckWX: Background refresh of %s failed: %s", endpoint, e)
+            data = None
+
+        if data is None:
+            self._consecutive_failures += 1
+        else:
+            self._consecutive_failures = 0
+        return data
+    
     async def _api_call(self, endpoint: str) -> Optional[Dict[str, Any]]:
         """Execute HTTP request to CheckWX API.
         
@@ -523,131 +562,6 @@ class CheckWXClient:
         
         return True
     
-    def _get_memory_cache(
-        self,
-        cache_key: str,
-        cache_ttl: timedelta
-    ) -> Optional[Dict[str, Any]]:
-        """Retrieve data from memory cache if valid.
-        
-        Args:
-            cache_key: Cache identifier
-            cache_ttl: Maximum age for valid cache
-        
-        Returns:
-            Cached data if valid, None otherwise
-        """
-        if cache_key in self._memory_cache:
-            data, timestamp = self._memory_cache[cache_key]
-            age = dt_util.utcnow() - timestamp
-            
-            if age < cache_ttl:
-                # Valid cache - move to end for LRU
-                self._memory_cache.move_to_end(cache_key)
-                return data
-        
-        return None
-    
-    def _set_memory_cache(self, cache_key: str, data: Dict[str, Any]) -> None:
-        """Store data in memory cache with LRU eviction.
-        
-        Args:
-            cache_key: Cache identifier
-            data: Data to cache
-        """
-        timestamp = dt_util.utcnow()
-        self._memory_cache[cache_key] = (data, timestamp)
-        self._memory_cache.move_to_end(cache_key)
-        
-        # Evict oldest entries if over limit
-        while len(self._memory_cache) > self._max_memory_entries:
-            evicted_key, _ = self._memory_cache.popitem(last=False)
-            _LOGGER.debug("CheckWX: Evicted memory cache entry: %s", evicted_key)
-    
-    async def _get_persistent_cache(
-        self,
-        cache_key: str,
-        cache_ttl: timedelta
-    ) -> Optional[Dict[str, Any]]:
-        """Retrieve data from persistent file cache if valid.
-        
-        Args:
-            cache_key: Cache identifier
-            cache_ttl: Maximum age for valid cache
-        
-        Returns:
-            Cached data if valid, None otherwise
-        """
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        
-        def _read_cache():
-            """Read cache file (blocking I/O)."""
-            try:
-                if not cache_file.exists():
-                    return None
-                
-                with open(cache_file, 'rb') as f:
-                    if HAS_ORJSON:
-                        cached = orjson.loads(f.read())
-                    else:
-                        cached = json.load(f)
-                
-                timestamp_str = cached.get("_cache_timestamp")
-                if not timestamp_str:
-                    return None
-                
-                timestamp = datetime.fromisoformat(timestamp_str)
-                age = dt_util.utcnow() - timestamp
-                
-                if age < cache_ttl:
-                    return cached.get("data")
-                
-                return None
-            
-            except (OSError, json.JSONDecodeError, ValueError) as e:
-                _LOGGER.debug("CheckWX: Cache read error for %s: %s", cache_key, e)
-                return None
-        
-        # Run blocking I/O in executor
-        return await self._hass.async_add_executor_job(_read_cache)
-    
-    async def _set_persistent_cache(
-        self,
-        cache_key: str,
-        data: Dict[str, Any]
-    ) -> None:
-        """Store data in persistent file cache.
-        
-        Args:
-            cache_key: Cache identifier
-            data: Data to cache
-        """
-        def _write_cache():
-            """Write cache file (blocking I/O)."""
-            try:
-                # Create cache directory if needed
-                self._cache_dir.mkdir(parents=True, exist_ok=True)
-                
-                cache_file = self._cache_dir / f"{cache_key}.json"
-                
-                cached = {
-                    "_cache_timestamp": dt_util.utcnow().isoformat(),
-                    "data": data
-                }
-                
-                with open(cache_file, 'wb') as f:
-                    if HAS_ORJSON:
-                        f.write(orjson.dumps(cached))
-                    else:
-                        json_str = json.dumps(cached)
-                        f.write(json_str.encode('utf-8'))
-            
-            except OSError as e:
-                _LOGGER.error("CheckWX: Cache write error for %s: %s", cache_key, e)
-        
-        # Run blocking I/O in executor
-        await self._hass.async_add_executor_job(_write_cache)
-    
     async def _get_stale_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve stale cache as fallback (ignores TTL).
         
@@ -659,38 +573,12 @@ class CheckWXClient:
         Returns:
             Cached data regardless of age, None if no cache exists
         """
-        # Check memory cache (any age)
-        if cache_key in self._memory_cache:
-            data, _ = self._memory_cache[cache_key]
-            _LOGGER.info("CheckWX: Using stale memory cache for %s", cache_key)
+        # The request just failed or was rate limited: don't retry in the background
+        data, _ = await self._cache.get_with_stale(cache_key, revalidate=False)
+        if data is not None:
+            _LOGGER.info("CheckWX: Using stale cache for %s", cache_key)
             return data
         
-        # Check persistent cache (any age)
-        if self._cache_enabled:
-            cache_file = self._cache_dir / f"{cache_key}.json"
-            
-            def _read_stale():
-                try:
-                    if not cache_file.exists():
-                        return None
-                    
-                    with open(cache_file, 'rb') as f:
-                        if HAS_ORJSON:
-                            cached = orjson.loads(f.read())
-                        else:
-                            cached = json.load(f)
-                    
-                    return cached.get("data")
-                
-                except (OSError, json.JSONDecodeError) as e:
-                    _LOGGER.debug("CheckWX: Stale cache read error: %s", e)
-                    return None
-            
-            data = await self._hass.async_add_executor_job(_read_stale)
-            if data:
-                _LOGGER.info("CheckWX: Using stale persistent cache for %s", cache_key)
-                return data
-        
         _LOGGER.warning("CheckWX: No cache available for %s", cache_key)
         return None
     
@@ -702,42 +590,33 @@ class CheckWXClient:
         """
         if icao:
             icao = icao.upper()
-            # Clear memory cache
-            keys_to_remove = [k for k in self._memory_cache.keys() if icao in k]
-            for key in keys_to_remove:
-                del self._memory_cache[key]
-            
-            # Clear persistent cache
-            if self._cache_enabled:
-                def _remove_files():
-                    if self._cache_dir.exists():
-                        for file in self._cache_dir.glob(f"*{icao}*.json"):
-                            try:
-                                file.unlink()
-                            except OSError as e:
-                                _LOGGER.error("Error deleting cache file: %s", e)
-                
-                await self._hass.async_add_executor_job(_remove_files)
+            for cache_key in self._cache_keys_for_icao(icao):
+                await self._cache.delete(cache_key)
             
             _LOGGER.info("CheckWX: Cleared cache for %s", icao)
         else:
-            # Clear all memory cache
-            self._memory_cache.clear()
-            
-            # Clear all persistent cache
-            if self._cache_enabled:
-                def _remove_all():
-                    if self._cache_dir.exists():
-                        for file in self._cache_dir.glob("*.json"):
-                            try:
-                                file.unlink()
-                            except OSError as e:
-                                _LOGGER.error("Error deleting cache file: %s", e)
-                
-                await self._hass.async_add_executor_job(_remove_all)
-            
+            await self._cache.clear()
             _LOGGER.info("CheckWX: Cleared all cache")
     
+    @staticmethod
+    def _cache_keys_for_icao(icao: str) -> list[str]:
+        """List every cache key this client may store for an ICAO code.
+        
+        Args:
+            icao: Upper-case 4-letter ICAO code
+        
+        Returns:
+            Cache keys for METAR, TAF, station and sun times data
+        """
+        return [
+            f"metar_{icao}_decoded",
+            f"metar_{icao}_raw",
+            f"taf_{icao}_decoded",
+            f"taf_{icao}_raw",
+            f"station_{icao}",
+            f"suntimes_{icao}",
+        ]
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics and rate limit information.
         
@@ -752,11 +631,13 @@ class CheckWXClient:
                     "consecutive_failures": 0
                 }
         """
+        cache_stats = self._cache.get_stats()
         return {
-            "memory_cache_entries": len(self._memory_cache),
-            "memory_cache_max": self._max_memory_entries,
-            "persistent_cache_enabled": self._cache_enabled,
-            "cache_directory": str(self._cache_dir),
+            "memory_cache_entries": cache_stats["memory_entries"],
+            "memory_cache_max": self._cache.max_memory_entries,
+            "persistent_cache_enabled": self._cache.persistent_enabled,
+            "cache_directory": str(self._cache.cache_dir),
+            "cache_hit_rate": cache_stats["hit_rate"],
             "daily_requests": self._daily_requests,
             "rate_limit": RATE_LIMIT_FREE_TIER,
             "remaining_requests": max(0, RATE_LIMIT_FREE_TIER - self._daily_requests),
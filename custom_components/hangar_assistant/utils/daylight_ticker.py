@@ -0,0 +1,168 @@
+"""Integration-wide minute ticker for daylight countdown entities.
+
+Daylight countdowns change every minute, but each airfield's sun events
+only change a few times a day. Rather than every countdown entity polling
+(and recomputing) on its own, all of them register here:
+
+1. One ``async_track_time_change`` callback at second 0 of every minute
+   refreshes every registered countdown in a single batch. Each refresh
+   is a bisection into the airfield's precomputed DaylightTimeline.
+2. One point-in-time timer is kept for the earliest upcoming sunrise or
+   sunset across all airfields, so phase flips (day/night) are published
+   at the exact boundary rather than up to a minute late. When it fires,
+   only the countdowns whose airfield crossed a boundary are refreshed
+   and the timer is moved to the next boundary.
+
+The ticker starts with the first registration and stops with the last,
+so it needs no setup or unload hooks of its own.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_change,
+)
+from homeassistant.util import dt as dt_util
+
+from ..const import DOMAIN
+from .ephemeris import DaylightTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key: DaylightTicker (shared by all config entries)
+DAYLIGHT_TICKER_KEY = "daylight_ticker"
+
+# An airfield crossed a boundary if it was its next one just before
+_EPSILON = timedelta(microseconds=1)
+
+Refresh = Callable[[], None]
+
+
+class DaylightTicker:
+    """Refresh all daylight countdowns each minute and at sun boundaries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an idle ticker.
+
+        Args:
+            hass: Home Assistant instance
+        """
+        self._hass = hass
+        self._subscribers: list[tuple[Refresh, DaylightTimeline | None]] = []
+        self._cancel_minute: CALLBACK_TYPE | None = None
+        self._cancel_boundary: CALLBACK_TYPE | None = None
+        self._boundary: datetime | None = None
+
+    @property
+    def active(self) -> bool:
+        """True while the minute tick is scheduled."""
+        return self._cancel_minute is not None
+
+    @property
+    def next_boundary(self) -> datetime | None:
+        """The sun boundary the exact-time timer is set for, if any."""
+        return self._boundary
+
+    @callback
+    def async_register(
+        self,
+        refresh: Refresh,
+        timeline: DaylightTimeline | None = None,
+    ) -> CALLBACK_TYPE:
+        """Refresh a countdown every minute (and at its airfield's boundaries).
+
+        Args:
+            refresh: Callback that recomputes and writes the entity state
+            timeline: The airfield's timeline, or None (minute ticks only)
+
+        Returns:
+            Callback that unregisters the countdown
+        """
+        subscriber = (refresh, timeline)
+        self._subscribers.append(subscriber)
+        if self._cancel_minute is None:
+            self._cancel_minute = async_track_time_change(
+                self._hass, self._async_tick, second=0)
+            _LOGGER.debug("Daylight ticker started")
+        self._schedule_boundary(dt_util.utcnow())
+
+        @callback
+        def _unregister() -> None:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            if not self._subscribers:
+                self._stop()
+
+        return _unregister
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Refresh every countdown (once a minute)."""
+        for refresh, _timeline in list(self._subscribers):
+            refresh()
+
+    @callback
+    def _async_boundary(self, now: datetime) -> None:
+        """Refresh the countdowns whose airfield just crossed a boundary."""
+        boundary = self._boundary
+        self._cancel_boundary = None
+        self._boundary = None
+        for refresh, timeline in list(self._subscribers):
+            if timeline is not None and boundary is not None and (
+                timeline.next_boundary(boundary - _EPSILON) == boundary
+            ):
+                refresh()
+        self._schedule_boundary(now)
+
+    def _schedule_boundary(self, now: datetime) -> None:
+        """Point the exact-time timer at the earliest upcoming boundary."""
+        upcoming = [
+            when for when in (
+                timeline.next_boundary(now)
+                for _refresh, timeline in self._subscribers
+                if timeline is not None)
+            if when is not None
+        ]
+        boundary = min(upcoming) if upcoming else None
+        if boundary == self._boundary:
+            return
+        if self._cancel_boundary is not None:
+            self._cancel_boundary()
+            self._cancel_boundary = None
+        self._boundary = boundary
+        if boundary is not None:
+            self._cancel_boundary = async_track_point_in_utc_time(
+                self._hass, self._async_boundary, boundary)
+
+    def _stop(self) -> None:
+        for cancel in (self._cancel_minute, self._cancel_boundary):
+            if cancel is not None:
+                cancel()
+        self._cancel_minute = None
+        self._cancel_boundary = None
+        self._boundary = None
+        _LOGGER.debug("Daylight ticker stopped")
+
+
+def get_daylight_ticker(hass: HomeAssistant) -> DaylightTicker:
+    """Return the integration-wide ticker, creating it on first use.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        DaylightTicker (not shared when hass.data is unavailable, as in tests)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return DaylightTicker(hass)
+    domain_data = hass_data.setdefault(DOMAIN, {})
+    ticker = domain_data.get(DAYLIGHT_TICKER_KEY)
+    if ticker is None:
+        ticker = DaylightTicker(hass)
+        domain_data[DAYLIGHT_TICKER_KEY] = ticker
+    return ticker
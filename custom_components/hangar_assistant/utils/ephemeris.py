@@ -0,0 +1,302 @@
+"""Per-airfield, per-day sun ephemeris with legal daylight bounds.
+
+Sunrise, sunset and civil twilight only change once a day for a given
+location, but the forecast window, AI briefings and daylight countdowns
+used to recompute them (or re-parse Home Assistant's ``sun.sun``, which is
+for the home location rather than the airfield) on every call. This module
+computes each airfield's day once, from the airfield's own coordinates,
+and memoises it:
+
+    day = get_day_ephemeris(51.5, -0.12, date(2026, 6, 21))
+    day.sunrise, day.sunset                 # UTC datetimes
+    day.civil_dawn, day.civil_dusk          # None if the sun never gets 6° below
+    day.legal_daylight_start/end            # sunrise - 30 min / sunset + 30 min
+
+``DaylightTimeline`` (and the one-off ``sun_events``) answers "is it day
+now, and when does the sun next rise and set?" from the cached days around
+``now``, so it is exact for airfields far from UTC and costs a bisection
+per call.
+
+Astral (shipped with Home Assistant) is used when available; otherwise a
+coarse approximation is used and a warning logged once.
+"""
+
+import bisect
+import logging
+import math
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+_LOGGER = logging.getLogger(__name__)
+
+# UK SERA.5005 / ANO night definition: night starts 30 minutes after sunset
+# and ends 30 minutes before sunrise
+LEGAL_DAYLIGHT_MARGIN = timedelta(minutes=30)
+
+# Airfields × days kept (a week for ~30 airfields)
+MAX_CACHED_DAYS = 256
+
+# Coordinates are rounded to ~10 m so float noise never misses the cache
+_COORD_PRECISION = 4
+
+_warned_no_astral = False
+
+
+class DayEphemeris:
+    """Sun events for one location on one UTC date (all times UTC)."""
+
+    __slots__ = (
+        "day", "sunrise", "sunset", "civil_dawn", "civil_dusk",
+        "legal_daylight_start", "legal_daylight_end",
+    )
+
+    def __init__(
+        self,
+        day: date,
+        sunrise: datetime | None,
+        sunset: datetime | None,
+        civil_dawn: datetime | None = None,
+        civil_dusk: datetime | None = None,
+    ) -> None:
+        """Initialise from computed events.
+
+        Args:
+            day: Date the events were computed for
+            sunrise: Sunrise, or None if the sun does not rise/set that day
+            sunset: Sunset, or None if the sun does not rise/set that day
+            civil_dawn: Start of civil twilight, if any
+            civil_dusk: End of civil twilight, if any
+        """
+        self.day = day
+        self.sunrise = sunrise
+        self.sunset = sunset
+        self.civil_dawn = civil_dawn
+        self.civil_dusk = civil_dusk
+        self.legal_daylight_start = (
+            sunrise - LEGAL_DAYLIGHT_MARGIN if sunrise else None)
+        self.legal_daylight_end = (
+            sunset + LEGAL_DAYLIGHT_MARGIN if sunset else None)
+
+    def as_dict(self) -> dict[str, str | None]:
+        """Return the events as ISO strings (for attributes and prompts)."""
+        return {
+            name: value.isoformat() if value else None
+            for name, value in (
+                ("civil_dawn", self.civil_dawn),
+                ("sunrise", self.sunrise),
+                ("sunset", self.sunset),
+                ("civil_dusk", self.civil_dusk),
+                ("legal_daylight_start", self.legal_daylight_start),
+                ("legal_daylight_end", self.legal_daylight_end),
+            )
+        }
+
+
+class SunEvents:
+    """Current sun phase and next events for a location at an instant."""
+
+    __slots__ = ("phase", "next_rising", "next_setting")
+
+    def __init__(
+        self,
+        phase: str,
+        next_rising: datetime | None,
+        next_setting: datetime | None,
+    ) -> None:
+        """Initialise.
+
+        Args:
+            phase: "day" if the sun is above the horizon, else "night"
+            next_rising: Next sunrise, if any within two days
+            next_setting: Next sunset, if any within two days
+        """
+        self.phase = phase
+        self.next_rising = next_rising
+        self.next_setting = next_setting
+
+    @property
+    def legal_daylight_start(self) -> datetime | None:
+        """Start of the next legal daylight period."""
+        if self.next_rising is None:
+            return None
+        return self.next_rising - LEGAL_DAYLIGHT_MARGIN
+
+    @property
+    def legal_daylight_end(self) -> datetime | None:
+        """End of the current (or next) legal daylight period."""
+        if self.next_setting is None:
+            return None
+        return self.next_setting + LEGAL_DAYLIGHT_MARGIN
+
+
+def _approximate_day(latitude: float, longitude: float, day: date) -> DayEphemeris:
+    """Rough sunrise/sunset (±15 min at mid-latitudes) without astral."""
+    day_of_year = day.timetuple().tm_yday
+    day_length_hours = 12 + 4 * math.sin((day_of_year - 80) * 2 * math.pi / 365)
+    solar_noon = datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+    solar_noon -= timedelta(hours=longitude / 15)
+    half_day = timedelta(hours=day_length_hours / 2)
+    return DayEphemeris(day, solar_noon - half_day, solar_noon + half_day)
+
+
+def _compute_day(latitude: float, longitude: float, day: date) -> DayEphemeris:
+    global _warned_no_astral
+    try:
+        from astral import Observer
+        from astral import sun as astral_sun
+    except ImportError:
+        if not _warned_no_astral:
+            _warned_no_astral = True
+            _LOGGER.warning(
+                "Astral library not available, using approximation for sunrise/sunset")
+        return _approximate_day(latitude, longitude, day)
+
+    observer = Observer(latitude=latitude, longitude=longitude)
+
+    def _event(func, **kwargs) -> datetime | None:
+        # Astral raises ValueError when the event does not happen that day
+        # (midnight sun, polar night, or twilight that never ends)
+        try:
+            return func(observer, date=day, tzinfo=timezone.utc, **kwargs)
+        except ValueError:
+            return None
+
+    return DayEphemeris(
+        day,
+        sunrise=_event(astral_sun.sunrise),
+        sunset=_event(astral_sun.sunset),
+        civil_dawn=_event(astral_sun.dawn, depression=6),
+        civil_dusk=_event(astral_sun.dusk, depression=6),
+    )
+
+
+@lru_cache(maxsize=MAX_CACHED_DAYS)
+def _cached_day(latitude: float, longitude: float, day: date) -> DayEphemeris:
+    return _compute_day(latitude, longitude, day)
+
+
+def get_day_ephemeris(latitude: float, longitude: float, day: date) -> DayEphemeris:
+    """Return the sun events for a location and UTC date (memoised).
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        day: UTC date
+
+    Returns:
+        DayEphemeris (shared; do not mutate)
+    """
+    return _cached_day(
+        round(float(latitude), _COORD_PRECISION),
+        round(float(longitude), _COORD_PRECISION),
+        day)
+
+
+class DaylightTimeline:
+    """Precomputed sunrise/sunset boundaries around now for one airfield.
+
+    Holds the sorted boundaries from yesterday to the day after tomorrow
+    (from the memoised days), so answering "what phase is it and when is
+    the next boundary?" is a bisection. It rebuilds itself when the UTC
+    date changes.
+    """
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        """Initialise (boundaries are built on first use).
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+        """
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+        self._built_for: date | None = None
+        self._times: list[datetime] = []
+        self._kinds: list[str] = []
+
+    def _ensure(self, now: datetime) -> None:
+        today = now.astimezone(timezone.utc).date()
+        if today == self._built_for:
+            return
+        boundaries: list[tuple[datetime, str]] = []
+        for offset in (-1, 0, 1, 2):
+            day = get_day_ephemeris(
+                self.latitude, self.longitude, today + timedelta(days=offset))
+            if day.sunrise:
+                boundaries.append((day.sunrise, "rise"))
+            if day.sunset:
+                boundaries.append((day.sunset, "set"))
+        boundaries.sort()
+        self._times = [when for when, _ in boundaries]
+        self._kinds = [kind for _, kind in boundaries]
+        self._built_for = today
+
+    def events_at(self, now: datetime) -> SunEvents:
+        """Return the sun phase and next sunrise/sunset at an instant.
+
+        Args:
+            now: Timezone-aware instant
+
+        Returns:
+            SunEvents
+        """
+        self._ensure(now)
+        index = bisect.bisect_right(self._times, now)
+        next_rising = next_setting = None
+        for when, kind in zip(self._times[index:], self._kinds[index:]):
+            if kind == "rise" and next_rising is None:
+                next_rising = when
+            elif kind == "set" and next_setting is None:
+                next_setting = when
+            if next_rising and next_setting:
+                break
+
+        if index > 0:
+            phase = "day" if self._kinds[index - 1] == "rise" else "night"
+        elif next_rising or next_setting:
+            # End of a polar day or night: the sun sets next only if it is up
+            first = min(when for when in (next_rising, next_setting) if when)
+            phase = "day" if first == next_setting else "night"
+        else:
+            phase = "day" if _sun_is_up(
+                self.latitude, self.longitude, now) else "night"
+        return SunEvents(phase, next_rising, next_setting)
+
+    def next_boundary(self, now: datetime) -> datetime | None:
+        """Return the next sunrise or sunset after now, if any."""
+        self._ensure(now)
+        index = bisect.bisect_right(self._times, now)
+        return self._times[index] if index < len(self._times) else None
+
+
+def sun_events(latitude: float, longitude: float, now: datetime) -> SunEvents:
+    """Return the sun phase and next sunrise/sunset at an instant.
+
+    Looks at the cached days either side of ``now`` so the answer is right
+    wherever the airfield is relative to UTC. Callers asking repeatedly for
+    the same airfield should keep a DaylightTimeline instead.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        now: Timezone-aware instant
+
+    Returns:
+        SunEvents
+    """
+    return DaylightTimeline(latitude, longitude).events_at(now)
+
+
+def _sun_is_up(latitude: float, longitude: float, now: datetime) -> bool:
+    """Return True if the sun is above the horizon (polar day/night only)."""
+    try:
+        from astral import Observer
+        from astral.sun import elevation
+    except ImportError:
+        return False
+    return elevation(Observer(latitude=latitude, longitude=longitude), now) > 0
+
+
+def clear_ephemeris_cache() -> None:
+    """Drop all memoised days (used by tests)."""
+    _cached_day.cache_clear()
@@ -0,0 +1,112 @@
+"""Load optional feature modules only when their integration is enabled.
+
+The integration package and platforms used to import every feature module
+(NOTAM client and XML parser, forecast analysis, ...) at import time,
+whether or not the feature was configured, which adds to Home Assistant's
+boot time on low-end hardware. Feature code now imports its modules
+inside the functions that use them, and this module preloads the modules
+for the features an entry has enabled:
+
+    features = enabled_features(entry.data)
+    await async_import_features(hass, features)
+
+Preloading runs in the executor during entry setup, so the first call into
+a feature never performs a blocking import on the event loop; the
+function-level imports are then plain ``sys.modules`` hits. The time each
+module took to import is logged at debug level (see also
+``scripts/import_benchmark.py`` for a reproducible per-module report).
+"""
+
+import importlib
+import logging
+import sys
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE = __name__.rsplit(".", 2)[0]
+
+# Feature -> modules (relative to the integration package) it needs
+FEATURE_MODULES: dict[str, tuple[str, ...]] = {
+    "openweathermap": (
+        ".utils.openweathermap",
+        ".utils.forecast_frame",
+        ".utils.forecast_analysis",
+        ".utils.flyability",
+    ),
+    "notams": (".utils.notam", ".utils.qcode_parser"),
+    "checkwx": (".utils.checkwx_client",),
+    "ai_assistant": (".utils.forecast_analysis",),
+}
+
+
+def enabled_features(data: Mapping[str, Any]) -> set[str]:
+    """Return the optional features a config entry has enabled.
+
+    Args:
+        data: Config entry data
+
+    Returns:
+        Subset of FEATURE_MODULES keys
+    """
+    if not isinstance(data, Mapping):
+        return set()
+    integrations = data.get("integrations") or {}
+    features = {
+        name for name in ("openweathermap", "notams", "checkwx")
+        if (integrations.get(name) or {}).get("enabled")
+    }
+    if (data.get("ai_assistant") or {}).get("ai_agent_entity"):
+        features.add("ai_assistant")
+    return features
+
+
+def import_features(features: Iterable[str]) -> dict[str, float]:
+    """Import the modules for features (blocking; run in the executor).
+
+    Args:
+        features: Feature names (unknown names are ignored)
+
+    Returns:
+        Seconds taken per newly imported module
+    """
+    timings: dict[str, float] = {}
+    for feature in sorted(features):
+        for module in FEATURE_MODULES.get(feature, ()):
+            name = _PACKAGE + module if module.startswith(".") else module
+            if name in sys.modules or name in timings:
+                continue
+            started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                _LOGGER.warning(
+                    "Could not load %s for feature %s: %s", name, feature, e)
+                continue
+            timings[name] = time.perf_counter() - started
+    return timings
+
+
+async def async_import_features(
+    hass: HomeAssistant, features: Iterable[str]
+) -> dict[str, float]:
+    """Import the modules for features in the executor.
+
+    Args:
+        hass: Home Assistant instance
+        features: Feature names
+
+    Returns:
+        Seconds taken per newly imported module
+    """
+    features = set(features)
+    if not features:
+        return {}
+    timings = await hass.async_add_executor_job(import_features, features)
+    for name, seconds in timings.items():
+        _LOGGER.debug("Imported %s in %.1f ms", name, seconds * 1000)
+    return timings
@@ -0,0 +1,152 @@
+"""Hourly flyability scores for an aircraft at an airfield, kept incrementally.
+
+``find_optimal_flying_window`` scores forecast points from scratch for
+each briefing. For continuous planning data the flyability sensor keeps a
+``FlyabilityTimeline`` instead: one score (0-100, higher is better; see
+``forecast_analysis.score_forecast_point``) per forecast hour over the
+next 48 hours. Each hour remembers the inputs it was scored from (wind,
+direction, cloud, visibility, precipitation), so when the forecast
+refreshes only hours that are new or whose inputs changed are rescored;
+hours that have passed or left the forecast are dropped.
+
+The timeline is exposed compactly for dashboard charts: a start hour and
+a list of scores, one per hour (``None`` for hours missing from the
+forecast).
+"""
+
+import bisect
+import math
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from .forecast_analysis import score_forecast_point
+from .forecast_frame import ForecastFrame
+
+FLYABILITY_HORIZON_H = 48
+
+# Scores above this are "acceptable" (as in find_optimal_flying_window)
+FLYABLE_SCORE = 50
+
+# Columns a point's score depends on
+_INPUT_COLUMNS = ("wind_kt", "wind_dir", "cloud_pct", "visibility_m", "precip_mm")
+
+_HOUR = 3600
+
+
+def _hour_of(epoch: float) -> int:
+    return int(epoch // _HOUR * _HOUR)
+
+
+def _iso(hour: int) -> str:
+    return datetime.fromtimestamp(hour, tz=timezone.utc).isoformat()
+
+
+class FlyabilityTimeline:
+    """Hourly flyability scores, rescored only where the forecast changed."""
+
+    def __init__(
+        self,
+        wind_limit_kt: Optional[float] = None,
+        crosswind_limit_kt: Optional[float] = None,
+        runway_heading: Optional[int] = None,
+        horizon_h: int = FLYABILITY_HORIZON_H,
+    ) -> None:
+        """Initialise an empty timeline.
+
+        Args:
+            wind_limit_kt: Maximum wind speed in knots (optional)
+            crosswind_limit_kt: Maximum crosswind component in knots (optional)
+            runway_heading: Runway heading in degrees (optional)
+            horizon_h: Hours ahead to keep scores for
+        """
+        self._limits = (wind_limit_kt, crosswind_limit_kt, runway_heading)
+        self._horizon_s = horizon_h * _HOUR
+        # Hour (epoch seconds) -> (scoring inputs, score), in hour order
+        self._hours: dict[int, tuple[tuple, float]] = {}
+        self.rescored = 0
+
+    def __len__(self) -> int:
+        """Return the number of hours with a score."""
+        return len(self._hours)
+
+    def update(self, frame: ForecastFrame, now: datetime) -> int:
+        """Bring the timeline up to date with a forecast.
+
+        Args:
+            frame: Forecast frame (time-sorted)
+            now: Current time (timezone-aware)
+
+        Returns:
+            Number of hours that were (re)scored
+        """
+        start = _hour_of(now.timestamp())
+        lo = bisect.bisect_left(frame.times, start)
+        hi = bisect.bisect_left(frame.times, start + self._horizon_s, lo)
+        columns = [frame.column(name) for name in _INPUT_COLUMNS]
+
+        hours: dict[int, tuple[tuple, float]] = {}
+        rescored = 0
+        for index in range(lo, hi):
+            hour = _hour_of(frame.times[index])
+            # nan != nan, so missing values are keyed as None
+            inputs = tuple(
+                None if math.isnan(value) else value
+                for value in (column[index] for column in columns)
+            )
+            previous = self._hours.get(hour)
+            if previous is not None and previous[0] == inputs:
+                hours[hour] = previous
+                continue
+            score = score_forecast_point(frame, index, *self._limits)
+            hours[hour] = (inputs, round(score, 1))
+            rescored += 1
+
+        # Hours that passed or left the forecast are not carried over
+        self._hours = hours
+        self.rescored = rescored
+        return rescored
+
+    def score_at(self, when: datetime) -> float | None:
+        """Return the score for the hour containing when, if known."""
+        entry = self._hours.get(_hour_of(when.timestamp()))
+        return entry[1] if entry is not None else None
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Return the timeline in a compact, chart-friendly form.
+
+        Returns:
+            Dictionary with start (ISO hour), interval_minutes, scores (one
+            per hour from start, None where the forecast has a gap),
+            best_hour, best_score, next_flyable_hour and rescored_hours
+        """
+        if not self._hours:
+            return {
+                "start": None,
+                "interval_minutes": 60,
+                "scores": [],
+                "best_hour": None,
+                "best_score": None,
+                "next_flyable_hour": None,
+                "rescored_hours": self.rescored,
+            }
+
+        first = next(iter(self._hours))
+        last = next(reversed(self._hours))
+        scores: list[float | None] = [None] * ((last - first) // _HOUR + 1)
+        best_hour, best_score, next_flyable = first, -1.0, None
+        for hour, (_inputs, score) in self._hours.items():
+            scores[(hour - first) // _HOUR] = score
+            if score > best_score:
+                best_hour, best_score = hour, score
+            if next_flyable is None and score > FLYABLE_SCORE:
+                next_flyable = hour
+
+        return {
+            "start": _iso(first),
+            "interval_minutes": 60,
+            "scores": scores,
+            "best_hour": _iso(best_hour),
+            "best_score": best_score,
+            "next_flyable_hour": _iso(next_flyable) if next_flyable else None,
+            "rescored_hours": self.rescored,
+        }
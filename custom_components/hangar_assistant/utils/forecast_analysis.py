@@ -5,14 +5,25 @@ Analyzes OpenWeatherMap forecast data to:
 2. Identify trend (improving/stable/deteriorating)
 3. Flag overnight conditions affecting airfield serviceability
 4. Calculate optimal flying windows
+
+Every analysis accepts either forecast dicts or a ForecastFrame. Callers
+running several analyses on the same forecast should build the frame once
+(``ForecastFrame.from_forecast``) and pass it to each, so each forecast
+point is parsed a single time.
 """
 
 import logging
 import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from collections.abc import Mapping
 from typing import Optional, Dict, Any, List, Tuple
 from homeassistant.util import dt as dt_util
 
+from .ephemeris import get_day_ephemeris
+from .forecast_frame import ForecastFrame, as_forecast_frame, value_or
+from .forecast_trends import trends_for_frame
+from .overnight_rules import OVERNIGHT_RULES, evaluate_overnight
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -22,8 +33,8 @@ def calculate_sunset_sunrise(latitude: float,
                                                       datetime]:
     """Calculate sunrise and sunset times for a location and date.
 
-    Uses simplified approximation suitable for mid-latitudes.
-    For production, consider using astral library for precision.
+    Served from the per-airfield ephemeris cache, so each location's day is
+    only computed once.
 
     Args:
         latitude: Latitude in decimal degrees
@@ -32,40 +43,15 @@ def calculate_sunset_sunrise(latitude: float,
 
     Returns:
         Tuple of (sunrise_time, sunset_time) as timezone-aware datetimes
-    """
-    # Simplified calculation - for production, use astral library
-    # This approximation is accurate to ~15 minutes for mid-latitudes
-
-    try:
-        from astral import LocationInfo
-        from astral.sun import sun
-
-        location = LocationInfo(latitude=latitude, longitude=longitude)
-        s = sun(location.observer, date=date.date())
-
-        return (s['sunrise'], s['sunset'])
-
-    except ImportError:
-        # Fallback to simple approximation if astral not available
-        _LOGGER.warning(
-            "Astral library not available, using approximation for sunrise/sunset")
-
-        # Very rough approximation for UK latitudes
-        # Assumes ~8 hour day in winter, ~16 hour day in summer
-        day_of_year = date.timetuple().tm_yday
-        day_length_hours = 12 + 4 * \
-            math.sin((day_of_year - 80) * 2 * math.pi / 365)
 
-        # Noon at longitude
-        noon_offset_hours = longitude / 15  # 15 degrees per hour
-        solar_noon = date.replace(hour=12, minute=0, second=0, microsecond=0)
-        solar_noon += timedelta(hours=noon_offset_hours)
-
-        half_day = timedelta(hours=day_length_hours / 2)
-        sunrise = solar_noon - half_day
-        sunset = solar_noon + half_day
-
-        return (sunrise, sunset)
+    Raises:
+        ValueError: If the sun does not rise or set that day (polar regions)
+    """
+    day = get_day_ephemeris(latitude, longitude, date.date())
+    if day.sunrise is None or day.sunset is None:
+        raise ValueError(
+            f"No sunrise/sunset at {latitude}, {longitude} on {day.day}")
+    return (day.sunrise, day.sunset)
 
 
 def get_forecast_window(
@@ -91,7 +77,7 @@ def get_forecast_window(
     if now is None:
         now = dt_util.utcnow()
 
-    sunrise_today, sunset_today = calculate_sunset_sunrise(
+    _sunrise_today, sunset_today = calculate_sunset_sunrise(
         latitude, longitude, now)
 
     # If before sunset today, use current → sunset
@@ -106,26 +92,6 @@ def get_forecast_window(
     return (sunrise_tomorrow, sunset_tomorrow, True)
 
 
-def _calculate_trend(values: List[float], threshold: float = 0.1) -> str:
-    """Determine if values are increasing/decreasing/stable.
-
-    Args:
-        values: List of numeric values over time
-        threshold: Minimum change per period to be considered a trend
-
-    Returns:
-        "increasing", "decreasing", or "stable"
-    """
-    if not values or len(values) < 2:
-        return "stable"
-    avg_change = (values[-1] - values[0]) / len(values)
-    if avg_change > threshold:
-        return "increasing"
-    elif avg_change < -threshold:
-        return "decreasing"
-    return "stable"
-
-
 def _convert_trend_to_word(
         trend: str,
         rising_word: str,
@@ -219,7 +185,7 @@ def _generate_trend_summary(
 
 
 def analyze_forecast_trends(
-        forecast_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        forecast_data: "ForecastFrame | List[Dict[str, Any]]") -> Dict[str, Any]:
     """Analyze forecast data to identify trends.
 
     Analyzes:
@@ -229,8 +195,12 @@ def analyze_forecast_trends(
     - Cloud cover trend (improving/deteriorating/stable)
     - Visibility trend (improving/deteriorating/stable)
 
+    Trends are least-squares slopes per hour of forecast time (see
+    forecast_trends), so a single outlier at either end does not decide
+    them.
+
     Args:
-        forecast_data: List of forecast dicts with hourly data
+        forecast_data: Forecast dicts with hourly data, or a ForecastFrame
 
     Returns:
         Dictionary with trend analysis:
@@ -240,31 +210,32 @@ def analyze_forecast_trends(
         - wind_trend: "increasing" / "decreasing" / "stable"
         - cloud_trend: "clearing" / "increasing" / "stable"
         - visibility_trend: "improving" / "deteriorating" / "stable"
+        - horizons: Slope per hour and direction for each variable over
+          the next 3/6/12/24 hours and the whole window
         - summary: Human-readable summary string
     """
-    if not forecast_data or len(forecast_data) < 3:
+    frame = as_forecast_frame(forecast_data)
+    if len(frame) < 3:
         return {
             "overall": "stable",
             "summary": "Insufficient forecast data for trend analysis"
         }
 
-    # Extract data points (handle both OWM format and test format)
-    temps = [f.get("temp") or f.get("temperature", 0) for f in forecast_data]
-    pressures = [f.get("pressure", 1013) for f in forecast_data]
-    winds = [f.get("wind_speed", 0) for f in forecast_data]
-    clouds = [f.get("clouds") or f.get("cloud_coverage", 0)
-              for f in forecast_data]
-
-    # Calculate trends
-    temp_trend = _calculate_trend(temps, 0.5)  # 0.5°C per hour
-    pressure_trend = _calculate_trend(pressures, 0.5)  # 0.5 hPa per hour
-    wind_trend = _calculate_trend(winds, 1.0)  # 1kt per hour
-    cloud_trend = _calculate_trend(clouds, 5.0)  # 5% per hour
+    # One least-squares pass for every variable and horizon, shared with
+    # any other caller analysing the same window
+    trends = trends_for_frame(frame)
+    temp_trend = trends.direction("temperature")
+    pressure_trend = trends.direction("pressure")
+    wind_trend = trends.direction("wind")
+    cloud_trend = trends.direction("clouds")
+    visibility_trend = trends.direction("visibility")
 
     # Convert to domain-specific words
     temp_word = _convert_trend_to_word(temp_trend, "rising", "falling")
     pressure_word = _convert_trend_to_word(pressure_trend, "rising", "falling")
     cloud_word = _convert_trend_to_word(cloud_trend, "increasing", "clearing")
+    visibility_word = _convert_trend_to_word(
+        visibility_trend, "improving", "deteriorating")
 
     # Overall assessment
     overall = _assess_overall_conditions(
@@ -279,196 +250,61 @@ def analyze_forecast_trends(
         "pressure": pressure_word,  # For backward compat with tests
         "wind": wind_trend,  # For backward compat with tests
         "clouds": cloud_word,  # For backward compat with tests
-        "visibility": "stable",  # TODO: Add visibility trend
+        "visibility": visibility_word,
         "temperature_trend": temp_word,
         "pressure_trend": pressure_word,
         "wind_trend": wind_trend,
         "cloud_trend": cloud_word,
+        "visibility_trend": visibility_word,
+        "horizons": trends.as_dict(),
         "summary": summary
     }
 
 
 def _filter_overnight_forecast(
-    forecast_data: List[Dict[str, Any]],
+    forecast_data: "ForecastFrame | List[Dict[str, Any]]",
     overnight_start: datetime,
     overnight_end: datetime
-) -> List[Dict[str, Any]]:
+) -> ForecastFrame:
     """Filter forecast data to overnight period.
 
+    Naive ``datetime`` values are taken to be in the window's timezone.
+
     Args:
-        forecast_data: Full forecast data
+        forecast_data: Full forecast data (dicts or a ForecastFrame)
         overnight_start: Start of overnight period
         overnight_end: End of overnight period
 
     Returns:
-        List of forecast dicts within overnight period
+        ForecastFrame with the points within the overnight period
     """
-    overnight_forecast = []
-    for f in forecast_data:
-        # Handle both OWM format (dt timestamp) and test format (datetime
-        # string)
-        if "dt" in f:
-            f_time = datetime.fromtimestamp(f["dt"], tz=overnight_start.tzinfo)
-        elif "datetime" in f:
-            f_time = datetime.fromisoformat(
-                f["datetime"]) if isinstance(
-                f["datetime"],
-                str) else f["datetime"]
-            # Ensure timezone awareness
-            if f_time.tzinfo is None:
-                f_time = f_time.replace(tzinfo=overnight_start.tzinfo)
-        else:
-            continue
-
-        if overnight_start <= f_time <= overnight_end:
-            overnight_forecast.append(f)
-
-    return overnight_forecast
-
-
-def _check_heavy_rain(
-        overnight_forecast: List[Dict[str, Any]], warnings: Dict[str, Any]) -> None:
-    """Check for heavy rain and update warnings dict.
-
-    Args:
-        overnight_forecast: Filtered forecast for overnight period
-        warnings: Warnings dictionary to update (modified in-place)
-    """
-    for f in overnight_forecast:
-        precip = f.get("precipitation", 0)
-        rain_1h = f.get(
-            "rain",
-            {}).get(
-            "1h",
-            0) if isinstance(
-            f.get("rain"),
-            dict) else precip
-        if rain_1h > 10:  # >10mm/hr
-            warnings["flooding_risk"] = True
-            warnings["has_warnings"] = True
-            warnings["details"].append(
-                f"Heavy rain forecast: {rain_1h:.1f}mm/hr - flooding risk")
-            break
-
-
-def _check_strong_winds(
-        overnight_forecast: List[Dict[str, Any]], warnings: Dict[str, Any]) -> None:
-    """Check for strong winds and update warnings dict.
-
-    Args:
-        overnight_forecast: Filtered forecast for overnight period
-        warnings: Warnings dictionary to update (modified in-place)
-    """
-    for f in overnight_forecast:
-        wind_speed = f.get("wind_speed", 0)
-        # If wind_speed is in m/s (OWM format), convert to knots
-        if wind_speed < 100:  # Assume m/s if < 100
-            wind_speed_kt = wind_speed * 1.94384 if wind_speed < 50 else wind_speed
-        else:
-            wind_speed_kt = wind_speed
-        if wind_speed_kt > 35:
-            warnings["wind_damage_risk"] = True
-            warnings["has_warnings"] = True
-            warnings["details"].append(
-                f"Strong winds forecast: {wind_speed_kt:.0f}kt - potential damage")
-            break
-
-
-def _check_surface_contamination(
-        overnight_forecast: List[Dict[str, Any]], warnings: Dict[str, Any]) -> None:
-    """Check for snow/ice and update warnings dict.
-
-    Args:
-        overnight_forecast: Filtered forecast for overnight period
-        warnings: Warnings dictionary to update (modified in-place)
-    """
-    for f in overnight_forecast:
-        weather = f.get("weather", [])
-        if any(
-            "snow" in w.get(
-                "main",
-                "").lower() or "snow" in w.get(
-                "description",
-                "").lower() for w in weather):
-            warnings["surface_contamination"] = True
-            warnings["has_warnings"] = True
-            warnings["details"].append(
-                "Snow forecast - surface contamination likely")
-            break
-        # Handle both 'temp' and 'temperature' fields
-        temp = f.get("temp") or f.get("temperature", 10)
-        precip = f.get("precipitation", 0)
-        if temp < 0 and precip > 0:
-            warnings["surface_contamination"] = True
-            warnings["has_warnings"] = True
-            warnings["details"].append(
-                "Freezing temperatures with precipitation - ice/snow risk")
-            break
-
-
-def _check_fog_risk(
-        overnight_forecast: List[Dict[str, Any]], warnings: Dict[str, Any]) -> None:
-    """Check for fog risk and update warnings dict.
-
-    Args:
-        overnight_forecast: Filtered forecast for overnight period
-        warnings: Warnings dictionary to update (modified in-place)
-    """
-    for f in overnight_forecast:
-        visibility = f.get("visibility", 10000)
-        humidity = f.get("humidity", 0)
-        temp = f.get("temp") or f.get("temperature", 10)
-        dew_point = f.get("dew_point", temp - 5)
-
-        if visibility < 1000 or (humidity > 90 and abs(temp - dew_point) < 2):
-            warnings["fog_risk"] = True
-            warnings["has_warnings"] = True
-            warnings["details"].append("Fog likely - morning delays possible")
-            break
-
-
-def _generate_overnight_summary(warnings: Dict[str, Any]) -> str:
-    """Generate summary of overnight warnings.
-
-    Args:
-        warnings: Warnings dictionary with flags set
-
-    Returns:
-        Human-readable summary string
-    """
-    if not warnings["has_warnings"]:
-        return "No significant overnight conditions forecast"
-
-    warning_types = []
-    if warnings["flooding_risk"]:
-        warning_types.append("flooding risk")
-    if warnings["wind_damage_risk"]:
-        warning_types.append("wind damage risk")
-    if warnings["surface_contamination"]:
-        warning_types.append("surface contamination")
-    if warnings["fog_risk"]:
-        warning_types.append("morning fog")
-
-    return "Overnight: " + ", ".join(warning_types)
+    frame = as_forecast_frame(
+        forecast_data, overnight_start.tzinfo or timezone.utc)
+    return frame.window(overnight_start, overnight_end)
 
 
 def check_overnight_conditions(
-    forecast_data: List[Dict[str, Any]],
+    forecast_data: "ForecastFrame | List[Dict[str, Any]]",
     overnight_start: datetime,
-    overnight_end: datetime
+    overnight_end: datetime,
+    thresholds: Optional[Mapping[str, float]] = None,
 ) -> Dict[str, Any]:
     """Check overnight forecast for conditions affecting airfield serviceability.
 
-    Flags:
+    Flags (default thresholds; see overnight_rules):
     - Heavy rain (>10mm/hr) - flooding risk
     - Strong winds (>35kt) - potential damage
+    - Gusts (>45kt) - potential damage
     - Snow/ice - surface contamination
     - Fog (visibility <1000m) - morning delays
+    - Thunderstorms and hail
 
     Args:
-        forecast_data: List of forecast dicts with hourly data
+        forecast_data: Forecast dicts with hourly data, or a ForecastFrame
         overnight_start: Start of overnight period
         overnight_end: End of overnight period
+        thresholds: Per-airfield thresholds (see overnight_thresholds);
+            defaults apply to any not given
 
     Returns:
         Dictionary with overnight warnings:
@@ -477,38 +313,27 @@ def check_overnight_conditions(
         - wind_damage_risk: Boolean (strong winds)
         - surface_contamination: Boolean (snow/ice)
         - fog_risk: Boolean (low visibility)
+        - gust_risk, thunderstorm_risk, hail_risk: Booleans
         - summary: Human-readable summary
         - details: List of specific warnings
     """
-    warnings: Dict[str, Any] = {
-        "has_warnings": False,
-        "flooding_risk": False,
-        "wind_damage_risk": False,
-        "surface_contamination": False,
-        "fog_risk": False,
-        "summary": "",
-        "details": []
-    }
-
     # Filter forecast to overnight period
     overnight_forecast = _filter_overnight_forecast(
         forecast_data, overnight_start, overnight_end
     )
 
-    if not overnight_forecast:
-        warnings["summary"] = "No data available for overnight period"
+    if not len(overnight_forecast):
+        warnings: Dict[str, Any] = {
+            rule.flag: False for rule in OVERNIGHT_RULES}
+        warnings.update({
+            "has_warnings": False,
+            "summary": "No data available for overnight period",
+            "details": [],
+        })
         return warnings
 
-    # Check all warning conditions
-    _check_heavy_rain(overnight_forecast, warnings)
-    _check_strong_winds(overnight_forecast, warnings)
-    _check_surface_contamination(overnight_forecast, warnings)
-    _check_fog_risk(overnight_forecast, warnings)
-
-    # Generate summary
-    warnings["summary"] = _generate_overnight_summary(warnings)
-
-    return warnings
+    # Every rule in one pass over the window, cached per forecast fetch
+    return evaluate_overnight(overnight_forecast, thresholds)
 
 
 def _score_wind(wind_speed_kt: float, wind_limit_kt: Optional[float]) -> float:
@@ -548,8 +373,6 @@ def _score_crosswind(
     Returns:
         Score penalty (negative value, 0 to -100)
     """
-    import math
-
     angle = abs(wind_dir - runway_heading)
     if angle > 180:
         angle = 360 - angle
@@ -562,8 +385,9 @@ def _score_crosswind(
     return -xwind_factor * 30
 
 
-def _score_forecast_point(
-    f: Dict[str, Any],
+def score_forecast_point(
+    frame: ForecastFrame,
+    index: int,
     wind_limit_kt: Optional[float],
     crosswind_limit_kt: Optional[float],
     runway_heading: Optional[int]
@@ -571,7 +395,8 @@ def _score_forecast_point(
     """Score a single forecast point for flying conditions (0-100, higher = better).
 
     Args:
-        f: Forecast data point
+        frame: Forecast frame
+        index: Index of the point in the frame
         wind_limit_kt: Maximum wind speed in knots (optional)
         crosswind_limit_kt: Maximum crosswind component in knots (optional)
         runway_heading: Runway heading in degrees (optional)
@@ -582,40 +407,32 @@ def _score_forecast_point(
     score: float = 50.0  # Start neutral
 
     # Wind scoring
-    wind_speed = f.get("wind_speed", 0)
-    wind_speed_kt = wind_speed if wind_speed > 50 else wind_speed * 1.94384
+    wind_speed_kt = value_or(frame.wind_kt[index], 0)
     score += _score_wind(wind_speed_kt, wind_limit_kt)
 
     # Crosswind scoring
     if crosswind_limit_kt and runway_heading is not None:
-        wind_dir = f.get("wind_deg") or f.get("wind_bearing", 0)
+        wind_dir = value_or(frame.wind_dir[index], 0)
         score += _score_crosswind(
             wind_speed_kt, wind_dir, runway_heading, crosswind_limit_kt
         )
 
     # Cloud scoring
-    clouds_pct = f.get("clouds") or f.get("cloud_coverage", 0)
+    clouds_pct = value_or(frame.cloud_pct[index], 0)
     if clouds_pct > 80:
         score -= 10
     elif clouds_pct < 30:
         score += 10
 
     # Visibility scoring
-    visibility = f.get("visibility", 10000)
+    visibility = value_or(frame.visibility_m[index], 10000)
     if visibility < 5000:
         score -= 20
     elif visibility >= 10000:
         score += 10
 
     # Precipitation scoring
-    precip = f.get("precipitation", 0)
-    rain = f.get(
-        "rain",
-        {}).get(
-        "1h",
-        0) if isinstance(
-        f.get("rain"),
-        dict) else precip
+    rain = value_or(frame.precip_mm[index], 0)
     if rain > 0:
         score -= rain * 5
 
@@ -623,7 +440,7 @@ def _score_forecast_point(
 
 
 def find_optimal_flying_window(
-    forecast_data: List[Dict[str, Any]],
+    forecast_data: "ForecastFrame | List[Dict[str, Any]]",
     window_start: datetime,
     window_end: datetime,
     wind_limit_kt: Optional[float] = None,
@@ -640,7 +457,7 @@ def find_optimal_flying_window(
     - Overall conditions
 
     Args:
-        forecast_data: List of forecast dicts with hourly data
+        forecast_data: Forecast dicts with hourly data, or a ForecastFrame
         window_start: Start of window to analyze
         window_end: End of window to analyze
         wind_limit_kt: Maximum wind speed in knots (optional)
@@ -660,7 +477,7 @@ def find_optimal_flying_window(
         forecast_data, window_start, window_end
     )
 
-    if not window_forecast:
+    if not len(window_forecast):
         return {
             "has_window": False,
             "average_score": 0,
@@ -668,30 +485,34 @@ def find_optimal_flying_window(
         }
 
     # Score each forecast point
-    scored_forecasts = []
-    for f in window_forecast:
-        score = _score_forecast_point(
-            f, wind_limit_kt, crosswind_limit_kt, runway_heading
-        )
-        scored_forecasts.append({
-            "time": f.get("_parsed_time", window_start),
-            "score": score,
-            "forecast": f
-        })
+    tz = window_start.tzinfo or timezone.utc
+    scored_forecasts = [
+        {
+            "time": window_forecast.time_at(i, tz),
+            "score": score_forecast_point(
+                window_forecast, i, wind_limit_kt, crosswind_limit_kt,
+                runway_heading),
+            "forecast": window_forecast.items[i],
+        }
+        for i in range(len(window_forecast))
+    ]
+
+    # Find continuous window with highest average score (minimum 2 hours),
+    # using prefix sums so each candidate window's average is O(1)
+    prefix = [0.0]
+    for sf in scored_forecasts:
+        prefix.append(prefix[-1] + sf["score"])
 
-    # Find continuous window with highest average score (minimum 2 hours)
     best_window = None
     best_score = 0
 
     for i in range(len(scored_forecasts)):
         for j in range(i + 2, len(scored_forecasts) + 1):  # At least 2 hours
-            window_slice = scored_forecasts[i:j]
-            avg_score = sum(sf["score"]
-                            for sf in window_slice) / len(window_slice)
+            avg_score = (prefix[j] - prefix[i]) / (j - i)
 
             if avg_score > best_score:
                 best_score = avg_score
-                best_window = window_slice
+                best_window = scored_forecasts[i:j]
 
     if not best_window or best_score < 30:  # Threshold for "good" conditions
         avg_of_all = sum(sf["score"] for sf in scored_forecasts) / \
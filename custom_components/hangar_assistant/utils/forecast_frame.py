@@ -0,0 +1,407 @@
+"""Normalised, columnar view of an hourly forecast.
+
+Forecasts reach the analysis code in two shapes: raw OpenWeatherMap points
+(``dt`` epoch seconds, ``temp``, ``wind_deg``, ``rain: {"1h": ...}``, wind
+in m/s for metric requests) and Home Assistant weather forecast attributes
+(``datetime`` ISO strings, ``temperature``, ``wind_bearing``,
+``cloud_coverage``, ``precipitation``). ``ForecastFrame`` parses either
+shape once into parallel columns with fixed units, so every analysis
+(trends, overnight checks, flying-window scoring) reads plain floats
+instead of re-parsing timestamps and re-guessing field names and units
+per point.
+
+Columns (one value per forecast point; ``nan`` when the source has no
+value, so each analysis chooses its own default):
+
+    times          epoch seconds (UTC)
+    wind_kt        wind speed, knots
+    gust_kt        wind gust speed, knots
+    wind_dir       wind direction, degrees true
+    temp_c         air temperature, °C
+    dew_point_c    dew point, °C
+    humidity_pct   relative humidity, %
+    pressure_hpa   sea-level pressure, hPa
+    cloud_pct      cloud cover, %
+    visibility_m   visibility, metres
+    precip_mm      precipitation in the hour (rain + snow), mm
+    snow           True if the weather description mentions snow
+    thunder        True if thunderstorms or lightning are forecast
+    hail           True if hail is forecast
+
+Points without a usable time are dropped, and the rest are sorted by
+time. Columns are ``array('d')`` buffers exposed as memoryviews, so
+``window`` finds its bounds with ``bisect`` (O(log n)) and returns a
+frame whose columns are slices of the same buffers (no copying). Briefings,
+dashboards and alerts can therefore cut "now to sunset" or "overnight"
+windows from one frame as often as they like.
+
+``frame_for_state`` keeps the frame for each forecast sensor until the
+sensor's state is updated, so repeated callers never re-parse the forecast.
+
+Wind speeds are converted from the unit the source declares (the
+``wind_speed_unit`` attribute of a forecast sensor, or m/s for metric OWM
+payloads). Only when no unit is known is it guessed per point.
+"""
+
+import bisect
+import logging
+import math
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Iterable, Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+# Wind speed conversions to knots
+WIND_TO_KT = {
+    "kt": 1.0,
+    "kn": 1.0,
+    "m/s": 1.94384,
+    "km/h": 0.539957,
+    "mph": 0.868976,
+}
+
+# With no declared unit, speeds below this are assumed to be m/s (as OWM
+# reports for metric requests) and anything faster is taken as knots
+AUTO_WIND_MS_LIMIT = 50
+
+# Forecast sensor attribute naming the unit of its wind speeds
+WIND_SPEED_UNIT_ATTRIBUTE = "wind_speed_unit"
+
+NAN = math.nan
+
+_NUMERIC_COLUMNS = (
+    "wind_kt", "gust_kt", "wind_dir", "temp_c", "dew_point_c", "humidity_pct",
+    "pressure_hpa", "cloud_pct", "visibility_m", "precip_mm",
+)
+
+# Forecast sensors whose frames are kept by frame_for_state
+MAX_CACHED_FRAMES = 32
+_FRAME_CACHE: "OrderedDict[str, tuple[Any, ForecastFrame]]" = OrderedDict()
+
+
+def _number(value: Any) -> float:
+    """Return value as a float, or nan if it is missing or not numeric."""
+    if value is None or isinstance(value, bool):
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _first(point: dict, *keys: str) -> float:
+    """Return the first present, non-null numeric field."""
+    for key in keys:
+        value = point.get(key)
+        if value is not None:
+            return _number(value)
+    return NAN
+
+
+def _point_time(point: dict, default_tz: tzinfo) -> float | None:
+    """Return a point's time as epoch seconds, or None if it has none."""
+    if point.get("dt") is not None:
+        return _number(point["dt"])
+    value = point.get("datetime")
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=default_tz)
+    return value.timestamp()
+
+
+def _hourly_amount(value: Any) -> float:
+    """Read an OWM ``rain``/``snow`` block ({"1h": mm}) or a plain number."""
+    if isinstance(value, dict):
+        return _number(value.get("1h", 0))
+    return _number(value)
+
+
+def _precipitation(point: dict) -> float:
+    rain, snow = point.get("rain"), point.get("snow")
+    if isinstance(rain, dict) or isinstance(snow, dict):
+        total = 0.0
+        for amount in (rain, snow):
+            if amount is not None:
+                value = _hourly_amount(amount)
+                if not math.isnan(value):
+                    total += value
+        return total
+    return _first(point, "precipitation")
+
+
+def _cloud_cover(point: dict) -> float:
+    clouds = point.get("clouds")
+    if isinstance(clouds, dict):
+        return _number(clouds.get("all"))
+    if clouds:
+        return _number(clouds)
+    return _first(point, "cloud_coverage", "clouds")
+
+
+def _mentions(point: dict, *words: str) -> bool:
+    """Return True if an OWM weather description mentions any of words."""
+    for weather in point.get("weather") or []:
+        if not isinstance(weather, dict):
+            continue
+        text = f"{weather.get('main', '')} {weather.get('description', '')}".lower()
+        if any(word in text for word in words):
+            return True
+    return False
+
+
+def _mentions_snow(point: dict) -> bool:
+    return _mentions(point, "snow")
+
+
+def _condition(point: dict) -> str:
+    """Return a Home Assistant forecast ``condition``, lower-cased."""
+    return str(point.get("condition") or "").lower()
+
+
+def _mentions_thunder(point: dict) -> bool:
+    return "lightning" in _condition(point) or _mentions(point, "thunder")
+
+
+def _mentions_hail(point: dict) -> bool:
+    return "hail" in _condition(point) or _mentions(point, "hail")
+
+
+def _wind_kt(point: dict, wind_unit: str | None, *keys: str) -> float:
+    speed = _first(point, *(keys or ("wind_speed",)))
+    if math.isnan(speed):
+        return speed
+    if wind_unit is None:
+        return speed * WIND_TO_KT["m/s"] if speed < AUTO_WIND_MS_LIMIT else speed
+    return speed * WIND_TO_KT[wind_unit]
+
+
+# Flag column -> test applied to each source point
+_FLAG_TESTS = {
+    "snow": _mentions_snow,
+    "thunder": _mentions_thunder,
+    "hail": _mentions_hail,
+}
+
+
+class ForecastFrame:
+    """Time-sorted forecast points as parallel columns with fixed units."""
+
+    def __init__(
+        self,
+        items: Sequence[dict],
+        times: memoryview,
+        columns: dict[str, memoryview],
+        flags: dict[str, memoryview],
+    ) -> None:
+        """Initialise from already-normalised columns (use from_forecast).
+
+        Args:
+            items: Source forecast dicts, in frame order
+            times: Epoch seconds per point, ascending
+            columns: Numeric columns, keyed by name
+            flags: Weather flags per point (1/0), keyed by name
+        """
+        self._items = items
+        self.times = times
+        self.snow = flags["snow"]
+        self.thunder = flags["thunder"]
+        self.hail = flags["hail"]
+        self.wind_kt = columns["wind_kt"]
+        self.gust_kt = columns["gust_kt"]
+        self.wind_dir = columns["wind_dir"]
+        self.temp_c = columns["temp_c"]
+        self.dew_point_c = columns["dew_point_c"]
+        self.humidity_pct = columns["humidity_pct"]
+        self.pressure_hpa = columns["pressure_hpa"]
+        self.cloud_pct = columns["cloud_pct"]
+        self.visibility_m = columns["visibility_m"]
+        self.precip_mm = columns["precip_mm"]
+
+    @classmethod
+    def from_forecast(
+        cls,
+        forecast: Iterable[dict],
+        default_tz: tzinfo = timezone.utc,
+        wind_unit: str | None = None,
+    ) -> "ForecastFrame":
+        """Build a frame from OWM or Home Assistant forecast points.
+
+        Args:
+            forecast: Forecast dicts
+            default_tz: Timezone assumed for naive ``datetime`` values
+            wind_unit: Unit of ``wind_speed`` (a WIND_TO_KT key), or None to
+                infer m/s vs knots per point
+
+        Returns:
+            ForecastFrame, sorted by time
+        """
+        if wind_unit is not None and wind_unit not in WIND_TO_KT:
+            raise ValueError(f"Unknown wind unit: {wind_unit}")
+        if wind_unit is None:
+            _LOGGER.debug(
+                "No wind unit declared for forecast; assuming m/s below %s",
+                AUTO_WIND_MS_LIMIT)
+
+        timed: list[tuple[float, dict]] = []
+        for point in forecast:
+            if not isinstance(point, dict):
+                continue
+            when = _point_time(point, default_tz)
+            if when is None or math.isnan(when):
+                continue
+            timed.append((when, point))
+        # Sources are normally in order already, making this a linear pass
+        timed.sort(key=lambda pair: pair[0])
+
+        items = [point for _, point in timed]
+        columns: dict[str, array] = {name: array("d") for name in _NUMERIC_COLUMNS}
+        for point in items:
+            columns["wind_kt"].append(_wind_kt(point, wind_unit))
+            columns["gust_kt"].append(
+                _wind_kt(point, wind_unit, "wind_gust", "wind_gust_speed"))
+            columns["wind_dir"].append(_first(point, "wind_deg", "wind_bearing"))
+            columns["temp_c"].append(_first(point, "temp", "temperature"))
+            columns["dew_point_c"].append(_first(point, "dew_point"))
+            columns["humidity_pct"].append(_first(point, "humidity"))
+            columns["pressure_hpa"].append(_first(point, "pressure"))
+            columns["cloud_pct"].append(_cloud_cover(point))
+            columns["visibility_m"].append(_first(point, "visibility"))
+            columns["precip_mm"].append(_precipitation(point))
+        return cls(
+            items,
+            memoryview(array("d", (when for when, _ in timed))),
+            {name: memoryview(column) for name, column in columns.items()},
+            {
+                name: memoryview(array("b", (test(p) for p in items)))
+                for name, test in _FLAG_TESTS.items()
+            },
+        )
+
+    def __len__(self) -> int:
+        """Return the number of forecast points."""
+        return len(self.times)
+
+    @property
+    def items(self) -> Sequence[dict]:
+        """Source forecast dicts, in time order."""
+        return self._items
+
+    def column(self, name: str) -> memoryview:
+        """Return a numeric or flag column by name."""
+        return getattr(self, name)
+
+    def slice(self, start: int, stop: int) -> "ForecastFrame":
+        """Return points start..stop-1 as a view sharing this frame's buffers."""
+        return ForecastFrame(
+            self._items[start:stop],
+            self.times[start:stop],
+            {name: self.column(name)[start:stop] for name in _NUMERIC_COLUMNS},
+            {name: self.column(name)[start:stop] for name in _FLAG_TESTS},
+        )
+
+    def window(self, start: datetime, end: datetime) -> "ForecastFrame":
+        """Return the points between two times (inclusive).
+
+        Finds the bounds by bisection; the result shares this frame's
+        column buffers.
+
+        Args:
+            start: Window start (timezone-aware)
+            end: Window end (timezone-aware)
+
+        Returns:
+            ForecastFrame view of the points inside the window
+        """
+        lo = bisect.bisect_left(self.times, start.timestamp())
+        hi = bisect.bisect_right(self.times, end.timestamp(), lo)
+        return self.slice(lo, hi)
+
+    def time_at(self, index: int, tz: tzinfo = timezone.utc) -> datetime:
+        """Return a point's time as a datetime in the given timezone."""
+        return datetime.fromtimestamp(self.times[index], tz=tz)
+
+
+def declared_wind_unit(attributes: Any) -> str | None:
+    """Return the wind unit a forecast source declares, if it is known.
+
+    Args:
+        attributes: Source attributes (``wind_speed_unit``)
+
+    Returns:
+        A WIND_TO_KT key, or None when no known unit is declared
+    """
+    if not isinstance(attributes, dict):
+        return None
+    unit = attributes.get(WIND_SPEED_UNIT_ATTRIBUTE)
+    return unit if unit in WIND_TO_KT else None
+
+
+def frame_for_state(state: Any) -> "ForecastFrame | None":
+    """Return the frame for a forecast sensor, parsing only when it changed.
+
+    Args:
+        state: State of a sensor with a ``forecast`` attribute list (and
+            ideally a ``wind_speed_unit`` attribute)
+
+    Returns:
+        ForecastFrame, or None if the sensor has no forecast
+    """
+    attributes = getattr(state, "attributes", None) or {}
+    forecast = attributes.get("forecast")
+    if not forecast:
+        return None
+
+    entity_id = getattr(state, "entity_id", None)
+    version = (getattr(state, "last_updated", None), id(forecast))
+    cached = _FRAME_CACHE.get(entity_id) if entity_id else None
+    if cached is not None and cached[0] == version:
+        _FRAME_CACHE.move_to_end(entity_id)
+        return cached[1]
+
+    frame = ForecastFrame.from_forecast(
+        forecast, wind_unit=declared_wind_unit(attributes))
+    if entity_id:
+        _FRAME_CACHE[entity_id] = (version, frame)
+        _FRAME_CACHE.move_to_end(entity_id)
+        while len(_FRAME_CACHE) > MAX_CACHED_FRAMES:
+            _FRAME_CACHE.popitem(last=False)
+    return frame
+
+
+def clear_frame_cache() -> None:
+    """Drop all cached frames (used by tests)."""
+    _FRAME_CACHE.clear()
+
+
+def as_forecast_frame(
+    forecast: "ForecastFrame | Iterable[dict]",
+    default_tz: tzinfo = timezone.utc,
+    wind_unit: str | None = None,
+) -> ForecastFrame:
+    """Return forecast as a frame, building one from dicts if needed.
+
+    Args:
+        forecast: A ForecastFrame, or forecast dicts
+        default_tz: Timezone assumed for naive ``datetime`` values
+        wind_unit: Unit of the dicts' wind speeds (a WIND_TO_KT key), or
+            None to infer it per point
+
+    Returns:
+        ForecastFrame
+    """
+    if isinstance(forecast, ForecastFrame):
+        return forecast
+    return ForecastFrame.from_forecast(forecast or [], default_tz, wind_unit)
+
+
+def value_or(value: float, default: float) -> float:
+    """Return value, or default when it is nan (missing)."""
+    return default if math.isnan(value) else value
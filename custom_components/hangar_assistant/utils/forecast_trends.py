@@ -0,0 +1,213 @@
+"""Least-squares forecast trends for every variable and horizon at once.
+
+Trends used to be derived per variable and per caller by comparing the
+first and last forecast values, so one outlier at either end decided the
+result and briefings, dashboards and alerts each re-derived the same
+numbers. ``compute_trends`` instead makes a single pass over a
+``ForecastFrame`` and fits a least-squares slope (units per hour, against
+real forecast time) for each variable over several horizons from the
+start of the frame:
+
+    trends = trends_for_frame(frame)
+    trends.slope("pressure", "3h")       # hPa per hour over the next 3 h
+    trends.direction("wind")             # over the whole frame
+
+Points where a variable is missing (``nan``) are left out of that
+variable's fit rather than replaced by a default, so a gap never reads as
+a jump. Results are cached by forecast content (``trends_for_frame``), so
+every consumer of the same forecast window reads the same precomputed
+trends.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any
+
+from .forecast_frame import ForecastFrame
+
+# Trend variable -> (frame column, change per hour that counts as a trend)
+TREND_VARIABLES: dict[str, tuple[str, float]] = {
+    "temperature": ("temp_c", 0.5),
+    "pressure": ("pressure_hpa", 0.5),
+    "wind": ("wind_kt", 1.0),
+    "clouds": ("cloud_pct", 5.0),
+    "visibility": ("visibility_m", 500.0),
+}
+
+# Horizons (hours from the first forecast point); "window" is the whole frame
+TREND_HORIZONS_H: tuple[int, ...] = (3, 6, 12, 24)
+WINDOW = "window"
+
+# Distinct forecast windows whose trends are kept
+MAX_CACHED_TRENDS = 32
+_TREND_CACHE: "OrderedDict[tuple[bytes, ...], ForecastTrends]" = OrderedDict()
+
+
+class ForecastTrends:
+    """Slopes per variable and horizon for one forecast window."""
+
+    __slots__ = ("slopes", "points")
+
+    def __init__(
+        self,
+        slopes: dict[str, dict[str, float]],
+        points: dict[str, int],
+    ) -> None:
+        """Initialise from computed slopes (use compute_trends).
+
+        Args:
+            slopes: Horizon label -> variable -> change per hour
+            points: Horizon label -> number of forecast points it covers
+        """
+        self.slopes = slopes
+        self.points = points
+
+    @property
+    def horizons(self) -> list[str]:
+        """Horizon labels covered by the forecast, shortest first."""
+        return list(self.slopes)
+
+    def slope(self, variable: str, horizon: str = WINDOW) -> float:
+        """Return a variable's change per hour over a horizon.
+
+        Args:
+            variable: A TREND_VARIABLES key
+            horizon: "3h", "6h", "12h", "24h" or "window"
+
+        Returns:
+            Least-squares slope per hour (0.0 when it cannot be fitted)
+        """
+        return self.slopes.get(horizon, {}).get(variable, 0.0)
+
+    def direction(self, variable: str, horizon: str = WINDOW) -> str:
+        """Classify a variable's slope against its threshold.
+
+        Args:
+            variable: A TREND_VARIABLES key
+            horizon: Horizon label
+
+        Returns:
+            "increasing", "decreasing", or "stable"
+        """
+        threshold = TREND_VARIABLES[variable][1]
+        slope = self.slope(variable, horizon)
+        if slope > threshold:
+            return "increasing"
+        if slope < -threshold:
+            return "decreasing"
+        return "stable"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return slopes and directions per horizon (for attributes/JSON)."""
+        return {
+            horizon: {
+                "points": self.points[horizon],
+                **{
+                    variable: {
+                        "slope_per_hour": round(slope, 3),
+                        "direction": self.direction(variable, horizon),
+                    }
+                    for variable, slope in slopes.items()
+                },
+            }
+            for horizon, slopes in self.slopes.items()
+        }
+
+
+def _slope(n: int, sx: float, sxx: float, sy: float, sxy: float) -> float:
+    if n < 2:
+        return 0.0
+    denominator = n * sxx - sx * sx
+    if denominator <= 1e-12:
+        return 0.0
+    return (n * sxy - sx * sy) / denominator
+
+
+def compute_trends(
+    frame: ForecastFrame,
+    horizons_h: tuple[int, ...] = TREND_HORIZONS_H,
+) -> ForecastTrends:
+    """Fit slopes for all variables and horizons in one pass.
+
+    Args:
+        frame: Time-sorted forecast frame
+        horizons_h: Horizons in hours from the first point, ascending
+
+    Returns:
+        ForecastTrends; horizons the forecast does not reach are omitted
+        (the "window" horizon is always present)
+    """
+    names = list(TREND_VARIABLES)
+    columns = [frame.column(TREND_VARIABLES[name][0]) for name in names]
+    # Running sums per variable: n, Σx, Σx², Σy, Σxy (x in hours)
+    sums = [[0, 0.0, 0.0, 0.0, 0.0] for _ in names]
+
+    def snapshot() -> dict[str, float]:
+        return {name: _slope(*acc) for name, acc in zip(names, sums)}
+
+    slopes: dict[str, dict[str, float]] = {}
+    points: dict[str, int] = {}
+    times = frame.times
+    count = len(times)
+    pending = list(horizons_h)
+    origin = times[0] if count else 0.0
+    last_x = 0.0
+
+    for index in range(count):
+        x = (times[index] - origin) / 3600
+        # A horizon is complete once a point lies beyond it
+        while pending and x > pending[0]:
+            label = f"{pending.pop(0)}h"
+            slopes[label], points[label] = snapshot(), index
+        for acc, column in zip(sums, columns):
+            y = column[index]
+            if math.isnan(y):
+                continue
+            acc[0] += 1
+            acc[1] += x
+            acc[2] += x * x
+            acc[3] += y
+            acc[4] += x * y
+        last_x = x
+
+    # Horizons ending exactly on the last point are complete as well
+    while pending and last_x >= pending[0]:
+        label = f"{pending.pop(0)}h"
+        slopes[label], points[label] = snapshot(), count
+    slopes[WINDOW], points[WINDOW] = snapshot(), count
+    return ForecastTrends(slopes, points)
+
+
+def _cache_key(frame: ForecastFrame) -> tuple[bytes, ...]:
+    return (frame.times.tobytes(),) + tuple(
+        frame.column(column).tobytes() for column, _ in TREND_VARIABLES.values()
+    )
+
+
+def trends_for_frame(frame: ForecastFrame) -> ForecastTrends:
+    """Return the trends for a forecast window, computing them only once.
+
+    Keyed on the window's contents, so a window cut again from the same
+    forecast (or the same forecast re-parsed) reuses the cached result.
+
+    Args:
+        frame: Time-sorted forecast frame
+
+    Returns:
+        ForecastTrends
+    """
+    key = _cache_key(frame)
+    cached = _TREND_CACHE.get(key)
+    if cached is not None:
+        _TREND_CACHE.move_to_end(key)
+        return cached
+    trends = compute_trends(frame)
+    _TREND_CACHE[key] = trends
+    while len(_TREND_CACHE) > MAX_CACHED_TRENDS:
+        _TREND_CACHE.popitem(last=False)
+    return trends
+
+
+def clear_trend_cache() -> None:
+    """Drop all cached trends (used by tests)."""
+    _TREND_CACHE.clear()
@@ -0,0 +1,286 @@
+"""Central scheduler for the integration's periodic and startup jobs.
+
+Scheduled pilot briefings, the hourly AI briefing run, the daily NOTAM
+update and the startup tasks are all registered here instead of as loose
+``async_track_time_change`` callbacks and background tasks. The scheduler:
+1. Never runs two instances of the same job at once. If a run is still in
+   progress when the next one is due (e.g. a slow AI agent), the new run
+   is skipped and counted.
+2. Spreads jobs due at the same clock time (typically hh:00:00) over the
+   first ``jitter_seconds`` of the minute. The offset is derived from the
+   job name, so each job keeps the same slot across restarts.
+3. Records the duration of every run and exposes per-job statistics
+   (count, failures, skipped overlaps, last/avg/p50/p95/max duration),
+   which the Job Scheduler diagnostics sensor publishes.
+
+Usage:
+    scheduler = ensure_job_scheduler(hass, entry.entry_id)
+    entry.async_on_unload(scheduler.schedule(
+        "notam_update", lambda: update_notams(), hour=2, minute=0))
+    scheduler.run_in_background(entry, "initial_notam_update", initial_fetch)
+"""
+
+import logging
+import math
+import time
+import zlib
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key: {entry_id: JobScheduler}
+JOB_SCHEDULERS_KEY = "job_schedulers"
+
+# Scheduled jobs start within this many seconds of their nominal time
+DEFAULT_JOB_JITTER_SECONDS = 30
+
+# Durations kept per job for percentile statistics
+DURATION_SAMPLES = 100
+
+Job = Callable[[], Awaitable[Any]]
+
+
+def jitter_offset(name: str, jitter_seconds: int) -> int:
+    """Return a job's stable start offset in seconds.
+
+    Args:
+        name: Job name
+        jitter_seconds: Maximum offset
+
+    Returns:
+        Offset between 0 and ``jitter_seconds`` (inclusive)
+    """
+    if jitter_seconds <= 0:
+        return 0
+    return zlib.crc32(name.encode("utf-8")) % (jitter_seconds + 1)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = math.ceil(percent / 100 * len(ordered))
+    index = max(0, min(len(ordered) - 1, rank - 1))
+    return ordered[index]
+
+
+class JobStats:
+    """Run statistics for one job."""
+
+    def __init__(self) -> None:
+        """Initialise empty statistics."""
+        self.runs = 0
+        self.failures = 0
+        self.overlaps_skipped = 0
+        self.running = False
+        self.last_started: str | None = None
+        self.last_duration: float | None = None
+        self.durations: deque[float] = deque(maxlen=DURATION_SAMPLES)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as sensor attributes (seconds, 3 d.p.)."""
+        stats: dict[str, Any] = {
+            "runs": self.runs,
+            "failures": self.failures,
+            "overlaps_skipped": self.overlaps_skipped,
+            "running": self.running,
+            "last_started": self.last_started,
+            "last_duration_s": (
+                round(self.last_duration, 3)
+                if self.last_duration is not None else None),
+        }
+        if self.durations:
+            ordered = sorted(self.durations)
+            stats.update(
+                avg_duration_s=round(sum(ordered) / len(ordered), 3),
+                p50_duration_s=round(_percentile(ordered, 50), 3),
+                p95_duration_s=round(_percentile(ordered, 95), 3),
+                max_duration_s=round(ordered[-1], 3),
+            )
+        return stats
+
+
+class JobScheduler:
+    """Run the integration's jobs without overlap and record their timing."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        jitter_seconds: int = DEFAULT_JOB_JITTER_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise the scheduler.
+
+        Args:
+            hass: Home Assistant instance
+            jitter_seconds: Maximum start offset for scheduled jobs
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._hass = hass
+        self._jitter_seconds = max(0, min(59, jitter_seconds))
+        self._clock = clock
+        self._stats: dict[str, JobStats] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def schedule(
+        self,
+        name: str,
+        job: Job,
+        *,
+        hour: int | None = None,
+        minute: int = 0,
+        jitter: bool = True,
+    ) -> CALLBACK_TYPE:
+        """Run a job every day at hour:minute (or every hour if hour is None).
+
+        Args:
+            name: Unique job name
+            job: Coroutine function to run
+            hour: Hour of day, or None for every hour
+            minute: Minute of the hour
+            jitter: Spread the start within the minute
+
+        Returns:
+            Callback that cancels the schedule
+        """
+        self._stats.setdefault(name, JobStats())
+        second = jitter_offset(name, self._jitter_seconds) if jitter else 0
+
+        async def _run_scheduled(_now) -> None:
+            await self.async_run(name, job)
+
+        _LOGGER.debug(
+            "Scheduled job %s at %s:%02d:%02d", name,
+            "**" if hour is None else f"{hour:02d}", minute, second)
+        return async_track_time_change(
+            self._hass, _run_scheduled, hour=hour, minute=minute, second=second)
+
+    def run_in_background(self, entry: ConfigEntry, name: str, job: Job) -> None:
+        """Run a job once now, as a background task tied to the entry.
+
+        Args:
+            entry: Config entry owning the task (cancelled on unload)
+            name: Unique job name
+            job: Coroutine function to run
+        """
+        self._stats.setdefault(name, JobStats())
+        entry.async_create_background_task(
+            self._hass, self.async_run(name, job), f"{DOMAIN} {name}")
+
+    async def async_run(self, name: str, job: Job) -> bool:
+        """Run a job unless it is already running, recording its duration.
+
+        Exceptions from the job are logged and counted, never raised.
+
+        Args:
+            name: Unique job name
+            job: Coroutine function to run
+
+        Returns:
+            True if the job ran and completed without raising
+        """
+        stats = self._stats.setdefault(name, JobStats())
+        if stats.running:
+            stats.overlaps_skipped += 1
+            _LOGGER.warning(
+                "Job %s is still running; skipping this run", name)
+            self._notify()
+            return False
+
+        stats.running = True
+        stats.last_started = dt_util.utcnow().isoformat()
+        self._notify()
+        started = self._clock()
+        succeeded = False
+        try:
+            await job()
+            succeeded = True
+        except Exception as e:
+            stats.failures += 1
+            _LOGGER.error("Job %s failed: %s", name, e)
+        finally:
+            stats.running = False
+            stats.runs += 1
+            stats.last_duration = self._clock() - started
+            stats.durations.append(stats.last_duration)
+            _LOGGER.debug(
+                "Job %s finished in %.3fs", name, stats.last_duration)
+            self._notify()
+        return succeeded
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return statistics for every registered job, keyed by name."""
+        return {name: stats.as_dict() for name, stats in sorted(self._stats.items())}
+
+    @callback
+    def async_add_listener(self, update: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call ``update`` whenever a job's statistics change.
+
+        Args:
+            update: Callback (e.g. an entity's async_write_ha_state)
+
+        Returns:
+            Callback that removes the listener
+        """
+        self._listeners.append(update)
+
+        @callback
+        def _remove() -> None:
+            if update in self._listeners:
+                self._listeners.remove(update)
+
+        return _remove
+
+    def _notify(self) -> None:
+        for update in list(self._listeners):
+            update()
+
+
+def get_job_scheduler(hass: HomeAssistant, entry_id: str) -> JobScheduler | None:
+    """Return an entry's job scheduler, if one has been created.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: Config entry ID
+
+    Returns:
+        JobScheduler, or None
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return None
+    return hass_data.get(DOMAIN, {}).get(JOB_SCHEDULERS_KEY, {}).get(entry_id)
+
+
+def ensure_job_scheduler(hass: HomeAssistant, entry_id: str) -> JobScheduler:
+    """Return an entry's job scheduler, creating it on first use.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: Config entry ID
+
+    Returns:
+        JobScheduler (not shared when hass.data is unavailable, as in tests)
+    """
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return JobScheduler(hass)
+    schedulers = hass_data.setdefault(DOMAIN, {}).setdefault(JOB_SCHEDULERS_KEY, {})
+    scheduler = schedulers.get(entry_id)
+    if scheduler is None:
+        scheduler = JobScheduler(hass)
+        schedulers[entry_id] = scheduler
+    return scheduler
+
+
+def remove_job_scheduler(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget an entry's job scheduler (on unload)."""
+    hass_data = getattr(hass, "data", None)
+    if isinstance(hass_data, dict):
+        hass_data.get(DOMAIN, {}).get(JOB_SCHEDULERS_KEY, {}).pop(entry_id, None)
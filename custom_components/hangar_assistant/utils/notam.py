@@ -7,7 +7,8 @@ Data Source:
     UK NATS AIS: https://pibs.nats.co.uk/operational/pibs/PIB.xml
 
 Caching Strategy:
-    - Persistent file-based caching with configurable retention (default: 7 days)
+    - Shared CacheManager "notam" namespace (memory + persistent) with
+      configurable retention (default: 7 days)
     - Stale cache allowed on fetch failure (graceful degradation)
     - Cache survives Home Assistant restarts
 
@@ -25,15 +26,14 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
-from pathlib import Path
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.core import HomeAssistant
 
+from .cache_manager import get_cache_manager
+
 # Try to import defusedxml for secure XML parsing
 try:
     from defusedxml import ElementTree as DefusedET
@@ -58,6 +58,10 @@ NATS_PIB_URL = "https://pibs.nats.co.uk/operational/pibs/PIB.xml"
 # Default timeout for HTTP requests (seconds)
 DEFAULT_TIMEOUT_SECONDS = 30
 
+# Cache namespace and key for the UK-wide PIB feed
+CACHE_NAMESPACE = "notam"
+CACHE_KEY = "uk_notams"
+
 
 class NOTAMClient:
     """Client for UK NATS NOTAM XML feed with persistent caching."""
@@ -79,35 +83,25 @@ class NOTAMClient:
         self.cache_days = cache_days
         self.entry = entry
 
-        # Safely resolve cache path even when hass.config.path is unavailable in tests
-        config_path = getattr(getattr(hass, "config", None), "path", None)
-        if callable(config_path):
-            cache_root = Path(config_path("hangar_assistant_cache"))
-        else:
-            cache_root = Path("/tmp/hangar_assistant_cache")
-
-        self.cache_dir = cache_root
-        self.cache_file = self.cache_dir / "notams.json"
-
-    async def _run_io(self, func):
-        """Run blocking I/O safely even when hass mock lacks executor."""
-        runner = getattr(self.hass, "async_add_executor_job", None)
-
-        if callable(runner):
-            if asyncio.iscoroutinefunction(runner):
-                return await runner(func)
-            result = runner(func)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+        # Shared across client instances (sensors create one per update) so
+        # the feed is read from disk at most once per session
+        self._cache = get_cache_manager(
+            hass,
+            CACHE_NAMESPACE,
+            ttl_minutes=self._cache_ttl_minutes,
+            max_memory_entries=10,
+        )
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, func)
+    @property
+    def _cache_ttl_minutes(self) -> int:
+        """Cache retention period in minutes."""
+        return self.cache_days * 24 * 60
 
     async def fetch_notams(self) -> Tuple[List[Dict[str, Any]], bool]:
         """Fetch NOTAMs from NATS or cache with stale fallback.
 
-        Optimized to read cache only once and reuse the data if fetch fails.
+        Reads the fresh cache once; on fetch failure falls back to the stale
+        entry (memory first, then disk).
 
         Returns:
             Tuple of (notams_list, is_stale_data)
@@ -135,16 +129,7 @@ class NOTAMClient:
             _LOGGER.error("NOTAM fetch failed: %s", e)
             await self._increment_failure_counter(str(e))
 
-            # Use stale cache if fetch failed (reuse already-read cache)
-            # This avoids a second file read (50% reduction in file I/O)
-            if cached:  # cached was already read above
-                cache_age = await self._get_cache_age_hours()
-                _LOGGER.warning(
-                    "Using stale NOTAM cache (%d hours old) due to fetch failure",
-                    cache_age)
-                return cached, True
-
-            # If cache is expired or missing from the fresh read, attempt a stale read now
+            # Fresh read missed, so fall back to the expired entry
             stale_cache = await self._read_stale_cache()
             if stale_cache:
                 cache_age = await self._get_cache_age_hours()
@@ -459,34 +444,7 @@ class NOTAMClient:
         Returns:
             List of NOTAMs or None if cache expired/missing
         """
-        def _read_sync():
-            if not self.cache_file.exists():
-                return None
-
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached = json.load(f)
-
-                timestamp_str = cached.get("cached_at") or cached.get("timestamp")
-                if not timestamp_str:
-                    return None
-
-                cache_time = datetime.fromisoformat(timestamp_str)
-                # Normalise timezone awareness for safe subtraction
-                now = datetime.now(cache_time.tzinfo) if cache_time.tzinfo else datetime.now()
-                try:
-                    age = now - cache_time
-                except TypeError:
-                    age = now.replace(tzinfo=None) - cache_time.replace(tzinfo=None)
-                if age < timedelta(days=self.cache_days):
-                    return cached["notams"]
-                return None
-
-            except (OSError, json.JSONDecodeError, KeyError) as e:
-                _LOGGER.debug("Failed to read NOTAM cache: %s", e)
-                return None
-
-        result = await self._run_io(_read_sync)
+        result = await self._cache.get(CACHE_KEY)
         if result:
             _LOGGER.debug(
                 "NOTAM cache hit (age: %d hours)",
@@ -501,40 +459,22 @@ class NOTAMClient:
         Returns:
             List of NOTAMs or None if cache missing/corrupt
         """
-        def _read_sync():
-            if not self.cache_file.exists():
-                return None
-
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached = json.load(f)
-                return cached.get("notams", [])
-
-            except (OSError, json.JSONDecodeError):
-                return None
-
-        return await self._run_io(_read_sync)
-
-    def _write_cache_sync(self, notams: List[Dict[str, Any]]) -> None:
-        """Write NOTAMs to persistent cache (blocking helper)."""
-        try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-            cached = {
-                "cached_at": datetime.now().isoformat(),
-                "notams": notams
-            }
-
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cached, f, indent=2)
-
-            _LOGGER.debug("Wrote %d NOTAMs to cache", len(notams))
-        except (OSError, TypeError) as e:
-            _LOGGER.error("Failed to write NOTAM cache: %s", e)
+        notams, _ = await self._cache.get_with_stale(CACHE_KEY)
+        return notams
 
     async def _write_cache(self, notams: List[Dict[str, Any]]) -> None:
-        """Async wrapper for cache writes for runtime usage."""
-        await self._run_io(lambda: self._write_cache_sync(notams))
+        """Write NOTAMs to the memory and persistent cache.
+
+        Args:
+            notams: Parsed NOTAM list
+        """
+        await self._cache.set(
+            CACHE_KEY,
+            notams,
+            ttl_minutes=self._cache_ttl_minutes,
+            metadata={"count": len(notams), "source": "nats_pib"},
+        )
+        _LOGGER.debug("Wrote %d NOTAMs to cache", len(notams))
 
     async def _get_cache_age_hours(self) -> int:
         """Get age of cached data in hours.
@@ -542,28 +482,10 @@ class NOTAMClient:
         Returns:
             Hours since cache was written, or 0 if no cache exists
         """
-        def _get_age_sync():
-            if not self.cache_file.exists():
-                return 0
-
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached = json.load(f)
-                timestamp_str = cached.get("cached_at") or cached.get("timestamp")
-                if not timestamp_str:
-                    return 0
-
-                cache_time = datetime.fromisoformat(timestamp_str)
-                now = datetime.now(cache_time.tzinfo) if cache_time.tzinfo else datetime.now()
-                try:
-                    age_seconds = (now - cache_time).total_seconds()
-                except TypeError:
-                    age_seconds = (now.replace(tzinfo=None) - cache_time.replace(tzinfo=None)).total_seconds()
-                return int(age_seconds / 3600)
-            except (OSError, json.JSONDecodeError, KeyError, ValueError):
-                return 0
-
-        return await self._run_io(_get_age_sync)
+        entry = await self._cache.get_entry(CACHE_KEY)
+        if entry is None:
+            return 0
+        return int(entry.age_seconds() / 3600)
 
     def filter_by_location(
         self,
@@ -658,67 +580,34 @@ class NOTAMClient:
 
     async def clear_cache(self) -> None:
         """Remove cached NOTAM data."""
-        def _clear_sync():
-            if self.cache_file.exists():
-                try:
-                    self.cache_file.unlink()
-                    _LOGGER.info("Cleared NOTAM cache")
-                    return True
-                except OSError as e:
-                    _LOGGER.error("Failed to clear NOTAM cache: %s", e)
-                    return False
-            return True
-
-        await self._run_io(_clear_sync)
+        await self._cache.delete(CACHE_KEY)
+        _LOGGER.info("Cleared NOTAM cache")
 
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
 
         Returns:
             Dictionary with cache metadata:
-                - exists: Whether cache file exists
+                - exists: Whether a cache entry exists
                 - age_hours: Age of cache in hours
                 - count: Number of cached NOTAMs
-                - size_bytes: Cache file size in bytes
+                - size_bytes: Persistent cache size in bytes
         """
-        def _get_stats_sync():
-            if not self.cache_file.exists():
-                return {
-                    "exists": False,
-                    "age_hours": 0,
-                    "count": 0,
-                    "size_bytes": 0
-                }
-
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cached = json.load(f)
+        entry = await self._cache.get_entry(CACHE_KEY)
+        if entry is None:
+            return {
+                "exists": False,
+                "age_hours": 0,
+                "count": 0,
+                "size_bytes": 0
+            }
 
-                # Calculate age inline since _get_cache_age_hours is now async
-                age_hours = 0
-                try:
-                    cache_time = datetime.fromisoformat(cached["cached_at"])
-                    age_hours = int((datetime.now() - cache_time).total_seconds() / 3600)
-                except (KeyError, ValueError):
-                    pass
-
-                return {
-                    "exists": True,
-                    "age_hours": age_hours,
-                    "count": len(cached.get("notams", [])),
-                    "size_bytes": self.cache_file.stat().st_size
-                }
-
-            except (OSError, json.JSONDecodeError) as e:
-                _LOGGER.debug("Error reading cache stats: %s", e)
-                return {
-                    "exists": True,
-                    "age_hours": 0,
-                    "count": 0,
-                    "size_bytes": 0
-                }
-
-        return await self._run_io(_get_stats_sync)
+        return {
+            "exists": True,
+            "age_hours": int(entry.age_seconds() / 3600),
+            "count": len(entry.data or []),
+            "size_bytes": await self._cache.get_persistent_size(CACHE_KEY)
+        }
 
     async def _increment_failure_counter(self, error_msg: str) -> None:
         """Track consecutive failures for monitoring.
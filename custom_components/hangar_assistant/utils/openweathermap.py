@@ -8,37 +8,28 @@ Provides professional weather data including:
 - Government weather alerts
 
 Features robust caching to protect against API rate limits,
-especially during system restarts.
+especially during system restarts. Caching is delegated to the shared
+CacheManager "weather" namespace.
 """
 from typing import Optional, Dict, Any
 import asyncio
-import json
 import logging
-import re
-from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-
-# Try to import orjson for 2-5x faster JSON operations
-try:
-    import orjson
-    HAS_ORJSON = True
-except ImportError:
-    HAS_ORJSON = False
-
-# Optional import for notifications (may not be available in test env)
-try:
-    from homeassistant.components.persistent_notification import async_create as _async_create_notification
-    HAS_NOTIFICATIONS = True
-except (ImportError, ModuleNotFoundError):
-    HAS_NOTIFICATIONS = False
-    _async_create_notification = None
+
+from .cache_manager import CacheManager, get_cache_manager
 
 _LOGGER = logging.getLogger(__name__)
 
 OWM_API_BASE = "https://api.openweathermap.org/data/3.0/onecall"
 DEFAULT_CACHE_TTL_MINUTES = 10  # OWM updates every 10 minutes
 DEFAULT_TIMEOUT_SECONDS = 10
+CACHE_NAMESPACE = "weather"
+MAX_MEMORY_CACHE_ENTRIES = 1000  # Prevent unbounded growth
+CACHE_WRITE_BEHIND_SECONDS = 30  # Batch persistent writes from all airfields
+
+DEFAULT_UNITS = "metric"
+# Unit of wind_speed/wind_gust in payloads for each OWM unit system
+WIND_SPEED_UNITS = {"metric": "m/s", "standard": "m/s", "imperial": "mph"}
 
 
 class OpenWeatherMapClient:
@@ -89,18 +80,26 @@ class OpenWeatherMapClient:
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
         self.entry = config_entry
 
-        # Persistent cache directory (survives restarts)
-        # Note: Directory creation is lazy - only created when needed
-        config_path = getattr(getattr(hass, "config", None), "path", None)
-        if callable(config_path):
-            self.cache_dir = Path(config_path("hangar_assistant_cache"))
+        # Memory LRU + persistent cache (survives restarts). Directory
+        # creation is lazy - only created when the first entry is written.
+        if cache_enabled:
+            self._cache: CacheManager = get_cache_manager(
+                hass,
+                CACHE_NAMESPACE,
+                ttl_minutes=cache_ttl_minutes,
+                max_memory_entries=MAX_MEMORY_CACHE_ENTRIES,
+                write_behind_seconds=CACHE_WRITE_BEHIND_SECONDS,
+                hydrate_on_first_read=True,
+            )
         else:
-            self.cache_dir = Path("/tmp/hangar_assistant_cache")
-        self._cache_dir_initialized = False
-
-        # In-memory cache for current session (LRU eviction for memory safety)
-        self._memory_cache: OrderedDict[str, tuple[Dict[str, Any], datetime]] = OrderedDict()
-        self._max_memory_entries = 1000  # Prevent unbounded growth
+            # Session-only cache, not shared with persistent clients
+            self._cache = CacheManager(
+                hass,
+                CACHE_NAMESPACE,
+                persistent_enabled=False,
+                ttl_minutes=cache_ttl_minutes,
+                max_memory_entries=MAX_MEMORY_CACHE_ENTRIES,
+            )
 
         # API call tracking (resets daily)
         self._api_calls_today = 0
@@ -205,178 +204,24 @@ class OpenWeatherMapClient:
             }
         )
 
-    def _ensure_cache_dir(self) -> None:
-        """Ensure cache directory exists (lazy initialization)."""
-        if not self._cache_dir_initialized and self.cache_enabled:
-            try:
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-                self._cache_dir_initialized = True
-            except (OSError, PermissionError) as e:
-                _LOGGER.error(
-                    "Failed to create OWM cache directory: %s. "
-                    "Caching will be disabled. Check permissions for: %s",
-                    e, self.cache_dir
-                )
-                # Disable caching if we can't create directory
-                self.cache_enabled = False
-                
-                # Notify user about permission issue (if available)
-                if HAS_NOTIFICATIONS and _async_create_notification:
-                    self.hass.async_create_task(
-                        _async_create_notification(
-                            self.hass,
-                            message=(
-                                f"Hangar Assistant cannot create weather cache directory. "
-                                f"Caching will be disabled. Please check permissions for: {self.cache_dir}"
-                            ),
-                            title="Hangar Assistant: Cache Permission Error",
-                            notification_id="hangar_owm_cache_permission_error"
-                        )
-                    )
-
-    def _get_cache_file_path(self, latitude: float, longitude: float) -> Path:
-        """Get cache file path for coordinates.
-
-        Args:
-            latitude: Latitude coordinate
-            longitude: Longitude coordinate
-
-        Returns:
-            Path to cache file
-        """
-        # Sanitize coordinates for filename (remove any non-numeric characters except decimal and minus)
-        lat_str = re.sub(r'[^0-9.-]', '', f"{latitude:.4f}")
-        lon_str = re.sub(r'[^0-9.-]', '', f"{longitude:.4f}")
-        
-        cache_key = f"owm_{lat_str}_{lon_str}.json"
-        return self.cache_dir / cache_key
-
-    def _read_persistent_cache(
-        self, latitude: float, longitude: float
-    ) -> Optional[Dict[str, Any]]:
-        """Read cached data from disk if valid.
+    @staticmethod
+    def _cache_key(latitude: float, longitude: float) -> str:
+        """Build the cache key for coordinates.
 
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
 
         Returns:
-            Cached data dict if valid, None otherwise
+            Cache key rounded to 4 decimal places (~11 m)
         """
-        if not self.cache_enabled:
-            return None
-
-        self._ensure_cache_dir()
-
-        cache_file = self._get_cache_file_path(latitude, longitude)
-
-        if not cache_file.exists():
-            return None
-
-        try:
-            with open(cache_file, "r") as f:
-                cached = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
-
-            # Check if cache is still valid
-            cached_time = datetime.fromisoformat(cached["cached_at"])
-            cache_age = datetime.now() - cached_time
-
-            if cache_age < self.cache_ttl:
-                _LOGGER.debug(
-                    "Using persistent cache (age: %d seconds)",
-                    cache_age.total_seconds()
-                )
-                return cached["data"]
-            else:
-                _LOGGER.debug(
-                    "Persistent cache expired (age: %d seconds)",
-                    cache_age.total_seconds()
-                )
-                return None
-
-        except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
-            _LOGGER.warning("Failed to read cache file: %s", e)
-            return None
-
-    def _read_persistent_cache_stale(
-        self, latitude: float, longitude: float
-    ) -> Optional[Dict[str, Any]]:
-        """Read cached data from disk even if expired (graceful degradation).
-
-        Args:
-            latitude: Latitude coordinate
-            longitude: Longitude coordinate
-
-        Returns:
-            Cached data dict if exists, None otherwise (ignoring TTL)
-        """
-        if not self.cache_enabled:
-            return None
-
-        self._ensure_cache_dir()
-
-        cache_file = self._get_cache_file_path(latitude, longitude)
-
-        if not cache_file.exists():
-            return None
-
-        try:
-            # Use orjson if available (2-5x faster)
-            if HAS_ORJSON:
-                cache_bytes = cache_file.read_bytes()
-                cached = orjson.loads(cache_bytes)
-            else:
-                with open(cache_file, "r") as f:
-                    cached = json.load(f)
-
-            # Return data regardless of age (stale cache for graceful degradation)
-            _LOGGER.debug("Using stale persistent cache for graceful degradation")
-            return cached["data"]
-
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            _LOGGER.warning("Failed to read stale cache file: %s", e)
-            return None
-
-    def _write_persistent_cache(
-        self, latitude: float, longitude: float, data: Dict[str, Any]
-    ) -> None:
-        """Write data to persistent cache.
-
-        Args:
-            latitude: Latitude coordinate
-            longitude: Longitude coordinate
-            data: Weather data to cache
-        """
-        if not self.cache_enabled:
-            return
-
-        self._ensure_cache_dir()
-
-        cache_file = self._get_cache_file_path(latitude, longitude)
-
-        try:
-            cached = {
-                "cached_at": datetime.now().isoformat(),
-                "coordinates": {"lat": latitude, "lon": longitude},
-                "data": data,
-            }
-
-            with open(cache_file, "w") as f:
-                if HAS_ORJSON:
-                    f.write(orjson.dumps(cached, option=orjson.OPT_INDENT_2).decode("utf-8"))
-                else:
-                    json.dump(cached, f, indent=2)
-
-            _LOGGER.debug("Wrote persistent cache to %s", cache_file.name)
-
-        except (OSError, TypeError) as e:
-            _LOGGER.error("Failed to write cache file: %s", e)
+        return f"{latitude:.4f}_{longitude:.4f}"
 
     async def get_weather_data(
         self,
         latitude: float,
         longitude: float,
-        units: str = "metric",
+        units: str = DEFAULT_UNITS,
     ) -> Optional[Dict[str, Any]]:
         """Fetch current weather and forecast data with multi-level caching.
 
@@ -384,6 +229,7 @@ class OpenWeatherMapClient:
         1. In-memory cache (fastest, session only)
         2. Persistent file cache (survives restarts)
         3. API call (only if cache invalid)
+        4. Stale cache (any age) if the API call fails
 
         This protects against rate limit breaches during:
         - Multiple system restarts
@@ -398,33 +244,14 @@ class OpenWeatherMapClient:
         Returns:
             Weather data dict or None if error
         """
-        cache_key = f"{latitude}_{longitude}"
-
-        # 1. Check in-memory cache first (fastest)
-        if cache_key in self._memory_cache:
-            cached_data, cached_time = self._memory_cache[cache_key]
-            cache_age = datetime.now() - cached_time
-
-            if cache_age < self.cache_ttl:
-                # Move to end to mark as recently used (LRU)
-                self._memory_cache.move_to_end(cache_key)
-                _LOGGER.debug(
-                    "Using memory cache for %s (age: %d seconds)",
-                    cache_key,
-                    cache_age.total_seconds(),
-                )
-                return cached_data
-
-        # 2. Check persistent cache (survives restarts)
-        persistent_data = await self.hass.async_add_executor_job(
-            self._read_persistent_cache, latitude, longitude
-        )
-        if persistent_data:
-            # Update memory cache with persistent data
-            self._memory_cache[cache_key] = (persistent_data, datetime.now())
-            return persistent_data
+        cache_key = self._cache_key(latitude, longitude)
+
+        # 1. Check memory, then persistent cache (survives restarts)
+        cached_data = await self._cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data
 
-        # 3. Fetch from API (cache miss)
+        # 2. Fetch from API (cache miss)
         try:
             data = await self._fetch_from_api(latitude, longitude, units)
             if data:
@@ -434,22 +261,21 @@ class OpenWeatherMapClient:
         except Exception as e:
             _LOGGER.error("OWM API fetch failed: %s", e)
             await self._increment_failure_counter(str(e))
-        
-        # 4. Return stale cache as last resort if API fails
-        stale_data = await self.hass.async_add_executor_job(
-            self._read_persistent_cache_stale, latitude, longitude
-        )
-        if stale_data:
-            _LOGGER.warning("Using stale OWM cache due to API failure")
+
+        # 3. Return stale cache as last resort if API fails
+        stale_data, is_stale = await self._cache.get_with_stale(cache_key)
+        if stale_data is not None:
+            if is_stale:
+                _LOGGER.warning("Using stale OWM cache due to API failure")
             return stale_data
-        
+
         return None
 
     async def _fetch_from_api(
         self,
         latitude: float,
         longitude: float,
-        units: str = "metric",
+        units: str = DEFAULT_UNITS,
     ) -> Optional[Dict[str, Any]]:
         """Fetch data from OWM API.
 
@@ -492,18 +318,16 @@ class OpenWeatherMapClient:
                 if response.status == 200:
                     data = await response.json()
 
-                    # Update both caches (with LRU eviction)
-                    cache_key = f"{latitude}_{longitude}"
-                    self._memory_cache[cache_key] = (data, datetime.now())
-                    self._memory_cache.move_to_end(cache_key)  # Mark as most recently used
-                    
-                    # Evict oldest entries if cache exceeds limit
-                    while len(self._memory_cache) > self._max_memory_entries:
-                        evicted_key, _ = self._memory_cache.popitem(last=False)
-                        _LOGGER.debug("Evicted oldest cache entry: %s", evicted_key)
-                    
-                    await self.hass.async_add_executor_job(
-                        self._write_persistent_cache, latitude, longitude, data
+                    # Update memory and persistent caches (LRU eviction
+                    # handled by the cache manager)
+                    await self._cache.set(
+                        self._cache_key(latitude, longitude),
+                        data,
+                        ttl_minutes=self.cache_ttl.total_seconds() / 60,
+                        metadata={
+                            "coordinates": {"lat": latitude, "lon": longitude},
+                            "api_calls": self._api_calls_today,
+                        },
                     )
 
                     _LOGGER.info(
@@ -621,7 +445,7 @@ class OpenWeatherMapClient:
         """
         return data.get("alerts", [])
 
-    def clear_cache(
+    async def clear_cache(
             self,
             latitude: Optional[float] = None,
             longitude: Optional[float] = None) -> None:
@@ -633,35 +457,53 @@ class OpenWeatherMapClient:
         """
         if latitude is not None and longitude is not None:
             # Clear specific coordinate cache
-            cache_key = f"{latitude}_{longitude}"
-            self._memory_cache.pop(cache_key, None)
-
-            cache_file = self._get_cache_file_path(latitude, longitude)
-            if cache_file.exists():
-                cache_file.unlink()
-                _LOGGER.info("Cleared cache for %s,%s", latitude, longitude)
+            await self._cache.delete(self._cache_key(latitude, longitude))
+            _LOGGER.info("Cleared cache for %s,%s", latitude, longitude)
         else:
             # Clear all caches
-            self._memory_cache.clear()
-
-            for cache_file in self.cache_dir.glob("owm_*.json"):
-                cache_file.unlink()
-
+            await self._cache.clear()
             _LOGGER.info("Cleared all OWM caches")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring.
 
         Returns:
-            Dict with cache stats (entries, API calls, etc.)
+            Dict with CacheManager stats plus OWM-specific fields
+            (cache entries, API calls, etc.)
         """
-        persistent_files = list(self.cache_dir.glob("owm_*.json"))
-
-        return {
+        stats = self._cache.get_stats()
+        stats.update({
             "cache_enabled": self.cache_enabled,
             "cache_ttl_minutes": self.cache_ttl.total_seconds() / 60,
-            "memory_cache_entries": len(self._memory_cache),
-            "persistent_cache_files": len(persistent_files),
+            "memory_cache_entries": stats["memory_entries"],
+            "persistent_cache_files": stats["persistent_files"],
             "api_calls_today": self._api_calls_today,
             "api_calls_date": self._api_calls_date.isoformat(),
-        }
+        })
+        return stats
+
+
+def client_from_entry(hass, entry: Any) -> Optional[OpenWeatherMapClient]:
+    """Create an OWM client from a config entry's integration settings.
+
+    Clients share the "weather" cache namespace, so a forecast fetched by
+    one (e.g. a sensor poll) is served from cache to the others.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry holding ``integrations.openweathermap``
+
+    Returns:
+        OpenWeatherMapClient, or None if no API key is configured
+    """
+    owm_config = entry.data.get("integrations", {}).get("openweathermap", {})
+    api_key = owm_config.get("api_key")
+    if not api_key:
+        return None
+    return OpenWeatherMapClient(
+        api_key,
+        hass,
+        cache_enabled=owm_config.get("cache_enabled", True),
+        cache_ttl_minutes=owm_config.get("cache_ttl", DEFAULT_CACHE_TTL_MINUTES),
+        config_entry=entry,
+    )
@@ -0,0 +1,240 @@
+"""Overnight hangar and airfield risks as rules over a forecast frame.
+
+Each risk (flooding, wind or gust damage, surface contamination, fog,
+thunderstorms, hail) is an ``OvernightRule``: a warning flag, the phrase
+used in the summary, and a check that reads one forecast point from the
+frame's normalised columns and returns a warning detail when the risk is
+present. ``evaluate_overnight`` runs every rule in a single pass over the
+overnight window, stops checking a rule once it has fired, and stops the
+pass as soon as every rule has fired. Adding a risk means adding a rule,
+not another scan of the forecast.
+
+Thresholds default to ``DEFAULT_OVERNIGHT_THRESHOLDS`` and can be set per
+airfield with ``overnight_<name>`` keys (see ``overnight_thresholds``).
+Results are cached per parsed forecast, window and thresholds, so the
+briefing, dashboards and alerts evaluating the same forecast fetch share
+one evaluation.
+"""
+
+import math
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .forecast_frame import ForecastFrame, value_or
+
+# Threshold name -> default; airfields override with "overnight_<name>"
+DEFAULT_OVERNIGHT_THRESHOLDS: dict[str, float] = {
+    "heavy_rain_mm_h": 10.0,
+    "strong_wind_kt": 35.0,
+    "gust_kt": 45.0,
+    "fog_visibility_m": 1000.0,
+    "fog_humidity_pct": 90.0,
+    "fog_spread_c": 2.0,
+}
+
+AIRFIELD_THRESHOLD_PREFIX = "overnight_"
+
+# Overnight windows whose evaluations are kept
+MAX_CACHED_EVALUATIONS = 32
+_EVALUATION_CACHE: "OrderedDict[tuple, tuple[Any, dict[str, str]]]" = OrderedDict()
+
+# Check signature: (frame, index, thresholds) -> warning detail or None
+RuleCheck = Callable[[ForecastFrame, int, Mapping[str, float]], "str | None"]
+
+
+class OvernightRule:
+    """One overnight risk: a warning flag, summary phrase and point check."""
+
+    __slots__ = ("flag", "summary", "check")
+
+    def __init__(self, flag: str, summary: str, check: RuleCheck) -> None:
+        """Initialise the rule.
+
+        Args:
+            flag: Warning key set to True when the rule fires
+            summary: Phrase used in the overnight summary
+            check: Returns a warning detail for a point, or None
+        """
+        self.flag = flag
+        self.summary = summary
+        self.check = check
+
+
+def _heavy_rain(frame: ForecastFrame, i: int, t: Mapping[str, float]) -> str | None:
+    precip = frame.precip_mm[i]
+    if precip > t["heavy_rain_mm_h"]:
+        return f"Heavy rain forecast: {precip:.1f}mm/hr - flooding risk"
+    return None
+
+
+def _strong_wind(frame: ForecastFrame, i: int, t: Mapping[str, float]) -> str | None:
+    wind = frame.wind_kt[i]
+    if wind > t["strong_wind_kt"]:
+        return f"Strong winds forecast: {wind:.0f}kt - potential damage"
+    return None
+
+
+def _gusts(frame: ForecastFrame, i: int, t: Mapping[str, float]) -> str | None:
+    gust = frame.gust_kt[i]
+    if gust > t["gust_kt"]:
+        return f"Gusts forecast: {gust:.0f}kt - potential damage"
+    return None
+
+
+def _surface_contamination(
+    frame: ForecastFrame, i: int, t: Mapping[str, float]
+) -> str | None:
+    if frame.snow[i]:
+        return "Snow forecast - surface contamination likely"
+    if frame.temp_c[i] < 0 and frame.precip_mm[i] > 0:
+        return "Freezing temperatures with precipitation - ice/snow risk"
+    return None
+
+
+def _fog(frame: ForecastFrame, i: int, t: Mapping[str, float]) -> str | None:
+    temp = value_or(frame.temp_c[i], 10)
+    dew_point = value_or(frame.dew_point_c[i], temp - 5)
+    if frame.visibility_m[i] < t["fog_visibility_m"] or (
+        frame.humidity_pct[i] > t["fog_humidity_pct"]
+        and abs(temp - dew_point) < t["fog_spread_c"]
+    ):
+        return "Fog likely - morning delays possible"
+    return None
+
+
+def _thunderstorms(
+    frame: ForecastFrame, i: int, t: Mapping[str, float]
+) -> str | None:
+    if frame.thunder[i]:
+        return "Thunderstorms forecast - lightning and squall risk"
+    return None
+
+
+def _hail(frame: ForecastFrame, i: int, t: Mapping[str, float]) -> str | None:
+    if frame.hail[i]:
+        return "Hail forecast - risk of damage to aircraft left outside"
+    return None
+
+
+# Evaluated in this order; details and the summary follow it
+OVERNIGHT_RULES: tuple[OvernightRule, ...] = (
+    OvernightRule("flooding_risk", "flooding risk", _heavy_rain),
+    OvernightRule("wind_damage_risk", "wind damage risk", _strong_wind),
+    OvernightRule("gust_risk", "damaging gusts", _gusts),
+    OvernightRule("surface_contamination", "surface contamination",
+                  _surface_contamination),
+    OvernightRule("fog_risk", "morning fog", _fog),
+    OvernightRule("thunderstorm_risk", "thunderstorms", _thunderstorms),
+    OvernightRule("hail_risk", "hail", _hail),
+)
+
+
+def overnight_thresholds(airfield: Mapping[str, Any] | None) -> dict[str, float]:
+    """Return overnight thresholds with an airfield's overrides applied.
+
+    Args:
+        airfield: Airfield config (``overnight_<name>`` keys override
+            DEFAULT_OVERNIGHT_THRESHOLDS), or None
+
+    Returns:
+        Complete threshold mapping
+    """
+    thresholds = dict(DEFAULT_OVERNIGHT_THRESHOLDS)
+    if not isinstance(airfield, Mapping):
+        return thresholds
+    for name in thresholds:
+        value = airfield.get(AIRFIELD_THRESHOLD_PREFIX + name)
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(number):
+            thresholds[name] = number
+    return thresholds
+
+
+def _evaluate(
+    frame: ForecastFrame,
+    thresholds: Mapping[str, float],
+    rules: tuple[OvernightRule, ...],
+) -> dict[str, str]:
+    """Run rules in one pass; return flag -> first warning detail."""
+    fired: dict[str, str] = {}
+    pending = list(rules)
+    for index in range(len(frame)):
+        still_pending = []
+        for rule in pending:
+            detail = rule.check(frame, index, thresholds)
+            if detail is None:
+                still_pending.append(rule)
+            else:
+                fired[rule.flag] = detail
+        pending = still_pending
+        if not pending:
+            break
+    return fired
+
+
+def _cache_key(
+    frame: ForecastFrame, thresholds: Mapping[str, float]
+) -> tuple | None:
+    """Key a window of a parsed forecast; windows share their parse's buffer."""
+    if not len(frame):
+        return None
+    return (
+        id(frame.times.obj),
+        frame.times[0],
+        len(frame),
+        tuple(sorted(thresholds.items())),
+    )
+
+
+def evaluate_overnight(
+    frame: ForecastFrame,
+    thresholds: Mapping[str, float] | None = None,
+    rules: tuple[OvernightRule, ...] = OVERNIGHT_RULES,
+) -> dict[str, Any]:
+    """Evaluate overnight rules over a forecast window.
+
+    Args:
+        frame: Overnight forecast window
+        thresholds: Threshold mapping (defaults filled in for missing names)
+        rules: Rules to evaluate, in reporting order
+
+    Returns:
+        Dictionary with each rule's flag, has_warnings, details (one per
+        fired rule, in rule order) and summary
+    """
+    merged = dict(DEFAULT_OVERNIGHT_THRESHOLDS)
+    merged.update(thresholds or {})
+
+    key = _cache_key(frame, merged) if rules is OVERNIGHT_RULES else None
+    cached = _EVALUATION_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _EVALUATION_CACHE.move_to_end(key)
+        fired = cached[1]
+    else:
+        fired = _evaluate(frame, merged, rules)
+        if key is not None:
+            # Keep the buffer alive so its id cannot be reused while cached
+            _EVALUATION_CACHE[key] = (frame.times.obj, fired)
+            while len(_EVALUATION_CACHE) > MAX_CACHED_EVALUATIONS:
+                _EVALUATION_CACHE.popitem(last=False)
+
+    result: dict[str, Any] = {rule.flag: rule.flag in fired for rule in rules}
+    result["has_warnings"] = bool(fired)
+    result["details"] = [fired[r.flag] for r in rules if r.flag in fired]
+    if fired:
+        result["summary"] = "Overnight: " + ", ".join(
+            r.summary for r in rules if r.flag in fired)
+    else:
+        result["summary"] = "No significant overnight conditions forecast"
+    return result
+
+
+def clear_overnight_cache() -> None:
+    """Drop all cached evaluations (used by tests)."""
+    _EVALUATION_CACHE.clear()
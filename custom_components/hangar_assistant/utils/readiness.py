@@ -0,0 +1,167 @@
+"""Event-driven readiness gate for startup work.
+
+Some startup work only makes sense once Home Assistant or the integration's
+own entities are ready: the first AI briefing needs live sensor values,
+the first NOTAM fetch needs the network (i.e. Home Assistant fully
+started), and the wizard's dashboard install needs the new config entry to
+have finished setting up. Rather than polling ``hass.states`` in a sleep
+loop, the gate subscribes to the relevant events and resolves one future
+per requirement as soon as it is met, so the work starts the instant the
+data is ready and nothing spins while Home Assistant boots.
+
+Usage:
+    not_ready = await async_wait_until_ready(
+        hass, ["sensor.popham_density_altitude"], timeout=30)
+    if not_ready:
+        _LOGGER.warning("Still waiting for %s", not_ready)
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name reported for the "Home Assistant has started" requirement
+HOMEASSISTANT_STARTED = "homeassistant_started"
+
+# States that do not count as a valid first write
+NOT_READY_STATES = ("unknown", "unavailable")
+
+
+def is_state_ready(state) -> bool:
+    """Return True if an entity state holds a usable value.
+
+    Args:
+        state: State object (or None if the entity does not exist yet)
+
+    Returns:
+        True when the entity exists and is not unknown/unavailable
+    """
+    return state is not None and state.state not in NOT_READY_STATES
+
+
+def is_started(hass: HomeAssistant) -> bool:
+    """Return True once Home Assistant has finished starting."""
+    return getattr(hass, "state", None) == CoreState.running
+
+
+async def async_wait_for_start(hass: HomeAssistant, timeout: float) -> bool:
+    """Wait for Home Assistant to finish starting.
+
+    Args:
+        hass: Home Assistant instance
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if Home Assistant has started, False on timeout
+    """
+    if is_started(hass):
+        return True
+
+    started = asyncio.get_running_loop().create_future()
+
+    @callback
+    def _on_started(_event: Event) -> None:
+        if not started.done():
+            started.set_result(None)
+
+    unsub = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STARTED, _on_started)
+    try:
+        await asyncio.wait_for(started, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        # A once-listener removes itself when it fires; wait_for cancels
+        # the future on timeout, so check for a real result
+        if started.cancelled() or not started.done():
+            unsub()
+
+
+async def async_wait_for_entities(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    timeout: float,
+) -> list[str]:
+    """Wait for each entity's first valid state.
+
+    Entities that are already ready resolve immediately. The others get a
+    future that the state-changed listener resolves on their first valid
+    write.
+
+    Args:
+        hass: Home Assistant instance
+        entity_ids: Entities that must report a usable state
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Sorted entity IDs that were still not ready at the timeout
+    """
+    loop = asyncio.get_running_loop()
+    waiting: dict[str, asyncio.Future] = {
+        entity_id: loop.create_future()
+        for entity_id in dict.fromkeys(entity_ids)
+        if not is_state_ready(hass.states.get(entity_id))
+    }
+    if not waiting:
+        return []
+
+    @callback
+    def _on_state_changed(event: Event) -> None:
+        future = waiting.get(event.data.get("entity_id"))
+        if (future is not None and not future.done()
+                and is_state_ready(event.data.get("new_state"))):
+            future.set_result(None)
+
+    unsub = async_track_state_change_event(
+        hass, list(waiting), _on_state_changed)
+    try:
+        await asyncio.wait(waiting.values(), timeout=timeout)
+    finally:
+        unsub()
+        for future in waiting.values():
+            future.cancel()
+
+    return sorted(
+        entity_id for entity_id, future in waiting.items()
+        if future.cancelled())
+
+
+async def async_wait_until_ready(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str] = (),
+    *,
+    wait_for_start: bool = False,
+    timeout: float,
+) -> list[str]:
+    """Wait until Home Assistant and the given entities are ready.
+
+    Args:
+        hass: Home Assistant instance
+        entity_ids: Entities that must report a usable state
+        wait_for_start: Also wait for Home Assistant to finish starting
+        timeout: Maximum seconds to wait for everything
+
+    Returns:
+        Requirements still unmet at the timeout (entity IDs, plus
+        HOMEASSISTANT_STARTED); empty when everything is ready
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    not_ready: list[str] = []
+
+    if wait_for_start and not await async_wait_for_start(hass, timeout):
+        not_ready.append(HOMEASSISTANT_STARTED)
+
+    not_ready.extend(await async_wait_for_entities(
+        hass, entity_ids, max(0.0, deadline - loop.time())))
+
+    if not_ready:
+        _LOGGER.debug("Readiness timeout after %ss: %s", timeout, not_ready)
+    return not_ready
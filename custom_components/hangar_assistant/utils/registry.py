@@ -0,0 +1,222 @@
+"""Runtime lookup indexes over a config entry's airfields, aircraft and pilots.
+
+Config entries store airfields, aircraft, pilots and hangars as lists, and
+callers used to find an item by scanning the list and normalising every
+registration or name on each call. The registry is built once per entry
+(at setup, and again whenever the entry's data is replaced) and provides
+O(1) lookups shared by the services and the sensor, binary sensor and
+select platforms:
+
+- aircraft by registration (``G-ABCD``, ``g_abcd`` and ``GABCD`` all match)
+- airfields by name, slug or ICAO code
+- pilots by name (case-insensitive)
+- aircraft by hangar
+- the select option lists (slugs, in configuration order)
+- each airfield's IANA timezone (resolved at setup by timezone_resolver)
+
+Registries are kept in ``hass.data[DOMAIN]["registries"]`` keyed by
+entry_id. ``get_registry`` rebuilds a registry when its entry's data object
+has been replaced (Home Assistant replaces, never mutates, entry data), so
+lookups never see stale configuration.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+from .timezone_resolver import cached_timezone
+
+# hass.data[DOMAIN] key: {entry_id: HangarRegistry}
+REGISTRIES_KEY = "registries"
+
+
+def slugify(value: str | None) -> str:
+    """Convert a name or registration to a slug (as used in entity IDs)."""
+    return (value or "").strip().lower().replace(" ", "_")
+
+
+def normalise_registration(value: str | None) -> str:
+    """Normalise an aircraft registration for matching.
+
+    Args:
+        value: Registration in any common form (G-ABCD, g_abcd, GABCD)
+
+    Returns:
+        Upper-case registration without separators
+    """
+    return "".join(
+        ch for ch in (value or "").upper() if ch not in "-_ ")
+
+
+def extract_slugs(items: Iterable[Any], keys: list[str]) -> list[str]:
+    """Extract unique slugs from a sequence of dicts using preferred keys.
+
+    Args:
+        items: Iterable of configuration dicts (airfields, aircraft, or pilots).
+        keys: Ordered list of field names to inspect for a usable identifier.
+
+    Returns:
+        Ordered list of slugified identifiers with duplicates removed while
+        preserving first-seen order.
+    """
+    seen: set[str] = set()
+    slugs: list[str] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for key in keys:
+            raw = item.get(key)
+            if raw:
+                slug = slugify(str(raw))
+                if slug and slug not in seen:
+                    seen.add(slug)
+                    slugs.append(slug)
+                break
+    return slugs
+
+
+def _dicts(data: dict, key: str) -> list[dict]:
+    items = data.get(key, []) if isinstance(data, dict) else []
+    return [item for item in items if isinstance(item, dict)]
+
+
+class HangarRegistry:
+    """O(1) lookup indexes over one config entry's data."""
+
+    def __init__(self, entry_id: str | None, data: dict) -> None:
+        """Build the indexes.
+
+        Args:
+            entry_id: Config entry ID
+            data: Config entry data
+        """
+        self.entry_id = entry_id
+        self.data = data
+        self.settings: dict = (
+            data.get("settings", {}) if isinstance(data, dict) else {})
+
+        airfields = _dicts(data, "airfields")
+        aircraft = _dicts(data, "aircraft")
+        pilots = _dicts(data, "pilots")
+        hangars = _dicts(data, "hangars")
+
+        self._aircraft_by_reg: dict[str, dict] = {}
+        self._aircraft_by_hangar: dict[str, list[dict]] = {}
+        for item in aircraft:
+            reg = normalise_registration(item.get("reg"))
+            if reg:
+                self._aircraft_by_reg.setdefault(reg, item)
+            hangar = slugify(item.get("hangar"))
+            if hangar:
+                self._aircraft_by_hangar.setdefault(hangar, []).append(item)
+
+        self.airfields = airfields
+        self._airfield_by_key: dict[str, dict] = {}
+        for item in airfields:
+            for key in (item.get("name"), item.get("icao"), item.get("icao_code")):
+                if key:
+                    self._airfield_by_key.setdefault(slugify(key), item)
+
+        self._pilot_by_name: dict[str, dict] = {}
+        for item in pilots:
+            name = item.get("name") or item.get("pilot_name")
+            if name:
+                self._pilot_by_name.setdefault(slugify(name), item)
+
+        self.airfield_options = extract_slugs(airfields, ["name", "icao_code"])
+        self.aircraft_options = extract_slugs(aircraft, ["reg", "name"])
+        self.pilot_options = extract_slugs(pilots, ["name", "pilot_name"])
+        self.hangar_options = extract_slugs(
+            (
+                {"slug": f"{slugify(h.get('airfield_name'))}_{slugify(h.get('name'))}"}
+                for h in hangars if h.get("name") and h.get("airfield_name")
+            ),
+            ["slug"])
+
+        # Airfield slug -> IANA zone, for airfields whose zone is resolved
+        self.timezones: dict[str, str] = {}
+        self.refresh_timezones()
+
+    def refresh_timezones(self) -> None:
+        """Fill ``timezones`` from the resolver's memo (no lookups)."""
+        for item in self.airfields:
+            zone = cached_timezone(item.get("latitude"), item.get("longitude"))
+            if zone:
+                self.timezones[slugify(item.get("name"))] = zone
+
+    def aircraft(self, registration: str | None) -> dict | None:
+        """Return the aircraft with a registration, in any common form."""
+        return self._aircraft_by_reg.get(normalise_registration(registration))
+
+    def airfield(self, name: str | None) -> dict | None:
+        """Return the airfield with a name, slug or ICAO code."""
+        return self._airfield_by_key.get(slugify(name))
+
+    def airfield_timezone(self, name: str | None) -> str | None:
+        """Return an airfield's resolved IANA zone, if known."""
+        airfield = self.airfield(name)
+        if airfield is None:
+            return None
+        return self.timezones.get(slugify(airfield.get("name")))
+
+    def pilot(self, name: str | None) -> dict | None:
+        """Return the pilot with a name (case-insensitive)."""
+        return self._pilot_by_name.get(slugify(name))
+
+    def aircraft_in_hangar(self, hangar: str | None) -> list[dict]:
+        """Return the aircraft assigned to a hangar (by name or slug)."""
+        return list(self._aircraft_by_hangar.get(slugify(hangar), []))
+
+
+def get_registry(hass: HomeAssistant, entry: ConfigEntry) -> HangarRegistry:
+    """Return an entry's registry, (re)building it if the data changed.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+
+    Returns:
+        HangarRegistry (not cached when hass.data is unavailable, as in tests)
+    """
+    entry_id = getattr(entry, "entry_id", None)
+    data = entry.data
+    hass_data = getattr(hass, "data", None)
+    if not isinstance(hass_data, dict):
+        return HangarRegistry(entry_id, data)
+
+    registries = hass_data.setdefault(DOMAIN, {}).setdefault(REGISTRIES_KEY, {})
+    registry = registries.get(entry_id)
+    if registry is None or registry.data is not data:
+        registry = HangarRegistry(entry_id, data)
+        registries[entry_id] = registry
+    return registry
+
+
+def find_aircraft(
+    hass: HomeAssistant, registration: str | None
+) -> tuple[HangarRegistry, dict] | tuple[None, None]:
+    """Find an aircraft across all of the integration's config entries.
+
+    Args:
+        hass: Home Assistant instance
+        registration: Aircraft registration in any common form
+
+    Returns:
+        (registry of the owning entry, aircraft config), or (None, None)
+    """
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        registry = get_registry(hass, entry)
+        aircraft = registry.aircraft(registration)
+        if aircraft is not None:
+            return registry, aircraft
+    return None, None
+
+
+def remove_registry(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget an entry's registry (on unload)."""
+    hass_data = getattr(hass, "data", None)
+    if isinstance(hass_data, dict):
+        hass_data.get(DOMAIN, {}).get(REGISTRIES_KEY, {}).pop(entry_id, None)
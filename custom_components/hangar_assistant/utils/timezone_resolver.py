@@ -0,0 +1,167 @@
+"""Lazy, shared airfield timezone resolution.
+
+``timezonefinder`` loads its polygon data when instantiated, which used to
+happen at import time of the sensor platform (slowing integration load and
+blocking the event loop), and the timezone sensor then ran a lookup on
+every state read. Instead:
+
+1. The finder is created on first use, in the executor, and shared by all
+   config entries (``async_load_timezone_finder``).
+2. Each airfield's zone is looked up once, in the executor, at entry setup
+   (and so again after a coordinate edit, which reloads the entry). Results
+   are memoised by rounded coordinates and stored in the entry's runtime
+   registry (``async_resolve_airfield_timezones``).
+3. Everything else (the timezone sensor, AI briefings) reads the memo with
+   ``cached_timezone`` or ``resolve_timezone``: dictionary lookups that
+   never touch the finder, so never block.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coordinates are rounded to ~10 m; zones never change at that scale
+_COORD_PRECISION = 4
+
+_finder: Any = None
+_finder_unavailable = False
+_finder_lock: asyncio.Lock | None = None
+
+# (lat, lon) rounded -> IANA zone, or None if the finder found none
+_ZONES: dict[tuple[float, float], str | None] = {}
+
+
+def _coord_key(latitude: Any, longitude: Any) -> tuple[float, float] | None:
+    try:
+        return (
+            round(float(latitude), _COORD_PRECISION),
+            round(float(longitude), _COORD_PRECISION),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_finder() -> Any:
+    """Create the TimezoneFinder (blocking: reads its data files)."""
+    global _finder, _finder_unavailable
+    if _finder is not None or _finder_unavailable:
+        return _finder
+    try:
+        from timezonefinder import TimezoneFinder
+    except ImportError:
+        _finder_unavailable = True
+        _LOGGER.debug("TimezoneFinder not available, using Home Assistant timezone")
+        return None
+    _finder = TimezoneFinder()
+    return _finder
+
+
+async def async_load_timezone_finder(hass: HomeAssistant) -> bool:
+    """Load the shared finder in the executor (once).
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        True if the finder is available
+    """
+    global _finder_lock
+    if _finder is not None or _finder_unavailable:
+        return _finder is not None
+    if _finder_lock is None:
+        _finder_lock = asyncio.Lock()
+    async with _finder_lock:
+        await hass.async_add_executor_job(_load_finder)
+    return _finder is not None
+
+
+def _lookup_all(coords: list[tuple[float, float]]) -> None:
+    """Look up and memoise zones for coordinates (blocking; finder loaded)."""
+    finder = _finder
+    if finder is None:
+        return
+    for lat, lon in coords:
+        if (lat, lon) in _ZONES:
+            continue
+        try:
+            _ZONES[(lat, lon)] = finder.timezone_at(lat=lat, lng=lon)
+        except (ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Invalid coordinates for timezone lookup: lat=%s, lon=%s: %s",
+                lat, lon, exc)
+            _ZONES[(lat, lon)] = None
+        if _ZONES[(lat, lon)] is None:
+            _LOGGER.debug("No timezone found for coordinates %s/%s", lat, lon)
+
+
+async def async_resolve_airfield_timezones(
+    hass: HomeAssistant, registry: Any
+) -> dict[str, str]:
+    """Resolve every airfield's zone and store the results in its registry.
+
+    Args:
+        hass: Home Assistant instance
+        registry: The entry's HangarRegistry
+
+    Returns:
+        Mapping of airfield slug to IANA zone (airfields with a zone only)
+    """
+    coords = [
+        key for key in (
+            _coord_key(a.get("latitude"), a.get("longitude"))
+            for a in registry.airfields)
+        if key is not None and key not in _ZONES
+    ]
+    if coords and await async_load_timezone_finder(hass):
+        await hass.async_add_executor_job(_lookup_all, coords)
+    registry.refresh_timezones()
+    return dict(registry.timezones)
+
+
+def cached_timezone(latitude: Any, longitude: Any) -> str | None:
+    """Return the memoised zone for coordinates, without any lookup.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+
+    Returns:
+        IANA zone, or None if unknown (not resolved yet, or no zone)
+    """
+    key = _coord_key(latitude, longitude)
+    return _ZONES.get(key) if key is not None else None
+
+
+def resolve_timezone(
+    hass: HomeAssistant, latitude: Any, longitude: Any
+) -> tuple[str, str]:
+    """Return the best-available zone for coordinates and where it came from.
+
+    Priority: airfield coordinates (memoised), Home Assistant's configured
+    zone, then UTC.
+
+    Args:
+        hass: Home Assistant instance
+        latitude: Latitude (or None)
+        longitude: Longitude (or None)
+
+    Returns:
+        (zone, source) where source is "airfield_coords", "home_assistant"
+        or "utc_fallback"
+    """
+    zone = cached_timezone(latitude, longitude)
+    if zone:
+        return zone, "airfield_coords"
+    ha_tz = getattr(getattr(hass, "config", None), "time_zone", None)
+    if isinstance(ha_tz, str) and ha_tz:
+        return ha_tz, "home_assistant"
+    return "UTC", "utc_fallback"
+
+
+def clear_timezone_cache() -> None:
+    """Forget memoised zones (used by tests; the finder stays loaded)."""
+    _ZONES.clear()
@@ -2,8 +2,16 @@
 
 Provides conversion functions between aviation units (feet, knots, pounds) and SI units
 (meters, kph, kilograms). Supports a configurable global unit preference system.
+
+Entities that convert many values per state write should resolve their
+preference once with ``unit_converters`` and use the returned
+``UnitConverters``: each conversion is then a single multiplication by a
+precomputed factor (``Converter``), with ``Converter.many`` for lists and
+arrays, instead of re-checking preference strings on every call.
 """
-from typing import Optional
+from array import array
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
 
 
 class UnitPreference:
@@ -53,6 +61,97 @@ POUNDS_TO_KG = 0.453592
 KG_TO_POUNDS = 1 / POUNDS_TO_KG
 
 
+class Converter:
+    """Multiply by a fixed factor; resolved once, applied many times."""
+
+    __slots__ = ("factor", "unit")
+
+    def __init__(self, factor: float, unit: str = "") -> None:
+        """Initialise the converter.
+
+        Args:
+            factor: Multiplier from the source unit to the target unit
+            unit: Target unit string (for display)
+        """
+        self.factor = factor
+        self.unit = unit
+
+    def __call__(self, value: Optional[float]) -> Optional[float]:
+        """Convert one value (None passes through; factor 1 returns value)."""
+        if value is None or self.factor == 1.0:
+            return value
+        return value * self.factor
+
+    def many(self, values: Iterable[Optional[float]]):
+        """Convert many values at once.
+
+        Args:
+            values: An ``array``/memoryview of floats, or any iterable of
+                numbers and None
+
+        Returns:
+            ``array('d')`` for array or memoryview input, otherwise a list
+            (None entries preserved)
+        """
+        factor = self.factor
+        if isinstance(values, (array, memoryview)):
+            return array("d", (value * factor for value in values))
+        return [None if value is None else value * factor for value in values]
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"Converter({self.factor!r}, {self.unit!r})"
+
+
+class UnitConverters(NamedTuple):
+    """Converters and display units for one unit preference."""
+
+    preference: str
+    altitude_from_feet: Converter
+    altitude_from_meters: Converter
+    speed_from_knots: Converter
+    speed_from_kph: Converter
+    weight_from_pounds: Converter
+    weight_from_kg: Converter
+    altitude_unit: str
+    speed_unit: str
+    weight_unit: str
+    fuel_volume_unit: str
+    fuel_burn_rate_unit: str
+
+
+@lru_cache(maxsize=None)
+def unit_converters(preference: str = "aviation") -> UnitConverters:
+    """Resolve a unit preference into converters (cached per preference).
+
+    Matches the convert_* functions: 'aviation' targets feet, knots and
+    pounds; any other preference targets metres, kph and kilograms.
+
+    Args:
+        preference: Unit preference ('aviation' or 'si')
+
+    Returns:
+        UnitConverters for the preference
+    """
+    aviation = preference == "aviation"
+    altitude, speed, weight = (
+        ("ft", "kt", "lbs") if aviation else ("m", "kph", "kg"))
+    return UnitConverters(
+        preference=preference,
+        altitude_from_feet=Converter(1.0 if aviation else FEET_TO_METERS, altitude),
+        altitude_from_meters=Converter(METERS_TO_FEET if aviation else 1.0, altitude),
+        speed_from_knots=Converter(1.0 if aviation else KNOTS_TO_KPH, speed),
+        speed_from_kph=Converter(KPH_TO_KNOTS if aviation else 1.0, speed),
+        weight_from_pounds=Converter(1.0 if aviation else POUNDS_TO_KG, weight),
+        weight_from_kg=Converter(KG_TO_POUNDS if aviation else 1.0, weight),
+        altitude_unit=altitude,
+        speed_unit=speed,
+        weight_unit=weight,
+        fuel_volume_unit="gal" if aviation else "L",
+        fuel_burn_rate_unit="gal/h" if aviation else "L/h",
+    )
+
+
 def convert_altitude(
         value: Optional[float],
         from_feet: bool = True,
@@ -67,21 +166,10 @@ def convert_altitude(
     Returns:
         Converted value, or None if input is None
     """
-    if value is None:
-        return None
-
-    if to_preference == "aviation":
-        # Target is feet
-        if from_feet:
-            return value  # Already in feet
-        else:
-            return value * METERS_TO_FEET  # Convert from meters to feet
-    else:
-        # Target is SI (meters)
-        if from_feet:
-            return value * FEET_TO_METERS  # Convert from feet to meters
-        else:
-            return value  # Already in meters
+    converters = unit_converters(to_preference)
+    if from_feet:
+        return converters.altitude_from_feet(value)
+    return converters.altitude_from_meters(value)
 
 
 def convert_speed(
@@ -98,21 +186,10 @@ def convert_speed(
     Returns:
         Converted value, or None if input is None
     """
-    if value is None:
-        return None
-
-    if to_preference == "aviation":
-        # Target is knots
-        if from_knots:
-            return value  # Already in knots
-        else:
-            return value * KPH_TO_KNOTS  # Convert from kph to knots
-    else:
-        # Target is SI (kph)
-        if from_knots:
-            return value * KNOTS_TO_KPH  # Convert from knots to kph
-        else:
-            return value  # Already in kph
+    converters = unit_converters(to_preference)
+    if from_knots:
+        return converters.speed_from_knots(value)
+    return converters.speed_from_kph(value)
 
 
 def convert_weight(
@@ -129,21 +206,10 @@ def convert_weight(
     Returns:
         Converted value, or None if input is None
     """
-    if value is None:
-        return None
-
-    if to_preference == "aviation":
-        # Target is pounds
-        if from_pounds:
-            return value  # Already in pounds
-        else:
-            return value * KG_TO_POUNDS  # Convert from kg to pounds
-    else:
-        # Target is SI (kg)
-        if from_pounds:
-            return value * POUNDS_TO_KG  # Convert from pounds to kg
-        else:
-            return value  # Already in kg
+    converters = unit_converters(to_preference)
+    if from_pounds:
+        return converters.weight_from_pounds(value)
+    return converters.weight_from_kg(value)
 
 
 def get_altitude_unit(preference: str = "aviation") -> str:
@@ -189,6 +255,46 @@ US_GALLONS_TO_LITERS = 3.78541
 IMPERIAL_GALLONS_TO_LITERS = 4.54609
 
 
+# Fuel volume unit -> litres per unit ("gallons" means US gallons)
+_LITERS_PER_UNIT = {
+    "liters": 1.0,
+    "gallons": US_GALLONS_TO_LITERS,
+    "gallons_us": US_GALLONS_TO_LITERS,
+    "gallons_imperial": IMPERIAL_GALLONS_TO_LITERS,
+}
+_UNITS_PER_LITER = {
+    "liters": 1.0,
+    "gallons": LITERS_TO_US_GALLONS,
+    "gallons_us": LITERS_TO_US_GALLONS,
+    "gallons_imperial": LITERS_TO_IMPERIAL_GALLONS,
+}
+
+
+@lru_cache(maxsize=None)
+def fuel_volume_converter(
+        from_unit: str = "liters",
+        to_unit: str = "liters") -> Converter:
+    """Resolve a fuel volume conversion into a converter (cached).
+
+    Follows convert_fuel_volume: an unknown source unit is left as-is and
+    an unknown target unit gives litres.
+
+    Args:
+        from_unit: Source unit ('liters', 'gallons', 'gallons_imperial')
+        to_unit: Target unit ('liters', 'gallons', 'gallons_imperial')
+
+    Returns:
+        Converter from from_unit to to_unit
+    """
+    from_unit = "gallons_us" if from_unit == "gallons" else from_unit
+    to_unit = "gallons_us" if to_unit == "gallons" else to_unit
+    if from_unit == to_unit or from_unit not in _LITERS_PER_UNIT:
+        return Converter(1.0, to_unit)
+    return Converter(
+        _LITERS_PER_UNIT[from_unit] * _UNITS_PER_LITER.get(to_unit, 1.0),
+        to_unit)
+
+
 def convert_fuel_volume(
         value: Optional[float],
         from_unit: str = "liters",
@@ -203,42 +309,7 @@ def convert_fuel_volume(
     Returns:
         Converted value, or None if input is None
     """
-    if value is None:
-        return None
-
-    # Normalize from_unit
-    if from_unit == "gallons":
-        from_unit = "gallons_us"
-
-    # Normalize to_unit
-    if to_unit == "gallons":
-        to_unit = "gallons_us"
-
-    # If same unit, return as-is
-    if from_unit == to_unit:
-        return value
-
-    # Convert to liters first (common base)
-    if from_unit == "liters":
-        value_liters = value
-    elif from_unit == "gallons_us":
-        value_liters = value * US_GALLONS_TO_LITERS
-    elif from_unit == "gallons_imperial":
-        value_liters = value * IMPERIAL_GALLONS_TO_LITERS
-    else:
-        # Unknown unit, return as-is
-        return value
-
-    # Convert from liters to target unit
-    if to_unit == "liters":
-        return value_liters
-    elif to_unit == "gallons_us":
-        return value_liters * LITERS_TO_US_GALLONS
-    elif to_unit == "gallons_imperial":
-        return value_liters * LITERS_TO_IMPERIAL_GALLONS
-    else:
-        # Unknown unit, return liters
-        return value_liters
+    return fuel_volume_converter(from_unit, to_unit)(value)
 
 
 def get_fuel_volume_unit(preference: str = "aviation") -> str:
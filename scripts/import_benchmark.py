@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Report the import-time cost of the integration, per module.
+
+Runs ``python -X importtime`` in fresh interpreters (so nothing is cached
+in ``sys.modules``), takes the median of several runs, and prints the
+self and cumulative import time of every module loaded by the target.
+Home Assistant core modules that are already loaded when HA imports an
+integration are preloaded before the measurement starts, so the report
+shows only what the integration itself adds to boot time.
+
+Usage (from the repository root, with Home Assistant installed):
+    python scripts/import_benchmark.py
+    python scripts/import_benchmark.py --runs 9 --top 30
+    python scripts/import_benchmark.py --target custom_components.hangar_assistant.sensor
+    python scripts/import_benchmark.py --json > import_times.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_TARGETS = [
+    "custom_components.hangar_assistant",
+    "custom_components.hangar_assistant.sensor",
+    "custom_components.hangar_assistant.binary_sensor",
+    "custom_components.hangar_assistant.select",
+]
+
+# Loaded by Home Assistant before any integration is imported
+DEFAULT_PRELOAD = [
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.event",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.select",
+]
+
+MARKER = "--- import benchmark target ---"
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parse ``-X importtime`` output after the marker line.
+
+    Args:
+        stderr: Interpreter stderr
+
+    Returns:
+        Module name -> (self µs, cumulative µs)
+    """
+    _, _, measured = stderr.partition(MARKER)
+    times: dict[str, tuple[int, int]] = {}
+    for line in measured.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def measure_once(targets: list[str], preload: list[str]) -> dict[str, tuple[int, int]]:
+    """Import the targets in a fresh interpreter and return module timings."""
+    code = "".join(f"import {name}\n" for name in preload)
+    code += f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\n"
+    code += "".join(f"import {name}\n" for name in targets)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Import failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def benchmark(
+    targets: list[str], preload: list[str], runs: int
+) -> list[dict[str, object]]:
+    """Median self/cumulative time per module over several runs.
+
+    Returns:
+        Rows sorted by cumulative time, slowest first
+    """
+    samples: dict[str, list[tuple[int, int]]] = {}
+    for _ in range(runs):
+        for module, timing in measure_once(targets, preload).items():
+            samples.setdefault(module, []).append(timing)
+    rows = [
+        {
+            "module": module,
+            "self_ms": statistics.median(s for s, _ in timings) / 1000,
+            "cumulative_ms": statistics.median(c for _, c in timings) / 1000,
+            "seen_in_runs": len(timings),
+        }
+        for module, timings in samples.items()
+    ]
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target", action="append", dest="targets",
+        help="Module to import (repeatable; default: package and platforms)")
+    parser.add_argument(
+        "--preload", action="append",
+        help="Module imported before measuring (repeatable; default: HA core)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs (median is reported)")
+    parser.add_argument("--top", type=int, default=25, help="Rows to print (0 = all)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    targets = args.targets or DEFAULT_TARGETS
+    preload = args.preload if args.preload is not None else DEFAULT_PRELOAD
+    rows = benchmark(targets, preload, max(1, args.runs))
+    total_ms = sum(row["self_ms"] for row in rows)
+
+    if args.json:
+        json.dump({"targets": targets, "runs": args.runs,
+                   "total_ms": round(total_ms, 2), "modules": rows},
+                  sys.stdout, indent=2)
+        print()
+        return
+
+    shown = rows if args.top <= 0 else rows[:args.top]
+    print(f"Imported {len(rows)} modules in {total_ms:.1f} ms "
+          f"(median of {args.runs} runs, HA core preloaded)\n")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for row in shown:
+        print(f"{row['self_ms']:9.2f} {row['cumulative_ms']:9.2f}  {row['module']}")
+
+
+if __name__ == "__main__":
+    main()
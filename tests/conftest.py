@@ -109,6 +109,9 @@ sys.modules["homeassistant.components.sensor"] = MagicMock()
 class HomeAssistant:
     """Minimal Home Assistant core object used for specs in tests."""
 
+    def async_add_shutdown_job(self, hassjob, *args):
+        """Register a job to run on shutdown (returns a remove callback)."""
+
 
 class ServiceCall:
     """Minimal ServiceCall stub with data payload."""
@@ -0,0 +1,87 @@
+"""Tests for the packaged asset cache."""
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.hangar_assistant.utils import asset_cache
+from custom_components.hangar_assistant.utils.asset_cache import (
+    DASHBOARD_TEMPLATE_ASSET,
+    PREFLIGHT_PROMPT_ASSET,
+    VFR_REFERENCE_ASSET,
+    async_load_text_asset,
+    clear_asset_cache,
+    get_cached_asset,
+    load_text_asset,
+    load_yaml_asset,
+)
+
+
+@pytest.fixture
+def asset_root(tmp_path):
+    """Point the asset cache at a temporary integration directory."""
+    clear_asset_cache()
+    with patch.object(asset_cache, "ASSET_ROOT", str(tmp_path)):
+        yield tmp_path
+    clear_asset_cache()
+
+
+class TestAssetCache:
+    """Test loading, caching and mtime revalidation of packaged assets."""
+
+    def test_packaged_assets_load(self):
+        """The real prompt, dashboard template and VFR reference load."""
+        clear_asset_cache()
+        assert "briefing" in load_text_asset(PREFLIGHT_PROMPT_ASSET).lower()
+        assert "views" in load_yaml_asset(DASHBOARD_TEMPLATE_ASSET)
+        assert "VFR" in load_text_asset(VFR_REFERENCE_ASSET)
+
+    def test_second_load_is_served_from_memory(self, asset_root):
+        """An unchanged file is only read once."""
+        (asset_root / "notes.txt").write_text("first", encoding="utf-8")
+
+        assert load_text_asset("notes.txt") == "first"
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            assert load_text_asset("notes.txt") == "first"
+
+    def test_modified_file_is_reloaded(self, asset_root):
+        """A changed mtime invalidates the cached value."""
+        path = asset_root / "notes.txt"
+        path.write_text("first", encoding="utf-8")
+        assert load_text_asset("notes.txt") == "first"
+
+        path.write_text("second", encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert get_cached_asset("notes.txt") is None
+        assert load_text_asset("notes.txt") == "second"
+
+    def test_yaml_is_parsed_once_and_shared(self, asset_root):
+        """YAML assets are parsed once and the same object is returned."""
+        (asset_root / "t.yaml").write_text("views:\n  - title: A\n", encoding="utf-8")
+
+        first = load_yaml_asset("t.yaml")
+        assert first == {"views": [{"title": "A"}]}
+        assert load_yaml_asset("t.yaml") is first
+        # Text and parsed views of a file are cached independently
+        assert load_text_asset("t.yaml").startswith("views:")
+
+    def test_missing_and_invalid_assets_return_none(self, asset_root):
+        """Unreadable assets return None and are not cached."""
+        (asset_root / "bad.yaml").write_text("views: [", encoding="utf-8")
+
+        assert load_text_asset("missing.txt") is None
+        assert load_yaml_asset("bad.yaml") is None
+        assert get_cached_asset("bad.yaml", "yaml") is None
+
+    @pytest.mark.asyncio
+    async def test_async_load_uses_executor_only_on_miss(self, asset_root):
+        """Cached assets are returned without scheduling an executor job."""
+        (asset_root / "notes.txt").write_text("text", encoding="utf-8")
+        hass = MagicMock()
+        hass.async_add_executor_job = AsyncMock(side_effect=lambda func: func())
+
+        assert await async_load_text_asset(hass, "notes.txt") == "text"
+        assert await async_load_text_asset(hass, "notes.txt") == "text"
+        assert hass.async_add_executor_job.await_count == 1
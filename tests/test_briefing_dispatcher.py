@@ -0,0 +1,132 @@
+"""Tests for the scheduled pilot briefing dispatcher."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.hangar_assistant.utils.briefing_dispatcher import (
+    async_dispatch_briefings,
+    build_notifications,
+    build_snapshot,
+    group_briefings_by_time,
+    render_briefing,
+)
+
+PILOTS = [
+    {"name": "John Smith", "email": "john@example.com"},
+    {"name": "Jane Doe", "email": "jane@example.com"},
+]
+
+
+def _briefing(time="07:00", pilots=("John Smith",), airfield="Popham"):
+    return {
+        "airfield_name": airfield,
+        "aircraft_reg": "G-ABCD",
+        "briefing_time": time,
+        "pilots": list(pilots),
+    }
+
+
+def _hass(states=None):
+    states = states or {}
+    hass = MagicMock()
+    hass.states.get = MagicMock(
+        side_effect=lambda eid: MagicMock(state=states[eid]) if eid in states else None)
+    hass.services.async_call = AsyncMock()
+    return hass
+
+
+def test_group_briefings_by_minute():
+    groups = group_briefings_by_time([
+        _briefing("07:00"), _briefing("07:00:00", airfield="Lasham"),
+        _briefing("18:30"), _briefing("bad")])
+    assert sorted(groups) == [(7, 0), (18, 30)]
+    assert len(groups[(7, 0)]) == 2
+
+
+def test_snapshot_reads_each_entity_once():
+    hass = _hass({"sensor.popham_density_altitude": "1200"})
+    snapshot = build_snapshot(hass, [_briefing(), _briefing(pilots=["Jane Doe"])])
+    assert hass.states.get.call_count == 3
+    assert snapshot["sensor.popham_density_altitude"] == "1200"
+    assert snapshot["sensor.popham_carb_risk"] == "N/A"
+
+
+def test_render_personalised_body():
+    snapshot = {"sensor.popham_density_altitude": "1200"}
+    subject, body = render_briefing(_briefing(), snapshot, "Jane Doe")
+    assert subject == "✈️ Hangar Briefing: Popham / G-ABCD"
+    assert body.startswith("Good morning Captain Jane Doe.")
+    assert "- Density Altitude: 1200 ft" in body
+    assert "Carb Icing Risk: N/A" in body
+
+
+def test_persistent_notification_sends_one_per_briefing():
+    notifications = build_notifications(
+        [_briefing(pilots=["John Smith", "Jane Doe"])], PILOTS, {})
+    assert len(notifications) == 1
+    assert "target" not in notifications[0][1]
+
+
+def test_targeted_service_sends_one_per_pilot():
+    notifications = build_notifications(
+        [_briefing(pilots=["John Smith", "Jane Doe", "Unknown"])],
+        PILOTS, {}, notify_service="email")
+    assert [n[1]["target"] for n in notifications] == [
+        ["john@example.com"], ["jane@example.com"]]
+    assert "Captain John Smith" in notifications[0][1]["message"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_is_concurrent_with_per_target_timeout():
+    """A hung target times out without delaying or failing the others."""
+    hass = _hass()
+    started = []
+
+    async def _call(domain, service, data, blocking=False):
+        started.append(data["target"][0])
+        if data["target"][0] == "jane@example.com":
+            await asyncio.sleep(10)
+
+    hass.services.async_call = AsyncMock(side_effect=_call)
+    briefings = [_briefing(pilots=["John Smith", "Jane Doe"])]
+    sent = await async_dispatch_briefings(
+        hass, briefings, PILOTS, notify_service="email", timeout=0.05)
+
+    assert sent == 1
+    assert sorted(started) == ["jane@example.com", "john@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_survives_failing_service():
+    hass = _hass()
+    hass.services.async_call = AsyncMock(side_effect=Exception("smtp down"))
+    sent = await async_dispatch_briefings(hass, [_briefing()], PILOTS)
+    assert sent == 0
+    hass.services.async_call.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_briefings_uses_configured_notify_service():
+    """The settings option selects the service; notify. prefix is optional."""
+    from custom_components.hangar_assistant import async_send_briefings
+
+    hass = _hass()
+    entry = MagicMock()
+    entry.data = {
+        "pilots": PILOTS,
+        "settings": {"briefing_notify_service": " notify.email "},
+    }
+
+    sent = await async_send_briefings(
+        hass, [_briefing(pilots=["John Smith", "Jane Doe"])], entry)
+
+    assert sent == 2
+    services = {c.args[1] for c in hass.services.async_call.await_args_list}
+    assert services == {"email"}
+
+    entry.data["settings"] = {"briefing_notify_service": ""}
+    hass.services.async_call.reset_mock()
+    await async_send_briefings(hass, [_briefing()], entry)
+    assert hass.services.async_call.await_args.args[1] == (
+        "persistent_notification")
@@ -0,0 +1,167 @@
+"""Tests for AI briefing input fingerprints."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.hangar_assistant.utils.briefing_fingerprint import (
+    DEFAULT_BRIEFING_MAX_AGE,
+    build_briefing_fingerprint,
+    material_change_reason,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+NOTAMS = (
+    "2 NOTAMs within 10nm: 1🔴 CRITICAL, 0🟠 HIGH, 0🟡 MEDIUM, 1⚪ LOW"
+    "\n🔴 CRITICAL - A1234/26 (EGTT) - AIRSPACE"
+    "\n  Q-code: QRTCA - Restricted area"
+    "\n⚪ LOW - B0001/26 (EGTT) - OTHER"
+    "\n  Q-code: QXXXX - Other"
+)
+
+FORECAST = (
+    "\n### FORECAST TO 18:00 UTC:\n"
+    "Overall Trend: STABLE\n"
+    "Summary: Wind steady around 10kt\n\n"
+    "Key Forecast Points:\n"
+    "  09:00: 8°C, Wind 10kt @ 220°, Clouds 40%, Precip 0mm\n"
+    "  12:00: 10°C, Wind 12kt @ 230°, Clouds 50%, Precip 0mm\n"
+    "\n(No overnight period in forecast window)\n"
+)
+
+
+def _sensors(**overrides):
+    values = {
+        "da": "1500",
+        "wind_speed": "10",
+        "wind_dir": "220",
+        "temp": "8",
+        "dp": "4",
+        "pressure": "1013",
+        "cloud_base": "3500",
+        "carb": "Low Risk",
+        "safety_alert": "off",
+    }
+    values.update(overrides)
+    data = {key: MagicMock(state=value) for key, value in values.items()}
+    data.update(crosswind=4.0, headwind=9.0, runway_number="22",
+                runway_length=800)
+    return data
+
+
+def _fingerprint(sensors=None, notams=NOTAMS, forecast=FORECAST, now=NOW,
+                 prompt="Brief me"):
+    return build_briefing_fingerprint(
+        prompt, sensors or _sensors(), notams, forecast, now)
+
+
+class TestBriefingFingerprint:
+    """Test material-change detection for AI briefing inputs."""
+
+    def test_identical_inputs_share_digest(self):
+        """Identical inputs produce identical digests and no change."""
+        first = _fingerprint()
+        second = _fingerprint(now=NOW + timedelta(hours=1))
+
+        assert first["digest"] == second["digest"]
+        assert material_change_reason(first, second) is None
+
+    def test_first_briefing_is_always_material(self):
+        """Without a previous fingerprint the briefing must be generated."""
+        assert material_change_reason(None, _fingerprint()) is not None
+
+    def test_small_numeric_changes_are_ignored(self):
+        """Sensor jitter below the thresholds does not trigger a briefing."""
+        previous = _fingerprint()
+        current = _fingerprint(_sensors(da="1650", wind_speed="12", temp="9"))
+
+        assert previous["digest"] != current["digest"]
+        assert material_change_reason(previous, current) is None
+
+    def test_threshold_changes_are_material(self):
+        """Density altitude +200 ft or wind +3 kt needs a new briefing."""
+        previous = _fingerprint()
+
+        assert "da" in material_change_reason(
+            previous, _fingerprint(_sensors(da="1700")))
+        assert "wind_speed" in material_change_reason(
+            previous, _fingerprint(_sensors(wind_speed="13")))
+
+    def test_si_values_use_aviation_thresholds(self):
+        """Metres and kph are normalised before comparing to ft/kt thresholds."""
+        def si_sensors(da, cloud_base, crosswind):
+            data = _sensors()
+            data["da"] = MagicMock(
+                state=da, attributes={"unit_of_measurement": "m"})
+            data["cloud_base"] = MagicMock(
+                state=cloud_base, attributes={"unit_of_measurement": "m"})
+            data["best_rwy"] = MagicMock(
+                state="22", attributes={"wind_unit": "kph"})
+            data["crosswind"] = crosswind
+            return data
+
+        previous = _fingerprint(si_sensors("460", "1070", 7.4))
+
+        # 50 m is about 164 ft: below the 200 ft threshold
+        assert material_change_reason(
+            previous, _fingerprint(si_sensors("510", "1070", 7.4))) is None
+        # 70 m is about 230 ft: material
+        assert "da" in material_change_reason(
+            previous, _fingerprint(si_sensors("530", "1070", 7.4)))
+        # 7.4 kph is 4 kt, 3 kph is under 2 kt
+        assert material_change_reason(
+            previous, _fingerprint(si_sensors("460", "1070", 10.4))) is None
+        assert previous["numeric"]["crosswind"] == pytest.approx(4.0, abs=0.01)
+
+    def test_wind_direction_wraps(self):
+        """Wind direction across north is compared on the circle."""
+        previous = _fingerprint(_sensors(wind_dir="350"))
+
+        assert material_change_reason(
+            previous, _fingerprint(_sensors(wind_dir="10"))) is None
+        assert material_change_reason(
+            previous, _fingerprint(_sensors(wind_dir="40"))) is not None
+
+    def test_categorical_changes_are_material(self):
+        """Carb risk, safety alert and sensor availability must match."""
+        previous = _fingerprint()
+
+        assert material_change_reason(
+            previous, _fingerprint(_sensors(carb="Serious Risk"))) == "carb changed"
+        assert material_change_reason(
+            previous, _fingerprint(_sensors(safety_alert="on"))
+        ) == "safety_alert changed"
+        assert material_change_reason(
+            previous, _fingerprint(_sensors(da="unavailable"))
+        ) == "unavailable changed"
+
+    def test_new_critical_notam_is_material(self):
+        """A new CRITICAL NOTAM triggers a briefing; a new LOW one does not."""
+        previous = _fingerprint()
+        new_low = NOTAMS + "\n⚪ LOW - B0002/26 (EGTT) - OTHER"
+        new_critical = NOTAMS + "\n🔴 CRITICAL - A9999/26 (EGTT) - AIRSPACE"
+
+        assert material_change_reason(
+            previous, _fingerprint(notams=new_low)) is None
+        assert material_change_reason(
+            previous, _fingerprint(notams=new_critical)) == "notams changed"
+
+    def test_forecast_points_ignored_but_trend_is_material(self):
+        """Hourly forecast points shift each run; the trend matters."""
+        previous = _fingerprint()
+        shifted = FORECAST.replace("09:00: 8°C", "10:00: 9°C")
+        deteriorating = FORECAST.replace("STABLE", "DETERIORATING")
+
+        assert material_change_reason(
+            previous, _fingerprint(forecast=shifted)) is None
+        assert material_change_reason(
+            previous, _fingerprint(forecast=deteriorating)) == "forecast changed"
+
+    def test_old_briefing_is_refreshed(self):
+        """Briefings are regenerated once they reach the maximum age."""
+        previous = _fingerprint()
+        current = _fingerprint(now=NOW + DEFAULT_BRIEFING_MAX_AGE)
+
+        assert material_change_reason(previous, current) == (
+            "previous briefing expired")
@@ -0,0 +1,104 @@
+"""Tests for the persisted AI briefing history."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.hangar_assistant.utils.briefing_history import (
+    BriefingHistory,
+    get_briefing_history,
+)
+
+T0 = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+
+
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.async_load = AsyncMock(side_effect=lambda: self.data)
+        self.async_save = AsyncMock(side_effect=self._save)
+        self.async_delay_save = MagicMock(side_effect=self._delay_save)
+
+    async def _save(self, data):
+        self.data = data
+
+    def _delay_save(self, data_func, _delay):
+        self.data = data_func()
+
+
+def _history(store=None, max_entries=48):
+    return BriefingHistory(MagicMock(), max_entries=max_entries, store=store or FakeStore())
+
+
+class TestBriefingHistory:
+    """Test recording, lookup and persistence of briefings."""
+
+    @pytest.mark.asyncio
+    async def test_recent_and_latest_newest_first(self):
+        history = _history()
+        await history.async_load()
+        for hour in range(3):
+            history.add("Popham", f"Brief {hour}", T0 + timedelta(hours=hour))
+
+        assert history.latest("Popham")["text"] == "Brief 2"
+        recent = history.recent("Popham", 2)
+        assert [r["text"] for r in recent] == ["Brief 2", "Brief 1"]
+        assert recent[0]["generated_at"] == (T0 + timedelta(hours=2)).isoformat()
+        assert history.recent("Unknown", 5) == []
+
+    @pytest.mark.asyncio
+    async def test_lookup_at_time(self):
+        """at() returns the briefing in effect at the requested time."""
+        history = _history()
+        await history.async_load()
+        history.add("Popham", "Morning", T0)
+        history.add("Popham", "Midday", T0 + timedelta(hours=4))
+
+        assert history.at("Popham", T0 - timedelta(minutes=1)) is None
+        assert history.at("Popham", T0)["text"] == "Morning"
+        assert history.at("Popham", T0 + timedelta(hours=3))["text"] == "Morning"
+        assert history.at("Popham", T0 + timedelta(hours=9))["text"] == "Midday"
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_per_airfield(self):
+        history = _history(max_entries=3)
+        await history.async_load()
+        for hour in range(5):
+            history.add("Popham", f"Brief {hour}", T0 + timedelta(hours=hour))
+        history.add("Lasham", "Other", T0)
+
+        assert [r["text"] for r in history.recent("Popham", 10)] == [
+            "Brief 4", "Brief 3", "Brief 2"]
+        assert history.airfields() == ["Lasham", "Popham"]
+
+    @pytest.mark.asyncio
+    async def test_persisted_compressed_and_restored(self):
+        """Stored text is compressed and survives a reload."""
+        store = FakeStore()
+        history = _history(store)
+        await history.async_load()
+        text = "Winds calm, CAVOK. " * 50
+        history.add("Popham", text, T0)
+
+        stored = store.data["Popham"]
+        assert stored["ts"] == [T0.timestamp()]
+        assert text not in stored["text"][0]
+        assert len(stored["text"][0]) < len(text) / 2
+
+        restored = _history(FakeStore(store.data))
+        await restored.async_load()
+        assert restored.latest("Popham")["text"] == text
+
+    @pytest.mark.asyncio
+    async def test_corrupt_storage_is_ignored(self):
+        history = _history(FakeStore({"Popham": {"ts": [1.0], "text": []}}))
+        await history.async_load()
+        assert history.airfields() == []
+
+    def test_shared_instance_requires_hass_data(self):
+        hass = MagicMock()
+        assert get_briefing_history(hass) is None
+        hass.data = {}
+        assert get_briefing_history(hass) is get_briefing_history(hass)
@@ -0,0 +1,105 @@
+"""Tests for the sectioned AI briefing prompt builder."""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from custom_components.hangar_assistant import _build_briefing_prompt
+from custom_components.hangar_assistant.utils.briefing_fingerprint import (
+    build_briefing_fingerprint,
+)
+from custom_components.hangar_assistant.utils.briefing_prompt import (
+    build_notam_section,
+    build_static_prefix,
+    estimate_tokens,
+)
+from custom_components.hangar_assistant.utils.qcode_parser import (
+    parse_qcode,
+    sort_notams_by_criticality,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _notams(q_codes):
+    notams = [
+        {
+            "id": f"A{index:04d}/26",
+            "location": "EGTT",
+            "q_code": q_code,
+            "text": "X" * 400,
+            "start_time": "2026-03-01T00:00Z",
+            "end_time": "2026-03-02T00:00Z",
+            "parsed_qcode": parse_qcode(q_code),
+        }
+        for index, q_code in enumerate(q_codes)
+    ]
+    return sort_notams_by_criticality(notams)
+
+
+class TestBriefingPrompt:
+    """Test prompt sections, caching and NOTAM trimming."""
+
+    def test_prompt_contains_all_sections(self):
+        """The assembled prompt keeps instructions, live data and sections."""
+        sensors = {
+            "da": MagicMock(state="1500"),
+            "wind_speed": MagicMock(state="12"),
+            "safety_alert": MagicMock(state="on"),
+            "crosswind": 4,
+            "headwind": None,
+            "runway_number": "22",
+            "runway_length": 800,
+        }
+        prompt = _build_briefing_prompt(
+            "SYSTEM", "Test Field", "EGXX", {"latitude": 51.0}, sensors,
+            "Europe/London", "07:00", "18:00", NOW, "NOTAMS HERE", 10,
+            "FORECAST HERE")
+
+        assert prompt.startswith("SYSTEM\n\n### LIVE DATA FOR Test Field (EGXX)")
+        assert "- Timezone: Europe/London" in prompt
+        assert "- Runway: 22 - 800m" in prompt
+        assert "- Density Altitude: 1500 ft" in prompt
+        assert "Crosswind: 4kt | Headwind: unknownkt" in prompt
+        assert "Master Safety Alert: ACTIVE" in prompt
+        assert "- Pressure: unknown hPa" in prompt
+        assert "**NOTAMs (10nm radius):**\nNOTAMS HERE" in prompt
+        assert "**FORECAST:**\nFORECAST HERE" in prompt
+
+    def test_static_prefix_is_cached(self):
+        """The same airfield reuses the cached static prefix object."""
+        build_static_prefix.cache_clear()
+        args = ("SYSTEM", "Field", "EGXX", 51.0, -1.0, 100, "UTC")
+
+        first = build_static_prefix(*args)
+        assert build_static_prefix(*args) is first
+        assert build_static_prefix.cache_info().hits == 1
+
+    def test_notams_within_budget_keep_detail(self):
+        """Small NOTAM sets are passed through in full."""
+        text = build_notam_section(_notams(["QMRLC", "QOBCE"]), 10)
+
+        assert text.startswith("2 NOTAMs within 10nm:")
+        assert "A0000/26" in text and "A0001/26" in text
+        assert "omitted" not in text
+
+    def test_notams_trimmed_by_criticality(self):
+        """Over budget, low-priority NOTAMs go first; critical stay listed."""
+        # Three CRITICAL runway closures and forty LOW obstacle NOTAMs
+        q_codes = ["QMRLC"] * 3 + ["QOBCE"] * 40
+        text = build_notam_section(_notams(q_codes), 10, token_budget=300)
+
+        assert estimate_tokens(text) <= 320
+        for index in range(3):
+            assert f"A{index:04d}/26" in text
+        assert "lower-priority NOTAMs omitted" in text
+        # Summary still counts every NOTAM
+        assert text.startswith("43 NOTAMs within 10nm:")
+
+    def test_trimmed_notams_keep_fingerprint_stable(self):
+        """Trimming never hides CRITICAL/HIGH IDs from the fingerprint."""
+        full = build_notam_section(_notams(["QMRLC"] * 3), 10)
+        trimmed = build_notam_section(_notams(["QMRLC"] * 3), 10, token_budget=0)
+
+        first = build_briefing_fingerprint("", {}, full, "", NOW)
+        second = build_briefing_fingerprint("", {}, trimmed, "", NOW)
+        assert first["categorical"]["notams"] == second["categorical"]["notams"]
+        assert len(first["categorical"]["notams"]) == 3
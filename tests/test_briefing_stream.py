@@ -0,0 +1,70 @@
+"""Tests for AI briefing delivery and speech chunking."""
+from unittest.mock import MagicMock
+
+from custom_components.hangar_assistant.utils.briefing_stream import (
+    EVENT_AI_BRIEFING,
+    EVENT_AI_BRIEFING_FAILED,
+    EVENT_AI_BRIEFING_STARTED,
+    BriefingStream,
+    chunk_for_speech,
+)
+
+
+def _events(hass):
+    return [(c.args[0], c.args[1]) for c in hass.bus.async_fire.call_args_list]
+
+
+class TestBriefingStream:
+    """Test the started/final event sequence."""
+
+    def test_started_then_complete_text(self):
+        """A briefing is announced, then published in one event."""
+        hass = MagicMock()
+        stream = BriefingStream(hass, "Popham")
+
+        stream.start()
+        assert stream.finish("Runway 22.") == "Runway 22."
+
+        assert _events(hass) == [
+            (EVENT_AI_BRIEFING_STARTED, {"airfield_name": "Popham"}),
+            (EVENT_AI_BRIEFING, {"airfield_name": "Popham", "text": "Runway 22."}),
+        ]
+
+    def test_fail_after_finish_is_ignored(self):
+        """fail() only fires if the briefing never finished."""
+        hass = MagicMock()
+        stream = BriefingStream(hass, "Popham")
+
+        stream.start()
+        stream.finish("Complete text")
+        stream.fail()
+        assert EVENT_AI_BRIEFING_FAILED not in [n for n, _ in _events(hass)]
+
+        stream.start()
+        stream.fail()
+        assert _events(hass)[-1] == (
+            EVENT_AI_BRIEFING_FAILED, {"airfield_name": "Popham"})
+
+
+class TestChunkForSpeech:
+    """Test splitting briefings for incremental TTS."""
+
+    def test_short_first_chunk_then_larger_chunks(self):
+        """The first chunk is short; all text is kept in order."""
+        text = "\n\n".join(
+            " ".join(f"Point {p}.{i} is noted." for i in range(10))
+            for p in range(5))
+
+        chunks = chunk_for_speech(text, first_chunk_chars=50, chunk_chars=200)
+
+        assert len(chunks[0]) <= 50
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert " ".join(chunks) == " ".join(text.split())
+
+    def test_long_sentence_is_not_split(self):
+        """A sentence longer than the limit stays whole."""
+        sentence = "A" * 300 + "."
+        assert chunk_for_speech(f"Hi. {sentence}", 50, 100) == ["Hi.", sentence]
+
+    def test_empty_text(self):
+        assert chunk_for_speech("") == []
@@ -26,15 +26,23 @@ Performance:
 
 import asyncio
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.hangar_assistant.utils.cache_backends import (
+    BACKEND_SQLITE,
+    SQLITE_FILENAME,
+)
 from custom_components.hangar_assistant.utils.cache_manager import (
     CacheEntry,
     CacheManager,
+    async_flush_cache_managers,
+    async_warm_cache_managers,
+    get_cache_manager,
 )
 
 
@@ -484,6 +492,39 @@ class TestCacheManager:
         assert stats["writes"] == 1
         assert stats["hit_rate"] == 66.67  # 2 hits / 3 requests
 
+    @pytest.mark.asyncio
+    async def test_get_stats_does_no_backend_io(self, cache_manager):
+        """get_stats() reports the last recorded count without counting."""
+        await cache_manager.set("key1", {"data": "1"})
+        await cache_manager.set("key2", {"data": "2"})
+        await cache_manager.delete("key1")
+
+        with patch.object(
+            cache_manager._backend, "count",
+            side_effect=AssertionError("count on the event loop")
+        ):
+            assert cache_manager.get_stats()["persistent_files"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_get_stats_recounts_in_executor(self, cache_manager):
+        """async_get_stats() refreshes the count through the executor."""
+        await cache_manager.set("key1", {"data": "1"})
+        cache_manager._backend.write_many({"other": {"data": "x"}})
+        assert cache_manager.get_stats()["persistent_files"] == 1
+
+        executor_calls = []
+        run_in_executor = cache_manager.hass.async_add_executor_job
+
+        async def recording_executor_job(func, *args):
+            executor_calls.append(func)
+            return await run_in_executor(func, *args)
+
+        cache_manager.hass.async_add_executor_job = recording_executor_job
+        stats = await cache_manager.async_get_stats()
+
+        assert stats["persistent_files"] == 2
+        assert executor_calls == [cache_manager._backend.count]
+
     @pytest.mark.asyncio
     async def test_cleanup_expired_entries(self, cache_manager):
         """Test cleanup of expired cache entries."""
@@ -629,3 +670,449 @@ class TestCacheManager:
 
         # Verify separate directories
         assert cache1.cache_dir != cache2.cache_dir
+
+
+class TestSQLiteBackend:
+    """Test the single-file SQLite backend and batched operations."""
+
+    @pytest.fixture
+    def mock_hass(self, tmp_path):
+        """Create mock Home Assistant instance."""
+        hass = MagicMock()
+        hass.config.path = MagicMock(return_value=str(tmp_path))
+
+        async def mock_executor_job(func, *args):
+            """Mock async_add_executor_job that returns awaitable."""
+            return func(*args)
+
+        hass.async_add_executor_job = mock_executor_job
+        return hass
+
+    @pytest.fixture
+    def sqlite_cache(self, mock_hass):
+        """Create SQLite-backed cache manager."""
+        manager = CacheManager(
+            mock_hass,
+            namespace="checkwx",
+            ttl_minutes=10,
+            backend=BACKEND_SQLITE,
+        )
+        yield manager
+        manager._backend.close()
+
+    def test_invalid_backend_rejected(self, mock_hass):
+        """Test unknown backend names raise ValueError."""
+        with pytest.raises(ValueError):
+            CacheManager(mock_hass, namespace="test", backend="lmdb")
+
+    @pytest.mark.asyncio
+    async def test_persistent_round_trip(self, mock_hass, sqlite_cache, tmp_path):
+        """Test values survive a restart via the single-file store."""
+        await sqlite_cache.set("metar_EGHP", {"icao": "EGHP"})
+
+        assert (tmp_path / SQLITE_FILENAME).exists()
+        assert not list(tmp_path.glob("checkwx/*.json"))
+
+        restarted = CacheManager(
+            mock_hass, namespace="checkwx", backend=BACKEND_SQLITE
+        )
+        assert await restarted.get("metar_EGHP") == {"icao": "EGHP"}
+        assert restarted.get_stats()["persistent_hits"] == 1
+        restarted._backend.close()
+
+    @pytest.mark.asyncio
+    async def test_namespaces_share_file_but_not_keys(self, mock_hass, sqlite_cache):
+        """Test namespaces are isolated inside the shared database."""
+        other = CacheManager(mock_hass, namespace="notam", backend=BACKEND_SQLITE)
+
+        await sqlite_cache.set("data", {"source": "checkwx"})
+        await other.set("data", {"source": "notam"})
+        await other.clear()
+
+        assert sqlite_cache._backend.read("data")["data"] == {"source": "checkwx"}
+        assert other._backend.count() == 0
+        other._backend.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_uses_expiry_index(self, sqlite_cache):
+        """Test expired rows are removed without touching fresh ones."""
+        await sqlite_cache.set("old", {"v": 1}, ttl_minutes=0.001)
+        await sqlite_cache.set("fresh", {"v": 2})
+        await asyncio.sleep(0.1)
+
+        removed = await sqlite_cache.cleanup_expired()
+
+        assert removed >= 1
+        assert sqlite_cache._backend.read("old") is None
+        assert sqlite_cache._backend.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_set_many_get_many(self, mock_hass, sqlite_cache):
+        """Test batched writes and reads across memory and persistent tiers."""
+        await sqlite_cache.set_many({f"key_{i}": {"i": i} for i in range(5)})
+        assert sqlite_cache._backend.count() == 5
+
+        # New manager: all values come from one persistent batch read
+        restarted = CacheManager(
+            mock_hass, namespace="checkwx", backend=BACKEND_SQLITE
+        )
+        with patch.object(
+            restarted._backend, "read", side_effect=AssertionError("per-key read")
+        ):
+            results = await restarted.get_many(["key_0", "key_3", "missing"])
+
+        assert results == {"key_0": {"i": 0}, "key_3": {"i": 3}}
+        stats = restarted.get_stats()
+        assert stats["persistent_hits"] == 2
+        assert stats["misses"] == 1
+
+        # Second batch is served from memory
+        assert await restarted.get_many(["key_0"]) == {"key_0": {"i": 0}}
+        assert restarted.get_stats()["memory_hits"] == 1
+        restarted._backend.close()
+
+    @pytest.mark.asyncio
+    async def test_get_many_json_backend(self, mock_hass):
+        """Test batched reads also work with the default JSON backend."""
+        manager = CacheManager(mock_hass, namespace="weather")
+        await manager.set_many({"a": 1, "b": 2})
+
+        restarted = CacheManager(mock_hass, namespace="weather")
+        assert await restarted.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+
+class TestWriteBehindPersistence:
+    """Test atomic writes and write-behind batching."""
+
+    @pytest.fixture
+    def mock_hass(self, tmp_path):
+        """Create mock Home Assistant instance."""
+        hass = MagicMock()
+        hass.config.path = MagicMock(return_value=str(tmp_path))
+
+        async def mock_executor_job(func, *args):
+            """Mock async_add_executor_job that returns awaitable."""
+            return func(*args)
+
+        hass.async_add_executor_job = mock_executor_job
+        return hass
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_previous_file(self, mock_hass):
+        """Test an interrupted write never leaves a truncated file."""
+        manager = CacheManager(mock_hass, namespace="weather")
+        await manager.set("london", {"temp": 15})
+        cache_file = manager._get_cache_file_path("london")
+
+        with patch(
+            "custom_components.hangar_assistant.utils.cache_backends.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            await manager.set("london", {"temp": 20})
+
+        assert json.loads(cache_file.read_text())["data"] == {"temp": 15}
+        assert list(manager.cache_dir.iterdir()) == [cache_file]
+
+    @pytest.mark.asyncio
+    async def test_temp_file_is_fsynced_before_replace(self, mock_hass):
+        """Test the data reaches disk before the rename makes it visible."""
+        manager = CacheManager(mock_hass, namespace="weather")
+        backends = "custom_components.hangar_assistant.utils.cache_backends"
+        real_fsync, real_replace = os.fsync, os.replace
+        events = []
+
+        def fsync(fd):
+            events.append(("fsync", os.fstat(fd).st_ino))
+            real_fsync(fd)
+
+        def replace(src, dst):
+            events.append(("replace", os.stat(src).st_ino))
+            real_replace(src, dst)
+
+        with patch(f"{backends}.os.fsync", side_effect=fsync), \
+                patch(f"{backends}.os.replace", side_effect=replace):
+            await manager.set("london", {"temp": 15})
+
+        # Rename keeps the inode: the synced file is the one moved into place
+        inode = manager._get_cache_file_path("london").stat().st_ino
+        assert events[:2] == [("fsync", inode), ("replace", inode)]
+        # One more fsync for the directory, once per batch
+        assert len(events) == 3 and events[2][0] == "fsync"
+
+    @pytest.mark.asyncio
+    async def test_set_is_deferred_until_flush(self, mock_hass):
+        """Test writes are queued and flushed in one batch."""
+        manager = CacheManager(
+            mock_hass, namespace="weather", write_behind_seconds=30
+        )
+        with patch.object(
+            manager._backend, "write_many", wraps=manager._backend.write_many
+        ) as write_many:
+            await manager.set("a", {"v": 1})
+            await manager.set("b", {"v": 2})
+            await manager.set("a", {"v": 3})
+
+            assert not manager._get_cache_file_path("a").exists()
+            assert manager.get_stats()["pending_writes"] == 2
+
+            assert await manager.async_flush() == 2
+            assert await manager.async_flush() == 0
+
+        write_many.assert_called_once()
+        restarted = CacheManager(mock_hass, namespace="weather")
+        assert await restarted.get("a") == {"v": 3}
+        assert await restarted.get("b") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_are_readable(self, mock_hass):
+        """Test reads see unflushed entries even without a memory cache."""
+        manager = CacheManager(
+            mock_hass,
+            namespace="weather",
+            memory_enabled=False,
+            write_behind_seconds=30,
+        )
+        await manager.set("a", {"v": 1})
+
+        assert await manager.get("a") == {"v": 1}
+        assert await manager.get_many(["a"]) == {"a": {"v": 1}}
+
+        await manager.delete("a")
+        assert manager.pending_writes == 0
+        assert await manager.async_flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_all_shared_managers(self, mock_hass):
+        """Test shutdown flush covers every shared manager."""
+        mock_hass.data = {}
+        manager = get_cache_manager(
+            mock_hass, "checkwx", backend=BACKEND_SQLITE, write_behind_seconds=30
+        )
+        await manager.set("metar_EGHP_decoded", {"icao": "EGHP"})
+
+        await async_flush_cache_managers(mock_hass, close=True)
+
+        assert manager.pending_writes == 0
+        assert manager._backend._conn is None
+        assert manager._backend.read("metar_EGHP_decoded") is not None
+        manager._backend.close()
+
+
+class TestCacheWarmUp:
+    """Test bulk warm-up and lazy hydration."""
+
+    @pytest.fixture
+    def mock_hass(self, tmp_path):
+        """Create mock Home Assistant instance."""
+        hass = MagicMock()
+        hass.config.path = MagicMock(return_value=str(tmp_path))
+
+        async def mock_executor_job(func, *args):
+            """Mock async_add_executor_job that returns awaitable."""
+            return func(*args)
+
+        hass.async_add_executor_job = mock_executor_job
+        return hass
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["json", BACKEND_SQLITE])
+    async def test_warm_loads_unexpired_entries(self, mock_hass, backend):
+        """Test warm() fills memory and skips expired entries."""
+        writer = CacheManager(mock_hass, namespace="weather", backend=backend)
+        await writer.set_many({"a": {"v": 1}, "b": {"v": 2}})
+        await writer.set("old", {"v": 0}, ttl_minutes=0.001)
+        await asyncio.sleep(0.1)
+
+        restarted = CacheManager(mock_hass, namespace="weather", backend=backend)
+        assert await restarted.warm() == 2
+        assert set(restarted._memory_cache) == {"a", "b"}
+
+        with patch.object(
+            restarted._backend, "read", side_effect=AssertionError("disk read")
+        ):
+            assert await restarted.get("a") == {"v": 1}
+        assert restarted.get_stats()["warmed_entries"] == 2
+        restarted._backend.close()
+        writer._backend.close()
+
+    @pytest.mark.asyncio
+    async def test_warm_respects_memory_limit(self, mock_hass):
+        """Test warm-up keeps the most recent entries within the LRU limit."""
+        writer = CacheManager(mock_hass, namespace="weather")
+        for i in range(4):
+            await writer.set(f"key_{i}", i)
+
+        restarted = CacheManager(
+            mock_hass, namespace="weather", max_memory_entries=2
+        )
+        assert await restarted.warm() == 2
+        assert list(restarted._memory_cache) == ["key_2", "key_3"]
+        assert restarted.get_stats()["evictions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_keeps_newer_memory_entries(self, mock_hass):
+        """Test warm-up never overwrites fresher in-memory values."""
+        writer = CacheManager(mock_hass, namespace="weather")
+        await writer.set("a", {"v": "disk"})
+
+        restarted = CacheManager(mock_hass, namespace="weather")
+        restarted._memory_cache["a"] = CacheEntry({"v": "memory"})
+
+        assert await restarted.warm() == 0
+        assert await restarted.get("a") == {"v": "memory"}
+
+    @pytest.mark.asyncio
+    async def test_first_read_hydrates_namespace(self, mock_hass):
+        """Test lazy hydration turns first reads into one bulk load."""
+        writer = CacheManager(mock_hass, namespace="checkwx")
+        await writer.set_many({"metar_EGHP": 1, "taf_EGHP": 2})
+
+        restarted = CacheManager(
+            mock_hass, namespace="checkwx", hydrate_on_first_read=True
+        )
+        with patch.object(
+            restarted._backend, "read_all", wraps=restarted._backend.read_all
+        ) as read_all:
+            results = await asyncio.gather(
+                restarted.get("metar_EGHP"), restarted.get("taf_EGHP")
+            )
+            assert await restarted.get("metar_EGHP") == 1
+
+        assert results == [1, 2]
+        read_all.assert_called_once()
+        assert restarted.warmed is True
+
+    @pytest.mark.asyncio
+    async def test_warm_all_shared_managers(self, mock_hass):
+        """Test setup warm-up covers shared managers once."""
+        mock_hass.data = {}
+        writer = CacheManager(mock_hass, namespace="weather")
+        await writer.set("a", 1)
+
+        manager = get_cache_manager(mock_hass, "weather")
+        assert await async_warm_cache_managers(mock_hass) == 1
+        assert await async_warm_cache_managers(mock_hass) == 0
+        assert manager.warmed is True
+
+
+class TestStaleWhileRevalidate:
+    """Test background refresh of stale entries via registered loaders."""
+
+    @pytest.fixture
+    def mock_hass(self, tmp_path):
+        """Create mock Home Assistant instance running background tasks."""
+        hass = MagicMock()
+        hass.config.path = MagicMock(return_value=str(tmp_path))
+
+        async def mock_executor_job(func, *args):
+            """Mock async_add_executor_job that returns awaitable."""
+            return func(*args)
+
+        hass.async_add_executor_job = mock_executor_job
+        hass.async_create_background_task.side_effect = (
+            lambda coro, name: asyncio.get_running_loop().create_task(coro)
+        )
+        return hass
+
+    @pytest.fixture
+    def cache(self, mock_hass):
+        """Create memory-only cache manager with one stale entry."""
+        manager = CacheManager(
+            mock_hass, namespace="test", persistent_enabled=False, ttl_minutes=10
+        )
+        manager._memory_cache["metar"] = CacheEntry(
+            {"v": "old"},
+            cached_at=datetime.now() - timedelta(minutes=15),
+            ttl=timedelta(minutes=10),
+        )
+        return manager
+
+    @staticmethod
+    async def _wait_for_refresh(manager):
+        """Wait until background refreshes have finished."""
+        while manager._revalidating:
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_stale_value_returned_and_refreshed_once(self, cache):
+        """Test stale data is served immediately and refreshed in background."""
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"v": "new"}
+
+        cache.register_loader("metar", loader, ttl_minutes=5)
+
+        first = await cache.get_with_stale("metar", max_age_hours=1)
+        second = await cache.get_with_stale("metar", max_age_hours=1)
+        await self._wait_for_refresh(cache)
+
+        assert first == ({"v": "old"}, True)
+        assert second == ({"v": "old"}, True)
+        assert len(calls) == 1
+        assert await cache.get_with_stale("metar") == ({"v": "new"}, False)
+        entry = cache._memory_cache["metar"]
+        assert entry.expires_at - entry.cached_at == timedelta(minutes=5)
+        assert cache.get_stats()["revalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_refresh_without_loader_or_past_hard_ttl(self, cache, mock_hass):
+        """Test refreshes only start for registered keys inside the hard TTL."""
+        assert await cache.get_with_stale("metar") == ({"v": "old"}, True)
+
+        cache.register_loader("metar", MagicMock())
+        assert await cache.get_with_stale("metar", max_age_hours=0.1) == (None, False)
+        assert await cache.get_with_stale("metar", revalidate=False) == (
+            {"v": "old"}, True
+        )
+
+        mock_hass.async_create_background_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self, cache):
+        """Test loader errors and empty results leave the entry untouched."""
+        async def failing_loader():
+            raise RuntimeError("API down")
+
+        cache.register_loader("metar", failing_loader)
+        await cache.get_with_stale("metar")
+        await self._wait_for_refresh(cache)
+
+        async def empty_loader():
+            return None
+
+        cache.register_loader("metar", empty_loader)
+        await cache.get_with_stale("metar")
+        await self._wait_for_refresh(cache)
+
+        assert await cache.get_with_stale("metar", revalidate=False) == (
+            {"v": "old"}, True
+        )
+        assert cache.get_stats()["revalidations"] == 0
+
+        cache.unregister_loader("metar")
+        assert cache._schedule_revalidation("metar") is False
+
+    @pytest.mark.asyncio
+    async def test_loader_unregistered_before_refresh_runs(self, cache, mock_hass):
+        """Test a refresh whose loader was removed still releases the key."""
+        tasks = []
+        mock_hass.async_create_background_task.side_effect = (
+            lambda coro, name: tasks.append(coro)
+        )
+
+        async def loader():
+            return {"v": "new"}
+
+        cache.register_loader("metar", loader)
+        assert cache._schedule_revalidation("metar") is True
+        cache.unregister_loader("metar")
+        await tasks[0]
+
+        assert cache._revalidating == set()
+        cache.register_loader("metar", loader)
+        assert cache._schedule_revalidation("metar") is True
+        await tasks[1]
+        assert await cache.get_with_stale("metar") == ({"v": "new"}, False)
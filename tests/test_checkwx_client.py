@@ -32,6 +32,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.util import dt as dt_util
 
+from custom_components.hangar_assistant.utils.cache_manager import CacheEntry
 from custom_components.hangar_assistant.utils.checkwx_client import (
     CheckWXClient,
     RATE_LIMIT_FREE_TIER,
@@ -55,7 +56,7 @@ def mock_hass(tmp_path):
         MagicMock: Configured Home Assistant instance
     """
     mock_hass = MagicMock()
-    mock_hass.config.path.return_value = str(tmp_path)
+    mock_hass.config.path.side_effect = lambda *parts: str(tmp_path.joinpath(*parts))
     
     # Mock executor job to run sync functions
     def run_sync(func, *args):
@@ -63,6 +64,11 @@ def mock_hass(tmp_path):
     
     mock_hass.async_add_executor_job = AsyncMock(side_effect=run_sync)
     
+    # Background refreshes (stale-while-revalidate) run as real tasks
+    mock_hass.async_create_background_task.side_effect = (
+        lambda coro, name: asyncio.get_running_loop().create_task(coro)
+    )
+    
     return mock_hass
 
 
@@ -98,7 +104,7 @@ async def test_checkwx_client_initialization(mock_hass):
         - API key stored correctly
         - Cache directories created
         - Rate limit counters initialized to zero
-        - Memory cache is empty OrderedDict
+        - Memory cache (CacheManager "checkwx" namespace) is empty
     
     Expected Result:
         Client initializes without errors, all attributes set correctly
@@ -113,7 +119,8 @@ async def test_checkwx_client_initialization(mock_hass):
     assert client._cache_enabled is True
     assert client._daily_requests == 0
     assert client._consecutive_failures == 0
-    assert len(client._memory_cache) == 0
+    assert len(client._cache._memory_cache) == 0
+    assert client._cache.namespace == "checkwx"
     assert client._rate_limit_warned is False
 
 
@@ -188,7 +195,7 @@ async def test_get_metar_success(mock_session, checkwx_client):
     assert result["wind"]["speed_kts"] == 12
     
     # Validate caching
-    assert len(checkwx_client._memory_cache) == 1
+    assert len(checkwx_client._cache._memory_cache) == 1
     assert checkwx_client._daily_requests == 1
 
 
@@ -305,8 +312,7 @@ async def test_memory_cache_hit(checkwx_client):
     # Manually cache data
     cache_key = "metar_KJFK_decoded"
     cached_data = {"icao": "KJFK", "flight_category": "VFR"}
-    timestamp = dt_util.utcnow()
-    checkwx_client._memory_cache[cache_key] = (cached_data, timestamp)
+    await checkwx_client._cache.set(cache_key, cached_data, ttl_minutes=15)
     
     # Fetch (should hit cache)
     with patch("aiohttp.ClientSession") as mock_session:
@@ -319,10 +325,10 @@ async def test_memory_cache_hit(checkwx_client):
 
 @pytest.mark.asyncio
 async def test_memory_cache_expired(checkwx_client):
-    """Test expired memory cache triggers new API call.
+    """Test cache past the stale-while-revalidate window triggers an API call.
     
     Setup:
-        - Cache data with old timestamp (>15 min ago)
+        - Cache data older than 2x the 15 min TTL
         - Mock fresh API response
     
     Validation:
@@ -335,8 +341,11 @@ async def test_memory_cache_expired(checkwx_client):
     """
     # Cache expired data
     cache_key = "metar_KJFK_decoded"
-    old_timestamp = dt_util.utcnow() - timedelta(minutes=30)  # Expired
-    checkwx_client._memory_cache[cache_key] = ({"old": "data"}, old_timestamp)
+    checkwx_client._cache._memory_cache[cache_key] = CacheEntry(
+        data={"old": "data"},
+        cached_at=datetime.now() - timedelta(minutes=45),
+        ttl=timedelta(minutes=15),
+    )
     
     # Mock fresh API response
     with patch("aiohttp.ClientSession") as mock_session:
@@ -354,6 +363,55 @@ async def test_memory_cache_expired(checkwx_client):
         assert checkwx_client._daily_requests == 1
 
 
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(checkwx_client):
+    """Test recently expired cache is served while refreshing in the background.
+    
+    Setup:
+        - Cache data 20 min old (TTL 15 min, inside the 2x window)
+        - Mock fresh API response
+    
+    Validation:
+        - Stale data returned without waiting for the API
+        - One background request refreshes the cache
+    
+    Expected Result:
+        Sensor update never blocks on the network; next read is fresh
+    """
+    cache_key = "metar_KJFK_decoded"
+    checkwx_client._cache._memory_cache[cache_key] = CacheEntry(
+        data={"old": "data"},
+        cached_at=datetime.now() - timedelta(minutes=20),
+        ttl=timedelta(minutes=15),
+    )
+    
+    with patch("aiohttp.ClientSession") as mock_session:
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={
+            "results": 1,
+            "data": [{"icao": "KJFK", "flight_category": "VFR"}]
+        })
+        mock_session.return_value.__aenter__.return_value.get.return_value.__aenter__.return_value = mock_response
+        
+        result = await checkwx_client.get_metar("KJFK", decoded=True)
+        second = await checkwx_client.get_metar("KJFK", decoded=True)
+        
+        assert result == {"old": "data"}
+        assert second == {"old": "data"}
+        
+        # Let the single background refresh finish
+        task = checkwx_client._hass.async_create_background_task
+        assert task.call_count == 1
+        await asyncio.sleep(0)
+        while checkwx_client._cache._revalidating:
+            await asyncio.sleep(0.01)
+    
+    assert checkwx_client._daily_requests == 1
+    assert (await checkwx_client.get_metar("KJFK", decoded=True))["flight_category"] == "VFR"
+    assert checkwx_client._cache.get_stats()["revalidations"] == 1
+
+
 @pytest.mark.asyncio
 async def test_lru_cache_eviction(checkwx_client):
     """Test LRU eviction when memory cache exceeds maximum entries.
@@ -370,20 +428,20 @@ async def test_lru_cache_eviction(checkwx_client):
     Expected Result:
         Cache maintains max size, oldest evicted
     """
-    checkwx_client._max_memory_entries = 5
+    checkwx_client._cache._max_memory_entries = 5
     
     # Add 10 entries
     for i in range(10):
         cache_key = f"test_key_{i}"
         data = {"entry": i}
-        checkwx_client._set_memory_cache(cache_key, data)
+        await checkwx_client._cache.set(cache_key, data)
     
     # Verify size limit
-    assert len(checkwx_client._memory_cache) == 5
+    assert len(checkwx_client._cache._memory_cache) == 5
     
     # Verify oldest evicted (0-4 gone, 5-9 remain)
-    assert "test_key_0" not in checkwx_client._memory_cache
-    assert "test_key_9" in checkwx_client._memory_cache
+    assert "test_key_0" not in checkwx_client._cache._memory_cache
+    assert "test_key_9" in checkwx_client._cache._memory_cache
 
 
 @pytest.mark.asyncio
@@ -439,8 +497,11 @@ async def test_rate_limit_blocking(checkwx_client):
     # Cache some data to fallback to
     cache_key = "metar_KJFK_decoded"
     cached_data = {"icao": "KJFK", "stale": True}
-    old_timestamp = dt_util.utcnow() - timedelta(hours=2)
-    checkwx_client._memory_cache[cache_key] = (cached_data, old_timestamp)
+    checkwx_client._cache._memory_cache[cache_key] = CacheEntry(
+        data=cached_data,
+        cached_at=datetime.now() - timedelta(hours=2),
+        ttl=timedelta(minutes=15),
+    )
     
     with patch("aiohttp.ClientSession") as mock_session:
         result = await checkwx_client.get_metar("KJFK")
@@ -493,7 +554,7 @@ async def test_persistent_cache_write_read(checkwx_client, tmp_path):
         3. New client reads persistent cache
     
     Validation:
-        - Data written to JSON file
+        - Data written to the SQLite cache store
         - New client instance finds cached data
         - No API call needed on restart
     
@@ -504,11 +565,14 @@ async def test_persistent_cache_write_read(checkwx_client, tmp_path):
     cache_key = "metar_KJFK_decoded"
     data = {"icao": "KJFK", "temperature": {"celsius": 20}}
     
-    await checkwx_client._set_persistent_cache(cache_key, data)
+    await checkwx_client._cache.set(cache_key, data, ttl_minutes=15)
+    # Write-behind entries are flushed on shutdown
+    await checkwx_client._cache.async_flush()
     
-    # Verify file created
-    cache_file = tmp_path / "hangar_assistant_cache" / "checkwx" / f"{cache_key}.json"
+    # Verify row written to the shared single-file store
+    cache_file = tmp_path / "hangar_assistant_cache" / "cache.sqlite3"
     assert cache_file.exists()
+    assert checkwx_client._cache._backend.read(cache_key) is not None
     
     # Simulate restart: new client instance
     new_client = CheckWXClient(
@@ -518,7 +582,7 @@ async def test_persistent_cache_write_read(checkwx_client, tmp_path):
     )
     
     # Read from persistent cache
-    cached = await new_client._get_persistent_cache(cache_key, timedelta(minutes=15))
+    cached = await new_client._cache.get(cache_key)
     
     assert cached is not None
     assert cached["icao"] == "KJFK"
@@ -546,8 +610,11 @@ async def test_graceful_degradation_on_api_failure(mock_session, checkwx_client)
     # Cache stale data
     cache_key = "metar_KJFK_decoded"
     stale_data = {"icao": "KJFK", "stale": True}
-    old_timestamp = dt_util.utcnow() - timedelta(hours=1)
-    checkwx_client._memory_cache[cache_key] = (stale_data, old_timestamp)
+    checkwx_client._cache._memory_cache[cache_key] = CacheEntry(
+        data=stale_data,
+        cached_at=datetime.now() - timedelta(hours=1),
+        ttl=timedelta(minutes=15),
+    )
     
     # Mock API failure
     mock_session.side_effect = asyncio.TimeoutError()
@@ -612,7 +679,7 @@ async def test_api_error_404_not_found(mock_session, checkwx_client):
 
 
 @pytest.mark.asyncio
-async def test_clear_cache_specific_icao(checkwx_client, tmp_path):
+async def test_clear_cache_specific_icao(checkwx_client):
     """Test cache clearing for specific ICAO code.
     
     Setup:
@@ -620,25 +687,26 @@ async def test_clear_cache_specific_icao(checkwx_client, tmp_path):
         - Clear only KJFK
     
     Validation:
-        - KJFK cache removed (memory + file)
+        - KJFK cache removed (memory + persistent store)
         - EGHP cache remains untouched
     
     Expected Result:
         Selective cache clearing works correctly
     """
     # Cache data for two ICAOs
-    checkwx_client._set_memory_cache("metar_KJFK_decoded", {"icao": "KJFK"})
-    checkwx_client._set_memory_cache("metar_EGHP_decoded", {"icao": "EGHP"})
-    
-    await checkwx_client._set_persistent_cache("metar_KJFK_decoded", {"icao": "KJFK"})
-    await checkwx_client._set_persistent_cache("metar_EGHP_decoded", {"icao": "EGHP"})
+    await checkwx_client._cache.set("metar_KJFK_decoded", {"icao": "KJFK"})
+    await checkwx_client._cache.set("metar_EGHP_decoded", {"icao": "EGHP"})
+    await checkwx_client._cache.async_flush()
     
     # Clear KJFK only
     await checkwx_client.clear_cache("KJFK")
     
     # Verify selective clearing
-    assert "metar_KJFK_decoded" not in checkwx_client._memory_cache
-    assert "metar_EGHP_decoded" in checkwx_client._memory_cache
+    backend = checkwx_client._cache._backend
+    assert "metar_KJFK_decoded" not in checkwx_client._cache._memory_cache
+    assert "metar_EGHP_decoded" in checkwx_client._cache._memory_cache
+    assert backend.read("metar_KJFK_decoded") is None
+    assert backend.read("metar_EGHP_decoded") is not None
 
 
 @pytest.mark.asyncio
@@ -650,18 +718,19 @@ async def test_clear_all_cache(checkwx_client):
     
     Validation:
         - All memory cache cleared
-        - All persistent cache files deleted
+        - All persistent cache entries deleted
     
     Expected Result:
         Complete cache wipe, fresh start
     """
     # Cache multiple entries
-    checkwx_client._set_memory_cache("metar_KJFK_decoded", {"icao": "KJFK"})
-    checkwx_client._set_memory_cache("taf_EGHP_decoded", {"icao": "EGHP"})
+    await checkwx_client._cache.set("metar_KJFK_decoded", {"icao": "KJFK"})
+    await checkwx_client._cache.set("taf_EGHP_decoded", {"icao": "EGHP"})
     
     await checkwx_client.clear_cache()
     
-    assert len(checkwx_client._memory_cache) == 0
+    assert len(checkwx_client._cache._memory_cache) == 0
+    assert checkwx_client._cache._backend.count() == 0
 
 
 @pytest.mark.asyncio
@@ -678,7 +747,7 @@ async def test_cache_stats(checkwx_client):
         Complete stats dictionary for monitoring
     """
     checkwx_client._daily_requests = 142
-    checkwx_client._set_memory_cache("test_key", {"data": "test"})
+    await checkwx_client._cache.set("test_key", {"data": "test"})
     
     stats = checkwx_client.get_cache_stats()
     
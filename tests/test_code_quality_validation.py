@@ -216,7 +216,9 @@ class TestExceptionHandlingQuality:
         )
 
         assert result is True
-        mock_hass.bus.async_fire.assert_called_once()
+        # A started event precedes the single completed-briefing event
+        fired = [c.args[0] for c in mock_hass.bus.async_fire.call_args_list]
+        assert fired.count("hangar_assistant_ai_briefing") == 1
 
 
 class TestBinarySensorComplexityReduction:
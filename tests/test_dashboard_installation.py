@@ -32,6 +32,7 @@ from custom_components.hangar_assistant.config_flow import (
     SetupWizardState,
 )
 from custom_components.hangar_assistant.const import DOMAIN
+from custom_components.hangar_assistant.utils.asset_cache import clear_asset_cache
 
 
 class TestDashboardInstallationService:
@@ -262,7 +263,8 @@ class TestDashboardYAMLGeneration:
         
         template_content = "views:\n  - title: Glass Cockpit\n    cards: []"
         
-        # Mock file read
+        # Mock file read (and make sure the real template is not cached)
+        clear_asset_cache()
         m_open = mock_open(read_data=template_content)
         
         with patch("builtins.open", m_open):
@@ -299,6 +301,7 @@ class TestDashboardYAMLGeneration:
         mock_entry.data = {"airfields": [], "aircraft": []}
         
         # Mock file read to raise FileNotFoundError
+        clear_asset_cache()
         with patch("builtins.open", side_effect=FileNotFoundError("Template not found")):
             result = await _generate_dashboard_yaml(mock_hass, mock_entry)
         
@@ -345,7 +348,8 @@ class TestWizardDashboardIntegration:
             background task after entry creation.
         """
         mock_hass = MagicMock(spec=HomeAssistant)
-        mock_hass.async_create_task = MagicMock()
+        # Close the scheduled coroutine; it would wait for entry setup
+        mock_hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
         mock_hass.services = MagicMock()
         mock_hass.services.async_call = AsyncMock()
         
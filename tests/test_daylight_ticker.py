@@ -0,0 +1,165 @@
+"""Tests for the shared daylight countdown ticker."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hangar_assistant.const import DOMAIN
+from custom_components.hangar_assistant.sensor import DaylightCountdownSensor
+from custom_components.hangar_assistant.utils import daylight_ticker
+from custom_components.hangar_assistant.utils.daylight_ticker import (
+    DAYLIGHT_TICKER_KEY,
+    DaylightTicker,
+    get_daylight_ticker,
+)
+from custom_components.hangar_assistant.utils.ephemeris import (
+    DaylightTimeline,
+    clear_ephemeris_cache,
+    get_day_ephemeris,
+)
+
+LONDON = (51.5074, -0.1278)
+AUCKLAND = (-37.0082, 174.7850)
+NOON = datetime(2025, 6, 21, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_ephemeris_cache()
+    yield
+    clear_ephemeris_cache()
+
+
+@pytest.fixture
+def timers():
+    """Patch the HA timer helpers used by the ticker."""
+    with patch.object(
+        daylight_ticker, "async_track_time_change"
+    ) as minute, patch.object(
+        daylight_ticker, "async_track_point_in_utc_time"
+    ) as point, patch.object(
+        daylight_ticker.dt_util, "utcnow", return_value=NOON
+    ):
+        minute.return_value = MagicMock(name="cancel_minute")
+        point.side_effect = lambda *_args: MagicMock(name="cancel_point")
+        yield minute, point
+
+
+class TestDaylightTimeline:
+    """Precomputed sunrise/sunset boundaries."""
+
+    def test_next_boundary_is_todays_sunset(self):
+        timeline = DaylightTimeline(*LONDON)
+        sunset = get_day_ephemeris(*LONDON, NOON.date()).sunset
+
+        assert timeline.next_boundary(NOON) == sunset
+        assert timeline.events_at(NOON).phase == "day"
+        assert timeline.events_at(sunset).phase == "night"
+
+    def test_rebuilds_when_date_changes(self):
+        timeline = DaylightTimeline(*LONDON)
+        timeline.events_at(NOON)
+        later = timeline.events_at(NOON + timedelta(days=5))
+
+        assert later.next_setting.date() == (NOON + timedelta(days=5)).date()
+
+
+class TestDaylightTicker:
+    """One minute tick and one boundary timer for all countdowns."""
+
+    def test_single_minute_tick_for_many_countdowns(self, timers):
+        minute, _point = timers
+        ticker = DaylightTicker(MagicMock())
+        refreshes = [MagicMock() for _ in range(5)]
+        for refresh in refreshes:
+            ticker.async_register(refresh, DaylightTimeline(*LONDON))
+
+        assert minute.call_count == 1
+        assert minute.call_args.kwargs == {"second": 0}
+
+        ticker._async_tick(NOON)
+        assert all(refresh.call_count == 1 for refresh in refreshes)
+
+    def test_boundary_timer_tracks_earliest_airfield(self, timers):
+        _minute, point = timers
+        ticker = DaylightTicker(MagicMock())
+        ticker.async_register(MagicMock(), DaylightTimeline(*LONDON))
+        ticker.async_register(MagicMock(), DaylightTimeline(*AUCKLAND))
+
+        london_sunset = get_day_ephemeris(*LONDON, NOON.date()).sunset
+        earliest = min(
+            london_sunset, DaylightTimeline(*AUCKLAND).next_boundary(NOON))
+        assert ticker.next_boundary == earliest
+        assert point.call_args.args[2] == earliest
+
+    def test_boundary_refreshes_only_crossing_airfields(self, timers):
+        ticker = DaylightTicker(MagicMock())
+        london, auckland, home = MagicMock(), MagicMock(), MagicMock()
+        ticker.async_register(london, DaylightTimeline(*LONDON))
+        ticker.async_register(auckland, DaylightTimeline(*AUCKLAND))
+        ticker.async_register(home)  # sun.sun fallback: minute ticks only
+
+        london_sunset = get_day_ephemeris(*LONDON, NOON.date()).sunset
+        ticker._boundary = london_sunset
+        ticker._async_boundary(london_sunset)
+
+        assert london.call_count == 1
+        assert auckland.call_count == 0
+        assert home.call_count == 0
+        assert ticker.next_boundary > london_sunset
+
+    def test_stops_when_last_countdown_unregisters(self, timers):
+        minute, _point = timers
+        ticker = DaylightTicker(MagicMock())
+        remove_a = ticker.async_register(MagicMock(), DaylightTimeline(*LONDON))
+        remove_b = ticker.async_register(MagicMock())
+
+        remove_a()
+        assert ticker.active
+        remove_b()
+
+        assert not ticker.active
+        assert ticker.next_boundary is None
+        minute.return_value.assert_called_once()
+
+    def test_shared_across_entries(self):
+        hass = MagicMock()
+        hass.data = {}
+
+        ticker = get_daylight_ticker(hass)
+
+        assert get_daylight_ticker(hass) is ticker
+        assert hass.data[DOMAIN][DAYLIGHT_TICKER_KEY] is ticker
+
+
+class TestCountdownSensorTicks:
+    """DaylightCountdownSensor state comes from the ticker."""
+
+    async def test_registers_timeline_and_refreshes_on_tick(self, mock_hass):
+        config = {
+            "name": "Test Airfield",
+            "latitude": LONDON[0],
+            "longitude": LONDON[1],
+        }
+        sensor = DaylightCountdownSensor(mock_hass, config, {})
+        sensor.async_on_remove = MagicMock()
+        sensor.async_write_ha_state = MagicMock()
+        ticker = MagicMock()
+
+        with patch(
+            "custom_components.hangar_assistant.sensor.get_daylight_ticker",
+            return_value=ticker,
+        ), patch(
+            "custom_components.hangar_assistant.sensor.dt_util.utcnow",
+            return_value=NOON,
+        ):
+            await sensor.async_added_to_hass()
+            refresh, timeline = ticker.async_register.call_args.args
+            assert timeline is sensor._timeline
+            refresh()
+
+        sunset_end = get_day_ephemeris(
+            *LONDON, NOON.date()).legal_daylight_end
+        sensor.async_write_ha_state.assert_called_once()
+        assert sensor.native_value == int(
+            (sunset_end - NOON).total_seconds() / 60)
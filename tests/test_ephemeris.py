@@ -0,0 +1,148 @@
+"""Tests for the memoised per-airfield sun ephemeris."""
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hangar_assistant.utils import ephemeris
+from custom_components.hangar_assistant.utils.ephemeris import (
+    LEGAL_DAYLIGHT_MARGIN,
+    clear_ephemeris_cache,
+    get_day_ephemeris,
+    sun_events,
+)
+from custom_components.hangar_assistant.sensor import DaylightCountdownSensor
+
+LONDON = (51.5074, -0.1278)
+AUCKLAND = (-37.0082, 174.7850)
+SVALBARD = (78.2232, 15.6267)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_ephemeris_cache()
+    yield
+    clear_ephemeris_cache()
+
+
+class TestDayEphemeris:
+    """Per-day sun events."""
+
+    def test_summer_solstice_london(self):
+        day = get_day_ephemeris(*LONDON, date(2025, 6, 21))
+
+        assert day.sunrise.hour == 3 and 40 <= day.sunrise.minute <= 50
+        assert day.sunset.hour == 20 and 15 <= day.sunset.minute <= 25
+        assert day.civil_dawn < day.sunrise < day.sunset < day.civil_dusk
+
+    def test_legal_daylight_bounds(self):
+        day = get_day_ephemeris(*LONDON, date(2025, 12, 21))
+
+        assert day.legal_daylight_start == day.sunrise - LEGAL_DAYLIGHT_MARGIN
+        assert day.legal_daylight_end == day.sunset + LEGAL_DAYLIGHT_MARGIN
+        assert day.as_dict()["legal_daylight_end"] == (
+            day.legal_daylight_end.isoformat())
+
+    def test_computed_once_per_location_and_day(self):
+        with patch.object(
+            ephemeris, "_compute_day", wraps=ephemeris._compute_day
+        ) as compute:
+            first = get_day_ephemeris(*LONDON, date(2025, 6, 21))
+            # Float noise in stored coordinates still hits the cache
+            again = get_day_ephemeris(
+                LONDON[0] + 1e-9, LONDON[1], date(2025, 6, 21))
+            get_day_ephemeris(*LONDON, date(2025, 6, 22))
+
+        assert again is first
+        assert compute.call_count == 2
+
+    def test_polar_day_has_no_sunrise_or_sunset(self):
+        day = get_day_ephemeris(*SVALBARD, date(2025, 6, 21))
+
+        assert day.sunrise is None and day.sunset is None
+        assert day.legal_daylight_start is None
+        assert day.legal_daylight_end is None
+
+
+class TestSunEvents:
+    """Phase and next events at an instant."""
+
+    def test_daytime_london(self):
+        now = datetime(2025, 6, 21, 12, 0, tzinfo=timezone.utc)
+        events = sun_events(*LONDON, now)
+
+        assert events.phase == "day"
+        assert events.next_setting.date() == now.date()
+        assert events.next_rising.date() == date(2025, 6, 22)
+        assert events.legal_daylight_end == (
+            events.next_setting + timedelta(minutes=30))
+
+    def test_night_before_sunrise_london(self):
+        now = datetime(2025, 6, 21, 2, 0, tzinfo=timezone.utc)
+        events = sun_events(*LONDON, now)
+
+        assert events.phase == "night"
+        assert events.next_rising.date() == now.date()
+        assert events.next_rising > now
+
+    def test_far_from_utc(self):
+        # 23:00 UTC is mid-morning in Auckland: the UTC date is "yesterday"
+        now = datetime(2025, 6, 20, 23, 0, tzinfo=timezone.utc)
+        events = sun_events(*AUCKLAND, now)
+
+        assert events.phase == "day"
+        assert now < events.next_setting < now + timedelta(hours=12)
+
+    def test_polar_day(self):
+        now = datetime(2025, 6, 21, 0, 0, tzinfo=timezone.utc)
+        events = sun_events(*SVALBARD, now)
+
+        assert events.phase == "day"
+        assert events.next_rising is None and events.next_setting is None
+
+
+class TestDaylightCountdownFromCoordinates:
+    """DaylightCountdownSensor uses the airfield's own coordinates."""
+
+    def test_uses_airfield_coordinates(self, mock_hass):
+        config = {
+            "name": "Test Airfield",
+            "latitude": LONDON[0],
+            "longitude": LONDON[1],
+        }
+        sensor = DaylightCountdownSensor(mock_hass, config, {})
+        mock_hass.states.get.return_value = None  # no sun.sun needed
+        now = datetime(2025, 6, 21, 12, 0, tzinfo=timezone.utc)
+
+        with patch(
+            "custom_components.hangar_assistant.sensor.dt_util.utcnow",
+            return_value=now,
+        ):
+            value = sensor.native_value
+            attrs = sensor.extra_state_attributes
+
+        expected_end = get_day_ephemeris(
+            *LONDON, now.date()).legal_daylight_end
+        assert attrs["phase"] == "day"
+        assert attrs["source"] == "airfield_coords"
+        assert attrs["legal_daylight_end"] == expected_end.isoformat()
+        assert value == int((expected_end - now).total_seconds() / 60)
+
+    def test_sun_entity_parsed_once(self, mock_hass):
+        now = datetime.now(timezone.utc)
+        sun_state = MagicMock(state="above_horizon", attributes={
+            "next_rising": (now + timedelta(hours=10)).isoformat(),
+            "next_setting": (now + timedelta(hours=1)).isoformat(),
+        })
+        mock_hass.states.get.side_effect = (
+            lambda entity_id: sun_state if entity_id == "sun.sun" else None)
+        sensor = DaylightCountdownSensor(mock_hass, {"name": "Test"}, {})
+
+        with patch.object(
+            sensor, "_parse_iso", wraps=sensor._parse_iso
+        ) as parse:
+            sensor.native_value
+            sensor.extra_state_attributes
+
+        assert parse.call_count == 2  # next_rising + next_setting, once
+        assert sensor.extra_state_attributes["source"] == "sun.sun"
@@ -0,0 +1,128 @@
+"""Tests for lazy feature module loading and the import benchmark."""
+import importlib.util
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.hangar_assistant.utils import feature_imports
+from custom_components.hangar_assistant.utils.feature_imports import (
+    FEATURE_MODULES,
+    async_import_features,
+    enabled_features,
+    import_features,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.hangar_assistant"
+
+
+def _load_benchmark():
+    path = os.path.join(REPO_ROOT, "scripts", "import_benchmark.py")
+    spec = importlib.util.spec_from_file_location("import_benchmark", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestEnabledFeatures:
+    """Features are derived from the config entry."""
+
+    def test_nothing_enabled(self):
+        assert enabled_features({"airfields": []}) == set()
+        assert enabled_features(None) == set()
+
+    def test_integrations_and_ai(self):
+        data = {
+            "integrations": {
+                "openweathermap": {"enabled": True},
+                "notams": {"enabled": True},
+                "checkwx": {"enabled": False},
+            },
+            "ai_assistant": {"ai_agent_entity": "conversation.openai"},
+        }
+
+        assert enabled_features(data) == {"openweathermap", "notams", "ai_assistant"}
+
+    def test_every_feature_module_exists(self):
+        for modules in FEATURE_MODULES.values():
+            for module in modules:
+                name = PACKAGE + module if module.startswith(".") else module
+                assert importlib.util.find_spec(name) is not None, name
+
+
+class TestImportFeatures:
+    """Enabled features are imported in the executor."""
+
+    def test_imports_only_missing_modules(self, monkeypatch):
+        importlib.import_module(f"{PACKAGE}.utils.units")
+        imported = []
+        monkeypatch.setattr(
+            feature_imports.importlib, "import_module", imported.append)
+        monkeypatch.setattr(feature_imports, "FEATURE_MODULES", {
+            "notams": (".utils.not_loaded_yet", ".utils.units"),
+            "checkwx": (".utils.not_loaded_yet",),
+        })
+        monkeypatch.delitem(
+            sys.modules, f"{PACKAGE}.utils.not_loaded_yet", raising=False)
+
+        timings = import_features({"notams", "checkwx", "unknown"})
+
+        assert imported == [f"{PACKAGE}.utils.not_loaded_yet"]
+        assert list(timings) == [f"{PACKAGE}.utils.not_loaded_yet"]
+
+    async def test_async_runs_in_executor(self, monkeypatch):
+        calls = []
+
+        async def add_executor_job(func, *args):
+            calls.append(func)
+            return func(*args)
+
+        hass = SimpleNamespace(async_add_executor_job=add_executor_job)
+        monkeypatch.setattr(feature_imports, "import_features", lambda f: {})
+
+        assert await async_import_features(hass, set()) == {}
+        assert calls == []
+        await async_import_features(hass, {"notams"})
+        assert len(calls) == 1
+
+
+class TestImportBenchmark:
+    """The benchmark script parses -X importtime output."""
+
+    def test_parse_importtime(self):
+        benchmark = _load_benchmark()
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 | homeassistant.core\n"
+            f"{benchmark.MARKER}\n"
+            "import time:       120 |        120 |   yaml\n"
+            "import time:       300 |        420 | custom_components.hangar_assistant\n"
+        )
+
+        assert benchmark.parse_importtime(stderr) == {
+            "yaml": (120, 120),
+            "custom_components.hangar_assistant": (300, 420),
+        }
+
+    def test_platforms_do_not_import_disabled_features(self):
+        pytest.importorskip("homeassistant.components.sensor")
+        benchmark = _load_benchmark()
+
+        modules = benchmark.measure_once(
+            [f"{PACKAGE}.sensor", f"{PACKAGE}.binary_sensor", f"{PACKAGE}.select"],
+            benchmark.DEFAULT_PRELOAD)
+
+        assert f"{PACKAGE}.sensor" in modules
+        for lazy in (
+            f"{PACKAGE}.utils.notam",
+            f"{PACKAGE}.utils.qcode_parser",
+            f"{PACKAGE}.utils.forecast_analysis",
+            f"{PACKAGE}.utils.checkwx_client",
+            f"{PACKAGE}.utils.pdf_generator",
+            "defusedxml",
+            "timezonefinder",
+            "fpdf",
+        ):
+            assert lazy not in modules, lazy
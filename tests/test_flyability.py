@@ -0,0 +1,206 @@
+"""Tests for the incrementally maintained flyability timeline."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.hangar_assistant import sensor as sensor_module
+from custom_components.hangar_assistant.sensor import FlyabilityTimelineSensor
+from custom_components.hangar_assistant.utils import flyability
+from custom_components.hangar_assistant.utils.flyability import FlyabilityTimeline
+from custom_components.hangar_assistant.utils.forecast_frame import ForecastFrame
+
+NOW = datetime(2026, 5, 2, 9, 20, tzinfo=timezone.utc)
+HOUR0 = NOW.replace(minute=0)
+
+
+def _forecast(hours, overrides=None):
+    points = []
+    for hour in hours:
+        point = {
+            "datetime": (HOUR0 + timedelta(hours=hour)).isoformat(),
+            "wind_speed": 8,
+            "wind_bearing": 240,
+            "cloud_coverage": 20,
+            "precipitation": 0,
+        }
+        point.update((overrides or {}).get(hour, {}))
+        points.append(point)
+    return points
+
+
+def _frame(points):
+    return ForecastFrame.from_forecast(points, wind_unit="kt")
+
+
+class TestTimeline:
+    """Only new or changed hours are rescored."""
+
+    def test_initial_update_scores_the_horizon(self):
+        timeline = FlyabilityTimeline()
+
+        rescored = timeline.update(_frame(_forecast(range(-2, 60))), NOW)
+
+        # Past hours are skipped, and only 48 hours are kept from this hour
+        assert rescored == 48 and len(timeline) == 48
+        attrs = timeline.as_attributes()
+        assert attrs["start"] == HOUR0.isoformat()
+        assert attrs["interval_minutes"] == 60
+        assert len(attrs["scores"]) == 48
+        assert timeline.score_at(NOW) == attrs["scores"][0]
+
+    def test_refresh_rescores_only_changed_hours(self, monkeypatch):
+        timeline = FlyabilityTimeline()
+        timeline.update(_frame(_forecast(range(48))), NOW)
+        calls = []
+        original = flyability.score_forecast_point
+
+        def counting(*args):
+            calls.append(args[1])
+            return original(*args)
+
+        monkeypatch.setattr(flyability, "score_forecast_point", counting)
+
+        # An hour later: one hour passed, one new hour, one hour changed
+        points = _forecast(range(1, 49), {5: {"precipitation": 4}})
+        rescored = timeline.update(_frame(points), NOW + timedelta(hours=1))
+
+        assert rescored == 2 and len(calls) == 2
+        assert len(timeline) == 48
+        attrs = timeline.as_attributes()
+        assert attrs["start"] == (HOUR0 + timedelta(hours=1)).isoformat()
+        assert attrs["scores"][4] < attrs["scores"][3]
+        assert attrs["rescored_hours"] == 2
+
+    def test_missing_values_do_not_force_rescoring(self):
+        timeline = FlyabilityTimeline()
+        points = _forecast(range(3))
+        timeline.update(_frame(points), NOW)
+
+        # No visibility in the forecast (nan) must still compare equal
+        assert timeline.update(_frame(points), NOW) == 0
+
+    def test_gaps_and_best_hour(self):
+        timeline = FlyabilityTimeline(crosswind_limit_kt=15, runway_heading=240)
+        points = _forecast([0, 1, 3], {
+            0: {"cloud_coverage": 90, "precipitation": 2},
+            3: {"wind_bearing": 330, "wind_speed": 20},
+        })
+
+        timeline.update(_frame(points), NOW)
+        attrs = timeline.as_attributes()
+
+        assert attrs["scores"][2] is None
+        assert attrs["best_hour"] == (HOUR0 + timedelta(hours=1)).isoformat()
+        assert attrs["next_flyable_hour"] == attrs["best_hour"]
+        # Full crosswind beyond the limit
+        assert attrs["scores"][3] < attrs["best_score"]
+
+    def test_empty(self):
+        attrs = FlyabilityTimeline().as_attributes()
+
+        assert attrs["scores"] == [] and attrs["start"] is None
+
+
+def _owm_hourly(hours, overrides=None):
+    """OWM One Call hourly points (metric: wind in m/s)."""
+    points = []
+    for hour in hours:
+        point = {
+            "dt": int((HOUR0 + timedelta(hours=hour)).timestamp()),
+            "wind_speed": 4.0,
+            "wind_deg": 260,
+            "clouds": 20,
+            "visibility": 10000,
+        }
+        point.update((overrides or {}).get(hour, {}))
+        points.append(point)
+    return points
+
+
+class TestSensor:
+    """The sensor scores the OpenWeatherMap client's cached forecast."""
+
+    AIRFIELD = {"name": "Popham", "primary_runway": "26",
+                "latitude": 51.19, "longitude": -1.23}
+
+    def _entry(self, api_key="key"):
+        entry = MagicMock()
+        entry.data = {"integrations": {"openweathermap": {
+            "enabled": True, "api_key": api_key, "cache_ttl": 15}}}
+        return entry
+
+    def _sensor(self, entry=None, airfield=None):
+        return FlyabilityTimelineSensor(
+            MagicMock(),
+            {"reg": "G-ABCD", "max_xwind": 15, "linked_airfield": "Popham"},
+            airfield or self.AIRFIELD,
+            {},
+            entry or self._entry(),
+        )
+
+    def _client(self, data):
+        client = MagicMock()
+        client.get_weather_data = AsyncMock(return_value=data)
+        client.extract_hourly_forecast = lambda payload: payload.get("hourly", [])
+        return client
+
+    async def test_scores_owm_forecast_and_skips_unchanged_polls(self):
+        hourly = _owm_hourly(range(6))
+        sensor = self._sensor()
+        client = self._client({"hourly": hourly})
+
+        with patch.object(sensor_module.dt_util, "utcnow", return_value=NOW), \
+                patch("custom_components.hangar_assistant.utils.openweathermap"
+                      ".OpenWeatherMapClient", return_value=client) as client_cls:
+            await sensor.async_update()
+            assert sensor.native_value is not None
+            attrs = sensor.extra_state_attributes
+            assert len(attrs["scores"]) == 6 and attrs["rescored_hours"] == 6
+            # Base attributes are kept
+            assert attrs["registration"] == "G-ABCD"
+            assert attrs["airfield"] == "Popham"
+
+            # Same cached forecast object in the same hour: nothing to do
+            await sensor.async_update()
+            assert sensor.extra_state_attributes["rescored_hours"] == 6
+
+            client.get_weather_data.return_value = {"hourly": _owm_hourly(range(8))}
+            await sensor.async_update()
+
+        assert sensor.extra_state_attributes["rescored_hours"] == 2
+        client_cls.assert_called_once()
+        assert client_cls.call_args.kwargs["cache_ttl_minutes"] == 15
+        client.get_weather_data.assert_awaited_with(51.19, -1.23)
+
+    async def test_owm_wind_is_read_as_metres_per_second(self):
+        # 10 m/s is about 19 kt: well beyond a 15 kt crosswind limit
+        sensor = self._sensor()
+        client = self._client({"hourly": _owm_hourly(
+            range(2), {1: {"wind_speed": 10.0, "wind_deg": 350}})})
+
+        with patch.object(sensor_module.dt_util, "utcnow", return_value=NOW), \
+                patch("custom_components.hangar_assistant.utils.openweathermap"
+                      ".OpenWeatherMapClient", return_value=client):
+            await sensor.async_update()
+
+        scores = sensor.extra_state_attributes["scores"]
+        assert scores[1] < scores[0]
+
+    async def test_without_api_key_or_coordinates(self):
+        for sensor in (
+            self._sensor(entry=self._entry(api_key="")),
+            self._sensor(airfield={"name": "Popham"}),
+        ):
+            await sensor.async_update()
+            assert sensor.native_value is None
+            assert sensor.extra_state_attributes["scores"] == []
+
+    async def test_fetch_failure_keeps_timeline(self):
+        sensor = self._sensor()
+        client = self._client(None)
+        client.get_weather_data.side_effect = RuntimeError("API down")
+
+        with patch("custom_components.hangar_assistant.utils.openweathermap"
+                   ".OpenWeatherMapClient", return_value=client):
+            await sensor.async_update()
+
+        assert sensor.extra_state_attributes["scores"] == []
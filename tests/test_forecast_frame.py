@@ -0,0 +1,222 @@
+"""Tests for the normalised forecast frame."""
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.hangar_assistant.utils.forecast_analysis import (
+    analyze_forecast_trends,
+    check_overnight_conditions,
+    find_optimal_flying_window,
+)
+from custom_components.hangar_assistant.utils.forecast_frame import (
+    ForecastFrame,
+    as_forecast_frame,
+)
+
+BASE = datetime(2025, 6, 21, 20, 0, tzinfo=timezone.utc)
+
+
+def _owm_point(hour, **fields):
+    point = {
+        "dt": int((BASE + timedelta(hours=hour)).timestamp()),
+        "temp": 8.0,
+        "dew_point": 4.0,
+        "pressure": 1015,
+        "humidity": 70,
+        "clouds": 40,
+        "visibility": 10000,
+        "wind_speed": 5.0,
+        "wind_deg": 250,
+        "weather": [{"main": "Clouds", "description": "scattered clouds"}],
+    }
+    point.update(fields)
+    return point
+
+
+class TestForecastFrame:
+    """Test parsing into columns."""
+
+    def test_owm_points(self):
+        frame = ForecastFrame.from_forecast(
+            [_owm_point(0, rain={"1h": 1.5}, snow={"1h": 0.5}),
+             _owm_point(1, clouds={"all": 90})],
+            wind_unit="m/s")
+
+        assert len(frame) == 2
+        assert frame.times[0] == BASE.timestamp()
+        assert frame.wind_kt[0] == pytest.approx(9.7192)
+        assert list(frame.wind_dir) == [250.0, 250.0]
+        assert list(frame.precip_mm) == [2.0, pytest.approx(math.nan, nan_ok=True)]
+        assert list(frame.cloud_pct) == [40.0, 90.0]
+        assert list(frame.snow) == [False, False]
+
+    def test_home_assistant_points(self):
+        frame = ForecastFrame.from_forecast([{
+            "datetime": "2025-06-21T21:00:00+00:00",
+            "temperature": 0,
+            "wind_speed": 20,
+            "wind_bearing": 180,
+            "cloud_coverage": 75,
+            "precipitation": 0.4,
+        }], wind_unit="kt")
+
+        assert list(frame.temp_c) == [0.0]
+        assert list(frame.wind_kt) == [20.0]
+        assert list(frame.wind_dir) == [180.0]
+        assert list(frame.cloud_pct) == [75.0]
+        assert list(frame.precip_mm) == [0.4]
+        assert math.isnan(frame.visibility_m[0])
+
+    def test_auto_wind_unit(self):
+        frame = ForecastFrame.from_forecast([
+            {"dt": 0, "wind_speed": 10}, {"dt": 1, "wind_speed": 60}])
+        assert list(frame.wind_kt) == [pytest.approx(19.4384), 60.0]
+
+    def test_auto_wind_unit_is_logged(self, caplog):
+        import logging
+
+        with caplog.at_level(logging.DEBUG):
+            ForecastFrame.from_forecast([{"dt": 0, "wind_speed": 10}])
+            ForecastFrame.from_forecast([{"dt": 0, "wind_speed": 10}], wind_unit="kt")
+        assert [r.levelno for r in caplog.records
+                if "No wind unit declared" in r.getMessage()] == [logging.DEBUG]
+
+    def test_naive_times_use_default_tz_and_untimed_points_dropped(self):
+        plus_two = timezone(timedelta(hours=2))
+        frame = ForecastFrame.from_forecast(
+            [{"datetime": "2025-06-21T22:00:00"}, {"temperature": 5},
+             {"datetime": "not a time"}],
+            default_tz=plus_two)
+        assert len(frame) == 1
+        assert frame.time_at(0) == BASE
+
+    def test_snow_flag_and_unknown_unit(self):
+        frame = ForecastFrame.from_forecast(
+            [_owm_point(0, weather=[{"main": "Snow", "description": "light snow"}])])
+        assert list(frame.snow) == [True]
+        with pytest.raises(ValueError):
+            ForecastFrame.from_forecast([], wind_unit="furlongs")
+
+    def test_window_and_take(self):
+        frame = ForecastFrame.from_forecast([_owm_point(h) for h in range(6)])
+        window = frame.window(BASE + timedelta(hours=1), BASE + timedelta(hours=3))
+        assert [window.time_at(i) for i in range(len(window))] == [
+            BASE + timedelta(hours=h) for h in (1, 2, 3)]
+        assert window.items[0] is frame.items[1]
+        assert as_forecast_frame(frame) is frame
+
+
+class TestAnalysesShareFrame:
+    """Analyses accept a prebuilt frame and give the same answers."""
+
+    def test_trends_and_overnight_from_frame(self):
+        points = [_owm_point(h, pressure=1000 + 3 * h, wind_speed=20.0)
+                  for h in range(6)]
+        frame = ForecastFrame.from_forecast(points, wind_unit="m/s")
+        end = BASE + timedelta(hours=10)
+
+        assert analyze_forecast_trends(frame) == analyze_forecast_trends(points)
+        assert analyze_forecast_trends(frame)["pressure"] == "rising"
+        warnings = check_overnight_conditions(frame, BASE, end)
+        assert warnings["wind_damage_risk"] is True
+        assert warnings == check_overnight_conditions(points, BASE, end)
+
+    def test_owm_freezing_rain_detected(self):
+        """Rain reported as an OWM block counts as precipitation."""
+        points = [_owm_point(1, temp=-2.0, rain={"1h": 0.8})]
+        warnings = check_overnight_conditions(
+            points, BASE, BASE + timedelta(hours=10))
+        assert warnings["surface_contamination"] is True
+
+    def test_optimal_window_reports_forecast_times(self):
+        points = [_owm_point(0, clouds=95, visibility=2000)] + [
+            _owm_point(h, wind_speed=2.0, clouds=10) for h in (1, 2)]
+        result = find_optimal_flying_window(
+            points, BASE, BASE + timedelta(hours=4), wind_limit_kt=25)
+        assert result["has_window"] is True
+        assert result["optimal_start"] == BASE + timedelta(hours=1)
+        assert result["optimal_end"] == BASE + timedelta(hours=2)
+
+
+class TestWindowSlicing:
+    """Test time-sorted storage and bisected windows."""
+
+    def test_points_sorted_by_time(self):
+        frame = ForecastFrame.from_forecast(
+            [_owm_point(h, temp=float(h)) for h in (3, 0, 2, 1)])
+        assert list(frame.times) == sorted(frame.times)
+        assert list(frame.temp_c) == [0.0, 1.0, 2.0, 3.0]
+        assert [p["temp"] for p in frame.items] == [0.0, 1.0, 2.0, 3.0]
+
+    def test_window_is_inclusive_view(self):
+        frame = ForecastFrame.from_forecast([_owm_point(h) for h in range(48)])
+        window = frame.window(
+            BASE + timedelta(hours=10), BASE + timedelta(hours=20, minutes=30))
+
+        assert len(window) == 11
+        assert window.time_at(0) == BASE + timedelta(hours=10)
+        assert window.time_at(len(window) - 1) == BASE + timedelta(hours=20)
+        # Columns are slices of the parent's buffers, not copies
+        assert window.wind_kt.obj is frame.wind_kt.obj
+        assert window.times.obj is frame.times.obj
+
+        nested = window.window(BASE, BASE + timedelta(hours=12))
+        assert [nested.time_at(i) for i in range(len(nested))] == [
+            BASE + timedelta(hours=h) for h in (10, 11, 12)]
+        assert len(frame.window(BASE - timedelta(days=2), BASE - timedelta(days=1))) == 0
+
+    def test_frame_for_state_reuses_parsed_frame(self):
+        from unittest.mock import MagicMock
+        from custom_components.hangar_assistant.utils.forecast_frame import (
+            clear_frame_cache,
+            frame_for_state,
+        )
+
+        clear_frame_cache()
+        state = MagicMock()
+        state.entity_id = "sensor.popham_weather_forecast_hourly"
+        state.last_updated = BASE
+        state.attributes = {"forecast": [_owm_point(h) for h in range(3)]}
+
+        frame = frame_for_state(state)
+        assert len(frame) == 3
+        assert frame_for_state(state) is frame
+
+        state.last_updated = BASE + timedelta(minutes=10)
+        state.attributes = {"forecast": [_owm_point(h) for h in range(5)]}
+        assert len(frame_for_state(state)) == 5
+
+        state.attributes = {}
+        assert frame_for_state(state) is None
+        clear_frame_cache()
+
+    def test_frame_for_state_uses_declared_wind_unit(self):
+        from unittest.mock import MagicMock
+        from custom_components.hangar_assistant.utils.forecast_frame import (
+            clear_frame_cache,
+            declared_wind_unit,
+            frame_for_state,
+        )
+
+        clear_frame_cache()
+        state = MagicMock()
+        state.entity_id = "sensor.popham_weather_forecast_hourly"
+        state.last_updated = BASE
+        # 20 would be guessed as m/s; the declared unit says knots
+        state.attributes = {
+            "forecast": [_owm_point(0, wind_speed=20)],
+            "wind_speed_unit": "kn",
+        }
+        assert list(frame_for_state(state).wind_kt) == [20.0]
+
+        state.last_updated = BASE + timedelta(minutes=10)
+        state.attributes = {
+            "forecast": [_owm_point(0, wind_speed=36)],
+            "wind_speed_unit": "km/h",
+        }
+        assert frame_for_state(state).wind_kt[0] == pytest.approx(19.44, abs=0.01)
+
+        assert declared_wind_unit({"wind_speed_unit": "furlongs"}) is None
+        assert declared_wind_unit(None) is None
+        clear_frame_cache()
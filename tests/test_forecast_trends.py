@@ -0,0 +1,161 @@
+"""Tests for the least-squares multi-horizon forecast trend engine."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.hangar_assistant.utils import forecast_trends
+from custom_components.hangar_assistant.utils.forecast_analysis import (
+    analyze_forecast_trends,
+)
+from custom_components.hangar_assistant.utils.forecast_frame import ForecastFrame
+from custom_components.hangar_assistant.utils.forecast_trends import (
+    clear_trend_cache,
+    compute_trends,
+    trends_for_frame,
+)
+
+START = datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+
+
+def _points(hours, **series):
+    points = []
+    for i, hour in enumerate(hours):
+        point = {"datetime": (START + timedelta(hours=hour)).isoformat()}
+        for key, values in series.items():
+            if values[i] is not None:
+                point[key] = values[i]
+        points.append(point)
+    return points
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_trend_cache()
+    yield
+    clear_trend_cache()
+
+
+class TestComputeTrends:
+    """Slopes are fitted per hour of real forecast time."""
+
+    def test_linear_slopes_for_every_variable(self):
+        hours = list(range(25))
+        frame = ForecastFrame.from_forecast(_points(
+            hours,
+            temperature=[10 + 0.5 * h for h in hours],
+            pressure=[1020 - 2 * h for h in hours],
+            wind_speed=[10.0 + h for h in hours],
+            cloud_coverage=[50] * 25,
+        ), wind_unit="kt")
+
+        trends = compute_trends(frame)
+
+        assert trends.horizons == ["3h", "6h", "12h", "24h", "window"]
+        assert trends.slope("temperature") == pytest.approx(0.5)
+        assert trends.slope("pressure", "3h") == pytest.approx(-2.0)
+        assert trends.slope("wind", "12h") == pytest.approx(1.0)
+        assert trends.slope("clouds") == pytest.approx(0.0)
+        assert trends.points == {
+            "3h": 4, "6h": 7, "12h": 13, "24h": 25, "window": 25}
+        assert trends.direction("pressure", "6h") == "decreasing"
+        assert trends.direction("clouds") == "stable"
+
+    def test_horizons_differ_when_trend_reverses(self):
+        hours = list(range(13))
+        pressures = [1010 + 2 * h if h <= 3 else 1016 - 2 * (h - 3) for h in hours]
+        frame = ForecastFrame.from_forecast(_points(hours, pressure=pressures))
+
+        trends = compute_trends(frame)
+
+        assert trends.direction("pressure", "3h") == "increasing"
+        assert trends.direction("pressure", "12h") == "decreasing"
+        assert "24h" not in trends.horizons
+
+    def test_irregular_spacing_uses_real_time(self):
+        # Two hourly points then a six-hourly one: still 1 hPa per hour
+        frame = ForecastFrame.from_forecast(
+            _points([0, 1, 7], pressure=[1000, 1001, 1007]))
+
+        assert compute_trends(frame).slope("pressure") == pytest.approx(1.0)
+
+    def test_missing_values_are_skipped_not_defaulted(self):
+        frame = ForecastFrame.from_forecast(_points(
+            [0, 1, 2, 3], pressure=[1000, None, 1002, 1003]))
+
+        trends = compute_trends(frame)
+
+        assert trends.slope("pressure") == pytest.approx(1.0)
+        assert trends.slope("visibility") == 0.0
+
+    def test_single_outlier_at_the_end_does_not_flip_trend(self):
+        hours = list(range(10))
+        temps = [10 + h for h in range(9)] + [12]
+        frame = ForecastFrame.from_forecast(_points(hours, temperature=temps))
+
+        assert compute_trends(frame).direction("temperature") == "increasing"
+
+    def test_empty_frame(self):
+        trends = compute_trends(ForecastFrame.from_forecast([]))
+
+        assert trends.horizons == ["window"]
+        assert trends.slope("wind") == 0.0
+
+
+class TestTrendCache:
+    """Trends are computed once per forecast window."""
+
+    def test_same_window_reuses_result(self, monkeypatch):
+        points = _points([0, 1, 2, 3], pressure=[1000, 1001, 1002, 1003])
+        frame = ForecastFrame.from_forecast(points)
+        calls = []
+        original = forecast_trends.compute_trends
+
+        def counting(frame):
+            calls.append(frame)
+            return original(frame)
+
+        monkeypatch.setattr(forecast_trends, "compute_trends", counting)
+
+        first = trends_for_frame(frame)
+        # A fresh window over the same data, and a re-parse, both hit
+        assert trends_for_frame(frame.slice(0, 4)) is first
+        assert trends_for_frame(ForecastFrame.from_forecast(points)) is first
+        assert len(calls) == 1
+
+        trends_for_frame(frame.slice(1, 4))
+        assert len(calls) == 2
+
+    def test_analysis_reads_cached_trends(self):
+        points = _points([0, 1, 2, 3], pressure=[1000, 1002, 1004, 1006])
+
+        result = analyze_forecast_trends(points)
+
+        assert len(forecast_trends._TREND_CACHE) == 1
+        assert result["pressure"] == "rising"
+        assert result["horizons"]["3h"]["pressure"] == {
+            "slope_per_hour": 2.0, "direction": "increasing"}
+        assert result["horizons"]["window"]["points"] == 4
+
+    def test_visibility_trend_reported(self):
+        points = _points(
+            [0, 1, 2, 3], visibility=[9000, 7000, 5000, 3000], pressure=[1013] * 4)
+
+        result = analyze_forecast_trends(points)
+
+        assert result["visibility"] == "deteriorating"
+        assert result["visibility_trend"] == "deteriorating"
+        # Visibility does not change the overall assessment
+        assert result["overall"] == "stable"
+
+
+def test_briefing_shows_pressure_tendency_per_horizon():
+    from custom_components.hangar_assistant import _format_forecast_text
+
+    hours = list(range(7))
+    frame = ForecastFrame.from_forecast(
+        _points(hours, pressure=[1010 - h for h in hours]))
+
+    text = _format_forecast_text(
+        frame, START + timedelta(hours=6), False, START)
+
+    assert "Pressure Tendency (hPa/h): 3h -1.0, 6h -1.0\n" in text
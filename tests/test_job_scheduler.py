@@ -0,0 +1,181 @@
+"""Tests for the integration job scheduler."""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hangar_assistant.const import DOMAIN
+from custom_components.hangar_assistant.utils import job_scheduler
+from custom_components.hangar_assistant.utils.job_scheduler import (
+    JobScheduler,
+    _percentile,
+    ensure_job_scheduler,
+    get_job_scheduler,
+    jitter_offset,
+    remove_job_scheduler,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_jitter_offset_is_stable_and_bounded():
+    offsets = {jitter_offset(f"job_{i}", 30) for i in range(50)}
+    assert all(0 <= o <= 30 for o in offsets)
+    assert len(offsets) > 1  # jobs are spread, not all at :00
+    assert jitter_offset("notam_update", 30) == jitter_offset("notam_update", 30)
+    assert jitter_offset("notam_update", 0) == 0
+
+
+def test_schedule_applies_jitter_to_seconds():
+    hass = MagicMock()
+    scheduler = JobScheduler(hass, jitter_seconds=30)
+    with patch.object(job_scheduler, "async_track_time_change") as track:
+        scheduler.schedule("hourly_ai_briefings", MagicMock(), minute=0)
+        scheduler.schedule("briefings_0700", MagicMock(), hour=7, minute=0, jitter=False)
+
+    first, second = track.call_args_list
+    assert first.kwargs == {
+        "hour": None, "minute": 0,
+        "second": jitter_offset("hourly_ai_briefings", 30)}
+    assert second.kwargs["second"] == 0
+    assert set(scheduler.stats()) == {"hourly_ai_briefings", "briefings_0700"}
+
+
+@pytest.mark.asyncio
+async def test_run_records_durations_and_percentiles():
+    clock = FakeClock()
+    scheduler = JobScheduler(MagicMock(), clock=clock)
+
+    for duration in (1.0, 2.0, 3.0, 4.0):
+        async def job(d=duration):
+            clock.now += d
+        assert await scheduler.async_run("notam_update", job)
+
+    stats = scheduler.stats()["notam_update"]
+    assert stats["runs"] == 4
+    assert stats["failures"] == 0
+    assert stats["last_duration_s"] == 4.0
+    assert stats["avg_duration_s"] == 2.5
+    assert stats["p50_duration_s"] == 2.0
+    assert stats["p95_duration_s"] == 4.0
+    assert stats["max_duration_s"] == 4.0
+
+
+def test_percentile_uses_nearest_rank_for_odd_sample_counts():
+    ordered = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert _percentile(ordered, 50) == 3.0
+    assert _percentile(ordered, 95) == 5.0
+    assert _percentile(ordered, 0) == 1.0
+    assert _percentile([7.0], 50) == 7.0
+
+
+def test_percentile_rounds_half_ranks_up():
+    # Rank 2.5 must select the 3rd sample, not round half to even
+    ordered = [float(i) for i in range(1, 11)]
+    assert _percentile(ordered, 25) == 3.0
+    assert _percentile(ordered, 75) == 8.0
+    assert _percentile(ordered, 100) == 10.0
+
+
+@pytest.mark.asyncio
+async def test_overlapping_run_is_skipped():
+    scheduler = JobScheduler(MagicMock())
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_job():
+        calls.append(1)
+        await release.wait()
+
+    first = asyncio.create_task(scheduler.async_run("hourly", slow_job))
+    await asyncio.sleep(0)
+    assert scheduler.stats()["hourly"]["running"] is True
+    assert await scheduler.async_run("hourly", slow_job) is False
+
+    release.set()
+    assert await first is True
+    stats = scheduler.stats()["hourly"]
+    assert calls == [1]
+    assert stats["overlaps_skipped"] == 1
+    assert stats["runs"] == 1
+    assert stats["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted_and_listeners_notified():
+    scheduler = JobScheduler(MagicMock())
+    listener = MagicMock()
+    remove = scheduler.async_add_listener(listener)
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    assert await scheduler.async_run("broken", broken) is False
+    assert scheduler.stats()["broken"]["failures"] == 1
+    assert listener.call_count == 2  # started and finished
+
+    remove()
+    await scheduler.async_run("broken", broken)
+    assert listener.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listeners_see_running_job():
+    scheduler = JobScheduler(MagicMock())
+    seen = []
+    scheduler.async_add_listener(
+        lambda: seen.append(scheduler.stats()["hourly"]["running"]))
+
+    async def job():
+        assert seen == [True]
+
+    assert await scheduler.async_run("hourly", job) is True
+    assert seen == [True, False]
+
+
+def test_scheduler_registry_per_entry():
+    hass = MagicMock()
+    hass.data = {}
+    scheduler = ensure_job_scheduler(hass, "entry1")
+    assert ensure_job_scheduler(hass, "entry1") is scheduler
+    assert get_job_scheduler(hass, "entry1") is scheduler
+    assert hass.data[DOMAIN]["job_schedulers"] == {"entry1": scheduler}
+
+    remove_job_scheduler(hass, "entry1")
+    assert get_job_scheduler(hass, "entry1") is None
+
+    no_data = MagicMock()
+    assert get_job_scheduler(no_data, "entry1") is None
+    assert isinstance(ensure_job_scheduler(no_data, "entry1"), JobScheduler)
+
+
+@pytest.mark.asyncio
+async def test_job_scheduler_sensor_reports_slowest_p95():
+    from custom_components.hangar_assistant.sensor import JobSchedulerSensor
+
+    clock = FakeClock()
+    scheduler = JobScheduler(MagicMock(), clock=clock)
+    entry = MagicMock()
+    entry.entry_id = "entry1"
+    sensor = JobSchedulerSensor(MagicMock(), entry, scheduler)
+    assert sensor.native_value is None
+
+    async def job():
+        clock.now += 2.5
+
+    await scheduler.async_run("hourly_ai_briefings", job)
+    await scheduler.async_run("notam_update", lambda: asyncio.sleep(0))
+
+    assert sensor.native_value == 2.5
+    attrs = sensor.extra_state_attributes
+    assert set(attrs["jobs"]) == {"hourly_ai_briefings", "notam_update"}
+    assert attrs["running_jobs"] == []
+    assert sensor._attr_unique_id == f"{DOMAIN}_entry1_job_scheduler"
@@ -30,11 +30,12 @@ Aviation Context:
 import asyncio
 import json
 import os
-from datetime import datetime, timedelta, UTC
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch, mock_open, AsyncMock
 import pytest
 
-from custom_components.hangar_assistant.utils.notam import NOTAMClient
+from custom_components.hangar_assistant.utils.cache_manager import CacheEntry
+from custom_components.hangar_assistant.utils.notam import CACHE_KEY, NOTAMClient
 
 
 # Sample PIB XML response for testing
@@ -76,13 +77,31 @@ SAMPLE_PIB_XML = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+def _write_cache_entry(client, notams, age):
+    """Write a NOTAM cache entry of the given age straight to disk.
+
+    Args:
+        client: NOTAMClient whose cache file should be written
+        notams: NOTAM list to store
+        age: How long ago the entry was cached (timedelta)
+    """
+    entry = CacheEntry(
+        data=notams,
+        cached_at=datetime.now() - age,
+        ttl=timedelta(days=client.cache_days),
+    )
+    cache_file = client._cache._get_cache_file_path(CACHE_KEY)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(entry.to_dict()))
+
+
 @pytest.fixture
-def mock_hass():
+def mock_hass(tmp_path):
     """Create a mock Home Assistant instance for NOTAM client testing.
     
     Provides:
-        - Mock hass with config.path() for cache file location
-        - Returns cache path: /mock/config/hangar_assistant_cache/notams.json
+        - Mock hass with config.path() rooted in a temp directory
+        - Cache file: <tmp>/hangar_assistant_cache/notam/uk_notams.json
     
     Used By:
         - All NOTAM client test classes
@@ -92,7 +111,7 @@ def mock_hass():
         MagicMock: Configured Home Assistant instance
     """
     hass = MagicMock()
-    hass.config.path = lambda x: f"/mock/config/{x}"
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
     hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
@@ -209,7 +228,7 @@ class TestNOTAMClientInitialization:
         assert client.cache_days == 14
         assert client.entry == mock_entry
 
-    def test_cache_directory_path(self, notam_client):
+    def test_cache_directory_path(self, notam_client, tmp_path):
         """Test cache file path constructed correctly in HA config directory.
         
         This test validates the cache file path follows the standard
@@ -219,15 +238,16 @@ class TestNOTAMClientInitialization:
             - Use notam_client fixture (pre-configured)
         
         Validation:
-            - cache_file path is /mock/config/hangar_assistant_cache/notams.json
+            - Cache lives in the shared "notam" CacheManager namespace
             - Path uses hass.config.path() helper
         
         Expected Result:
             Cache file stored in persistent location that survives
             Home Assistant restarts.
         """
-        expected_path = "/mock/config/hangar_assistant_cache/notams.json"
-        assert str(notam_client.cache_file) == expected_path
+        expected_path = tmp_path / "hangar_assistant_cache" / "notam" / "uk_notams.json"
+        assert notam_client._cache.namespace == "notam"
+        assert notam_client._cache._get_cache_file_path(CACHE_KEY) == expected_path
 
 
 class TestXMLParsing:
@@ -353,11 +373,6 @@ class TestCaching:
     def test_write_and_read_cache(self, notam_client, tmp_path):
         """Test writing cache and reading it back returns same data."""
         # Override cache path to use temp directory
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         test_notams = [
             {"id": "A0001/25", "location": "EGKA", "text": "Test NOTAM"}
@@ -366,19 +381,17 @@ class TestCaching:
         asyncio.run(notam_client._write_cache(test_notams))
         
         # Read back
-        assert os.path.exists(notam_client.cache_file)
-        with open(notam_client.cache_file, "r") as f:
+        cache_file = notam_client._cache._get_cache_file_path(CACHE_KEY)
+        assert os.path.exists(cache_file)
+        with open(cache_file, "r") as f:
             cache_data = json.load(f)
         
-        assert cache_data["notams"] == test_notams
-        assert "cached_at" in cache_data  # Implementation uses cached_at not timestamp
+        assert cache_data["data"] == test_notams
+        assert "cached_at" in cache_data
+        assert cache_data["metadata"]["count"] == 1
 
     def test_read_fresh_cache(self, notam_client, tmp_path):
         """Test reading fresh cache returns NOTAMs."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         # Write fresh cache
         test_notams = [{"id": "A0001/25", "text": "Test"}]
@@ -391,21 +404,10 @@ class TestCaching:
 
     def test_read_expired_cache_returns_none(self, notam_client, tmp_path):
         """Test reading expired cache returns None."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         notam_client.cache_days = 7
         
-        # Write cache with old timestamp (timezone-aware UTC)
-        old_time = (datetime.now(UTC) - timedelta(days=8)).isoformat()
-        cache_data = {
-            "notams": [{"id": "A0001/25"}],
-            "timestamp": old_time
-        }
-        
-        with open(notam_client.cache_file, "w") as f:
-            json.dump(cache_data, f)
+        # Write cache with old timestamp
+        _write_cache_entry(notam_client, [{"id": "A0001/25"}], timedelta(days=8))
         
         # Attempt to read - should return None (expired)
         result = asyncio.run(notam_client._read_cache())
@@ -414,20 +416,11 @@ class TestCaching:
 
     def test_read_stale_cache(self, notam_client, tmp_path):
         """Test reading stale cache still returns NOTAMs for graceful degradation."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
-        # Write stale cache (timezone-aware UTC)
-        old_time = (datetime.now(UTC) - timedelta(days=10)).isoformat()
-        cache_data = {
-            "notams": [{"id": "A0001/25", "text": "Stale"}],
-            "timestamp": old_time
-        }
-        
-        with open(notam_client.cache_file, "w") as f:
-            json.dump(cache_data, f)
+        # Write stale cache
+        _write_cache_entry(
+            notam_client, [{"id": "A0001/25", "text": "Stale"}], timedelta(days=10)
+        )
         
         # Read stale cache
         result = asyncio.run(notam_client._read_stale_cache())
@@ -436,10 +429,6 @@ class TestCaching:
 
     def test_read_nonexistent_cache(self, notam_client, tmp_path):
         """Test reading nonexistent cache returns None."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "does_not_exist.json"))
         
         result = asyncio.run(notam_client._read_cache())
 
@@ -452,10 +441,6 @@ class TestFetchNOTAMs:
     @pytest.mark.asyncio
     async def test_fetch_with_fresh_cache(self, notam_client, tmp_path):
         """Test fetch returns fresh cache without network call."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         # Create fresh cache
         test_notams = [{"id": "A0001/25", "location": "EGKA"}]
@@ -470,10 +455,6 @@ class TestFetchNOTAMs:
     @pytest.mark.asyncio
     async def test_fetch_from_nats_on_cache_miss(self, notam_client, tmp_path):
         """Test fetch calls NATS API when cache is missing."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         # Mock successful HTTP response via HA's aiohttp helper
         mock_session = MagicMock()
@@ -492,19 +473,13 @@ class TestFetchNOTAMs:
     @pytest.mark.asyncio
     async def test_fetch_handles_network_error_gracefully(self, notam_client, mock_entry, tmp_path):
         """Test fetch falls back to stale cache on network error."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
-        # Create stale cache (timezone-aware UTC)
-        old_time = (datetime.now(UTC) - timedelta(days=10)).isoformat()
-        cache_data = {
-            "notams": [{"id": "STALE001", "text": "Stale NOTAM"}],
-            "timestamp": old_time
-        }
-        with open(notam_client.cache_file, "w") as f:
-            json.dump(cache_data, f)
+        # Create stale cache
+        _write_cache_entry(
+            notam_client,
+            [{"id": "STALE001", "text": "Stale NOTAM"}],
+            timedelta(days=10),
+        )
         
         # Mock network failure via HA's aiohttp helper
         mock_session = MagicMock()
@@ -523,19 +498,9 @@ class TestFetchNOTAMs:
     @pytest.mark.asyncio
     async def test_fetch_handles_http_error_status(self, notam_client, tmp_path):
         """Test fetch handles HTTP error status codes gracefully."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
-        # Create stale cache for fallback (timezone-aware UTC)
-        old_time = (datetime.now(UTC) - timedelta(days=10)).isoformat()
-        cache_data = {
-            "notams": [{"id": "FALLBACK001"}],
-            "timestamp": old_time
-        }
-        with open(notam_client.cache_file, "w") as f:
-            json.dump(cache_data, f)
+        # Create stale cache for fallback
+        _write_cache_entry(notam_client, [{"id": "FALLBACK001"}], timedelta(days=10))
         
         # Mock HTTP 500 error via HA's aiohttp helper
         mock_session = MagicMock()
@@ -553,10 +518,6 @@ class TestFetchNOTAMs:
     @pytest.mark.asyncio
     async def test_fetch_with_no_cache_and_network_error(self, notam_client, tmp_path):
         """Test fetch returns empty list when no cache and network fails."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "nonexistent.json"))
         
         # Mock network failure via HA's aiohttp helper
         mock_session = MagicMock()
@@ -683,27 +644,21 @@ class TestCacheManagement:
     @pytest.mark.asyncio
     async def test_clear_cache(self, notam_client, tmp_path):
         """Test cache clearing removes file."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         # Create cache
         await notam_client._write_cache([{ "id": "A0001/25" }])
-        assert os.path.exists(notam_client.cache_file)
+        cache_file = notam_client._cache._get_cache_file_path(CACHE_KEY)
+        assert os.path.exists(cache_file)
         
         # Clear cache
         await notam_client.clear_cache()
         
-        assert not os.path.exists(notam_client.cache_file)
+        assert not os.path.exists(cache_file)
+        assert await notam_client._read_stale_cache() is None
 
     @pytest.mark.asyncio
     async def test_get_cache_stats_with_existing_cache(self, notam_client, tmp_path):
         """Test cache stats returns correct information."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "notams.json"))
         
         # Create cache
         await notam_client._write_cache([{ "id": "A0001/25" }, { "id": "A0002/25" }])
@@ -718,10 +673,6 @@ class TestCacheManagement:
     @pytest.mark.asyncio
     async def test_get_cache_stats_with_no_cache(self, notam_client, tmp_path):
         """Test cache stats returns False for nonexistent cache."""
-        from pathlib import Path
-        notam_client.cache_dir = Path(str(tmp_path))
-
-        notam_client.cache_file = Path(str(tmp_path / "nonexistent.json"))
         
         stats = await notam_client.get_cache_stats()
         
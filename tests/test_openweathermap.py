@@ -32,9 +32,8 @@ Performance:
     - Configured TTL (default: 10 minutes) balances freshness and API usage
 """
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch, mock_open
+from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timedelta
-import json
 import asyncio
 from custom_components.hangar_assistant.utils.openweathermap import (
     OpenWeatherMapClient,
@@ -44,11 +43,11 @@ from custom_components.hangar_assistant.utils.openweathermap import (
 
 
 @pytest.fixture
-def mock_hass():
+def mock_hass(tmp_path):
     """Create a mock Home Assistant instance for OWM client testing.
     
     Provides:
-        - Mock hass with config.path() for cache directory
+        - Mock hass with config.path() pointing at a temp cache directory
         - Mock aiohttp client session for HTTP requests
         - Mock async_add_executor_job for file I/O operations
     
@@ -63,7 +62,9 @@ def mock_hass():
         MagicMock: Configured Home Assistant instance with cache support
     """
     hass = MagicMock()
-    hass.config.path = MagicMock(return_value="/config/hangar_assistant_cache")
+    hass.config.path = MagicMock(
+        side_effect=lambda *parts: str(tmp_path.joinpath(*parts))
+    )
     hass.helpers.aiohttp_client.async_get_clientsession = MagicMock(
         return_value=AsyncMock()
     )
@@ -254,77 +255,66 @@ class TestOpenWeatherMapClientInit:
 
 
 class TestOpenWeatherMapClientCaching:
-    """Test caching functionality."""
+    """Test caching via the shared CacheManager "weather" namespace."""
+
+    def test_cache_key_rounds_coordinates(self, owm_client):
+        """Test cache key uses 4 decimal places for coordinates."""
+        assert owm_client._cache_key(51.2, -1.2) == "51.2000_-1.2000"
+        assert owm_client._cache_key(51.123456, -1.987654) == "51.1235_-1.9877"
+
+    def test_cache_uses_weather_namespace(self, owm_client, tmp_path):
+        """Test persistent cache lives in the weather namespace directory."""
+        assert owm_client._cache.namespace == "weather"
+        assert owm_client._cache.cache_dir == tmp_path / "hangar_assistant_cache" / "weather"
+        assert owm_client._cache.persistent_enabled is True
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("pathlib.Path.exists")
-    def test_read_valid_persistent_cache(
-        self, mock_exists, mock_file, owm_client, sample_owm_response
+    @pytest.mark.asyncio
+    async def test_persistent_cache_survives_restart(
+        self, owm_client, mock_hass, sample_owm_response
     ):
-        """Test reading valid persistent cache."""
-        mock_exists.return_value = True
-        cached_data = {
-            "cached_at": datetime.now().isoformat(),
-            "coordinates": {"lat": 51.2, "lon": -1.2},
-            "data": sample_owm_response,
-        }
-        mock_file.return_value.read.return_value = json.dumps(cached_data)
+        """Test a new client instance reads the persistent cache."""
+        await owm_client._cache.set(
+            owm_client._cache_key(51.2, -1.2), sample_owm_response
+        )
+        # Shutdown flushes write-behind entries
+        await owm_client._cache.async_flush()
         
-        result = owm_client._read_persistent_cache(51.2, -1.2)
+        new_client = OpenWeatherMapClient("test_key", mock_hass)
+        result = await new_client.get_weather_data(51.2, -1.2)
         
         assert result == sample_owm_response
+        assert new_client._api_calls_today == 0
 
-    @patch("pathlib.Path.exists")
-    def test_read_expired_persistent_cache(self, mock_exists, owm_client):
-        """Test reading expired persistent cache returns None."""
-        mock_exists.return_value = True
-        cached_data = {
-            "cached_at": (datetime.now() - timedelta(minutes=15)).isoformat(),
-            "data": {"test": "data"},
-        }
-        
-        with patch("builtins.open", mock_open(read_data=json.dumps(cached_data))):
-            result = owm_client._read_persistent_cache(51.2, -1.2)
-        
-        assert result is None
+    @pytest.mark.asyncio
+    async def test_persistent_writes_are_batched(
+        self, owm_client, sample_owm_response
+    ):
+        """Test cache writes are queued and flushed as one batch."""
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
+        await owm_client._cache.set("51.3000_-1.3000", sample_owm_response)
 
-    @patch("pathlib.Path.exists")
-    def test_read_cache_disabled(self, mock_exists, mock_hass):
-        """Test cache reading when caching is disabled."""
-        client = OpenWeatherMapClient(
-            "test_key", mock_hass, cache_enabled=False
-        )
-        
-        result = client._read_persistent_cache(51.2, -1.2)
-        
-        assert result is None
-        mock_exists.assert_not_called()
+        assert owm_client._cache.pending_writes == 2
+        assert owm_client._cache.get_stats()["persistent_files"] == 0
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_write_persistent_cache(self, mock_file, owm_client, sample_owm_response):
-        """Test writing to persistent cache."""
-        owm_client._write_persistent_cache(51.2, -1.2, sample_owm_response)
-        
-        mock_file.assert_called_once()
-        handle = mock_file()
-        written_data = "".join(
-            call.args[0] for call in handle.write.call_args_list
-        )
-        cached = json.loads(written_data)
-        
-        assert cached["data"] == sample_owm_response
-        assert "cached_at" in cached
-        assert cached["coordinates"] == {"lat": 51.2, "lon": -1.2}
+        assert await owm_client._cache.async_flush() == 2
+
+        stats = owm_client._cache.get_stats()
+        assert stats["persistent_files"] == 2
+        assert stats["flushes"] == 1
+        assert owm_client._cache.pending_writes == 0
 
-    def test_write_cache_disabled(self, mock_hass, sample_owm_response):
-        """Test cache writing when caching is disabled."""
+    @pytest.mark.asyncio
+    async def test_cache_disabled_is_memory_only(self, mock_hass, tmp_path):
+        """Test caching disabled keeps data in memory without writing files."""
         client = OpenWeatherMapClient(
             "test_key", mock_hass, cache_enabled=False
         )
         
-        with patch("builtins.open", mock_open()) as mock_file:
-            client._write_persistent_cache(51.2, -1.2, sample_owm_response)
-            mock_file.assert_not_called()
+        await client._cache.set(client._cache_key(51.2, -1.2), {"test": "data"})
+        
+        assert client._cache.persistent_enabled is False
+        assert await client._cache.get("51.2000_-1.2000") == {"test": "data"}
+        assert not (tmp_path / "hangar_assistant_cache").exists()
 
 
 class TestOpenWeatherMapClientAPI:
@@ -350,8 +340,7 @@ class TestOpenWeatherMapClientAPI:
             mock_session
         )
         
-        with patch.object(owm_client, "_write_persistent_cache"):
-            result = await owm_client._fetch_from_api(51.2, -1.2)
+        result = await owm_client._fetch_from_api(51.2, -1.2)
         
         assert result == sample_owm_response
         assert owm_client._api_calls_today == 1
@@ -445,9 +434,8 @@ class TestOpenWeatherMapClientAPI:
             mock_session
         )
         
-        with patch.object(owm_client, "_write_persistent_cache"):
-            await owm_client._fetch_from_api(51.2, -1.2)
-            await owm_client._fetch_from_api(51.3, -1.3)
+        await owm_client._fetch_from_api(51.2, -1.2)
+        await owm_client._fetch_from_api(51.3, -1.3)
         
         assert owm_client._api_calls_today == 2
 
@@ -506,31 +494,27 @@ class TestOpenWeatherMapClientMultiLevelCache:
     @pytest.mark.asyncio
     async def test_memory_cache_hit(self, owm_client, sample_owm_response):
         """Test memory cache returns data without API call."""
-        # Pre-populate memory cache
-        owm_client._memory_cache["51.2_-1.2"] = (
-            sample_owm_response,
-            datetime.now(),
-        )
+        # Pre-populate cache
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
         
         result = await owm_client.get_weather_data(51.2, -1.2)
         
         assert result == sample_owm_response
+        assert owm_client._cache.get_stats()["memory_hits"] == 1
         # No API call should be made
         assert owm_client._api_calls_today == 0
 
     @pytest.mark.asyncio
     async def test_persistent_cache_hit(self, owm_client, sample_owm_response):
         """Test persistent cache fallback when memory cache misses."""
-        with patch.object(
-            owm_client,
-            "_read_persistent_cache",
-            return_value=sample_owm_response,
-        ):
-            result = await owm_client.get_weather_data(51.2, -1.2)
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
+        owm_client._cache._memory_cache.clear()
+        
+        result = await owm_client.get_weather_data(51.2, -1.2)
         
         assert result == sample_owm_response
         # Data should be added to memory cache
-        assert "51.2_-1.2" in owm_client._memory_cache
+        assert "51.2000_-1.2000" in owm_client._cache._memory_cache
         # No API call should be made
         assert owm_client._api_calls_today == 0
 
@@ -554,72 +538,70 @@ class TestOpenWeatherMapClientMultiLevelCache:
             mock_session
         )
         
-        with patch.object(owm_client, "_read_persistent_cache", return_value=None):
-            with patch.object(owm_client, "_write_persistent_cache"):
-                result = await owm_client.get_weather_data(51.2, -1.2)
+        result = await owm_client.get_weather_data(51.2, -1.2)
         
         assert result == sample_owm_response
         assert owm_client._api_calls_today == 1
+        # Response cached with API call metadata
+        entry = await owm_client._cache.get_entry("51.2000_-1.2000")
+        assert entry.data == sample_owm_response
+        assert entry.metadata["api_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_on_api_failure(self, owm_client, sample_owm_response):
+        """Test expired cache returned when the API fails."""
+        await owm_client._cache.set(
+            "51.2000_-1.2000", sample_owm_response, ttl_minutes=0.001
+        )
+        await asyncio.sleep(0.1)
+        
+        with patch.object(owm_client, "_fetch_from_api", return_value=None):
+            result = await owm_client.get_weather_data(51.2, -1.2)
+        
+        assert result == sample_owm_response
 
 
 class TestOpenWeatherMapClientCacheManagement:
     """Test cache management utilities."""
 
-    @patch("pathlib.Path.unlink")
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_clear_specific_cache(
-        self, mock_exists, mock_unlink, owm_client, sample_owm_response
-    ):
+    @pytest.mark.asyncio
+    async def test_clear_specific_cache(self, owm_client, sample_owm_response):
         """Test clearing cache for specific coordinates."""
-        # Pre-populate memory cache
-        owm_client._memory_cache["51.2_-1.2"] = (
-            sample_owm_response,
-            datetime.now(),
-        )
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
+        await owm_client._cache.set("51.3000_-1.3000", sample_owm_response)
         
-        owm_client.clear_cache(51.2, -1.2)
+        await owm_client.clear_cache(51.2, -1.2)
         
-        assert "51.2_-1.2" not in owm_client._memory_cache
-        mock_unlink.assert_called_once()
+        assert await owm_client._cache.get_entry("51.2000_-1.2000") is None
+        assert await owm_client._cache.get_entry("51.3000_-1.3000") is not None
 
-    @patch("pathlib.Path.glob")
-    def test_clear_all_caches(
-        self, mock_glob, owm_client, sample_owm_response
-    ):
+    @pytest.mark.asyncio
+    async def test_clear_all_caches(self, owm_client, sample_owm_response):
         """Test clearing all caches."""
-        # Pre-populate memory cache
-        owm_client._memory_cache["51.2_-1.2"] = (
-            sample_owm_response,
-            datetime.now(),
-        )
-        
-        mock_file1 = MagicMock()
-        mock_file2 = MagicMock()
-        mock_glob.return_value = [mock_file1, mock_file2]
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
+        await owm_client._cache.set("51.3000_-1.3000", sample_owm_response)
         
-        owm_client.clear_cache()
+        await owm_client.clear_cache()
         
-        assert len(owm_client._memory_cache) == 0
-        assert mock_file1.unlink.called
-        assert mock_file2.unlink.called
+        assert len(owm_client._cache._memory_cache) == 0
+        assert list(owm_client._cache.cache_dir.glob("*.json")) == []
 
-    def test_get_cache_stats(self, owm_client, sample_owm_response):
+    @pytest.mark.asyncio
+    async def test_get_cache_stats(self, owm_client, sample_owm_response):
         """Test getting cache statistics."""
-        # Pre-populate memory cache
-        owm_client._memory_cache["51.2_-1.2"] = (
-            sample_owm_response,
-            datetime.now(),
-        )
+        await owm_client._cache.set("51.2000_-1.2000", sample_owm_response)
+        await owm_client._cache.set("51.3000_-1.3000", sample_owm_response)
+        await owm_client._cache.async_flush()
         owm_client._api_calls_today = 5
         
-        with patch("pathlib.Path.glob", return_value=[MagicMock(), MagicMock()]):
-            stats = owm_client.get_cache_stats()
+        stats = owm_client.get_cache_stats()
         
         assert stats["cache_enabled"] is True
         assert stats["cache_ttl_minutes"] == 10
-        assert stats["memory_cache_entries"] == 1
+        assert stats["memory_cache_entries"] == 2
         assert stats["persistent_cache_files"] == 2
         assert stats["api_calls_today"] == 5
+        assert stats["namespace"] == "weather"
 
 
 class TestOpenWeatherMapClientRateLimitProtection:
@@ -647,8 +629,7 @@ class TestOpenWeatherMapClientRateLimitProtection:
             mock_session
         )
         
-        with patch.object(owm_client, "_write_persistent_cache"):
-            await owm_client._fetch_from_api(51.2, -1.2)
+        await owm_client._fetch_from_api(51.2, -1.2)
         
         assert owm_client._api_calls_today == 951
         # Check warning was logged (in real test would check caplog)
@@ -708,13 +689,12 @@ class TestOpenWeatherMapClientEdgeCases:
             mock_session
         )
         
-        with patch.object(owm_client, "_write_persistent_cache"):
-            # Simulate concurrent requests
-            tasks = [
-                owm_client._fetch_from_api(51.2, -1.2),
-                owm_client._fetch_from_api(51.3, -1.3),
-                owm_client._fetch_from_api(51.4, -1.4),
-            ]
-            await asyncio.gather(*tasks)
+        # Simulate concurrent requests
+        tasks = [
+            owm_client._fetch_from_api(51.2, -1.2),
+            owm_client._fetch_from_api(51.3, -1.3),
+            owm_client._fetch_from_api(51.4, -1.4),
+        ]
+        await asyncio.gather(*tasks)
         
         assert owm_client._api_calls_today == 3
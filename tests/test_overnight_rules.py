@@ -0,0 +1,169 @@
+"""Tests for the single-pass overnight risk rule engine."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.hangar_assistant.utils import overnight_rules
+from custom_components.hangar_assistant.utils.forecast_analysis import (
+    check_overnight_conditions,
+)
+from custom_components.hangar_assistant.utils.forecast_frame import ForecastFrame
+from custom_components.hangar_assistant.utils.overnight_rules import (
+    DEFAULT_OVERNIGHT_THRESHOLDS,
+    OVERNIGHT_RULES,
+    OvernightRule,
+    clear_overnight_cache,
+    evaluate_overnight,
+    overnight_thresholds,
+)
+
+START = datetime(2026, 1, 10, 20, 0, tzinfo=timezone.utc)
+END = START + timedelta(hours=10)
+
+
+def _point(hour, **fields):
+    point = {
+        "datetime": (START + timedelta(hours=hour)).isoformat(),
+        "temperature": 8,
+        "wind_speed": 10,
+        "precipitation": 0,
+        "visibility": 9000,
+        "humidity": 70,
+    }
+    point.update(fields)
+    return point
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_overnight_cache()
+    yield
+    clear_overnight_cache()
+
+
+class TestRules:
+    """Each risk is detected from the normalised columns."""
+
+    def test_quiet_night_sets_every_flag_false(self):
+        result = check_overnight_conditions(
+            [_point(h) for h in range(4)], START, END)
+
+        assert result["has_warnings"] is False
+        assert all(result[rule.flag] is False for rule in OVERNIGHT_RULES)
+        assert result["details"] == []
+
+    def test_new_risks_gusts_thunder_and_hail(self):
+        forecast = [
+            _point(1, wind_gust_speed=50),
+            _point(2, condition="lightning-rainy"),
+            _point(3, condition="hail"),
+        ]
+
+        result = check_overnight_conditions(forecast, START, END)
+
+        assert result["gust_risk"] is True
+        assert result["thunderstorm_risk"] is True
+        assert result["hail_risk"] is True
+        assert result["wind_damage_risk"] is False
+        assert result["summary"] == (
+            "Overnight: damaging gusts, thunderstorms, hail")
+
+    def test_owm_thunderstorm_description(self):
+        point = {"dt": int((START + timedelta(hours=1)).timestamp()),
+                 "weather": [{"main": "Thunderstorm",
+                              "description": "thunderstorm with heavy rain"}]}
+
+        result = check_overnight_conditions([point], START, END)
+
+        assert result["thunderstorm_risk"] is True
+
+    def test_details_follow_rule_order_not_time(self):
+        forecast = [
+            _point(1, visibility=500),
+            _point(2, precipitation=15),
+            _point(3, precipitation=20),
+        ]
+
+        result = check_overnight_conditions(forecast, START, END)
+
+        # One detail per rule, from the first point that triggered it
+        assert result["details"] == [
+            "Heavy rain forecast: 15.0mm/hr - flooding risk",
+            "Fog likely - morning delays possible",
+        ]
+
+
+class TestThresholds:
+    """Thresholds are configurable per airfield."""
+
+    def test_airfield_overrides(self):
+        thresholds = overnight_thresholds({
+            "name": "Popham",
+            "overnight_strong_wind_kt": 25,
+            "overnight_gust_kt": "bad",
+            "overnight_fog_visibility_m": None,
+        })
+
+        assert thresholds["strong_wind_kt"] == 25.0
+        assert thresholds["gust_kt"] == DEFAULT_OVERNIGHT_THRESHOLDS["gust_kt"]
+        assert thresholds["fog_visibility_m"] == 1000.0
+        assert overnight_thresholds(None) == DEFAULT_OVERNIGHT_THRESHOLDS
+
+    def test_lower_wind_threshold_fires(self):
+        forecast = ForecastFrame.from_forecast(
+            [_point(1, wind_speed=28)], wind_unit="kt")
+
+        default = check_overnight_conditions(forecast, START, END)
+        strict = check_overnight_conditions(
+            forecast, START, END, {"strong_wind_kt": 25})
+
+        assert default["wind_damage_risk"] is False
+        assert strict["wind_damage_risk"] is True
+
+
+class TestSinglePass:
+    """Rules share one pass, stop once fired, and results are cached."""
+
+    def test_fired_rules_are_not_checked_again(self):
+        calls = []
+
+        def counting(frame, i, t):
+            calls.append(i)
+            return "fired" if i == 1 else None
+
+        frame = ForecastFrame.from_forecast([_point(h) for h in range(5)])
+        rules = (OvernightRule("custom_risk", "custom", counting),)
+
+        result = evaluate_overnight(frame, rules=rules)
+
+        assert result["custom_risk"] is True
+        # The pass stopped once every rule had fired
+        assert calls == [0, 1]
+
+    def test_cached_per_forecast_fetch(self, monkeypatch):
+        frame = ForecastFrame.from_forecast(
+            [_point(h, precipitation=12) for h in range(6)])
+        calls = []
+        original = overnight_rules._evaluate
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(overnight_rules, "_evaluate", counting)
+
+        first = check_overnight_conditions(frame, START, END)
+        second = check_overnight_conditions(frame, START, END)
+        assert first == second and first["flooding_risk"] is True
+        assert len(calls) == 1
+
+        # A different window or threshold set is evaluated separately
+        check_overnight_conditions(frame, START + timedelta(hours=2), END)
+        check_overnight_conditions(
+            frame, START, END, {"heavy_rain_mm_h": 15})
+        assert len(calls) == 3
+
+        # Callers can modify their result without touching the cache
+        first["details"].append("edited")
+        assert check_overnight_conditions(frame, START, END)["details"] == [
+            "Heavy rain forecast: 12.0mm/hr - flooding risk"]
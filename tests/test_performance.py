@@ -5,20 +5,6 @@ from unittest.mock import MagicMock, patch, mock_open
 from pathlib import Path
 from collections import OrderedDict
 
-# Test dashboard template caching
-
-
-def test_dashboard_template_caching_mtime_check():
-    """Test that dashboard template caching checks mtime."""
-    from custom_components.hangar_assistant import (
-        _dashboard_template_cache,
-        _dashboard_template_mtime
-    )
-    
-    # Initially should be None
-    assert _dashboard_template_cache is None
-    assert _dashboard_template_mtime is None
-
 
 def test_json_serialization_with_orjson():
     """Test JSON serialization falls back gracefully."""
@@ -0,0 +1,127 @@
+"""Tests for the event-driven startup readiness gate."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hangar_assistant.utils import readiness
+from custom_components.hangar_assistant.utils.readiness import (
+    HOMEASSISTANT_STARTED,
+    async_wait_for_entities,
+    async_wait_until_ready,
+)
+
+
+class FakeStateHass:
+    """hass stand-in with a state machine and state-changed listeners."""
+
+    def __init__(self, states=None):
+        self._states = dict(states or {})
+        self.listeners = []
+        self.bus = MagicMock()
+        self.state = "starting"
+
+    @property
+    def states(self):
+        return SimpleNamespace(get=self._states.get)
+
+    def set_state(self, entity_id, value):
+        new_state = SimpleNamespace(state=value)
+        self._states[entity_id] = new_state
+        event = SimpleNamespace(data={"entity_id": entity_id, "new_state": new_state})
+        for entity_ids, action in list(self.listeners):
+            if entity_id in entity_ids:
+                action(event)
+
+
+@pytest.fixture
+def fake_hass():
+    hass = FakeStateHass()
+    unsubscribed = []
+
+    def track(hass_arg, entity_ids, action):
+        listener = (list(entity_ids), action)
+        hass_arg.listeners.append(listener)
+
+        def unsub():
+            hass_arg.listeners.remove(listener)
+            unsubscribed.append(listener)
+        return unsub
+
+    with patch.object(readiness, "async_track_state_change_event", side_effect=track):
+        hass.unsubscribed = unsubscribed
+        yield hass
+
+
+class TestReadinessGate:
+    """Test waiting on entity states and Home Assistant start."""
+
+    @pytest.mark.asyncio
+    async def test_ready_entities_resolve_immediately(self, fake_hass):
+        """Entities with valid states do not subscribe to anything."""
+        fake_hass.set_state("sensor.a", "1500")
+
+        assert await async_wait_for_entities(fake_hass, ["sensor.a"], 5) == []
+        assert fake_hass.unsubscribed == []
+
+    @pytest.mark.asyncio
+    async def test_resolves_on_first_valid_state(self, fake_hass):
+        """The gate opens as soon as the last entity reports a value."""
+        fake_hass.set_state("sensor.a", "unavailable")
+        loop = asyncio.get_running_loop()
+        loop.call_soon(fake_hass.set_state, "sensor.a", "unknown")
+        loop.call_later(0.01, fake_hass.set_state, "sensor.a", "1500")
+        loop.call_later(0.02, fake_hass.set_state, "sensor.b", "12")
+
+        start = loop.time()
+        not_ready = await async_wait_for_entities(
+            fake_hass, ["sensor.a", "sensor.b"], timeout=5)
+
+        assert not_ready == []
+        assert loop.time() - start < 1
+        assert fake_hass.listeners == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_missing_entities(self, fake_hass):
+        """Entities that never report are returned after the timeout."""
+        fake_hass.set_state("sensor.a", "1500")
+
+        not_ready = await async_wait_for_entities(
+            fake_hass, ["sensor.a", "sensor.b"], timeout=0.01)
+
+        assert not_ready == ["sensor.b"]
+        assert fake_hass.listeners == []
+
+    @pytest.mark.asyncio
+    async def test_waits_for_homeassistant_start(self, fake_hass):
+        """wait_for_start resolves on EVENT_HOMEASSISTANT_STARTED."""
+        def listen_once(_event_type, action):
+            asyncio.get_running_loop().call_later(0.01, action, None)
+            return MagicMock()
+
+        fake_hass.bus.async_listen_once.side_effect = listen_once
+
+        assert await async_wait_until_ready(
+            fake_hass, wait_for_start=True, timeout=5) == []
+
+    @pytest.mark.asyncio
+    async def test_start_timeout_is_reported(self, fake_hass):
+        """An unfinished start is reported and the listener removed."""
+        unsub = MagicMock()
+        fake_hass.bus.async_listen_once.return_value = unsub
+
+        not_ready = await async_wait_until_ready(
+            fake_hass, wait_for_start=True, timeout=0.01)
+
+        assert not_ready == [HOMEASSISTANT_STARTED]
+        unsub.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_already_started_does_not_listen(self, fake_hass):
+        """A running Home Assistant passes the start gate immediately."""
+        fake_hass.state = readiness.CoreState.running
+
+        assert await async_wait_until_ready(
+            fake_hass, wait_for_start=True, timeout=5) == []
+        fake_hass.bus.async_listen_once.assert_not_called()
@@ -0,0 +1,98 @@
+"""Tests for the runtime lookup registry."""
+from unittest.mock import MagicMock
+
+from custom_components.hangar_assistant.const import DOMAIN
+from custom_components.hangar_assistant.utils.registry import (
+    HangarRegistry,
+    find_aircraft,
+    get_registry,
+    normalise_registration,
+    remove_registry,
+)
+
+DATA = {
+    "airfields": [
+        {"name": "Popham", "icao": "EGHP"},
+        {"name": "Old Sarum", "icao": "EGLS"},
+    ],
+    "aircraft": [
+        {"reg": "G-ABCD", "hangar": "Hangar 1"},
+        {"reg": "G-EFGH", "hangar": "Hangar 1"},
+        {"reg": "N12345"},
+    ],
+    "pilots": [{"name": "Jane Doe"}, {"pilot_name": "John"}],
+    "hangars": [{"name": "Hangar 1", "airfield_name": "Popham"}],
+    "settings": {"fuel": {"reserve_minutes": 45}},
+}
+
+
+def _entry(entry_id="entry1", data=None):
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.data = DATA if data is None else data
+    return entry
+
+
+def test_normalise_registration():
+    assert normalise_registration("g-abcd") == "GABCD"
+    assert normalise_registration("G_ABCD") == "GABCD"
+    assert normalise_registration(None) == ""
+
+
+def test_lookups():
+    registry = HangarRegistry("entry1", DATA)
+    assert registry.aircraft("G_ABCD") is DATA["aircraft"][0]
+    assert registry.aircraft("g-abcd") is DATA["aircraft"][0]
+    assert registry.aircraft("G-ZZZZ") is None
+    assert registry.airfield("Old Sarum") is DATA["airfields"][1]
+    assert registry.airfield("old_sarum") is DATA["airfields"][1]
+    assert registry.airfield("eghp") is DATA["airfields"][0]
+    assert registry.pilot("jane doe") is DATA["pilots"][0]
+    assert registry.pilot("John") is DATA["pilots"][1]
+    assert [a["reg"] for a in registry.aircraft_in_hangar("hangar_1")] == [
+        "G-ABCD", "G-EFGH"]
+    assert registry.aircraft_in_hangar("Unknown") == []
+    assert registry.settings["fuel"]["reserve_minutes"] == 45
+
+
+def test_select_options():
+    registry = HangarRegistry("entry1", DATA)
+    assert registry.airfield_options == ["popham", "old_sarum"]
+    assert registry.aircraft_options == ["g-abcd", "g-efgh", "n12345"]
+    assert registry.pilot_options == ["jane_doe", "john"]
+    assert registry.hangar_options == ["popham_hangar_1"]
+
+
+def test_tolerates_malformed_data():
+    registry = HangarRegistry("entry1", {"aircraft": ["bad", {"model": "C172"}]})
+    assert registry.aircraft("") is None
+    assert registry.airfield_options == []
+
+
+def test_registry_cached_until_entry_data_replaced():
+    hass = MagicMock()
+    hass.data = {}
+    entry = _entry()
+    registry = get_registry(hass, entry)
+    assert get_registry(hass, entry) is registry
+    assert hass.data[DOMAIN]["registries"]["entry1"] is registry
+
+    entry.data = {**DATA, "aircraft": [{"reg": "G-NEWW"}]}
+    rebuilt = get_registry(hass, entry)
+    assert rebuilt is not registry
+    assert rebuilt.aircraft("G-NEWW") is not None
+
+    remove_registry(hass, "entry1")
+    assert "entry1" not in hass.data[DOMAIN]["registries"]
+
+
+def test_find_aircraft_across_entries():
+    hass = MagicMock()
+    hass.data = {}
+    other = _entry("entry2", {"aircraft": [{"reg": "G-OTHR"}]})
+    hass.config_entries.async_entries = MagicMock(return_value=[_entry(), other])
+
+    registry, aircraft = find_aircraft(hass, "G-OTHR")
+    assert registry.entry_id == "entry2"
+    assert aircraft["reg"] == "G-OTHR"
+    assert find_aircraft(hass, "G-NONE") == (None, None)
@@ -40,3 +40,30 @@ def test_runway_suitability_matrix_best_runway(mock_hass):
     by_runway = {item["runway"]: item for item in matrix}
     assert by_runway["18"]["crosswind"] < by_runway["09"]["crosswind"]
     assert attrs.get("min_crosswind") == by_runway["18"]["crosswind"]
+
+
+def test_runway_suitability_matrix_si_units(mock_hass):
+    """Matrix components are converted to the SI speed unit in bulk."""
+    config = {
+        "name": "Test Airfield",
+        "runways": "09, 18",
+        "wind_sensor": "sensor.wind",
+        "wind_dir_sensor": "sensor.wind_dir",
+    }
+    aviation = RunwaySuitabilitySensor(mock_hass, config, {})
+    si = RunwaySuitabilitySensor(mock_hass, config, {"unit_preference": "si"})
+
+    mock_hass.states.get.side_effect = lambda entity_id: {
+        "sensor.wind": MagicMock(state="20"),
+        "sensor.wind_dir": MagicMock(state="140"),
+    }.get(entity_id)
+
+    kt_matrix = aviation.extra_state_attributes["runway_matrix"]
+    si_matrix = si.extra_state_attributes["runway_matrix"]
+
+    assert si.native_value == aviation.native_value
+    for kt_row, si_row in zip(kt_matrix, si_matrix):
+        assert si_row["runway"] == kt_row["runway"]
+        assert si_row["component_unit"] != kt_row["component_unit"]
+        assert si_row["crosswind"] == pytest.approx(
+            kt_row["crosswind"] * 1.852, abs=0.2)
@@ -317,9 +317,9 @@ async def test_async_file_operations():
     # Track if async_add_executor_job is called
     executor_calls = []
     
-    async def track_executor(func):
+    async def track_executor(func, *args):
         executor_calls.append(func.__name__)
-        return func()
+        return func(*args)
     
     mock_hass.async_add_executor_job = track_executor
     
@@ -328,6 +328,6 @@ async def test_async_file_operations():
     # Call async methods that should use executor
     await client._read_cache()
     
-    # Verify executor was used
+    # Verify executor was used (CacheManager persistent read)
     assert len(executor_calls) > 0
-    assert "_read_sync" in executor_calls
+    assert "read" in executor_calls
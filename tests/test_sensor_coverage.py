@@ -448,6 +448,29 @@ class TestAIBriefingSensor:
 
         assert sensor._attr_icon == "mdi:robot"
 
+    def test_streamed_briefing_lifecycle(self, mock_hass):
+        """Started, complete and failed events drive the state.
+
+        The previous text stays visible while generating and after a
+        failed briefing.
+        """
+        sensor = AIBriefingSensor(mock_hass, {"name": "Test Airfield"})
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor.async_set_generating()
+        assert sensor.native_value == "Generating"
+        assert sensor._briefing_text == "Waiting for first briefing..."
+
+        sensor.async_update_briefing("Good morning. Runway 22 in use.")
+        assert sensor.native_value == "Ready"
+        assert sensor.extra_state_attributes["generating"] is False
+
+        sensor.async_set_generating()
+        assert sensor._briefing_text == "Good morning. Runway 22 in use."
+        sensor.async_generation_failed()
+        assert sensor.native_value == "Ready"
+        assert sensor._briefing_text == "Good morning. Runway 22 in use."
+
 
 class TestDensityAltitudeBanner:
     """Test suite for density altitude warning banners.
@@ -1389,7 +1412,7 @@ class TestAirfieldTimezoneSensor:
     for airfield coordinates with multiple fallback levels.
     
     Test Approach:
-        - Mock timezonefinder library lookup
+        - Seed the timezone resolver's memo (lookups happen at setup)
         - Test coordinate-based timezone detection
         - Validate fallback chain to HA timezone then UTC
     
@@ -1415,11 +1438,11 @@ class TestAirfieldTimezoneSensor:
         
         Scenario:
             - Airfield at 51.47°N, 0.45°W (near London)
-            - timezonefinder library available
+            - Zone for the coordinates resolved at setup
             - Expected: "Europe/London" timezone
         
         Setup:
-            - Mock timezonefinder with fake lookup function
+            - Seed the timezone resolver's memo for the coordinates
             - Airfield config with latitude/longitude
         
         Validation:
@@ -1436,28 +1459,30 @@ class TestAirfieldTimezoneSensor:
             "longitude": -0.45,
         }
 
-        from types import SimpleNamespace
-        fake_finder = SimpleNamespace(timezone_at=lambda lat, lng: "Europe/London")
-        mocker.patch("custom_components.hangar_assistant.sensor._TZ_FINDER", fake_finder)
+        from unittest.mock import patch
 
-        sensor = AirfieldTimezoneSensor(mock_hass, config)
-        assert sensor.native_value == "Europe/London"
-        assert sensor.extra_state_attributes.get("source") == "airfield_coords"
+        # Zone resolved at setup by the shared timezone resolver
+        with patch.dict(
+            "custom_components.hangar_assistant.utils.timezone_resolver._ZONES",
+            {(51.47, -0.45): "Europe/London"},
+        ):
+            sensor = AirfieldTimezoneSensor(mock_hass, config)
+            assert sensor.native_value == "Europe/London"
+            assert sensor.extra_state_attributes.get("source") == "airfield_coords"
 
     def test_timezone_falls_back_to_ha(self, mocker, mock_hass):
         """Test fallback to Home Assistant timezone when coordinate lookup fails.
         
         This test validates the first fallback level: using HA system timezone
-        when timezonefinder is unavailable or coordinates not configured.
+        when no zone was resolved or coordinates are not configured.
         
         Scenario:
             - Airfield configured without coordinates
-            - timezonefinder not available (_TZ_FINDER = None)
+            - No zone resolved for the airfield
             - HA system timezone: "Europe/Paris"
             - Expected: Use HA timezone
         
         Setup:
-            - Mock _TZ_FINDER as None
             - mock_hass.config.time_zone = "Europe/Paris"
         
         Validation:
@@ -1470,7 +1495,6 @@ class TestAirfieldTimezoneSensor:
         """
         config = {"name": "Test Airfield"}
         mock_hass.config.time_zone = "Europe/Paris"
-        mocker.patch("custom_components.hangar_assistant.sensor._TZ_FINDER", None)
 
         sensor = AirfieldTimezoneSensor(mock_hass, config)
         assert sensor.native_value == "Europe/Paris"
@@ -1484,12 +1508,11 @@ class TestAirfieldTimezoneSensor:
         
         Scenario:
             - No coordinates configured
-            - timezonefinder unavailable
+            - No zone resolved
             - HA timezone not configured (None)
             - Expected: UTC fallback
         
         Setup:
-            - Mock _TZ_FINDER as None
             - mock_hass.config.time_zone = None
         
         Validation:
@@ -1502,7 +1525,6 @@ class TestAirfieldTimezoneSensor:
         """
         config = {"name": "Test Airfield"}
         mock_hass.config.time_zone = None
-        mocker.patch("custom_components.hangar_assistant.sensor._TZ_FINDER", None)
 
         sensor = AirfieldTimezoneSensor(mock_hass, config)
         assert sensor.native_value == "UTC"
@@ -39,6 +39,7 @@ from custom_components.hangar_assistant import (
     async_generate_all_ai_briefings,
     async_setup_entry,
 )
+from custom_components.hangar_assistant.utils.asset_cache import clear_asset_cache
 
 
 @pytest.fixture
@@ -342,6 +343,7 @@ async def test_ai_prompt_includes_timezone():
 
     mock_hass.states.get.side_effect = state_for
 
+    clear_asset_cache()
     await async_generate_all_ai_briefings(mock_hass, entry)
 
     assert async_call.call_count == 1
@@ -350,6 +352,70 @@ async def test_ai_prompt_includes_timezone():
     mock_hass.async_add_executor_job.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_ai_briefing_forecast_comes_from_owm_client():
+    """The briefing forecast is built from the OWM client's hourly data."""
+    from datetime import datetime, timedelta, timezone
+
+    start = datetime(2026, 6, 1, 9, 0, tzinfo=timezone.utc)
+    end = start + timedelta(hours=6)
+    payload = {
+        "hourly": [
+            {
+                "dt": int((start + timedelta(hours=h)).timestamp()),
+                "temp": 18.0,
+                "dew_point": 9.0,
+                "pressure": 1016 - h,
+                "wind_speed": 4.0 + h,  # m/s in OWM metric units
+                "wind_deg": 240,
+                "clouds": 30,
+                "visibility": 10000,
+                "pop": 0.0,
+            }
+            for h in range(8)
+        ]
+    }
+    client = MagicMock()
+    client.get_weather_data = AsyncMock(return_value=payload)
+    client.extract_hourly_forecast.side_effect = lambda data: data["hourly"]
+
+    hass = _ai_briefing_hass(
+        AsyncMock(return_value=_ok_response("Briefing")))
+    hass.states.get.return_value = None
+    entry = MagicMock()
+    entry.data = {
+        "ai_assistant": {"ai_agent_entity": "conversation.test"},
+        "airfields": [{
+            "name": "Popham", "icao_code": "EGHP",
+            "latitude": 51.19, "longitude": -1.23,
+        }],
+        "integrations": {
+            "openweathermap": {"enabled": True, "api_key": "key"},
+        },
+        "settings": {},
+    }
+
+    clear_asset_cache()
+    with patch(
+        "custom_components.hangar_assistant.utils.openweathermap."
+        "OpenWeatherMapClient", return_value=client,
+    ), patch(
+        "custom_components.hangar_assistant.utils.forecast_analysis."
+        "get_forecast_window", return_value=(start, end, False),
+    ):
+        results = await async_generate_all_ai_briefings(hass, entry)
+
+    assert results == {"Popham": True}
+    client.get_weather_data.assert_awaited_once_with(51.19, -1.23)
+    text = hass.services.async_call.call_args[0][2]["text"]
+    assert "### FORECAST TO" in text
+    # 4 m/s from OWM reported in knots, with OWM field names read
+    assert "09:00: 18°C, Wind 8kt @ 240°, Clouds 30%, Precip 0mm" in text
+    assert "OWM forecast sensor not available" not in text
+    requested = [c.args[0] for c in hass.states.get.call_args_list]
+    assert "sensor.popham_weather_forecast_hourly" not in requested
+
+
 @pytest.mark.asyncio
 async def test_speak_briefing_defaults_to_browser_media_player():
     """When no media player is specified, prefer browser-based player."""
@@ -451,3 +517,250 @@ async def test_speak_briefing_fallbacks_to_first_available_media_player():
     args, kwargs = hass.services.async_call.call_args
     payload = args[2]
     assert payload["media_player_entity_id"] == "media_player.living_room"
+
+
+def _ai_briefing_entry(airfields, **ai_options):
+    """Create a config entry with an AI agent and the given airfields."""
+    entry = MagicMock()
+    entry.data = {
+        "ai_assistant": {"ai_agent_entity": "conversation.test", **ai_options},
+        "airfields": [{"name": name} for name in airfields],
+        "settings": {},
+    }
+    return entry
+
+
+def _ai_briefing_hass(service_call):
+    """Create a hass mock whose conversation.process uses service_call."""
+    hass = MagicMock()
+
+    async def executor(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = executor
+    hass.services.async_call = AsyncMock(side_effect=service_call)
+    return hass
+
+
+def _briefing_events(hass, event_type="hangar_assistant_ai_briefing"):
+    """Return the data of every bus event of the given type."""
+    return [
+        c.args[1] for c in hass.bus.async_fire.call_args_list
+        if c.args[0] == event_type
+    ]
+
+
+def _ok_response(text):
+    return {"response": {"speech": {"plain": {"speech": text}}}}
+
+
+@pytest.fixture
+def stub_prompt_inputs():
+    """Skip sensor, NOTAM and forecast gathering; prompt is the airfield name."""
+    module = "custom_components.hangar_assistant"
+    with patch(f"{module}._gather_airfield_sensor_data", return_value={}), \
+            patch(f"{module}._get_timezone_and_solar_info", return_value=("UTC", None, None)), \
+            patch(f"{module}._process_notams_for_briefing", return_value=""), \
+            patch(f"{module}._async_process_forecast_for_briefing",
+                  new_callable=AsyncMock, return_value=""), \
+            patch(f"{module}._build_briefing_prompt",
+                  side_effect=lambda _sys, name, *_args: name):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_ai_briefings_run_concurrently_within_limit(stub_prompt_inputs):
+    """Briefings for all airfields run in parallel, capped by the option."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def service_call(domain, service, data, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return _ok_response(data["text"])
+
+    hass = _ai_briefing_hass(service_call)
+    entry = _ai_briefing_entry(["A", "B", "C", "D"], briefing_concurrency=2)
+
+    results = await async_generate_all_ai_briefings(hass, entry)
+
+    assert results == {"A": True, "B": True, "C": True, "D": True}
+    assert peak == 2
+    assert len(_briefing_events(hass)) == 4
+
+
+@pytest.mark.asyncio
+async def test_ai_briefing_backoff_does_not_block_other_airfields(stub_prompt_inputs):
+    """A failing airfield's backoff neither holds a slot nor delays the run."""
+    async def service_call(domain, service, data, **kwargs):
+        if data["text"] == "Broken":
+            return None  # No response -> 60 s backoff
+        return _ok_response(data["text"])
+
+    hass = _ai_briefing_hass(service_call)
+    entry = _ai_briefing_entry(["Broken", "Good"], briefing_concurrency=1)
+
+    with patch(
+        "custom_components.hangar_assistant.AI_BRIEFING_RUN_DEADLINE_SECONDS", 0.2
+    ):
+        results = await async_generate_all_ai_briefings(hass, entry)
+
+    # Deadline cancelled the retrying airfield; the other still completed
+    assert results == {"Broken": False, "Good": True}
+    assert [e["airfield_name"] for e in _briefing_events(hass)] == ["Good"]
+    # The cancelled airfield's sensor is told its briefing failed
+    assert [e["airfield_name"] for e in _briefing_events(
+        hass, "hangar_assistant_ai_briefing_failed")] == ["Broken"]
+
+
+@pytest.mark.asyncio
+async def test_ai_briefing_concurrency_option_is_clamped():
+    """Invalid or out-of-range concurrency options fall back safely."""
+    from custom_components.hangar_assistant import _get_ai_briefing_concurrency
+    from custom_components.hangar_assistant.const import (
+        DEFAULT_AI_BRIEFING_CONCURRENCY,
+        MAX_AI_BRIEFING_CONCURRENCY,
+    )
+
+    assert _get_ai_briefing_concurrency({}) == DEFAULT_AI_BRIEFING_CONCURRENCY
+    assert _get_ai_briefing_concurrency({"briefing_concurrency": 3.0}) == 3
+    assert _get_ai_briefing_concurrency({"briefing_concurrency": 0}) == 1
+    assert _get_ai_briefing_concurrency({"briefing_concurrency": "x"}) == (
+        DEFAULT_AI_BRIEFING_CONCURRENCY
+    )
+    assert _get_ai_briefing_concurrency({"briefing_concurrency": 99}) == (
+        MAX_AI_BRIEFING_CONCURRENCY
+    )
+
+
+@pytest.mark.asyncio
+async def test_ai_briefings_skip_unchanged_inputs(stub_prompt_inputs):
+    """Hourly runs skip airfields whose inputs are unchanged; refresh forces."""
+    async def service_call(domain, service, data, **kwargs):
+        return _ok_response(data["text"])
+
+    hass = _ai_briefing_hass(service_call)
+    hass.data = {}
+    entry = _ai_briefing_entry(["A", "B"])
+    entry.entry_id = "entry-1"
+
+    first = await async_generate_all_ai_briefings(hass, entry)
+    second = await async_generate_all_ai_briefings(hass, entry)
+
+    assert first == second == {"A": True, "B": True}
+    assert hass.services.async_call.call_count == 2
+
+    await async_generate_all_ai_briefings(hass, entry, force=True)
+    assert hass.services.async_call.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_speak_briefing_stream_queues_chunks():
+    """With stream=True the first sentences are spoken and the rest queued."""
+    from custom_components.hangar_assistant import _speak_briefing_chunks
+
+    hass = MagicMock()
+    hass.services.async_call = AsyncMock()
+    briefing = " ".join(f"Sentence number {i} of the briefing." for i in range(40))
+
+    await _speak_briefing_chunks(hass, "tts.cloud", "media_player.hangar", briefing)
+
+    calls = hass.services.async_call.call_args_list
+    assert calls[0].args[:2] == ("tts", "speak")
+    assert len(calls[0].args[2]["message"]) <= 200
+    queued = calls[1:]
+    assert queued and all(c.args[:2] == ("media_player", "play_media") for c in queued)
+    assert all(c.args[2]["enqueue"] == "add" for c in queued)
+    assert queued[0].args[2]["media_content_id"].startswith(
+        "media-source://tts/tts.cloud?message=Sentence%20number")
+
+
+@pytest.mark.asyncio
+async def test_get_briefing_history_service_returns_stored_briefings():
+    """get_briefing_history returns stored briefings as response data."""
+    from datetime import datetime, timedelta, timezone
+    from custom_components.hangar_assistant import async_setup
+    from custom_components.hangar_assistant.utils.briefing_history import (
+        BRIEFING_HISTORY_KEY,
+        BriefingHistory,
+    )
+
+    hass = MagicMock()
+    hass.services.async_register = AsyncMock()
+    history = BriefingHistory(hass, store=MagicMock())
+    history._loaded = True
+    hass.data = {DOMAIN: {BRIEFING_HISTORY_KEY: history}}
+    t0 = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+    history.add("Test Airfield", "Early brief", t0)
+    history.add("Test Airfield", "Late brief", t0 + timedelta(hours=1))
+
+    await async_setup(hass, {})
+    registration = next(
+        c for c in hass.services.async_register.call_args_list
+        if c.args[1] == "get_briefing_history")
+    handler = registration.args[2]
+    assert "supports_response" in registration.kwargs
+
+    call = MagicMock(spec=ServiceCall)
+    call.data = {"airfield": "test_airfield", "limit": 2}
+    response = await handler(call)
+    assert response["airfield"] == "Test Airfield"
+    assert [b["text"] for b in response["briefings"]] == ["Late brief", "Early brief"]
+
+    call.data = {"airfield": "Test Airfield", "at": t0 + timedelta(minutes=30)}
+    response = await handler(call)
+    assert [b["text"] for b in response["briefings"]] == ["Early brief"]
+
+
+@pytest.mark.asyncio
+async def test_fuel_services_return_response_across_entries():
+    """Fuel services find aircraft in any entry and return their results."""
+    from custom_components.hangar_assistant import async_setup
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.services.async_register = AsyncMock()
+    first = MagicMock()
+    first.entry_id = "first"
+    first.data = {"aircraft": [{"reg": "G-AAAA"}]}
+    second = MagicMock()
+    second.entry_id = "second"
+    second.data = {
+        "aircraft": [{"reg": "G-ABCD", "fuel": {
+            "burn_rate": 30, "burn_rate_unit": "liters",
+            "tank_capacity": 150, "tank_capacity_unit": "liters"}}],
+        "settings": {"fuel": {"reserve_minutes": 30}},
+    }
+    hass.config_entries.async_entries = MagicMock(return_value=[first, second])
+
+    await async_setup(hass, {})
+    handlers = {
+        c.args[1]: c for c in hass.services.async_register.call_args_list}
+    for name in ("calculate_fuel_cost", "estimate_trip_fuel"):
+        assert "supports_response" in handlers[name].kwargs
+
+    call = MagicMock(spec=ServiceCall)
+    call.data = {"aircraft_reg": "g-abcd", "flight_time_hours": 2.0,
+                 "fuel_price_per_liter": 2.0}
+    cost = await handlers["calculate_fuel_cost"].args[2](call)
+    assert cost["fuel_used_liters"] == 60.0
+    assert cost["total_cost"] == 120.0
+    hass.bus.async_fire.assert_called_with(
+        f"{DOMAIN}_fuel_cost_calculated", cost)
+
+    call.data = {"aircraft_reg": "G-ABCD", "departure_icao": "eghp",
+                 "destination_icao": "egtk", "distance_nm": 100.0,
+                 "cruise_speed_kts": 100.0}
+    trip = await handlers["estimate_trip_fuel"].args[2](call)
+    assert trip["total_fuel_required_liters"] == 45.0
+    assert trip["sufficient_capacity"] is True
+
+    call.data = {"aircraft_reg": "G-NONE", "flight_time_hours": 1.0,
+                 "fuel_price_per_liter": 2.0}
+    missing = await handlers["calculate_fuel_cost"].args[2](call)
+    assert missing["error"] == "aircraft_not_found"
@@ -0,0 +1,140 @@
+"""Tests for lazy, shared airfield timezone resolution."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.hangar_assistant import _get_timezone_and_solar_info
+from custom_components.hangar_assistant.utils import timezone_resolver
+from custom_components.hangar_assistant.utils.registry import HangarRegistry
+from custom_components.hangar_assistant.utils.timezone_resolver import (
+    async_resolve_airfield_timezones,
+    cached_timezone,
+    clear_timezone_cache,
+    resolve_timezone,
+)
+
+DATA = {
+    "airfields": [
+        {"name": "Popham", "icao_code": "EGHP",
+         "latitude": 51.1939, "longitude": -1.2367},
+        {"name": "Le Touquet", "icao_code": "LFAT",
+         "latitude": 50.5175, "longitude": 1.6206},
+        {"name": "No Coords"},
+    ],
+}
+
+ZONES = {(51.1939, -1.2367): "Europe/London", (50.5175, 1.6206): "Europe/Paris"}
+
+
+class FakeFinder:
+    """Stand-in for TimezoneFinder that counts lookups."""
+
+    def __init__(self):
+        self.lookups = 0
+
+    def timezone_at(self, lat, lng):
+        self.lookups += 1
+        return ZONES.get((lat, lng))
+
+
+@pytest.fixture
+def finder(monkeypatch):
+    fake = FakeFinder()
+    monkeypatch.setattr(timezone_resolver, "_finder", None)
+    monkeypatch.setattr(timezone_resolver, "_finder_unavailable", False)
+    monkeypatch.setattr(timezone_resolver, "_finder_lock", None)
+    created = []
+
+    def _load():
+        created.append(fake)
+        timezone_resolver._finder = fake
+        return fake
+
+    monkeypatch.setattr(timezone_resolver, "_load_finder", _load)
+    clear_timezone_cache()
+    yield fake, created
+    clear_timezone_cache()
+
+
+@pytest.fixture
+def hass():
+    executor_calls = []
+
+    async def add_executor_job(func, *args):
+        executor_calls.append(func)
+        return func(*args)
+
+    return SimpleNamespace(
+        async_add_executor_job=add_executor_job,
+        config=SimpleNamespace(time_zone="Europe/London"),
+        states=MagicMock(),
+        executor_calls=executor_calls,
+    )
+
+
+def test_sensor_module_does_not_load_finder_at_import():
+    from custom_components.hangar_assistant import sensor
+
+    assert not hasattr(sensor, "_TZ_FINDER")
+
+
+async def test_resolves_once_in_executor_and_stores_in_registry(finder, hass):
+    fake, created = finder
+    registry = HangarRegistry("entry", DATA)
+
+    zones = await async_resolve_airfield_timezones(hass, registry)
+
+    assert zones == {"popham": "Europe/London", "le_touquet": "Europe/Paris"}
+    assert registry.airfield_timezone("EGHP") == "Europe/London"
+    assert registry.airfield_timezone("le_touquet") == "Europe/Paris"
+    assert registry.airfield_timezone("No Coords") is None
+    assert len(created) == 1 and fake.lookups == 2
+    # Finder creation and lookups both ran through the executor
+    assert len(hass.executor_calls) == 2
+
+    # A reload (or another entry) with the same coordinates looks nothing up
+    again = HangarRegistry("entry", DATA)
+    await async_resolve_airfield_timezones(hass, again)
+    assert fake.lookups == 2
+    assert again.timezones == registry.timezones
+
+
+async def test_coordinate_edit_resolves_only_the_new_location(finder, hass):
+    fake, _created = finder
+    await async_resolve_airfield_timezones(hass, HangarRegistry("entry", DATA))
+
+    edited = {"airfields": [
+        dict(DATA["airfields"][0], latitude=50.5175, longitude=1.6206),
+    ]}
+    registry = HangarRegistry("entry", edited)
+    # Rebuilt registries pick up memoised zones immediately
+    assert registry.airfield_timezone("Popham") == "Europe/Paris"
+    await async_resolve_airfield_timezones(hass, registry)
+    assert fake.lookups == 2
+
+
+def test_resolve_timezone_fallback_chain(finder):
+    hass = SimpleNamespace(config=SimpleNamespace(time_zone="Europe/Dublin"))
+    assert resolve_timezone(hass, 51.1939, -1.2367) == (
+        "Europe/Dublin", "home_assistant")
+
+    timezone_resolver._ZONES[(51.1939, -1.2367)] = "Europe/London"
+    assert cached_timezone(51.19390001, -1.2367) == "Europe/London"
+    assert resolve_timezone(hass, 51.1939, -1.2367) == (
+        "Europe/London", "airfield_coords")
+
+    no_tz = SimpleNamespace(config=SimpleNamespace(time_zone=None))
+    assert resolve_timezone(no_tz, None, None) == ("UTC", "utc_fallback")
+
+
+async def test_briefing_uses_registry_zone(finder, hass):
+    registry = HangarRegistry("entry", DATA)
+    await async_resolve_airfield_timezones(hass, registry)
+    hass.states.get.return_value = None
+
+    tz_value, _sunrise, _sunset = _get_timezone_and_solar_info(
+        hass, "le_touquet", 50.5175, 1.6206, registry)
+
+    assert tz_value == "Europe/Paris"
+    hass.states.get.assert_not_called()
@@ -14,6 +14,10 @@ from custom_components.hangar_assistant.utils.units import (
     KPH_TO_KNOTS,
     POUNDS_TO_KG,
     KG_TO_POUNDS,
+    Converter,
+    convert_fuel_volume,
+    fuel_volume_converter,
+    unit_converters,
 )
 
 
@@ -193,3 +197,55 @@ class TestRealWorldScenarios:
         to_meters = convert_altitude(original, from_feet=True, to_preference="si")
         back_to_feet = convert_altitude(to_meters, from_feet=False, to_preference="aviation")
         assert abs(back_to_feet - original) < 1
+
+
+class TestCompiledConverters:
+    """Preferences resolve once into factor-based converters."""
+
+    def test_resolved_once_per_preference(self):
+        assert unit_converters("si") is unit_converters("si")
+        si = unit_converters("si")
+        assert si.altitude_from_feet.factor == FEET_TO_METERS
+        assert si.speed_from_kph.factor == 1.0
+        assert (si.altitude_unit, si.speed_unit, si.weight_unit) == ("m", "kph", "kg")
+        aviation = unit_converters("aviation")
+        assert aviation.weight_from_kg.factor == KG_TO_POUNDS
+        assert aviation.fuel_burn_rate_unit == "gal/h"
+
+    @pytest.mark.parametrize("preference", ["aviation", "si", "metric"])
+    def test_matches_convert_functions(self, preference):
+        units = unit_converters(preference)
+        for value in (0, 1, 123.4, -50, None):
+            assert units.altitude_from_feet(value) == convert_altitude(
+                value, from_feet=True, to_preference=preference)
+            assert units.altitude_from_meters(value) == convert_altitude(
+                value, from_feet=False, to_preference=preference)
+            assert units.speed_from_knots(value) == convert_speed(
+                value, from_knots=True, to_preference=preference)
+            assert units.weight_from_kg(value) == convert_weight(
+                value, from_pounds=False, to_preference=preference)
+
+    def test_identity_returns_value_unchanged(self):
+        assert unit_converters("aviation").altitude_from_feet(1500) == 1500
+        assert isinstance(unit_converters("aviation").altitude_from_feet(1500), int)
+
+    def test_bulk_conversion(self):
+        from array import array
+
+        to_kph = unit_converters("si").speed_from_knots
+        assert to_kph.many([10, None, 0]) == [10 * KNOTS_TO_KPH, None, 0]
+        converted = to_kph.many(array("d", [1.0, 2.0]))
+        assert isinstance(converted, array)
+        assert list(converted) == [KNOTS_TO_KPH, 2 * KNOTS_TO_KPH]
+        assert Converter(2.0).many(memoryview(array("d", [3.0]))) == array("d", [6.0])
+
+    def test_fuel_volume_converter(self):
+        assert fuel_volume_converter("gallons", "liters") is fuel_volume_converter(
+            "gallons", "liters")
+        for from_unit, to_unit in [
+            ("liters", "gallons"), ("gallons_imperial", "liters"),
+            ("gallons", "gallons_us"), ("unknown", "liters"), ("liters", "unknown"),
+        ]:
+            assert fuel_volume_converter(from_unit, to_unit)(40) == pytest.approx(
+                convert_fuel_volume(40, from_unit=from_unit, to_unit=to_unit))
+        assert convert_fuel_volume(None) is None